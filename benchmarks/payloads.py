@@ -0,0 +1,153 @@
+"""
+Synthetic FMP payloads for the benchmark suite.
+
+Statement payloads take their field names and types from the rename() and astype() calls
+of the method being benchmarked, or the class schemas those calls name, so they stay in
+step with the shaping code.
+"""
+
+import ast
+import inspect
+import textwrap
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+def shaping_fields(method: Callable) -> Dict[str, str]:
+    """
+    Returns the raw fields a method renames or casts, mapped to the type it casts them to.
+    """
+    tree = ast.parse(textwrap.dedent(inspect.getsource(method)))
+    owner = getattr(inspect.getmodule(method), method.__qualname__.split(".")[0])
+    renames, types = {}, {}
+
+    def schema(node: ast.expr) -> Dict[str, str]:
+        if isinstance(node, ast.Dict):
+            return ast.literal_eval(node)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id == "self":
+                return getattr(owner, node.attr)
+        return {}
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+        if node.func.attr == "rename":
+            for keyword in node.keywords:
+                if keyword.arg == "columns":
+                    renames.update(schema(keyword.value))
+        elif node.func.attr == "astype" and node.args:
+            types.update(schema(node.args[0]))
+
+    fields = {raw: str(types.get(name, "float")) for raw, name in renames.items()}
+    renamed = set(renames.values())
+    fields.update({k: str(v) for k, v in types.items() if k not in renamed})
+    return fields
+
+
+def records(fields: Dict[str, str], rows: int, seed: int = 0) -> List[dict]:
+    """
+    Returns rows records with a value of the right type for every field.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2024-06-28", periods=rows)
+    columns = {}
+
+    for field, dtype in fields.items():
+        name = field.lower()
+        if "date" in name or dtype.startswith("datetime"):
+            fmt = "%Y-%m-%d %H:%M:%S" if name.startswith("accepted") else "%Y-%m-%d"
+            columns[field] = dates.strftime(fmt).tolist()
+        elif name == "symbol":
+            columns[field] = [f"SYM{i % 5000:05d}" for i in range(rows)]
+        elif name == "period":
+            columns[field] = ["FY"] * rows
+        elif name in ("calendaryear", "year"):
+            columns[field] = dates.year.astype(str).tolist()
+        elif name.endswith("currency"):
+            columns[field] = ["USD"] * rows
+        elif dtype in ("str", "object", "string"):
+            columns[field] = [f"https://example.com/{field}/{i}" for i in range(rows)]
+        elif dtype.startswith("int"):
+            columns[field] = rng.integers(0, 10**12, rows).tolist()
+        elif dtype == "bool":
+            columns[field] = (rng.random(rows) < 0.5).tolist()
+        else:
+            columns[field] = rng.normal(0, 10**9, rows).round(2).tolist()
+
+    return pd.DataFrame(columns).to_dict("records")
+
+
+def stock_list(rows: int, seed: int = 0) -> List[dict]:
+    """
+    Returns a v3/stock/list payload.
+    """
+    rng = np.random.default_rng(seed)
+    exchanges = rng.choice(["NASDAQ", "NYSE", "AMEX", "LSE", "TSX"], rows)
+    return pd.DataFrame(
+        {
+            "symbol": [f"SYM{i:06d}" for i in range(rows)][::-1],
+            "name": [f"Company {i}" for i in range(rows)],
+            "exchange": exchanges,
+            "price": rng.uniform(1, 500, rows).round(2),
+            "exchangeShortName": exchanges,
+            "type": rng.choice(["stock", "etf", "fund"], rows),
+        }
+    ).to_dict("records")
+
+
+def quote(symbol: str = "AAPL") -> List[dict]:
+    """
+    Returns a v3/quote payload for one symbol.
+    """
+    return [
+        {
+            "symbol": symbol,
+            "name": "Apple Inc.",
+            "price": 214.29,
+            "changePercentage": 0.47,
+            "change": 1.0,
+            "dayLow": 212.3,
+            "dayHigh": 215.2,
+            "yearHigh": 237.2,
+            "yearLow": 164.1,
+            "marketCap": 3285000000000,
+            "priceAvg50": 210.1,
+            "priceAvg200": 190.4,
+            "exchange": "NASDAQ",
+            "volume": 51234567,
+            "avgVolume": 61234567,
+            "open": 213.1,
+            "previousClose": 213.3,
+            "eps": 6.57,
+            "pe": 32.6,
+            "earningsAnnouncement": "2024-07-25T20:00:00.000+0000",
+            "sharesOutstanding": 15334100000,
+            "timestamp": 1721419200,
+        }
+    ]
+
+
+def bars(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Returns daily OHLCV bars, oldest first, indexed by date.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    open_ = close * np.exp(rng.normal(0, 0.003, rows))
+    return pd.DataFrame(
+        {
+            "open": open_.round(2),
+            "high": (np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, rows))).round(
+                2
+            ),
+            "low": (np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, rows))).round(
+                2
+            ),
+            "close": close.round(2),
+            "volume": rng.integers(1_000, 10_000_000, rows),
+        },
+        index=pd.date_range("1900-01-01", periods=rows, freq="D", name="date"),
+    )
@@ -0,0 +1,143 @@
+"""
+Runs the benchmark suite and compares it with a stored baseline.
+
+    python benchmarks/run.py                      # run and compare with baseline.json
+    python benchmarks/run.py --filter FmpChartData --quick
+    python benchmarks/run.py --save               # store the results as the new baseline
+
+Each benchmark reports its best time over --repeat runs and its peak traced memory
+from a separate run. The exit status is 1 when a time or peak memory is more than
+--threshold above the baseline, beyond a small absolute tolerance for noise.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from suite import BENCHMARKS
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+MIN_SECONDS = 0.001
+MIN_BYTES = 1024 * 1024
+
+
+def measure(fn, repeat: int) -> dict:
+    """
+    Returns the best time of repeat runs and the peak traced memory of one more.
+    """
+    fn()
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(times), "peak_bytes": peak}
+
+
+def run(filter_: str, quick: bool, repeat: int) -> dict:
+    results = {}
+    for benchmark in BENCHMARKS.values():
+        if filter_ and filter_ not in benchmark.name:
+            continue
+        for rows in benchmark.sizes[:1] if quick else benchmark.sizes:
+            setup = benchmark.setup(rows)
+            fn, cleanup = setup if isinstance(setup, tuple) else (setup, None)
+            try:
+                results[f"{benchmark.name}[{rows}]"] = measure(fn, repeat)
+            finally:
+                if cleanup:
+                    cleanup()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Prints the results next to the baseline and returns the regressions.
+    """
+    regressions = []
+    print(f"{'benchmark':<55} {'ms':>10} {'base':>10} {'MiB':>8} {'base':>8}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        ms, mib = result["seconds"] * 1000, result["peak_bytes"] / 2**20
+        base_ms = f"{base['seconds'] * 1000:10.2f}" if base else f"{'-':>10}"
+        base_mib = f"{base['peak_bytes'] / 2**20:8.1f}" if base else f"{'-':>8}"
+        flag = ""
+
+        if base:
+            slower = result["seconds"] - base["seconds"]
+            larger = result["peak_bytes"] - base["peak_bytes"]
+            if slower > max(base["seconds"] * threshold, MIN_SECONDS):
+                regressions.append(f"{key}: time {ms:.2f}ms vs {base_ms.strip()}ms")
+                flag = " <- time"
+            if larger > max(base["peak_bytes"] * threshold, MIN_BYTES):
+                regressions.append(
+                    f"{key}: memory {mib:.1f}MiB vs {base_mib.strip()}MiB"
+                )
+                flag += " <- memory"
+
+        print(f"{key:<55} {ms:10.2f} {base_ms} {mib:8.1f} {base_mib}{flag}")
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the fmp_py benchmark suite.")
+    parser.add_argument(
+        "--filter", default="", help="Run benchmarks whose name contains this."
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Run the smallest size only."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="Store results as the baseline."
+    )
+    args = parser.parse_args()
+
+    results = run(args.filter, args.quick, args.repeat)
+
+    stored = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            stored = json.load(file)
+
+    regressions = compare(results, stored.get("results", {}), args.threshold)
+
+    if args.save:
+        stored["python"] = platform.python_version()
+        stored["machine"] = platform.machine()
+        stored.setdefault("results", {}).update(results)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(stored, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+The benchmarks. Each one is registered with the row counts it runs at and a setup
+function that builds its inputs and returns the callable to time, or a (callable,
+cleanup) pair. Requests are served by FmpLocalServer or by a stubbed get_request, so
+nothing reaches the network. Import benchmarks time a fresh interpreter.
+"""
+
+import importlib.util
+import inspect
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import payloads
+
+from fmp_py.fmp_anchored import FmpAnchoredVwap
+from fmp_py.fmp_backtest import FmpBacktest
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_chart_data import FmpChartData
+from fmp_py.fmp_financial_statements import FmpFinancialStatements
+from fmp_py.fmp_indicator_pool import FmpIndicatorPool
+from fmp_py.fmp_local_server import FmpLocalServer
+from fmp_py.fmp_quote import FmpQuote
+from fmp_py.fmp_statement_analysis import FmpStatementAnalysis
+from fmp_py.fmp_stock_list import FmpStockList
+
+API_KEY = "benchmark"
+STATEMENT_SIZES = (1_000, 10_000)
+LIST_SIZES = (1_000, 10_000, 100_000)
+CHART_SIZES = (100_000,)
+POOL_SYMBOLS = (50,)
+POOL_BARS = 2_000
+SWEEP_PERIODS = range(5, 205)
+BACKTEST_VARIANTS = (1_000, 5_000)
+BACKTEST_BARS = 2_520
+POOL_INDICATORS = ["rsi", "sma", "ema", "macd", "bb", "atr", "obv", "roc"]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    sizes: Tuple[int, ...]
+    setup: Callable[[int], Callable]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, sizes: Tuple[int, ...]):
+    def register(setup: Callable[[int], Callable]) -> Callable[[int], Callable]:
+        BENCHMARKS[name] = Benchmark(name, sizes, setup)
+        return setup
+
+    return register
+
+
+def stub_response(client: FmpBase, response) -> FmpBase:
+    client.get_request = lambda url, params=None: response
+    return client
+
+
+############################
+# Request Decode
+############################
+@benchmark("get_request_decode", LIST_SIZES)
+def get_request_decode(rows: int):
+    server = FmpLocalServer().start()
+    response = payloads.stock_list(rows)
+    server.register("v3/stock/list", lambda endpoint, params, limit: response)
+
+    client = FmpBase(API_KEY)
+    client.base_url = server.url
+    return (lambda: client.get_request("v3/stock/list")), server.stop
+
+
+############################
+# Statement Shaping
+############################
+def statement_benchmark(client_class, method_name: str) -> None:
+    method = getattr(client_class, method_name)
+    fields = payloads.shaping_fields(method)
+
+    @benchmark(f"{client_class.__name__}.{method_name}", STATEMENT_SIZES)
+    def setup(rows: int):
+        client = stub_response(client_class(API_KEY), payloads.records(fields, rows))
+        return lambda: getattr(client, method_name)("AAPL")
+
+
+for _method in ["income_statements", "balance_sheet_statements", "cashflow_statements"]:
+    statement_benchmark(FmpFinancialStatements, _method)
+
+for _method in ["ratios", "key_metrics", "financial_growth"]:
+    statement_benchmark(FmpStatementAnalysis, _method)
+
+
+############################
+# Lists and Quotes
+############################
+@benchmark("FmpStockList._process_data", LIST_SIZES)
+def stock_list_process_data(rows: int):
+    client = stub_response(FmpStockList(API_KEY), payloads.stock_list(rows))
+    return lambda: client._process_data("v3/stock/list")
+
+
+def output_benchmark(output: str) -> None:
+    @benchmark(f"FmpStockList._process_data[{output}]", LIST_SIZES)
+    def setup(rows: int):
+        client = stub_response(FmpStockList(API_KEY), payloads.stock_list(rows))
+        return lambda: client._process_data("v3/stock/list", output)
+
+
+for _output, _module in [
+    ("numpy", "numpy"),
+    ("arrow", "pyarrow"),
+    ("polars", "polars"),
+]:
+    if importlib.util.find_spec(_module):
+        output_benchmark(_output)
+
+
+@benchmark("FmpQuote._process_quote", (1_000,))
+def quote_process_quote(rows: int):
+    client = stub_response(FmpQuote(API_KEY), payloads.quote())
+
+    def run():
+        for _ in range(rows):
+            client._process_quote("v3/quote/AAPL")
+
+    return run
+
+
+############################
+# Chart Indicators
+############################
+INDICATORS = [
+    name
+    for name, member in vars(FmpChartData).items()
+    if inspect.isfunction(member)
+    and not name.startswith("_")
+    and name not in ("return_chart", "sweep", "anchored_vwap", "volume_profile")
+]
+
+
+def indicator_benchmark(name: str) -> None:
+    @benchmark(f"FmpChartData.{name}", CHART_SIZES)
+    def setup(rows: int):
+        chart_data = FmpChartData.from_chart(payloads.bars(rows), api_key=API_KEY)
+        chart = chart_data.chart
+
+        def run():
+            chart_data.chart = chart
+            getattr(chart_data, name)()
+
+        return run
+
+
+for _name in INDICATORS:
+    indicator_benchmark(_name)
+
+
+def sweep_benchmark(indicator: str) -> None:
+    @benchmark(f"FmpChartData.sweep[{indicator}]", CHART_SIZES)
+    def setup(rows: int):
+        chart_data = FmpChartData.from_chart(payloads.bars(rows), api_key=API_KEY)
+        return lambda: chart_data.sweep(indicator, SWEEP_PERIODS)
+
+
+for _indicator in ("sma", "ema", "rsi", "bb"):
+    sweep_benchmark(_indicator)
+
+
+def minute_bars(rows: int):
+    chart = payloads.bars(rows)
+    chart.index = pd.date_range("2024-01-02 09:30", periods=rows, freq="min")
+    return chart
+
+
+@benchmark("FmpAnchoredVwap.update", CHART_SIZES)
+def anchored_vwap_update(rows: int):
+    chart = minute_bars(rows)
+    return lambda: FmpAnchoredVwap(step=0.5).update(chart)
+
+
+@benchmark("FmpAnchoredVwap.update[live bar]", CHART_SIZES)
+def anchored_vwap_live_bar(rows: int):
+    chart = minute_bars(rows + 1)
+    anchored = FmpAnchoredVwap(step=0.5)
+    anchored.update(chart.iloc[:-1])
+    bar = chart.iloc[-1:]
+    return lambda: anchored.update(bar)
+
+
+def pool_benchmark(processes: int) -> None:
+    @benchmark(f"FmpIndicatorPool.compute[{processes or 'cpus'}]", POOL_SYMBOLS)
+    def setup(symbols: int):
+        charts = {f"SYM{i}": payloads.bars(POOL_BARS, seed=i) for i in range(symbols)}
+        pool = FmpIndicatorPool(processes=processes)
+        return lambda: pool.compute(charts, POOL_INDICATORS)
+
+
+for _processes in (1, None):
+    pool_benchmark(_processes)
+
+
+############################
+# Backtest
+############################
+@benchmark("FmpBacktest.run_arrays", BACKTEST_VARIANTS)
+def backtest_run_arrays(variants: int):
+    rng = np.random.default_rng(0)
+    close = payloads.bars(BACKTEST_BARS)["close"].to_numpy()
+    prices = np.broadcast_to(close, (variants, BACKTEST_BARS))
+    entries = rng.random((variants, BACKTEST_BARS)) < 0.02
+    exits = rng.random((variants, BACKTEST_BARS)) < 0.02
+    backtest = FmpBacktest(cost=0.001)
+    return lambda: backtest.run_arrays(prices, entries, exits)
+
+
+############################
+# Import Time
+############################
+IMPORTS = {
+    "fmp_py": "import fmp_py",
+    "fmp_py.FmpQuote": "from fmp_py import FmpQuote",
+    "fmp_py.fmp_chart_data": "import fmp_py.fmp_chart_data",
+}
+
+
+def import_benchmark(name: str, statement: str) -> None:
+    @benchmark(f"import {name}", (1,))
+    def setup(rows: int):
+        return lambda: subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+for _name, _statement in IMPORTS.items():
+    import_benchmark(_name, _statement)
@@ -0,0 +1,78 @@
+"""
+The fmp_py package. Importing it loads .env once for every module and nothing else;
+each client class and submodule is imported the first time it is accessed, e.g.
+fmp_py.FmpQuote only imports fmp_py.fmp_quote.
+"""
+
+from importlib import import_module
+from typing import List
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LAZY_ATTRIBUTES = {
+    "FmpAnchoredVwap": "fmp_py.fmp_anchored",
+    "FmpBacktest": "fmp_py.fmp_backtest",
+    "FmpBacktestResult": "fmp_py.fmp_backtest",
+    "FmpBase": "fmp_py.fmp_base",
+    "FmpBulkExport": "fmp_py.fmp_bulk_export",
+    "FmpChartData": "fmp_py.fmp_chart_data",
+    "FmpCompanyInformation": "fmp_py.fmp_company_information",
+    "FmpCompanySearch": "fmp_py.fmp_company_search",
+    "FmpCrypto": "fmp_py.fmp_crypto",
+    "DcfInputs": "fmp_py.fmp_dcf",
+    "FmpDcf": "fmp_py.fmp_dcf",
+    "FmpDividends": "fmp_py.fmp_dividends",
+    "FmpEarnings": "fmp_py.fmp_earnings",
+    "FmpFinancialStatements": "fmp_py.fmp_financial_statements",
+    "FmpForex": "fmp_py.fmp_forex",
+    "FmpFundamentalsWarehouse": "fmp_py.fmp_fundamentals_warehouse",
+    "FmpFxMatrix": "fmp_py.fmp_fx_matrix",
+    "FmpHistoricalData": "fmp_py.fmp_historical_data",
+    "FmpIndicatorPool": "fmp_py.fmp_indicator_pool",
+    "FmpIpoCalendar": "fmp_py.fmp_ipo_calendar",
+    "FmpLocalAnalytics": "fmp_py.fmp_local_analytics",
+    "FmpLocalServer": "fmp_py.fmp_local_server",
+    "FmpMergersAndAquisitions": "fmp_py.fmp_mergers_and_aquisitions",
+    "FmpPanel": "fmp_py.fmp_panel",
+    "FmpPanelBuilder": "fmp_py.fmp_panel",
+    "FmpPriceTargets": "fmp_py.fmp_price_targets",
+    "FmpQuote": "fmp_py.fmp_quote",
+    "FmpQuoteBook": "fmp_py.fmp_quote_book",
+    "FmpQuoteSnapshot": "fmp_py.fmp_quote_snapshot",
+    "FmpRecordReplayAdapter": "fmp_py.fmp_transport",
+    "FmpScheduler": "fmp_py.fmp_scheduler",
+    "FmpScreener": "fmp_py.fmp_screener",
+    "FmpSplits": "fmp_py.fmp_splits",
+    "FmpStatementAnalysis": "fmp_py.fmp_statement_analysis",
+    "FmpStockList": "fmp_py.fmp_stock_list",
+    "FmpSymbolIndex": "fmp_py.fmp_symbol_index",
+    "FmpSymbolResolver": "fmp_py.fmp_symbol_resolver",
+    "FMPUpgradesDowngrades": "fmp_py.fmp_upgrades_downgrades",
+    "FmpValuation": "fmp_py.fmp_valuation",
+}
+
+__all__ = list(LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    """
+    Imports a client class or submodule on first access and caches it on the package.
+    """
+    if name in LAZY_ATTRIBUTES:
+        value = getattr(import_module(LAZY_ATTRIBUTES[name]), name)
+    elif name.startswith("fmp_") or name == "models":
+        try:
+            value = import_module(f"fmp_py.{name}")
+        except ModuleNotFoundError:
+            raise AttributeError(f"module 'fmp_py' has no attribute '{name}'")
+    else:
+        raise AttributeError(f"module 'fmp_py' has no attribute '{name}'")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
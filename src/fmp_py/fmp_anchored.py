@@ -0,0 +1,334 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""
+The FmpAnchoredVwap class computes VWAP and cumulative delta that restart at every anchor:
+the first bar of each trading session, an event such as an earnings release, or both.
+Each batch of bars is one pass of segmented cumulative sums, and the sums of the open
+anchor are carried into the next batch, so live bars can be fed as they arrive.
+
+def update(self, bars: pd.DataFrame, anchors=None) -> pd.DataFrame:
+    Returns the VWAP and cumulative delta of new bars.
+
+def profile(self) -> pd.DataFrame:
+    The volume profile of the open anchor.
+
+def session_keys(index: pd.Index, session_start: str) -> np.ndarray:
+    The trading session of each bar.
+
+def session_mask(index: pd.Index, session_start: str) -> np.ndarray:
+    Marks the first bar of each trading session.
+
+def anchor_mask(index: pd.Index, anchors, bars: pd.DataFrame = None, after=None) -> np.ndarray:
+    Marks the bars that start an event anchor.
+
+def volume_profile(bars: pd.DataFrame, step: float, starts: np.ndarray) -> pd.DataFrame:
+    Volume and delta per anchor and price level.
+
+Bars carry no aggressor side, so the delta of a bar is its volume signed by the bar's
+direction: positive when it closes above its open, negative below and zero when flat.
+"""
+
+BARS = ["open", "high", "low", "close", "volume"]
+DAY = 86_400 * 10**9
+
+Anchors = Union[str, List, pd.Series, np.ndarray]
+
+
+class FmpAnchoredVwap:
+    def __init__(self, session_start: str = "00:00", step: float = None) -> None:
+        """
+        Initialize the FmpAnchoredVwap class.
+
+        Args:
+            session_start (str, optional): Wall-clock time at which sessions start, e.g.
+                "18:00" for futures that open the evening before. None anchors on events
+                only. Defaults to "00:00", one session per calendar day.
+            step (float, optional): Price per volume profile level. None keeps no
+                profile. Defaults to None.
+        """
+        if step is not None and step <= 0:
+            raise ValueError("step must be positive")
+
+        if session_start is not None:
+            _session_offset(session_start)
+
+        self.session_start = session_start
+        self.step = step
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forgets the open anchor, so the next bar starts a new one.
+        """
+        self._session = None
+        self._anchor = None
+        self._last = None
+        self._sums = np.zeros(3)
+        self._levels = {}
+
+    ############################
+    # Update
+    ############################
+    def update(self, bars: pd.DataFrame, anchors: Anchors = None) -> pd.DataFrame:
+        """
+        Returns the VWAP and cumulative delta of new bars since their anchor. The first
+        bar fed after a reset starts an anchor; after that, a bar starts one when its
+        session differs from the bar before it or when anchors marks it.
+
+        Args:
+            bars (pd.DataFrame): New bars with open, high, low, close and volume columns
+                and a DatetimeIndex, oldest first and after the bars fed before.
+            anchors (Anchors, optional): Event anchors among the new bars: a boolean
+                column name, a boolean Series or array, or a list of timestamps, each of
+                which anchors the first bar at or after it. Timestamps at or before a
+                bar fed earlier were already applied and are ignored, so the same list
+                can be passed with every batch. Defaults to None.
+
+        Returns:
+            pd.DataFrame: vwap, cumulative_delta and anchor, the first bar of each bar's
+                anchor, indexed like bars.
+
+        Raises:
+            ValueError: If a column is missing or the index is not made of timestamps.
+        """
+        starts = anchor_mask(bars.index, anchors, bars, after=self._last)
+        sessions = session_keys(bars.index, self.session_start)
+        if len(bars):
+            if sessions is not None:
+                previous = self._session if self._session is not None else sessions[0]
+                starts[0] |= sessions[0] != previous
+                starts[1:] |= sessions[1:] != sessions[:-1]
+            starts[0] |= self._anchor is None
+
+        typical, values = _values(bars)
+        # Segmented sums: running sums minus the running sums before each anchor. Bars
+        # before the first new anchor continue from the carried sums of the open anchor.
+        totals = np.cumsum(values, axis=1)
+        positions = np.flatnonzero(starts)
+        group = np.cumsum(starts)
+        bases = np.concatenate(
+            [-self._sums[:, None], (totals - values)[:, positions]], axis=1
+        )
+        sums = totals - bases[:, group]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = pd.DataFrame(
+                {"vwap": sums[0] / sums[1], "cumulative_delta": sums[2]},
+                index=bars.index,
+            )
+        first = np.concatenate([[-1], positions])[group]
+        anchor = pd.Series(bars.index.take(np.maximum(first, 0)), index=bars.index)
+        if len(bars) and first[0] < 0:
+            anchor[first < 0] = self._anchor
+        result["anchor"] = anchor
+
+        if len(bars):
+            if self.step is not None:
+                self._keep_levels(typical, values, positions)
+            self._sums = sums[:, -1].copy()
+            self._session = None if sessions is None else sessions[-1]
+            self._anchor = result["anchor"].iloc[-1]
+            self._last = bars.index[-1]
+        return result
+
+    def profile(self) -> pd.DataFrame:
+        """
+        Returns the volume profile of the open anchor, kept when step is set.
+
+        Returns:
+            pd.DataFrame: volume and delta per price level, the lower edge of the level,
+                lowest first.
+        """
+        levels = sorted(self._levels)
+        return pd.DataFrame(
+            [self._levels[level] for level in levels],
+            index=pd.Index(
+                np.array(levels, dtype=np.float64) * self.step, name="price"
+            ),
+            columns=["volume", "delta"],
+            dtype=np.float64,
+        )
+
+    def _keep_levels(
+        self, typical: np.ndarray, values: np.ndarray, positions: np.ndarray
+    ) -> None:
+        """
+        Adds the volume and delta of the bars in the open anchor to its profile.
+        """
+        first = positions[-1] if len(positions) else 0
+        if len(positions):
+            self._levels = {}
+        levels, inverse = np.unique(
+            np.floor(typical[first:] / self.step), return_inverse=True
+        )
+        volume = np.bincount(inverse, weights=values[1, first:])
+        delta = np.bincount(inverse, weights=values[2, first:])
+        for level, traded, signed in zip(levels.tolist(), volume, delta):
+            kept = self._levels.setdefault(level, [0.0, 0.0])
+            kept[0] += traded
+            kept[1] += signed
+
+
+############################
+# Helpers
+############################
+def session_keys(index: pd.Index, session_start: str) -> Union[np.ndarray, None]:
+    """
+    Returns the session of each bar as a day number in wall-clock time, where a session
+    runs from session_start to session_start on the next day.
+
+    Args:
+        index (pd.Index): The bar timestamps.
+        session_start (str): "HH:MM", or None for no sessions.
+
+    Returns:
+        Union[np.ndarray, None]: The sessions, or None when session_start is None.
+
+    Raises:
+        ValueError: If session_start is not "HH:MM" or index is not made of timestamps.
+    """
+    if session_start is None:
+        return None
+    if not isinstance(index, pd.DatetimeIndex):
+        if not (
+            pd.api.types.is_datetime64_any_dtype(index)
+            or (len(index) and pd.api.types.infer_dtype(index) == "datetime")
+        ):
+            raise ValueError("Sessions need bars indexed by timestamp.")
+        index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return (index.as_unit("ns").asi8 - _session_offset(session_start)) // DAY
+
+
+def session_mask(index: pd.Index, session_start: str) -> np.ndarray:
+    """
+    Marks the first bar of each session, see session_keys.
+    """
+    keys = session_keys(index, session_start)
+    starts = np.zeros(len(index), dtype=bool)
+    if keys is not None and len(keys):
+        starts[0] = True
+        starts[1:] = keys[1:] != keys[:-1]
+    return starts
+
+
+def anchor_mask(
+    index: pd.Index, anchors: Anchors, bars: pd.DataFrame = None, after=None
+) -> np.ndarray:
+    """
+    Marks the bars that start an event anchor.
+
+    Args:
+        index (pd.Index): The bar labels, oldest first.
+        anchors (Anchors): A boolean column name of bars, a boolean Series or array
+            aligned with index, or a list of labels, each of which anchors the first bar
+            at or after it. Timestamps without a time zone are read as wall-clock time
+            in the zone of index. None marks no bar.
+        bars (pd.DataFrame, optional): The bars, for a column name. Defaults to None.
+        after (optional): The last bar seen before index. Labels at or before it are
+            ignored instead of anchoring the first bar. Defaults to None.
+
+    Returns:
+        np.ndarray: A boolean array aligned with index.
+
+    Raises:
+        ValueError: If a column is missing or a boolean signal does not match index.
+    """
+    starts = np.zeros(len(index), dtype=bool)
+    if anchors is None:
+        return starts
+
+    if isinstance(anchors, str):
+        if bars is None or anchors not in bars.columns:
+            raise ValueError(f"Bars have no column: {anchors}")
+        anchors = bars[anchors]
+    values = np.asarray(anchors)
+    if values.dtype == bool:
+        if len(values) != len(index):
+            raise ValueError("anchors do not match the bars")
+        return values.copy()
+
+    if isinstance(index, pd.DatetimeIndex):
+        anchors = pd.DatetimeIndex([pd.Timestamp(anchor) for anchor in anchors])
+        if index.tz is not None and anchors.tz is None:
+            anchors = anchors.tz_localize(index.tz)
+    anchors = pd.Index(anchors)
+    if after is not None:
+        anchors = anchors[anchors > after]
+    positions = index.searchsorted(anchors)
+    starts[positions[positions < len(index)]] = True
+    return starts
+
+
+def volume_profile(bars: pd.DataFrame, step: float, starts: np.ndarray) -> pd.DataFrame:
+    """
+    Returns the volume and delta traded at each price level within each anchor. A bar's
+    volume goes to the level of its typical price, (high + low + close) / 3.
+
+    Args:
+        bars (pd.DataFrame): Bars with open, high, low, close and volume columns.
+        step (float): Price per level.
+        starts (np.ndarray): Marks the bars that start an anchor; the first bar always
+            starts one.
+
+    Returns:
+        pd.DataFrame: volume and delta indexed by anchor, the first bar of the anchor,
+            and price, the lower edge of the level.
+    """
+    typical, values = _values(bars)
+    levels = np.floor(typical / step)
+
+    starts = np.asarray(starts, dtype=bool).copy()
+    if len(starts):
+        starts[0] = True
+    group = np.cumsum(starts) - 1
+    anchors = bars.index[np.flatnonzero(starts)]
+
+    profile = (
+        pd.DataFrame(
+            {"group": group, "level": levels, "volume": values[1], "delta": values[2]}
+        )
+        .groupby(["group", "level"], sort=True)
+        .sum()
+    )
+    groups = profile.index.get_level_values("group").to_numpy()
+    profile.index = pd.MultiIndex.from_arrays(
+        [
+            anchors.take(groups),
+            profile.index.get_level_values("level").to_numpy() * step,
+        ],
+        names=["anchor", "price"],
+    )
+    return profile
+
+
+def _session_offset(session_start: str) -> int:
+    try:
+        return pd.Timedelta(f"{session_start}:00").value
+    except ValueError as error:
+        raise ValueError(f"session_start must be HH:MM, got {session_start}") from error
+
+
+def _values(bars: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the typical price of each bar and a (3, bars) array of typical price times
+    volume, volume and delta.
+    """
+    missing = [column for column in BARS if column not in bars.columns]
+    if missing:
+        raise ValueError(f"Bars are missing columns: {missing}")
+
+    volume = bars["volume"].to_numpy(dtype=np.float64)
+    close = bars["close"].to_numpy(dtype=np.float64)
+    typical = (
+        bars["high"].to_numpy(dtype=np.float64)
+        + bars["low"].to_numpy(dtype=np.float64)
+        + close
+    ) / 3
+    direction = np.sign(close - bars["open"].to_numpy(dtype=np.float64))
+    return typical, np.stack([typical * volume, volume, volume * direction])
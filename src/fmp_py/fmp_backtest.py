@@ -0,0 +1,443 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""
+The FmpBacktest class evaluates entry and exit signals, such as the wae_uptrend, xtrender,
+macd or rsi columns of FmpChartData, without a per-bar loop. Every variant (a symbol, a
+parameter set or both) is one row of a (variants, bars) array, and positions, returns,
+equity, drawdowns and trades come from cumulative operations along the bars, so
+thousands of variants run in one batch.
+
+def run(self, chart: pd.DataFrame, entry, exit=None, price: str = "close") -> FmpBacktestResult:
+    Backtests signals on one chart; entry may hold one column per variant.
+
+def run_many(self, charts: Dict[str, pd.DataFrame], entry: str, exit: str = None, price: str = "close") -> FmpBacktestResult:
+    Backtests the same signal columns on many symbols.
+
+def run_arrays(self, prices: np.ndarray, entries: np.ndarray, exits: np.ndarray = None, variants: List = None) -> FmpBacktestResult:
+    Backtests (variants, bars) arrays.
+"""
+
+DIRECTIONS = {"long": 1.0, "short": -1.0}
+ARRAYS = ("positions", "returns", "equity", "drawdown")
+
+Signal = Union[str, pd.Series, pd.DataFrame, np.ndarray]
+
+
+@dataclass
+class FmpBacktestResult:
+    variants: pd.Index
+    index: pd.Index
+    positions: np.ndarray
+    returns: np.ndarray
+    equity: np.ndarray
+    drawdown: np.ndarray
+    trades: pd.DataFrame
+    summary: pd.DataFrame
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """
+        Returns positions, returns, equity or drawdown as a bars x variants frame backed
+        by the result's array.
+
+        Args:
+            name (str): "positions", "returns", "equity" or "drawdown".
+
+        Returns:
+            pd.DataFrame: The values, indexed by bar with one column per variant.
+
+        Raises:
+            ValueError: If the name is not one of the arrays.
+        """
+        if name not in ARRAYS:
+            raise ValueError(f"Invalid array. Allowed arrays: {list(ARRAYS)}")
+
+        return pd.DataFrame(
+            getattr(self, name).T, index=self.index, columns=self.variants, copy=False
+        )
+
+
+class FmpBacktest:
+    def __init__(
+        self,
+        cost: float = 0.0,
+        direction: str = "long",
+        lag: int = 1,
+        entry_threshold: float = 0.0,
+        exit_threshold: float = 0.0,
+        periods_per_year: int = 252,
+    ) -> None:
+        """
+        Initialize the FmpBacktest class.
+
+        Args:
+            cost (float, optional): Fees and slippage as a fraction of the traded value,
+                charged on entry and on exit. Defaults to 0.0.
+            direction (str, optional): "long" or "short". Defaults to "long".
+            lag (int, optional): Bars from a signal to its fill. With 1 the position is
+                taken at the close of the signal bar and earns from the next bar on.
+                Defaults to 1.
+            entry_threshold (float, optional): A score signal enters above this.
+                Defaults to 0.0.
+            exit_threshold (float, optional): A score signal exits below this.
+                Defaults to 0.0.
+            periods_per_year (int, optional): Bars per year, for annualized figures.
+                Defaults to 252.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(
+                f"Invalid direction. Allowed directions: {list(DIRECTIONS)}"
+            )
+        if lag < 1:
+            raise ValueError("lag must be at least 1")
+        if cost < 0:
+            raise ValueError("cost must not be negative")
+
+        self.cost = cost
+        self.direction = direction
+        self.lag = lag
+        self.entry_threshold = entry_threshold
+        self.exit_threshold = exit_threshold
+        self.periods_per_year = periods_per_year
+
+    ############################
+    # Run
+    ############################
+    def run(
+        self,
+        chart: pd.DataFrame,
+        entry: Signal,
+        exit: Signal = None,
+        price: str = "close",
+    ) -> FmpBacktestResult:
+        """
+        Backtests signals on one chart. Boolean signals are used as they are; score
+        signals enter above entry_threshold and exit below exit_threshold. A position
+        opens on an entry and is held until an exit; an exit on the same bar as an
+        entry wins. Without exit signals the position is held while the entry signal
+        lasts.
+
+        Args:
+            chart (pd.DataFrame): Bars oldest first, e.g. FmpChartData.return_chart().
+            entry (Signal): A column name, a Series or array aligned with the chart, or a
+                frame with one column per variant, e.g. chart_data.sweep("rsi", ...) < 30.
+            exit (Signal, optional): The same forms as entry. Defaults to None.
+            price (str, optional): The column traded at. Defaults to "close".
+
+        Returns:
+            FmpBacktestResult: One variant per entry column, or a single "signal" variant.
+
+        Raises:
+            ValueError: If a column is missing or a signal does not match the chart.
+        """
+        entries, variants = self._signal(chart, entry, "entry")
+        exits = None
+        if exit is not None:
+            exits, exit_variants = self._signal(chart, exit, "exit")
+            if exits.shape[0] not in (1, entries.shape[0]):
+                raise ValueError("exit must have one variant or as many as entry")
+            if entries.shape[0] == 1 and exits.shape[0] > 1:
+                variants = exit_variants
+
+        count = max(entries.shape[0], 1 if exits is None else exits.shape[0])
+        prices = np.broadcast_to(self._column(chart, price), (count, len(chart)))
+        return self.run_arrays(
+            prices,
+            np.broadcast_to(entries, prices.shape),
+            None if exits is None else np.broadcast_to(exits, prices.shape),
+            variants=variants,
+            index=chart.index,
+        )
+
+    def run_many(
+        self,
+        charts: Dict[str, pd.DataFrame],
+        entry: str,
+        exit: str = None,
+        price: str = "close",
+    ) -> FmpBacktestResult:
+        """
+        Backtests the same signal columns on many symbols in one batch. Shorter charts
+        are padded at the end with flat bars that earn nothing and count in no figure.
+
+        Args:
+            charts (Dict[str, pd.DataFrame]): Symbol to bars, oldest first.
+            entry (str): The entry column.
+            exit (str, optional): The exit column. Defaults to None.
+            price (str, optional): The column traded at. Defaults to "close".
+
+        Returns:
+            FmpBacktestResult: One variant per symbol. Its index counts bars, and the
+                trades carry each symbol's own entry and exit dates.
+        """
+        symbols = list(charts)
+        lengths = np.array([len(charts[symbol]) for symbol in symbols], dtype=np.int64)
+        bars = int(lengths.max()) if len(symbols) else 0
+
+        prices = np.full((len(symbols), bars), np.nan)
+        entries = np.zeros((len(symbols), bars), dtype=bool)
+        exits = None if exit is None else np.zeros((len(symbols), bars), dtype=bool)
+        for row, symbol in enumerate(symbols):
+            chart = charts[symbol]
+            prices[row, : lengths[row]] = self._column(chart, price)
+            entries[row, : lengths[row]] = self._signal(chart, entry, "entry")[0][0]
+            if exit is not None:
+                exits[row, : lengths[row]] = self._signal(chart, exit, "exit")[0][0]
+
+        return self.run_arrays(
+            prices,
+            entries,
+            exits,
+            variants=symbols,
+            lengths=lengths,
+            labels=[charts[symbol].index for symbol in symbols],
+        )
+
+    def run_arrays(
+        self,
+        prices: np.ndarray,
+        entries: np.ndarray,
+        exits: np.ndarray = None,
+        variants: List = None,
+        index: pd.Index = None,
+        lengths: np.ndarray = None,
+        labels: List[pd.Index] = None,
+    ) -> FmpBacktestResult:
+        """
+        Backtests boolean (variants, bars) arrays.
+
+        Args:
+            prices (np.ndarray): Prices, one row per variant. Missing prices carry the
+                last price forward.
+            entries (np.ndarray): Entry signals.
+            exits (np.ndarray, optional): Exit signals. Defaults to the bars without an
+                entry signal.
+            variants (List, optional): Variant names. Defaults to 0, 1, ...
+            index (pd.Index, optional): Bar labels shared by all variants. Defaults to
+                a RangeIndex.
+            lengths (np.ndarray, optional): Valid bars per variant; later bars are
+                padding. Defaults to all bars.
+            labels (List[pd.Index], optional): Bar labels per variant, for the trade
+                dates. Defaults to index.
+
+        Returns:
+            FmpBacktestResult: The backtest.
+        """
+        prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+        shared = len(prices) > 1 and prices.strides[0] == 0
+        prices = np.broadcast_to(_ffill(prices[:1] if shared else prices), prices.shape)
+        entries = np.atleast_2d(np.asarray(entries, dtype=bool))
+        exits = ~entries if exits is None else np.atleast_2d(np.asarray(exits, bool))
+        if entries.shape != prices.shape or exits.shape != prices.shape:
+            raise ValueError("prices, entries and exits must have the same shape")
+
+        count, bars = prices.shape
+        variants = pd.Index(range(count) if variants is None else variants)
+        index = pd.RangeIndex(bars) if index is None else pd.Index(index)
+        if lengths is None:
+            lengths = np.full(count, bars, dtype=np.int64)
+
+        # Hold from an entry until an exit: the last signal carried forward.
+        signal = np.where(exits, 0, np.where(entries, 1, -1)).astype(np.int8)
+        last = np.where(signal >= 0, np.arange(bars, dtype=np.int32), 0)
+        np.maximum.accumulate(last, axis=1, out=last)
+        state = np.maximum(np.take_along_axis(signal, last, axis=1), 0)
+        positions = np.zeros((count, bars))
+        if self.lag < bars:
+            positions[:, self.lag :] = state[:, : bars - self.lag]
+        positions *= DIRECTIONS[self.direction]
+        # Padding bars of shorter variants hold nothing, so no trade starts in them.
+        valid = np.arange(bars)[None, :] < lengths[:, None]
+        positions[~valid] = 0.0
+
+        # Rows broadcast from one price series, as in run(), share one return series.
+        changes = np.zeros(prices[:1].shape if shared else prices.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(
+                prices[: len(changes), 1:],
+                prices[: len(changes), :-1],
+                out=changes[:, 1:],
+            )
+        changes[:, 1:] -= 1.0
+        changes[~np.isfinite(changes)] = 0.0
+
+        turnover = np.abs(np.diff(positions, axis=1, prepend=0.0))
+        turnover[~valid] = 0.0
+        returns = positions * changes - turnover * self.cost
+        returns[~valid] = 0.0
+        equity = np.cumprod(1.0 + returns, axis=1)
+        drawdown = equity / np.maximum.accumulate(equity, axis=1) - 1.0
+
+        trades, rows = self._trades(
+            prices, positions, equity, variants, index, lengths, labels
+        )
+        summary = self._summary(
+            variants,
+            positions,
+            returns,
+            equity,
+            drawdown,
+            turnover,
+            trades,
+            rows,
+            valid,
+        )
+        return FmpBacktestResult(
+            variants=variants,
+            index=index,
+            positions=positions,
+            returns=returns,
+            equity=equity,
+            drawdown=drawdown,
+            trades=trades,
+            summary=summary,
+        )
+
+    ############################
+    # Trades and Summary
+    ############################
+    def _trades(
+        self,
+        prices: np.ndarray,
+        positions: np.ndarray,
+        equity: np.ndarray,
+        variants: pd.Index,
+        index: pd.Index,
+        lengths: np.ndarray,
+        labels: List[pd.Index],
+    ) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Lists the trades and the variant row of each. A trade holds from its start bar
+        up to its end bar, the first flat bar, whose exit cost it carries; trades still
+        held at the end of their variant's bars are open.
+        """
+        count, bars = positions.shape
+        held = np.zeros((count, bars + 2), dtype=bool)
+        held[:, 1:-1] = positions != 0
+        rows, starts = np.nonzero(held[:, 1:-1] & ~held[:, :-2])
+        _, ends = np.nonzero(~held[:, 2:] & held[:, 1:-1])
+        ends = ends + 1
+
+        last = np.minimum(ends, bars - 1)
+        booked = np.concatenate([np.ones((count, 1)), equity], axis=1)
+        entered, exited = starts - 1, np.minimum(ends, lengths[rows]) - 1
+
+        trades = pd.DataFrame(
+            {
+                "variant": variants[rows],
+                "entry_bar": entered,
+                "exit_bar": exited,
+                "entry_price": prices[rows, entered],
+                "exit_price": prices[rows, exited],
+                "bars": np.minimum(ends, lengths[rows]) - starts,
+                "return": booked[rows, last + 1] / booked[rows, starts] - 1.0,
+                "open": ends >= lengths[rows],
+            }
+        )
+        if labels is None:
+            trades.insert(2, "entry_date", index[entered])
+            trades.insert(4, "exit_date", index[exited])
+        else:
+            trades.insert(
+                2, "entry_date", [labels[r][i] for r, i in zip(rows, entered)]
+            )
+            trades.insert(4, "exit_date", [labels[r][i] for r, i in zip(rows, exited)])
+        return trades, rows
+
+    def _summary(
+        self,
+        variants: pd.Index,
+        positions: np.ndarray,
+        returns: np.ndarray,
+        equity: np.ndarray,
+        drawdown: np.ndarray,
+        turnover: np.ndarray,
+        trades: pd.DataFrame,
+        rows: np.ndarray,
+        valid: np.ndarray,
+    ) -> pd.DataFrame:
+        """
+        Returns one row of figures per variant, over its valid bars.
+        """
+        count, bars = returns.shape
+        lengths = valid.sum(axis=1)
+        observed = np.maximum(lengths, 1)
+
+        mean = np.where(valid, returns, 0.0).sum(axis=1) / observed
+        deviation = np.sqrt(
+            np.where(valid, (returns - mean[:, None]) ** 2, 0.0).sum(axis=1)
+            / np.maximum(lengths - 1, 1)
+        )
+        final = equity[:, -1] if bars else np.ones(count)
+        trade_count = np.bincount(rows, minlength=count)
+        wins = np.bincount(
+            rows, weights=trades["return"].to_numpy() > 0, minlength=count
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return pd.DataFrame(
+                {
+                    "total_return": final - 1.0,
+                    "cagr": final ** (self.periods_per_year / observed) - 1.0,
+                    "volatility": deviation * np.sqrt(self.periods_per_year),
+                    "sharpe": np.where(
+                        deviation > 0,
+                        mean / deviation * np.sqrt(self.periods_per_year),
+                        np.nan,
+                    ),
+                    "max_drawdown": drawdown.min(axis=1) if bars else np.zeros(count),
+                    "trades": trade_count,
+                    "win_rate": np.where(trade_count > 0, wins / trade_count, np.nan),
+                    "exposure": np.where(valid, np.abs(positions), 0.0).sum(axis=1)
+                    / observed,
+                    "turnover": turnover.sum(axis=1),
+                },
+                index=pd.Index(variants, name="variant"),
+            )
+
+    ############################
+    # Helpers
+    ############################
+    def _signal(self, chart: pd.DataFrame, signal: Signal, kind: str):
+        """
+        Returns a signal as a boolean (variants, bars) array and the variant names.
+        """
+        if isinstance(signal, str):
+            signal = self._column(chart, signal, raw=True)
+        if isinstance(signal, pd.DataFrame):
+            variants = list(signal.columns)
+            values = signal.to_numpy().T
+        else:
+            variants = [getattr(signal, "name", None) or "signal"]
+            values = np.asarray(signal)
+            values = values.reshape(1, -1) if values.ndim == 1 else values
+
+        if values.shape[-1] != len(chart):
+            raise ValueError(f"{kind} signal does not match the chart length")
+        if values.dtype != bool:
+            values = np.asarray(values, dtype=np.float64)
+            with np.errstate(invalid="ignore"):
+                if kind == "entry":
+                    values = values > self.entry_threshold
+                else:
+                    values = values < self.exit_threshold
+        return values, variants
+
+    @staticmethod
+    def _column(chart: pd.DataFrame, column: str, raw: bool = False):
+        if column not in chart.columns:
+            raise ValueError(f"Chart has no column: {column}")
+        return chart[column] if raw else chart[column].to_numpy(dtype=np.float64)
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    """
+    Carries the last non-NaN value forward along the bars; leading NaNs stay NaN.
+    """
+    seen = np.where(np.isnan(values), 0, np.arange(values.shape[1]))
+    np.maximum.accumulate(seen, axis=1, out=seen)
+    return np.take_along_axis(values, seen, axis=1)
@@ -1,16 +1,82 @@
 import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
-from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterator, List, Set, Tuple
+
+from fmp_py.fmp_output import check_output
+from fmp_py.fmp_transport import FmpRecordReplayAdapter
 
-load_dotenv()
 
 FMP_API_KEY = os.getenv("FMP_API_KEY", "")
 FMP_BASE_URL = "https://financialmodelingprep.com/api/"
 
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATETIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+]
+EPOCH_SCALE = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+TZ_SUFFIX = re.compile(r"(?<=\d)(Z|[+-]\d{2}:?\d{2})$")
+
+CALENDAR_WINDOW_DAYS = 90
+CALENDAR_ROW_LIMIT = 4000
+CALENDAR_CACHE_SIZE = 1024
+CALENDAR_CACHE_GRACE_DAYS = 7
+CALENDAR_CACHE_TTL = 24 * 60 * 60
+
+_calendar_cache = OrderedDict()
+_calendar_cache_lock = threading.Lock()
+
+
+def clear_calendar_cache() -> None:
+    """
+    Drops every calendar window cached by FmpBase.get_calendar_request.
+    """
+    with _calendar_cache_lock:
+        _calendar_cache.clear()
+
+
+@lru_cache(maxsize=256)
+def _detect_datetime_format(shape: str) -> Tuple[str, int]:
+    """
+    Finds the format of a timestamp from its shape, the string with every digit
+    replaced by 0. Returns the format of the part before any UTC offset and that
+    part's length, or ("", 0) if no known format matches.
+    """
+    sample = shape.replace("0", "1")
+    prefix = TZ_SUFFIX.sub("", sample) if ("T" in sample or " " in sample) else sample
+    for fmt in DATETIME_FORMATS:
+        try:
+            datetime.strptime(prefix, fmt)
+        except ValueError:
+            continue
+        return fmt, len(prefix)
+    return "", 0
+
+
+@lru_cache(maxsize=64)
+def _timezone(tz: str):
+    if not tz:
+        return timezone.utc
+
+    import pendulum
+
+    return pendulum.timezone(tz)
+
 
 class FmpBase:
     def __init__(self, api_key: str = FMP_API_KEY) -> None:
@@ -38,6 +104,49 @@ class FmpBase:
         self.session.mount("https://", self.adapter)
         self.session.mount("http://", self.adapter)
 
+        self.base_url = os.getenv("FMP_BASE_URL", FMP_BASE_URL).rstrip("/") + "/"
+        self.output = "pandas"
+
+        transport = os.getenv("FMP_TRANSPORT")
+        if transport:
+            self.use_transport(
+                FmpRecordReplayAdapter(
+                    transport,
+                    os.getenv("FMP_FIXTURES", "tests/fixtures"),
+                    max_retries=self.retry_strategy,
+                )
+            )
+
+    def use_transport(self, adapter: HTTPAdapter) -> None:
+        """
+        Sends this client's requests through another transport adapter, e.g. a
+        FmpRecordReplayAdapter. FMP_TRANSPORT and FMP_FIXTURES do the same for every
+        client at construction.
+
+        Args:
+            adapter (HTTPAdapter): The adapter to mount for http and https.
+        """
+        self.adapter = adapter
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def resolve_output(self, output: str = None) -> str:
+        """
+        Returns the output format of a call: output when given, else the client's
+        output attribute. Endpoints that take output= build "arrow", "polars" and
+        "numpy" results from the decoded records without a pandas DataFrame.
+
+        Args:
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None.
+
+        Returns:
+            str: The output format.
+
+        Raises:
+            ValueError: If the output is not supported.
+        """
+        return check_output(output or self.output)
+
     def fill_na(self, df: pd.DataFrame) -> pd.DataFrame:
         for col in df:
             dt = df[col].dtype
@@ -60,6 +169,288 @@ class FmpBase:
         else:
             return value
 
+    def parse_datetime(self, values: pd.Series) -> pd.Series:
+        """
+        Parses a column of timestamp strings into naive datetimes. The format is detected
+        once from the first value and the whole column is converted in one call. A trailing
+        UTC offset or "Z" is dropped and the wall clock time kept, as pendulum's
+        to_datetime_string() did. Columns that mix formats fall back to per-value inference.
+
+        Args:
+            values (pd.Series): Timestamp strings such as "2024-07-19T14:32:00.000Z".
+
+        Returns:
+            pd.Series: The parsed values as datetime64[ns].
+        """
+        values = pd.Series(values)
+        strings = values.dropna().astype(str)
+        if strings.empty:
+            return pd.to_datetime(values, errors="coerce")
+
+        sample = strings.iloc[0]
+        fmt, length = _detect_datetime_format(re.sub(r"\d", "0", sample))
+        lengths = strings.str.len()
+
+        if fmt and (lengths == len(sample)).all():
+            if length != len(sample):
+                values = values.str.slice(0, length)
+            return pd.to_datetime(values, format=fmt, cache=True, errors="coerce")
+
+        stripped = values.astype(str).str.replace(TZ_SUFFIX, "", regex=True)
+        return pd.to_datetime(stripped, format="mixed", cache=True, errors="coerce")
+
+    def epoch_to_datetime(
+        self, values: pd.Series, unit: str = "ms", tz: str = None
+    ) -> pd.Series:
+        """
+        Converts a column of epoch timestamps to naive datetimes with integer arithmetic.
+
+        Args:
+            values (pd.Series): Epoch timestamps.
+            unit (str, optional): "s", "ms", "us" or "ns". Defaults to "ms".
+            tz (str, optional): Time zone whose wall clock time is returned. Defaults to UTC.
+
+        Returns:
+            pd.Series: The converted values as datetime64[ns].
+        """
+        converted = pd.to_datetime(pd.Series(values), unit=unit, utc=True)
+        if tz:
+            converted = converted.dt.tz_convert(tz)
+        return converted.dt.tz_localize(None)
+
+    def format_datetime(self, value: str) -> str:
+        """
+        Formats one timestamp string as "YYYY-MM-DD HH:MM:SS", reusing the format
+        detected for strings of the same shape.
+
+        Args:
+            value (str): A timestamp string.
+
+        Returns:
+            str: The formatted timestamp.
+        """
+        fmt, length = _detect_datetime_format(re.sub(r"\d", "0", value))
+        if not fmt:
+            import pendulum
+
+            return pendulum.parse(value).strftime(DATETIME_FORMAT)
+        return datetime.strptime(value[:length], fmt).strftime(DATETIME_FORMAT)
+
+    def format_epoch(self, value: float, unit: str = "s", tz: str = None) -> str:
+        """
+        Formats one epoch timestamp as "YYYY-MM-DD HH:MM:SS".
+
+        Args:
+            value (float): An epoch timestamp.
+            unit (str, optional): "s", "ms", "us" or "ns". Defaults to "s".
+            tz (str, optional): Time zone whose wall clock time is returned. Defaults to UTC.
+
+        Returns:
+            str: The formatted timestamp.
+        """
+        return datetime.fromtimestamp(
+            value / EPOCH_SCALE[unit], _timezone(tz)
+        ).strftime(DATETIME_FORMAT)
+
+    def iter_pages(
+        self,
+        fetch_page: Callable[[int], List[dict]],
+        start_page: int = 0,
+        prefetch: int = 4,
+        max_pages: int = None,
+    ) -> Iterator[Tuple[int, List[dict]]]:
+        """
+        Yields (page, records) in page order while the next pages are fetched in the
+        background. Stops at the first empty page, after max_pages, or when the caller
+        stops iterating; pages not yet started are then cancelled.
+
+        Args:
+            fetch_page (Callable[[int], List[dict]]): Returns the raw records of one page.
+            start_page (int, optional): The first page. Defaults to 0.
+            prefetch (int, optional): Pages requested ahead of the consumer. Defaults to 4.
+            max_pages (int, optional): The maximum number of pages. Defaults to no limit.
+
+        Yields:
+            Tuple[int, List[dict]]: The page number and its records.
+        """
+        end_page = None if max_pages is None else start_page + max_pages
+        pending = deque()
+        next_page = start_page
+
+        with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            try:
+                while True:
+                    while len(pending) < max(prefetch, 1) and (
+                        end_page is None or next_page < end_page
+                    ):
+                        pending.append(
+                            (next_page, executor.submit(fetch_page, next_page))
+                        )
+                        next_page += 1
+
+                    if not pending:
+                        return
+
+                    page, future = pending.popleft()
+                    records = future.result()
+                    if not records:
+                        return
+
+                    yield page, records
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def iter_feed(
+        self,
+        fetch_page: Callable[[int], List[dict]],
+        shape: Callable[[List[dict]], pd.DataFrame],
+        keys: List[str],
+        date_column: str,
+        cutoff: str = None,
+        seen: Set[tuple] = None,
+        start_page: int = 0,
+        prefetch: int = 4,
+        max_pages: int = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams a newest-first paged feed as typed DataFrames, one per page. Rows already
+        yielded on an earlier page are dropped. Iteration stops at the first empty page,
+        at the first page reaching past cutoff, or at the first page containing a key
+        from seen. New keys are added to seen, so the same set can drive the next
+        incremental run.
+
+        Args:
+            fetch_page (Callable[[int], List[dict]]): Returns the raw records of one page.
+            shape (Callable[[List[dict]], pd.DataFrame]): Turns raw records into a typed frame.
+            keys (List[str]): Columns identifying an item.
+            date_column (str): The datetime column compared against cutoff.
+            cutoff (str, optional): Oldest date to keep, e.g. "2024-01-01". Defaults to None.
+            seen (Set[tuple], optional): Keys of items already processed. Defaults to None.
+            start_page (int, optional): The first page. Defaults to 0.
+            prefetch (int, optional): Pages requested ahead of the consumer. Defaults to 4.
+            max_pages (int, optional): The maximum number of pages. Defaults to no limit.
+
+        Yields:
+            pd.DataFrame: The new rows of each page.
+        """
+        cutoff = pd.Timestamp(cutoff) if cutoff else None
+        emitted = set()
+
+        for _, records in self.iter_pages(fetch_page, start_page, prefetch, max_pages):
+            data_df = shape(records)
+            page_keys = list(data_df[keys].itertuples(index=False, name=None))
+
+            reached_seen = seen is not None and any(k in seen for k in page_keys)
+            fresh = [
+                k not in emitted and (seen is None or k not in seen) for k in page_keys
+            ]
+            data_df = data_df[fresh]
+
+            reached_cutoff = False
+            if cutoff is not None:
+                reached_cutoff = bool((data_df[date_column] < cutoff).any())
+                data_df = data_df[data_df[date_column] >= cutoff]
+
+            new_keys = list(data_df[keys].itertuples(index=False, name=None))
+            emitted.update(new_keys)
+            if seen is not None:
+                seen.update(new_keys)
+
+            if not data_df.empty:
+                yield data_df.reset_index(drop=True)
+
+            if reached_seen or reached_cutoff:
+                return
+
+    def get_calendar_request(
+        self,
+        url: str,
+        from_date: str,
+        to_date: str,
+        keys: Tuple[str, ...] = ("symbol", "date"),
+        window_days: int = CALENDAR_WINDOW_DAYS,
+        max_workers: int = 4,
+        cache: bool = True,
+    ) -> List[dict]:
+        """
+        Fetches a from/to calendar endpoint in windows of at most window_days, several
+        windows at a time, and returns the records in window order without duplicates.
+        A window returning CALENDAR_ROW_LIMIT rows or more is assumed truncated and is
+        fetched again in halves. Windows lie on a fixed grid of window_days counted from
+        1970-01-01, with only the first and last clipped to the range. Windows that
+        ended more than CALENDAR_CACHE_GRACE_DAYS ago are cached for CALENDAR_CACHE_TTL
+        seconds, so overlapping backfills only request the missing windows while late
+        revisions (reported figures, moved dates) are still picked up.
+        clear_calendar_cache empties the cache.
+
+        Args:
+            url (str): The calendar endpoint.
+            from_date (str): The first date in "YYYY-MM-DD" format.
+            to_date (str): The last date in "YYYY-MM-DD" format.
+            keys (Tuple[str, ...], optional): Record fields identifying an event.
+                Defaults to ("symbol", "date").
+            window_days (int, optional): The longest span of one request. Defaults to 90.
+            max_workers (int, optional): Concurrent requests. Defaults to 4.
+            cache (bool, optional): Read and keep cached windows. Defaults to True.
+
+        Returns:
+            List[dict]: The raw records of every window.
+        """
+        settled = date.today() - timedelta(days=CALENDAR_CACHE_GRACE_DAYS)
+
+        def fetch(start: date, end: date) -> List[dict]:
+            cache_key = (self.base_url, url, start, end)
+            with _calendar_cache_lock:
+                if cache and cache_key in _calendar_cache:
+                    stored_at, records = _calendar_cache[cache_key]
+                    if time.monotonic() - stored_at < CALENDAR_CACHE_TTL:
+                        _calendar_cache.move_to_end(cache_key)
+                        return records
+                    del _calendar_cache[cache_key]
+
+            records = self.get_request(
+                url, {"from": start.isoformat(), "to": end.isoformat()}
+            )
+            if not isinstance(records, list):
+                records = []
+
+            if len(records) >= CALENDAR_ROW_LIMIT and start < end:
+                middle = start + (end - start) // 2
+                records = fetch(start, middle) + fetch(middle + timedelta(days=1), end)
+
+            if cache and end < settled:
+                with _calendar_cache_lock:
+                    _calendar_cache[cache_key] = (time.monotonic(), records)
+                    while len(_calendar_cache) > CALENDAR_CACHE_SIZE:
+                        _calendar_cache.popitem(last=False)
+
+            return records
+
+        start = date.fromisoformat(from_date)
+        end = date.fromisoformat(to_date)
+        epoch = date(1970, 1, 1)
+        grid = epoch + timedelta(days=(start - epoch).days // window_days * window_days)
+        windows = []
+        while grid <= end:
+            window_end = grid + timedelta(days=window_days - 1)
+            windows.append((max(grid, start), min(window_end, end)))
+            grid = window_end + timedelta(days=1)
+
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            pages = list(executor.map(lambda window: fetch(*window), windows))
+
+        seen = set()
+        records = []
+        for page in pages:
+            for record in page:
+                key = tuple(record.get(k) for k in keys)
+                if key not in seen:
+                    seen.add(key)
+                    records.append(record)
+
+        return records
+
     def get_request(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Make a GET request to the specified URL with the given parameters.
@@ -76,7 +467,7 @@ class FmpBase:
         """
         params = params or {}
         params["apikey"] = self.api_key
-        full_url = f"{FMP_BASE_URL}{url}"
+        full_url = f"{self.base_url}{url}"
 
         try:
             response = self.session.get(full_url, params=params)
@@ -0,0 +1,404 @@
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_financial_statements import FmpFinancialStatements
+from fmp_py.fmp_historical_data import FmpHistoricalData
+from fmp_py.fmp_statement_analysis import FmpStatementAnalysis
+
+
+"""
+The FmpBulkExport class downloads datasets for a universe of symbols to Parquet files
+partitioned by dataset and symbol, with bounded concurrency and an optional request rate.
+Every finished (dataset, symbol) is appended to a checkpoint file after its Parquet file is
+in place, so an interrupted export started again with the same arguments resumes where it
+stopped.
+
+def export(self, symbols: List[str], datasets: List[str] = None, period: str = "annual", limit: int = 20, from_date: str = None, to_date: str = None) -> pd.DataFrame:
+    Downloads every (dataset, symbol) not yet in the checkpoint.
+
+def progress(self) -> pd.DataFrame:
+    Returns the latest checkpoint entry of every (dataset, symbol).
+
+def read(self, dataset: str, symbols: List[str] = None) -> pd.DataFrame:
+    Reads an exported dataset back into one frame.
+
+Run from the command line with:
+    python -m fmp_py.fmp_bulk_export --symbols-file universe.txt --datasets income ratios --path export
+"""
+
+
+class FmpBulkExport(FmpBase):
+    DATASETS = {
+        "daily_history": ("history_client", "daily_history"),
+        "income": ("statements_client", "income_statements"),
+        "balance_sheet": ("statements_client", "balance_sheet_statements"),
+        "cashflow": ("statements_client", "cashflow_statements"),
+        "ratios": ("analysis_client", "ratios"),
+        "key_metrics": ("analysis_client", "key_metrics"),
+        "financial_growth": ("analysis_client", "financial_growth"),
+        "income_growth": ("analysis_client", "income_growth"),
+        "balance_sheet_growth": ("analysis_client", "balance_sheet_growth"),
+        "cashflow_growth": ("analysis_client", "cashflow_growth"),
+    }
+    CHECKPOINT = "_checkpoint.jsonl"
+    FINISHED = ("done", "empty")
+
+    def __init__(
+        self,
+        path: str = "fmp_export",
+        max_workers: int = 4,
+        calls_per_minute: int = None,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> None:
+        """
+        Initialize the FmpBulkExport class.
+
+        Args:
+            path (str, optional): The export directory. Defaults to "fmp_export".
+            max_workers (int, optional): Concurrent downloads. Defaults to 4.
+            calls_per_minute (int, optional): The most requests to start per minute, e.g.
+                the limit of the API plan. Defaults to None, which does not pace requests.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.path = path
+        self.max_workers = max_workers
+        self.calls_per_minute = calls_per_minute
+        self.history_client = FmpHistoricalData(api_key)
+        self.statements_client = FmpFinancialStatements(api_key)
+        self.analysis_client = FmpStatementAnalysis(api_key)
+
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+
+    ############################
+    # Export
+    ############################
+    def export(
+        self,
+        symbols: List[str],
+        datasets: List[str] = None,
+        period: str = "annual",
+        limit: int = 20,
+        from_date: str = None,
+        to_date: str = None,
+    ) -> pd.DataFrame:
+        """
+        Downloads every (dataset, symbol) that the checkpoint does not already record as
+        done or empty for the same request parameters. Each one is written to
+        <path>/<dataset>/symbol=<symbol>/part-0.parquet and then appended to the
+        checkpoint. A symbol the API has no data for is recorded as empty; any other
+        failure is recorded as an error and retried on the next run.
+
+        Args:
+            symbols (List[str]): The universe.
+            datasets (List[str], optional): Datasets to export, see DATASETS. Defaults to
+                the income, balance sheet and cash flow statements.
+            period (str, optional): "annual" or "quarter" for statement datasets. Defaults to "annual".
+            limit (int, optional): Periods per symbol for statement datasets. Defaults to 20.
+            from_date (str, optional): Start date for daily_history, 'YYYY-MM-DD'.
+            to_date (str, optional): End date for daily_history, 'YYYY-MM-DD'.
+
+        Returns:
+            pd.DataFrame: One row per (dataset, symbol) with its status ("done", "empty",
+                "error" or "skipped" when resumed) and the rows written.
+
+        Raises:
+            ValueError: If symbols is not a list, or a dataset, period or date range is invalid.
+            ImportError: If no Parquet engine is installed.
+        """
+        if isinstance(symbols, str):
+            raise ValueError("symbols must be a list of symbols")
+
+        datasets = datasets or ["income", "balance_sheet", "cashflow"]
+        for dataset in datasets:
+            self._validate_dataset(dataset)
+
+        if period not in ["annual", "quarter"]:
+            raise ValueError("Period must be either 'annual' or 'quarter'")
+
+        if "daily_history" in datasets and not (from_date and to_date):
+            raise ValueError("from_date and to_date are required for daily_history")
+
+        if not any(
+            importlib.util.find_spec(engine) for engine in ["pyarrow", "fastparquet"]
+        ):
+            raise ImportError(
+                "Parquet export needs pyarrow. Install it with 'pip install fmp-py[arrow]'."
+            )
+
+        os.makedirs(self.path, exist_ok=True)
+        finished = self._finished()
+
+        results = []
+        tasks = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for dataset in dict.fromkeys(datasets):
+                request = self._request(dataset, period, limit, from_date, to_date)
+                for symbol in dict.fromkeys(symbols):
+                    if finished.get((dataset, symbol)) == request:
+                        results.append(
+                            {
+                                "dataset": dataset,
+                                "symbol": symbol,
+                                "status": "skipped",
+                                "rows": 0,
+                            }
+                        )
+                        continue
+
+                    future = executor.submit(self._export_one, dataset, symbol, request)
+                    tasks[future] = (dataset, symbol)
+
+            for future in as_completed(tasks):
+                results.append(future.result())
+
+        return (
+            pd.DataFrame(results, columns=["dataset", "symbol", "status", "rows"])
+            .astype({"dataset": "str", "symbol": "str", "status": "str", "rows": "int"})
+            .sort_values(by=["dataset", "symbol"], ascending=True)
+            .reset_index(drop=True)
+        )
+
+    ############################
+    # Progress
+    ############################
+    def progress(self) -> pd.DataFrame:
+        """
+        Returns the latest checkpoint entry of every (dataset, symbol).
+
+        Returns:
+            pd.DataFrame: Columns dataset, symbol, status, rows, error and the request parameters.
+        """
+        entries = {}
+        for entry in self._entries():
+            entries[(entry["dataset"], entry["symbol"])] = entry
+
+        columns = ["dataset", "symbol", "status", "rows", "error", "request"]
+        data_df = pd.DataFrame(list(entries.values()), columns=columns)
+        return data_df.sort_values(by=["dataset", "symbol"]).reset_index(drop=True)
+
+    ############################
+    # Read
+    ############################
+    def read(self, dataset: str, symbols: List[str] = None) -> pd.DataFrame:
+        """
+        Reads an exported dataset back into one frame.
+
+        Args:
+            dataset (str): The dataset, see DATASETS.
+            symbols (List[str], optional): Only read these symbols. Defaults to all.
+
+        Returns:
+            pd.DataFrame: The exported rows with a symbol column.
+
+        Raises:
+            ValueError: If the dataset is invalid or nothing was exported for it.
+        """
+        self._validate_dataset(dataset)
+        wanted = set(symbols) if symbols is not None else None
+
+        frames = []
+        pattern = os.path.join(self.path, dataset, "symbol=*", "part-0.parquet")
+        for file in sorted(glob.glob(pattern)):
+            symbol = unquote(os.path.basename(os.path.dirname(file))[len("symbol=") :])
+            if wanted is None or symbol in wanted:
+                frames.append(pd.read_parquet(file))
+
+        if not frames:
+            raise ValueError(f"No exported data found for {dataset}.")
+
+        return pd.concat(frames, ignore_index=True)
+
+    ############################
+    # Export One
+    ############################
+    def _export_one(self, dataset: str, symbol: str, request: Dict) -> Dict:
+        """
+        Fetches, writes and checkpoints one (dataset, symbol).
+        """
+        client, method = self.DATASETS[dataset]
+        fetch = getattr(getattr(self, client), method)
+
+        entry = {"dataset": dataset, "symbol": symbol, "request": request}
+        try:
+            self._throttle()
+            try:
+                if dataset == "daily_history":
+                    data_df = fetch(symbol, request["from_date"], request["to_date"])
+                    data_df = data_df.reset_index()
+                else:
+                    data_df = fetch(
+                        symbol, period=request["period"], limit=request["limit"]
+                    )
+            except ValueError as error:
+                if not self._no_data(error):
+                    raise
+                data_df = None
+
+            if data_df is None or data_df.empty:
+                entry.update(status="empty", rows=0)
+            else:
+                if "symbol" not in data_df.columns:
+                    data_df.insert(0, "symbol", symbol)
+
+                self._write(dataset, symbol, data_df)
+                entry.update(status="done", rows=len(data_df))
+        except Exception as error:
+            entry.update(status="error", rows=0, error=repr(error))
+
+        self._checkpoint(entry)
+        return {key: entry[key] for key in ["dataset", "symbol", "status", "rows"]}
+
+    @staticmethod
+    def _no_data(error: ValueError) -> bool:
+        """
+        Whether an error is a client's "No data found" answer rather than a failure, such
+        as a ValueError subclass raised while casting or writing a frame.
+        """
+        return type(error) is ValueError and str(error).startswith("No data found")
+
+    def _write(self, dataset: str, symbol: str, data_df: pd.DataFrame) -> None:
+        """
+        Writes one partition through a temporary file, so a partition on disk is always complete.
+        """
+        directory = os.path.join(self.path, dataset, f"symbol={quote(symbol, safe='')}")
+        os.makedirs(directory, exist_ok=True)
+
+        file = os.path.join(directory, "part-0.parquet")
+        partial = f"{file}.{threading.get_ident()}.tmp"
+        data_df.to_parquet(partial, index=False)
+        os.replace(partial, file)
+
+    def _throttle(self) -> None:
+        """
+        Waits for the next request slot when calls_per_minute is set.
+        """
+        if not self.calls_per_minute:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_call)
+            self._next_call = start + 60.0 / self.calls_per_minute
+
+        if start > now:
+            time.sleep(start - now)
+
+    ############################
+    # Checkpoint
+    ############################
+    def _checkpoint(self, entry: Dict) -> None:
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            with open(os.path.join(self.path, self.CHECKPOINT), "a") as file:
+                file.write(line)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def _entries(self) -> List[Dict]:
+        """
+        Returns the checkpoint entries, skipping a last line cut short by a crash.
+        """
+        path = os.path.join(self.path, self.CHECKPOINT)
+        if not os.path.exists(path):
+            return []
+
+        entries = []
+        with open(path) as file:
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def _finished(self) -> Dict:
+        """
+        Returns the request of every (dataset, symbol) whose latest entry is done or empty.
+        """
+        finished = {}
+        for entry in self._entries():
+            key = (entry["dataset"], entry["symbol"])
+            if entry["status"] in self.FINISHED:
+                finished[key] = entry["request"]
+            else:
+                finished.pop(key, None)
+        return finished
+
+    def _request(
+        self, dataset: str, period: str, limit: int, from_date: str, to_date: str
+    ) -> Dict:
+        """
+        Returns the parameters that identify a download of a dataset.
+        """
+        if dataset == "daily_history":
+            return {"from_date": from_date, "to_date": to_date}
+        return {"period": period, "limit": limit}
+
+    def _validate_dataset(self, dataset: str) -> None:
+        if dataset not in self.DATASETS:
+            raise ValueError(
+                f"Invalid dataset. Allowed datasets: {', '.join(self.DATASETS)}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export FMP datasets to Parquet.")
+    parser.add_argument("--symbols", nargs="*", default=[])
+    parser.add_argument(
+        "--symbols-file", default=None, help="A file with one symbol per line."
+    )
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        default=["income", "balance_sheet", "cashflow"],
+        choices=list(FmpBulkExport.DATASETS),
+    )
+    parser.add_argument("--path", default="fmp_export")
+    parser.add_argument("--period", default="annual", choices=["annual", "quarter"])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--from-date", default=None)
+    parser.add_argument("--to-date", default=None)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--calls-per-minute", type=int, default=None)
+    args = parser.parse_args()
+
+    symbols = list(args.symbols)
+    if args.symbols_file:
+        with open(args.symbols_file) as file:
+            symbols += [line.strip() for line in file if line.strip()]
+    if not symbols:
+        parser.error("no symbols given")
+
+    exporter = FmpBulkExport(
+        path=args.path,
+        max_workers=args.workers,
+        calls_per_minute=args.calls_per_minute,
+    )
+    results = exporter.export(
+        symbols,
+        datasets=args.datasets,
+        period=args.period,
+        limit=args.limit,
+        from_date=args.from_date,
+        to_date=args.to_date,
+    )
+    print(results["status"].value_counts().to_string())
+    return 1 if (results["status"] == "error").any() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,59 +1,10 @@
+import numpy as np
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
+from typing import Iterable, Union
 
 from fmp_py.fmp_historical_data import FmpHistoricalData
-from ta.trend import (
-    SMAIndicator,
-    EMAIndicator,
-    WMAIndicator,
-    ADXIndicator,
-    MACD,
-    VortexIndicator,
-    TRIXIndicator,
-    MassIndex,
-    CCIIndicator,
-    DPOIndicator,
-    KSTIndicator,
-    # IchimokuIndicator,
-    # PSARIndicator,
-    # STCIndicator,
-    # AroonIndicator,
-)
-from ta.momentum import (
-    RSIIndicator,
-    StochRSIIndicator,
-    StochasticOscillator,
-    TSIIndicator,
-    UltimateOscillator,
-    WilliamsRIndicator,
-    AwesomeOscillatorIndicator,
-    KAMAIndicator,
-    ROCIndicator,
-    # PercentagePriceOscillator,
-    # PercentageVolumeOscillator,
-)
-from ta.volume import (
-    VolumeWeightedAveragePrice,
-    MFIIndicator,
-    AccDistIndexIndicator,
-    OnBalanceVolumeIndicator,
-    ChaikinMoneyFlowIndicator,
-    ForceIndexIndicator,
-    EaseOfMovementIndicator,
-    VolumePriceTrendIndicator,
-    NegativeVolumeIndexIndicator,
-)
-from ta.volatility import (
-    AverageTrueRange,
-    BollingerBands,
-    # KeltnerChannel,
-    # DonchianChannel,
-    # UlcerIndex,
-)
-
-load_dotenv()
 
 
 class FmpChartData(FmpBase):
@@ -70,6 +21,26 @@ class FmpChartData(FmpBase):
             symbol=symbol, interval=interval, from_date=from_date, to_date=to_date
         )
 
+    @classmethod
+    def from_chart(
+        cls, chart: pd.DataFrame, api_key: str = os.getenv("FMP_API_KEY")
+    ) -> "FmpChartData":
+        """
+        Creates an FmpChartData from price data already on hand, without a request.
+
+        Args:
+            chart (pd.DataFrame): Bars with open, high, low, close and volume columns,
+                oldest first, as returned by FmpHistoricalData.intraday_history.
+            api_key (str): The API key for Financial Modeling Prep.
+
+        Returns:
+            FmpChartData: The chart data, holding a copy of chart.
+        """
+        chart_data = cls.__new__(cls)
+        FmpBase.__init__(chart_data, api_key)
+        chart_data.chart = chart.copy()
+        return chart_data
+
     ##########################################################################
     ########################### VOLUME INDICATORS ############################
     ##########################################################################
@@ -97,6 +68,8 @@ class FmpChartData(FmpBase):
             >>> fmp.nvi()
             >>> print(fmp.return_chart())
         """
+        from ta.volume import NegativeVolumeIndexIndicator
+
         chart = self.chart.copy()
         chart["nvi"] = (
             NegativeVolumeIndexIndicator(
@@ -130,6 +103,8 @@ class FmpChartData(FmpBase):
             >>> fmp.vpt()
             >>> print(fmp.return_chart())
         """
+        from ta.volume import VolumePriceTrendIndicator
+
         chart = self.chart.copy()
         chart["vpt"] = (
             VolumePriceTrendIndicator(
@@ -154,6 +129,8 @@ class FmpChartData(FmpBase):
             None
 
         """
+        from ta.volume import EaseOfMovementIndicator
+
         chart = self.chart.copy()
         chart[f"sma_eom{period}"] = (
             EaseOfMovementIndicator(
@@ -192,6 +169,8 @@ class FmpChartData(FmpBase):
             >>> fmp.eom(14)
             >>> print(fmp.return_chart())
         """
+        from ta.volume import EaseOfMovementIndicator
+
         chart = self.chart.copy()
         chart[f"eom{period}"] = (
             EaseOfMovementIndicator(
@@ -229,6 +208,8 @@ class FmpChartData(FmpBase):
             >>> fmp.fi(13)
             >>> print(fmp.return_chart())
         """
+        from ta.volume import ForceIndexIndicator
+
         chart = self.chart.copy()
         chart[f"fi{period}"] = (
             ForceIndexIndicator(
@@ -257,6 +238,8 @@ class FmpChartData(FmpBase):
             >>> fmp.cmf()
             >>> print(fmp.return_chart())
         """
+        from ta.volume import ChaikinMoneyFlowIndicator
+
         chart = self.chart.copy()
         chart["cmf"] = (
             ChaikinMoneyFlowIndicator(
@@ -291,6 +274,8 @@ class FmpChartData(FmpBase):
             >>> fmp.obv()
             >>> print(fmp.return_chart())
         """
+        from ta.volume import OnBalanceVolumeIndicator
+
         chart = self.chart.copy()
         chart["obv"] = (
             OnBalanceVolumeIndicator(
@@ -320,6 +305,8 @@ class FmpChartData(FmpBase):
             >>> fmp.adi(14)
             >>> print(fmp.return_chart())
         """
+        from ta.volume import AccDistIndexIndicator
+
         chart = self.chart.copy()
         chart[f"adi{period}"] = (
             AccDistIndexIndicator(
@@ -355,6 +342,8 @@ class FmpChartData(FmpBase):
             >>> fmp.mfi(14)
             >>> print(fmp.return_chart())
         """
+        from ta.volume import MFIIndicator
+
         chart = self.chart.copy()
         chart[f"mfi{period}"] = (
             MFIIndicator(
@@ -391,6 +380,8 @@ class FmpChartData(FmpBase):
             >>> fmp.vwap()
             >>> print(fmp.return_chart())
         """
+        from ta.volume import VolumeWeightedAveragePrice
+
         chart = self.chart.copy()
         chart["vwap"] = (
             VolumeWeightedAveragePrice(
@@ -405,6 +396,152 @@ class FmpChartData(FmpBase):
         ).astype(float)
         self.chart = chart
 
+    #################################
+    # Session Anchored VWAP
+    #################################
+    def session_vwap(self, session_start: str = "00:00") -> None:
+        """
+        Calculates the VWAP from the first bar of each trading session, as intraday desks
+        use it, instead of over a rolling window or the whole range.
+
+        Args:
+            session_start (str): Wall-clock time at which sessions start, e.g. "18:00" for
+                futures that open the evening before. Default is "00:00", one session per
+                calendar day.
+
+        Returns:
+            None
+
+        Modifies:
+            Adds a 'session_vwap' column to the chart.
+
+        Example:
+            >>> fmp = FmpChartData(symbol="AAPL", from_date="2024-01-02", to_date="2024-01-05", interval="5min")
+            >>> fmp.session_vwap()
+            >>> print(fmp.return_chart())
+        """
+        from fmp_py.fmp_anchored import FmpAnchoredVwap
+
+        chart = self.chart.copy()
+        chart["session_vwap"] = (
+            FmpAnchoredVwap(session_start=session_start)
+            .update(chart)["vwap"]
+            .round(2)
+            .astype(float)
+        )
+        self.chart = chart
+
+    #################################
+    # Event Anchored VWAP
+    #################################
+    def anchored_vwap(self, anchors) -> None:
+        """
+        Calculates the VWAP from each anchor event, such as an earnings release or a
+        swing low, until the next one. Bars before the first anchor have no value.
+
+        Args:
+            anchors: A boolean column name, a boolean Series or array aligned with the
+                chart, or a list of timestamps, each of which anchors the first bar at or
+                after it.
+
+        Returns:
+            None
+
+        Modifies:
+            Adds an 'anchored_vwap' column to the chart.
+
+        Example:
+            >>> fmp = FmpChartData(symbol="AAPL", from_date="2024-01-01", to_date="2024-06-30")
+            >>> fmp.anchored_vwap(["2024-02-01", "2024-05-02"])
+            >>> print(fmp.return_chart())
+        """
+        from fmp_py.fmp_anchored import FmpAnchoredVwap, anchor_mask
+
+        chart = self.chart.copy()
+        starts = anchor_mask(chart.index, anchors, chart)
+        vwap = (
+            FmpAnchoredVwap(session_start=None)
+            .update(chart, starts)["vwap"]
+            .round(2)
+            .astype(float)
+        )
+        vwap[np.cumsum(starts) == 0] = np.nan
+        chart["anchored_vwap"] = vwap
+        self.chart = chart
+
+    #################################
+    # Cumulative Delta
+    #################################
+    def cumulative_delta(self, session_start: str = "00:00") -> None:
+        """
+        Calculates the cumulative volume delta of each trading session. Bars carry no
+        aggressor side, so each bar counts its volume as bought when it closes above its
+        open and as sold when it closes below.
+
+        Args:
+            session_start (str): Wall-clock time at which sessions start. Default is
+                "00:00". None accumulates over the whole chart.
+
+        Returns:
+            None
+
+        Modifies:
+            Adds a 'cumulative_delta' column to the chart.
+
+        Example:
+            >>> fmp = FmpChartData(symbol="AAPL", from_date="2024-01-02", to_date="2024-01-05", interval="5min")
+            >>> fmp.cumulative_delta()
+            >>> print(fmp.return_chart())
+        """
+        from fmp_py.fmp_anchored import FmpAnchoredVwap
+
+        chart = self.chart.copy()
+        chart["cumulative_delta"] = (
+            FmpAnchoredVwap(session_start=session_start)
+            .update(chart)["cumulative_delta"]
+            .astype(float)
+        )
+        self.chart = chart
+
+    #################################
+    # Volume Profile
+    #################################
+    def volume_profile(
+        self, step: float = None, bins: int = 24, session_start: str = "00:00"
+    ) -> pd.DataFrame:
+        """
+        Calculates the volume profile of each trading session: the volume and delta
+        traded at each price level, from each bar's typical price. The chart is not
+        modified.
+
+        Args:
+            step (float): Price per level. Default is None, which splits the range of the
+                whole chart into bins levels.
+            bins (int): Levels across the chart's range when step is None. Default is 24.
+            session_start (str): Wall-clock time at which sessions start. Default is
+                "00:00". None gives one profile for the whole chart.
+
+        Returns:
+            pd.DataFrame: volume and delta indexed by anchor, the first bar of the session,
+                and price, the lower edge of the level.
+
+        Example:
+            >>> fmp = FmpChartData(symbol="AAPL", from_date="2024-01-02", to_date="2024-01-05", interval="5min")
+            >>> profile = fmp.volume_profile(step=0.25)
+            >>> print(profile.groupby(level="anchor")["volume"].idxmax())  # point of control
+        """
+        from fmp_py.fmp_anchored import session_mask, volume_profile
+
+        if step is None:
+            span = self.chart["high"].max() - self.chart["low"].min()
+            step = span / bins if span > 0 else 1.0
+        if step <= 0:
+            raise ValueError("step must be positive")
+
+        return volume_profile(
+            self.chart, step, session_mask(self.chart.index, session_start)
+        )
+
     ##########################################################################
     ######################## VOLATILITY INDICATORS ###########################
     ##########################################################################
@@ -431,6 +568,8 @@ class FmpChartData(FmpBase):
             >>> fmp.bb(20, 2)
             >>> print(fmp.return_chart())
         """
+        from ta.volatility import BollingerBands
+
         chart = self.chart.copy()
 
         # Bollinger Channel High Band
@@ -543,6 +682,8 @@ class FmpChartData(FmpBase):
             >>> fmp.atr(14)
             >>> print(fmp.return_chart())
         """
+        from ta.volatility import AverageTrueRange
+
         chart = self.chart.copy()
         chart[f"atr{period}"] = (
             AverageTrueRange(
@@ -585,6 +726,9 @@ class FmpChartData(FmpBase):
         Returns:
             None
         """
+        from ta.momentum import RSIIndicator
+        from ta.trend import EMAIndicator
+
         chart = self.chart.copy()
         chart["short_term_xtrender"] = (
             RSIIndicator(
@@ -666,6 +810,8 @@ class FmpChartData(FmpBase):
             >>> fmp.kst(10, 15, 20, 30, 10, 10, 10, 15, 9)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import KSTIndicator
+
         chart = self.chart.copy()
 
         chart["kst"] = (
@@ -729,6 +875,8 @@ class FmpChartData(FmpBase):
             >>> fmp.dpo(20)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import DPOIndicator
+
         chart = self.chart.copy()
         chart[f"dpo{period}"] = (
             DPOIndicator(
@@ -765,6 +913,8 @@ class FmpChartData(FmpBase):
             >>> fmp.cci(14, 0.015)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import CCIIndicator
+
         chart = self.chart.copy()
         chart[f"cci{period}"] = (
             CCIIndicator(
@@ -810,6 +960,8 @@ class FmpChartData(FmpBase):
             >>> print(fmp.return_chart())
 
         """
+        from ta.trend import MassIndex
+
         chart = self.chart.copy()
         chart["mi"] = (
             MassIndex(
@@ -849,6 +1001,8 @@ class FmpChartData(FmpBase):
             >>> fmp.trix(14)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import TRIXIndicator
+
         chart = self.chart.copy()
         chart[f"trix{period}"] = (
             TRIXIndicator(
@@ -881,6 +1035,8 @@ class FmpChartData(FmpBase):
         >>> fmp.vi(14)
         >>> print(fmp.return_chart())
         """
+        from ta.trend import VortexIndicator
+
         chart = self.chart.copy()
         chart[f"vi{period}"] = (
             VortexIndicator(
@@ -919,6 +1075,8 @@ class FmpChartData(FmpBase):
             >>> fmp.macd(12, 26, 9)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import MACD
+
         chart = self.chart.copy()
         chart["macd"] = (
             MACD(
@@ -988,6 +1146,9 @@ class FmpChartData(FmpBase):
             >>> fmp.waddah_attar_explosion(n_fast=20, n_slow=40, channel_period=20, mul=2.0, sensitivity=150)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import EMAIndicator
+        from ta.volatility import BollingerBands
+
         df = self.chart.copy()
 
         # Calculate the MACD
@@ -1045,6 +1206,7 @@ class FmpChartData(FmpBase):
             >>> fmp.adx(14)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import ADXIndicator
 
         chart = self.chart.copy()
         chart[f"adx{period}"] = (
@@ -1104,6 +1266,8 @@ class FmpChartData(FmpBase):
             >>> fmp.wma(14)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import WMAIndicator
+
         chart = self.chart.copy()
         chart[f"wma{period}"] = (
             WMAIndicator(
@@ -1135,6 +1299,8 @@ class FmpChartData(FmpBase):
             >>> fmp.sma(14)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import SMAIndicator
+
         chart = self.chart.copy()
         chart[f"sma{period}"] = (
             SMAIndicator(
@@ -1165,6 +1331,8 @@ class FmpChartData(FmpBase):
             >>> fmp.ema(14)
             >>> print(fmp.return_chart())
         """
+        from ta.trend import EMAIndicator
+
         chart = self.chart.copy()
         chart[f"ema{period}"] = (
             EMAIndicator(close=chart["close"], window=period, fillna=True)
@@ -1195,6 +1363,8 @@ class FmpChartData(FmpBase):
             >>> fmp.rsi(14)
             >>> print(fmp.return_chart())
         """
+        from ta.momentum import RSIIndicator
+
         chart = self.chart.copy()
         chart[f"rsi{period}"] = (
             RSIIndicator(close=chart["close"], window=period, fillna=True)
@@ -1216,6 +1386,7 @@ class FmpChartData(FmpBase):
         Returns:
             None
         """
+        from ta.momentum import StochRSIIndicator
 
         chart = self.chart.copy()
         chart[f"srsi{period}"] = (
@@ -1275,6 +1446,8 @@ class FmpChartData(FmpBase):
             >>> fmp.stoch(14, 3)
             >>> print(fmp.return_chart())
         """
+        from ta.momentum import StochasticOscillator
+
         chart = self.chart.copy()
         chart[f"stoch{period}"] = (
             StochasticOscillator(
@@ -1321,6 +1494,8 @@ class FmpChartData(FmpBase):
             >>> fmp.tsi(25, 13)
             >>> print(fmp.return_chart())
         """
+        from ta.momentum import TSIIndicator
+
         chart = self.chart.copy()
         chart["tsi"] = (
             TSIIndicator(
@@ -1364,6 +1539,8 @@ class FmpChartData(FmpBase):
             >>> fmp.uo(7, 14, 28, 4.0, 2.0, 1.0)
             >>> print(fmp.return
         """
+        from ta.momentum import UltimateOscillator
+
         chart = self.chart.copy()
         chart["uo"] = (
             UltimateOscillator(
@@ -1400,6 +1577,8 @@ class FmpChartData(FmpBase):
             >>> fmp.wr(14)
             >>> print(fmp.return_chart())
         """
+        from ta.momentum import WilliamsRIndicator
+
         chart = self.chart.copy()
         chart[f"wr{period}"] = (
             WilliamsRIndicator(
@@ -1432,6 +1611,8 @@ class FmpChartData(FmpBase):
             >>> fmp.ao(5, 34)
             >>> print(fmp.return_chart())
         """
+        from ta.momentum import AwesomeOscillatorIndicator
+
         chart = self.chart.copy()
         chart["ao"] = (
             AwesomeOscillatorIndicator(
@@ -1465,6 +1646,8 @@ class FmpChartData(FmpBase):
             >>> fmp.kama(10, 2, 30)
             >>> print(fmp.return_chart
         """
+        from ta.momentum import KAMAIndicator
+
         chart = self.chart.copy()
         chart[f"kama{period}"] = (
             KAMAIndicator(
@@ -1496,6 +1679,8 @@ class FmpChartData(FmpBase):
             >>> fmp.roc(12)
             >>> print(fmp.return_chart())
         """
+        from ta.momentum import ROCIndicator
+
         chart = self.chart.copy()
         chart[f"roc{period}"] = (
             ROCIndicator(
@@ -1509,5 +1694,66 @@ class FmpChartData(FmpBase):
 
         self.chart = chart
 
+    #####################################
+    # Parameter Sweep
+    #####################################
+    def sweep(
+        self,
+        indicator: str,
+        periods: Iterable[int],
+        wide: bool = True,
+        decimals: int = 2,
+        **kwargs,
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Calculates one indicator for many periods at once, e.g. to tune a strategy.
+        Windows are taken from shared prefix sums and exponential averages from one
+        blocked pass of their recursion, so a sweep costs about as much as writing its
+        output. Values match the indicator methods up to floating point rounding.
+        The chart is not modified.
+
+        Args:
+            indicator (str): "sma", "ema", "wma", "rsi", "roc" or "bb".
+            periods (Iterable[int]): The periods, e.g. range(5, 201).
+            wide (bool): Return a DataFrame with one column per period, named like the
+                method's column (sma20, bb_pband20), indexed like the chart. False returns
+                a numpy array of shape (len(periods), len(chart)). Default is True.
+            decimals (int): Decimals to round to, as the methods do. None skips
+                rounding. Default is 2.
+            **kwargs: For "bb", std (default 2) and band: "hband", "mband", "lband",
+                "wband", "pband" (default), "hband_ind" or "lband_ind".
+
+        Returns:
+            Union[pd.DataFrame, np.ndarray]: The indicator for every period.
+
+        Raises:
+            ValueError: If the indicator or band is not supported, a period is below 1
+                or the close column has missing values.
+
+        Example:
+            >>> fmp = FmpChartData(symbol="AAPL", from_date="2021-01-01", to_date="2022-01-01")
+            >>> smas = fmp.sweep("sma", periods=range(5, 201))
+            >>> print(smas["sma50"])
+        """
+        from fmp_py.fmp_sweep import sweep
+
+        periods = list(periods)
+        values = sweep(
+            self.chart["close"].to_numpy(dtype=np.float64),
+            indicator,
+            periods,
+            decimals,
+            **kwargs,
+        )
+        if not wide:
+            return values
+
+        prefix = f"bb_{kwargs.get('band', 'pband')}" if indicator == "bb" else indicator
+        return pd.DataFrame(
+            values.T,
+            index=self.chart.index,
+            columns=[f"{prefix}{period}" for period in periods],
+        )
+
     def return_chart(self) -> pd.DataFrame:
         return self.chart
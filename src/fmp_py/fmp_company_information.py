@@ -16,9 +16,6 @@ from fmp_py.models.company_information import (
 
 from datetime import datetime
 
-from dotenv import load_dotenv
-
-load_dotenv()
 
 CURRENT_DATE = datetime.now().date()
 ONE_YEAR_BACK = CURRENT_DATE.replace(year=CURRENT_DATE.year - 1)
@@ -1,9 +1,83 @@
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+
+AVAILABLE_EXCHANGES = (
+    "AMEX",
+    "AMS",
+    "AQS",
+    "ASX",
+    "ATH",
+    "BER",
+    "BME",
+    "BRU",
+    "BSE",
+    "BUD",
+    "BUE",
+    "CAI",
+    "CBOE",
+    "CNQ",
+    "CPH",
+    "DFM",
+    "DOH",
+    "DUS",
+    "DXE",
+    "ETF",
+    "EURONEXT",
+    "HAM",
+    "HEL",
+    "HKSE",
+    "ICE",
+    "IOB",
+    "IST",
+    "JKT",
+    "JNB",
+    "JPX",
+    "KLS",
+    "KOE",
+    "KSC",
+    "KUW",
+    "LSE",
+    "MCX",
+    "MEX",
+    "MIL",
+    "MUN",
+    "NASDAQ",
+    "NEO",
+    "NIM",
+    "NSE",
+    "NYSE",
+    "NZE",
+    "OEM",
+    "OQB",
+    "OQX",
+    "OSL",
+    "OTC",
+    "PNK",
+    "PRA",
+    "RIS",
+    "SAO",
+    "SAU",
+    "SES",
+    "SET",
+    "SGO",
+    "SHH",
+    "SHZ",
+    "SIX",
+    "STO",
+    "STU",
+    "TAI",
+    "TLV",
+    "TSX",
+    "TSXV",
+    "TWO",
+    "VIE",
+    "VSE",
+    "WSE",
+    "XETRA",
+)
+EXCHANGE_SET = frozenset(AVAILABLE_EXCHANGES)
 
 """
 This class provides methods for searching for companies on Financial Modeling Prep (FMP).
@@ -288,7 +362,7 @@ class FmpCompanySearch(FmpBase):
     def _process_search_data(
         self, url: str, query: str, exchange: str, limit: int
     ) -> pd.DataFrame:
-        if exchange and exchange not in self._available_exchanges():
+        if exchange and exchange not in EXCHANGE_SET:
             raise ValueError(
                 f"Invalid exchange: {exchange}. Please choose from {self._available_exchanges()}."
             )
@@ -326,77 +400,4 @@ class FmpCompanySearch(FmpBase):
         Returns:
             list: A list of available exchanges.
         """
-        return [
-            "AMEX",
-            "AMS",
-            "AQS",
-            "ASX",
-            "ATH",
-            "BER",
-            "BME",
-            "BRU",
-            "BSE",
-            "BUD",
-            "BUE",
-            "CAI",
-            "CBOE",
-            "CNQ",
-            "CPH",
-            "DFM",
-            "DOH",
-            "DUS",
-            "DXE",
-            "ETF",
-            "EURONEXT",
-            "HAM",
-            "HEL",
-            "HKSE",
-            "ICE",
-            "IOB",
-            "IST",
-            "JKT",
-            "JNB",
-            "JPX",
-            "KLS",
-            "KOE",
-            "KSC",
-            "KUW",
-            "LSE",
-            "MCX",
-            "MEX",
-            "MIL",
-            "MUN",
-            "NASDAQ",
-            "NEO",
-            "NIM",
-            "NSE",
-            "NYSE",
-            "NZE",
-            "OEM",
-            "OQB",
-            "OQX",
-            "OSL",
-            "OTC",
-            "PNK",
-            "PRA",
-            "RIS",
-            "SAO",
-            "SAU",
-            "SES",
-            "SET",
-            "SGO",
-            "SHH",
-            "SHZ",
-            "SIX",
-            "STO",
-            "STU",
-            "TAI",
-            "TLV",
-            "TSX",
-            "TSXV",
-            "TWO",
-            "VIE",
-            "VSE",
-            "WSE",
-            "XETRA",
-        ]
+        return list(AVAILABLE_EXCHANGES)
@@ -0,0 +1,341 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_valuation import FmpValuation
+
+
+"""
+The FmpDcf class revalues the FmpValuation.advanced_dcf and levered_dcf models locally for
+many symbols at once, so WACC and terminal growth sensitivities and Monte Carlo draws need
+no extra requests. Rates are percentages, as the API reports them.
+
+def fetch(self, symbols: List[str], model: str = "advanced") -> pd.DataFrame:
+    Downloads the DCF frames for several symbols.
+
+def value(self, data_df: pd.DataFrame) -> pd.DataFrame:
+    Recomputes the base case from the frame's own inputs.
+
+def grid(self, data_df: pd.DataFrame, wacc: List[float], growth: List[float]) -> pd.DataFrame:
+    Values every (wacc, growth) pair for every symbol.
+
+def monte_carlo(self, data_df: pd.DataFrame, draws: int = 10000) -> pd.DataFrame:
+    Values random draws of wacc, growth and cash flows and summarizes them per symbol.
+"""
+
+
+@dataclass
+class DcfInputs:
+    symbols: pd.Index
+    flows: np.ndarray
+    horizon: np.ndarray
+    terminal_flow: np.ndarray
+    wacc: np.ndarray
+    growth: np.ndarray
+    net_debt: np.ndarray
+    shares: np.ndarray
+    price: np.ndarray
+
+
+class FmpDcf(FmpBase):
+    def __init__(
+        self, max_workers: int = 4, api_key: str = os.getenv("FMP_API_KEY")
+    ) -> None:
+        """
+        Initialize the FmpDcf class.
+
+        Args:
+            max_workers (int, optional): Concurrent downloads in fetch(). Defaults to 4.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.max_workers = max_workers
+        self.valuation_client = FmpValuation(api_key)
+
+    ############################
+    # Fetch
+    ############################
+    def fetch(self, symbols: List[str], model: str = "advanced") -> pd.DataFrame:
+        """
+        Downloads the DCF model for each symbol and stacks the frames. Symbols without
+        data are skipped.
+
+        Args:
+            symbols (List[str]): The symbols to download.
+            model (str, optional): "advanced" or "levered". Defaults to "advanced".
+
+        Returns:
+            pd.DataFrame: The stacked frames, sorted by symbol and year.
+
+        Raises:
+            ValueError: If the model is invalid or no symbol returned data.
+        """
+        if model not in ["advanced", "levered"]:
+            raise ValueError("Model must be either 'advanced' or 'levered'")
+
+        method = (
+            self.valuation_client.advanced_dcf
+            if model == "advanced"
+            else self.valuation_client.levered_dcf
+        )
+
+        def fetch_one(symbol: str) -> pd.DataFrame:
+            try:
+                return method(symbol)
+            except ValueError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = [f for f in executor.map(fetch_one, symbols) if f is not None]
+
+        if not frames:
+            raise ValueError("No data found for the given symbols")
+
+        return (
+            pd.concat(frames, ignore_index=True)
+            .sort_values(by=["symbol", "year"], ascending=True)
+            .reset_index(drop=True)
+        )
+
+    ############################
+    # Value
+    ############################
+    def value(self, data_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Recomputes each symbol's valuation from the inputs in its DCF frame.
+
+        Args:
+            data_df (pd.DataFrame): Stacked advanced_dcf or levered_dcf frames.
+
+        Returns:
+            pd.DataFrame: symbol, wacc, long_term_growth_rate, enterprise_value,
+                equity_value, equity_value_per_share and upside against the current price.
+        """
+        inputs = self._inputs(data_df)
+        ev = self._enterprise_value(inputs, inputs.wacc, inputs.growth)
+        return self._frame(inputs, inputs.wacc, inputs.growth, ev).drop(
+            columns="symbol_index"
+        )
+
+    ############################
+    # Grid
+    ############################
+    def grid(
+        self,
+        data_df: pd.DataFrame,
+        wacc: List[float],
+        growth: List[float],
+        relative: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Values every combination of WACC and terminal growth for every symbol in one
+        broadcast over (wacc, growth, symbol).
+
+        Args:
+            data_df (pd.DataFrame): Stacked advanced_dcf or levered_dcf frames.
+            wacc (List[float]): WACC values in percent.
+            growth (List[float]): Long term growth rates in percent.
+            relative (bool, optional): Treat the values as shifts from each symbol's own
+                wacc and growth instead of absolute rates. Defaults to False.
+
+        Returns:
+            pd.DataFrame: One row per (symbol, wacc, growth) with the valuation. Rows
+                where wacc does not exceed growth are NaN.
+        """
+        inputs = self._inputs(data_df)
+        wacc = np.asarray(wacc, dtype="float64")[:, None, None] / 100
+        growth = np.asarray(growth, dtype="float64")[None, :, None] / 100
+
+        if relative:
+            wacc = wacc + inputs.wacc
+            growth = growth + inputs.growth
+
+        wacc, growth = np.broadcast_arrays(
+            wacc, growth, np.empty((1, 1, len(inputs.symbols)))
+        )[:2]
+        ev = self._enterprise_value(inputs, wacc, growth)
+
+        return (
+            self._frame(inputs, wacc.ravel(), growth.ravel(), ev.ravel())
+            .sort_values(
+                by=["symbol_index", "wacc", "long_term_growth_rate"], kind="stable"
+            )
+            .drop(columns="symbol_index")
+            .reset_index(drop=True)
+        )
+
+    ############################
+    # Monte Carlo
+    ############################
+    def monte_carlo(
+        self,
+        data_df: pd.DataFrame,
+        draws: int = 10000,
+        wacc_std: float = 1.0,
+        growth_std: float = 0.5,
+        flow_std: float = 0.1,
+        seed: int = None,
+        chunk_size: int = 1000,
+        summary: bool = True,
+    ):
+        """
+        Values random scenarios around each symbol's own inputs. WACC and growth are
+        drawn from normal distributions (in percentage points) and the projected cash
+        flows are scaled by a lognormal factor per draw and symbol. Draws are evaluated
+        in chunks so memory stays bounded.
+
+        Args:
+            data_df (pd.DataFrame): Stacked advanced_dcf or levered_dcf frames.
+            draws (int, optional): Number of scenarios per symbol. Defaults to 10000.
+            wacc_std (float, optional): Standard deviation of WACC in points. Defaults to 1.0.
+            growth_std (float, optional): Standard deviation of growth in points. Defaults to 0.5.
+            flow_std (float, optional): Log standard deviation of the cash flow factor. Defaults to 0.1.
+            seed (int, optional): Seed for reproducible draws. Defaults to None.
+            chunk_size (int, optional): Draws evaluated per broadcast. Defaults to 1000.
+            summary (bool, optional): Return per-symbol statistics instead of the raw
+                (draws, symbols) array of per-share values. Defaults to True.
+
+        Returns:
+            pd.DataFrame | np.ndarray: Mean, standard deviation, percentiles and the
+                probability of exceeding the current price per symbol, or the raw values.
+        """
+        inputs = self._inputs(data_df)
+        rng = np.random.default_rng(seed)
+        n = len(inputs.symbols)
+        per_share = np.empty((draws, n), dtype="float64")
+
+        for start in range(0, draws, chunk_size):
+            size = min(chunk_size, draws - start)
+            wacc = inputs.wacc + rng.normal(0.0, wacc_std / 100, (size, n))
+            growth = inputs.growth + rng.normal(0.0, growth_std / 100, (size, n))
+            factor = rng.lognormal(0.0, flow_std, (size, n))
+            ev = self._enterprise_value(inputs, wacc, growth, factor)
+            per_share[start : start + size] = (ev - inputs.net_debt) / inputs.shares
+
+        if not summary:
+            return per_share
+
+        with np.errstate(invalid="ignore"):
+            percentiles = np.nanpercentile(per_share, [5, 25, 50, 75, 95], axis=0)
+            above = np.nanmean(per_share > inputs.price, axis=0)
+
+        return pd.DataFrame(
+            {
+                "symbol": inputs.symbols,
+                "price": inputs.price,
+                "mean": np.nanmean(per_share, axis=0),
+                "std": np.nanstd(per_share, axis=0),
+                "p5": percentiles[0],
+                "p25": percentiles[1],
+                "p50": percentiles[2],
+                "p75": percentiles[3],
+                "p95": percentiles[4],
+                "prob_above_price": above,
+                "valid_draws": np.isfinite(per_share).sum(axis=0),
+            }
+        )
+
+    ############################
+    # Private Methods
+    ############################
+    def _inputs(self, data_df: pd.DataFrame) -> DcfInputs:
+        """
+        Turns stacked DCF frames into per-symbol arrays. Projected cash flows are padded
+        to the longest horizon with zeros.
+        """
+        flow_column = "ufcf" if "ufcf" in data_df.columns else "free_cash_flow"
+        required = [
+            "symbol",
+            "year",
+            flow_column,
+            "wacc",
+            "long_term_growth_rate",
+            "net_debt",
+            "diluted_shares_outstanding",
+        ]
+        missing = [c for c in required if c not in data_df.columns]
+        if missing:
+            raise ValueError(f"DCF frame is missing columns: {missing}")
+
+        data_df = data_df.sort_values(by=["symbol", "year"], kind="stable")
+        codes, symbols = pd.factorize(data_df["symbol"], sort=True)
+        position = data_df.groupby("symbol", sort=False).cumcount().to_numpy()
+        horizon = np.bincount(codes, minlength=len(symbols))
+
+        flows = np.zeros((len(symbols), horizon.max()), dtype="float64")
+        flows[codes, position] = data_df[flow_column].to_numpy(dtype="float64")
+
+        last = data_df.groupby("symbol", sort=True).tail(1)
+        price = (
+            last["price"].to_numpy(dtype="float64")
+            if "price" in last.columns
+            else np.full(len(symbols), np.nan)
+        )
+
+        return DcfInputs(
+            symbols=pd.Index(symbols, name="symbol"),
+            flows=flows,
+            horizon=horizon,
+            terminal_flow=flows[np.arange(len(symbols)), horizon - 1],
+            wacc=last["wacc"].to_numpy(dtype="float64") / 100,
+            growth=last["long_term_growth_rate"].to_numpy(dtype="float64") / 100,
+            net_debt=last["net_debt"].to_numpy(dtype="float64"),
+            shares=last["diluted_shares_outstanding"].to_numpy(dtype="float64"),
+            price=price,
+        )
+
+    @staticmethod
+    def _enterprise_value(
+        inputs: DcfInputs,
+        wacc: np.ndarray,
+        growth: np.ndarray,
+        factor: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Sum of discounted projected cash flows plus the discounted Gordon growth terminal
+        value. wacc and growth broadcast against the symbol axis, which is last.
+        """
+        years = np.arange(1, inputs.flows.shape[1] + 1, dtype="float64")
+        discount = (1.0 + wacc)[..., None] ** -years
+        pv = np.sum(inputs.flows * discount, axis=-1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terminal = inputs.terminal_flow * (1.0 + growth) / (wacc - growth)
+            pv_terminal = terminal / (1.0 + wacc) ** inputs.horizon
+
+        ev = pv + pv_terminal
+        if factor is not None:
+            ev = ev * factor
+
+        return np.where(wacc > growth, ev, np.nan)
+
+    @staticmethod
+    def _frame(
+        inputs: DcfInputs, wacc: np.ndarray, growth: np.ndarray, ev: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Lays out valuations whose last axis is the symbol axis as a long frame.
+        """
+        n = len(inputs.symbols)
+        repeats = ev.size // n
+        index = np.tile(np.arange(n), repeats)
+        equity = ev - inputs.net_debt[index]
+        per_share = equity / inputs.shares[index]
+
+        return pd.DataFrame(
+            {
+                "symbol_index": index,
+                "symbol": inputs.symbols[index],
+                "wacc": np.round(wacc * 100, 10),
+                "long_term_growth_rate": np.round(growth * 100, 10),
+                "enterprise_value": ev,
+                "equity_value": equity,
+                "equity_value_per_share": per_share,
+                "upside": per_share / inputs.price[index] - 1.0,
+            }
+        )
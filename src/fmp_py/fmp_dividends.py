@@ -3,9 +3,7 @@ import os
 import pendulum
 from fmp_py.fmp_base import FmpBase
 import pandas as pd
-from dotenv import load_dotenv
 
-load_dotenv()
 """
 This class is used to access the FMP dividends endpoints.
 Reference: https://site.financialmodelingprep.com/developer/docs#dividends
@@ -51,8 +49,7 @@ class FmpDividends(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v3/stock_dividend_calendar"
-        params = {"from": from_date, "to": to_date}
-        response = self.get_request(url=url, params=params)
+        response = self.get_calendar_request(url, from_date, to_date)
 
         if not response:
             raise ValueError("Failed to fetch dividends calendar data.")
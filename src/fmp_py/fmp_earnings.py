@@ -1,10 +1,10 @@
+import numpy as np
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
 import pendulum
-from dotenv import load_dotenv
+from typing import List
 
-load_dotenv()
 
 pd.set_option("future.no_silent_downcasting", True)
 
@@ -27,14 +27,20 @@ def earnings_within_weeks(self, symbol: str, weeks_ahead: int = 2) -> bool:
     References: This function is not documented in the Financial Modeling Prep API documentation.
                 It is a custom function that is not documented in the Financial Modeling Prep API documentation.
 
+def earnings_within_weeks_bulk(self, symbols: List[str], weeks_ahead: int = 2, refresh: bool = False) -> pd.Series:
+    Answers earnings_within_weeks for many symbols from one cached earnings calendar download.
+
 def earnings_confirmed(self, symbol: str, date: str) -> pd.DataFrame:
     References: https://site.financialmodelingprep.com/developer/docs#earnings-confirmed-earnings
 """
 
 
 class FmpEarnings(FmpBase):
+    EARNINGS_INDEX_STRIDE = 1_000_000
+
     def __init__(self, api_key: str = os.getenv("FMP_API_KEY")):
         super().__init__(api_key)
+        self._earnings_index = None
 
     #############################
     # Earnings Surprises
@@ -108,8 +114,7 @@ class FmpEarnings(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v4/earning-calendar-confirmed"
-        params = {"from": from_date, "to": to_date}
-        response = self.get_request(url, params)
+        response = self.get_calendar_request(url, from_date, to_date)
 
         if not response:
             raise ValueError("Error fetching earnings calendar data")
@@ -179,8 +184,7 @@ class FmpEarnings(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v3/earning_calendar"
-        params = {"from": from_date, "to": to_date}
-        response = self.get_request(url, params)
+        response = self.get_calendar_request(url, from_date, to_date)
 
         if not response:
             raise ValueError("Error fetching earnings calendar data")
@@ -314,3 +318,86 @@ class FmpEarnings(FmpBase):
             return False
 
         return True
+
+    def earnings_within_weeks_bulk(
+        self, symbols: List[str], weeks_ahead: int = 2, refresh: bool = False
+    ) -> pd.Series:
+        """
+        Checks many symbols for earnings within a number of weeks ahead using a single
+        earnings calendar download. The calendar is indexed by symbol and date and kept
+        until refresh is set or a check needs dates outside the indexed window.
+
+        Args:
+            symbols (List[str]): The symbols of the stocks.
+            weeks_ahead (int, optional): The number of weeks ahead to check for earnings. Defaults to 2.
+            refresh (bool, optional): Download the calendar again. Defaults to False.
+
+        Returns:
+            pd.Series: True for each symbol with earnings in the window, indexed by symbol.
+        """
+        today = pendulum.today()
+        from_day = self._day_number(today.to_date_string())
+        to_day = self._day_number(today.add(weeks=weeks_ahead).to_date_string())
+
+        index = self._earnings_index
+        if refresh or index is None or index[0] > from_day or index[1] < to_day:
+            index = self._build_earnings_index(
+                today.to_date_string(),
+                today.add(weeks=weeks_ahead).to_date_string(),
+            )
+
+        _, _, known, keys = index
+        symbols = pd.Index(symbols)
+        codes = np.searchsorted(known, symbols.to_numpy(dtype=object))
+        codes = np.minimum(codes, max(len(known) - 1, 0))
+        found = (
+            known[codes] == symbols.to_numpy(dtype=object)
+            if len(known)
+            else np.zeros(len(symbols), dtype=bool)
+        )
+
+        span = to_day - from_day + 1
+        position = np.searchsorted(keys, codes * self.EARNINGS_INDEX_STRIDE + from_day)
+        position = np.minimum(position, max(len(keys) - 1, 0))
+        nearest = keys[position] if len(keys) else np.zeros(len(symbols), dtype="int64")
+        offset = nearest - (codes * self.EARNINGS_INDEX_STRIDE + from_day)
+
+        return pd.Series(
+            found & (offset >= 0) & (offset < span), index=symbols, name="earnings"
+        )
+
+    #############################
+    # Private Methods
+    #############################
+    def _build_earnings_index(self, from_date: str, to_date: str) -> tuple:
+        """
+        Downloads the earnings calendar for the window and indexes it as a sorted array of
+        symbols and a sorted array of symbol_code * EARNINGS_INDEX_STRIDE + day keys.
+        """
+        try:
+            calendar = self.earnings_calendar(from_date, to_date)
+        except ValueError:
+            calendar = pd.DataFrame({"symbol": [], "date": []})
+
+        known, codes = np.unique(
+            calendar["symbol"].astype(str).to_numpy(dtype=object), return_inverse=True
+        )
+        days = (
+            pd.to_datetime(calendar["date"]).to_numpy().astype("datetime64[D]")
+        ).astype("int64")
+        keys = np.sort(codes.astype("int64") * self.EARNINGS_INDEX_STRIDE + days)
+
+        self._earnings_index = (
+            self._day_number(from_date),
+            self._day_number(to_date),
+            known,
+            keys,
+        )
+        return self._earnings_index
+
+    @staticmethod
+    def _day_number(value: str) -> int:
+        """
+        Returns a date as days since the epoch.
+        """
+        return int(np.datetime64(value, "D").astype("int64"))
@@ -1,22 +1,22 @@
 from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_output import build_output
+import numpy as np
 import pandas as pd
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from typing import List
 
 
 """
 This class is used to retrieve financial statements data from the Financial Modeling Prep API.
 Reference: https://site.financialmodelingprep.com/developer/docs#financial-statements
 
-def income_statements(self, symbol: str, period: str = "annual") -> pd.DataFrame:
+def income_statements(self, symbol: str, period: str = "annual", limit: int = 20, output: str = None) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#income-statements-financial-statements
 
-def balance_sheet_statements(self, symbol: str, period: str = "annual", limit: int = 20) -> pd.DataFrame:
+def balance_sheet_statements(self, symbol: str, period: str = "annual", limit: int = 20, output: str = None) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#balance-sheet-statements-financial-statements
     
-def cashflow_statements(self, symbol: str, period: str = "annual", limit: int = 20) -> pd.DataFrame:
+def cashflow_statements(self, symbol: str, period: str = "annual", limit: int = 20, output: str = None) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#cashflow-statements-financial-statements
     
 def income_statements_as_reported(self, symbol: str, period: str = "annual", limit: int = 20) -> pd.DataFrame:
@@ -27,10 +27,294 @@ def balance_sheet_statements_as_reported(self, symbol: str, period: str = "annua
     
 def cashflow_statements_as_reported(self, symbol: str, period: str = "annual", limit: int = 20) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#cashflow-statements-as-reported-financial-statements
+
+def concat_as_reported(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    Stacks long as-reported frames for many symbols, keeping tags as one shared category.
+
+def pivot_as_reported(data_df: pd.DataFrame, sparse: bool = True) -> pd.DataFrame:
+    Turns a long as-reported frame into one column per tag.
 """
 
 
 class FmpFinancialStatements(FmpBase):
+    INCOME_COLUMNS = {
+        "symbol": "symbol",
+        "date": "date",
+        "reportedCurrency": "reported_currency",
+        "cik": "cik",
+        "fillingDate": "filling_date",
+        "acceptedDate": "accepted_date",
+        "calendarYear": "calendar_year",
+        "period": "period",
+        "revenue": "revenue",
+        "costOfRevenue": "cost_of_revenue",
+        "grossProfit": "gross_profit",
+        "grossProfitRatio": "gross_profit_ratio",
+        "researchAndDevelopmentExpenses": "research_and_development_expenses",
+        "generalAndAdministrativeExpenses": "general_and_administrative_expenses",
+        "sellingAndMarketingExpenses": "selling_and_marketing_expenses",
+        "sellingGeneralAndAdministrativeExpenses": "selling_general_and_administrative_expenses",
+        "otherExpenses": "other_expenses",
+        "operatingExpenses": "operating_expenses",
+        "costAndExpenses": "cost_and_expenses",
+        "interestExpense": "interest_expense",
+        "interestIncome": "interest_income",
+        "depreciationAndAmortization": "depreciation_and_amortization",
+        "ebitda": "ebitda",
+        "ebitdaratio": "ebitda_ratio",
+        "operatingIncome": "operating_income",
+        "operatingIncomeRatio": "operating_income_ratio",
+        "totalOtherIncomeExpensesNet": "total_other_income_expenses_net",
+        "incomeBeforeTax": "income_before_tax",
+        "incomeBeforeTaxRatio": "income_before_tax_ratio",
+        "incomeTaxExpense": "income_tax_expense",
+        "netIncome": "net_income",
+        "netIncomeRatio": "net_income_ratio",
+        "eps": "eps",
+        "epsdiluted": "epsdiluted",
+        "weightedAverageShsOut": "weighted_average_shs_out",
+        "weightedAverageShsOutDil": "weighted_average_shs_out_dil",
+        "link": "link",
+        "finalLink": "final_link",
+    }
+
+    INCOME_TYPES = {
+        "symbol": "str",
+        "date": "datetime64[ns]",
+        "reported_currency": "str",
+        "cik": "str",
+        "filling_date": "datetime64[ns]",
+        "accepted_date": "datetime64[ns]",
+        "calendar_year": "int",
+        "period": "str",
+        "revenue": "int",
+        "cost_of_revenue": "int",
+        "gross_profit": "int",
+        "gross_profit_ratio": "float",
+        "research_and_development_expenses": "int",
+        "general_and_administrative_expenses": "int",
+        "selling_and_marketing_expenses": "int",
+        "selling_general_and_administrative_expenses": "int",
+        "other_expenses": "int",
+        "operating_expenses": "int",
+        "cost_and_expenses": "int",
+        "interest_expense": "int",
+        "interest_income": "int",
+        "depreciation_and_amortization": "int",
+        "ebitda": "int",
+        "ebitda_ratio": "float",
+        "operating_income": "int",
+        "operating_income_ratio": "float",
+        "total_other_income_expenses_net": "int",
+        "income_before_tax": "int",
+        "income_before_tax_ratio": "float",
+        "income_tax_expense": "int",
+        "net_income": "int",
+        "net_income_ratio": "float",
+        "eps": "float",
+        "epsdiluted": "float",
+        "weighted_average_shs_out": "int",
+        "weighted_average_shs_out_dil": "int",
+        "link": "str",
+        "final_link": "str",
+    }
+
+    BALANCE_SHEET_COLUMNS = {
+        "date": "date",
+        "symbol": "symbol",
+        "reportedCurrency": "reported_currency",
+        "cik": "cik",
+        "fillingDate": "filling_date",
+        "acceptedDate": "accepted_date",
+        "calendarYear": "calendar_year",
+        "period": "period",
+        "cashAndCashEquivalents": "cash_and_cash_equivalents",
+        "shortTermInvestments": "short_term_investments",
+        "cashAndShortTermInvestments": "cash_and_short_term_investments",
+        "netReceivables": "net_receivables",
+        "inventory": "inventory",
+        "otherCurrentAssets": "other_current_assets",
+        "totalCurrentAssets": "total_current_assets",
+        "propertyPlantEquipmentNet": "property_plant_equipment_net",
+        "goodwill": "goodwill",
+        "intangibleAssets": "intangible_assets",
+        "goodwillAndIntangibleAssets": "goodwill_and_intangible_assets",
+        "longTermInvestments": "long_term_investments",
+        "taxAssets": "tax_assets",
+        "otherNonCurrentAssets": "other_non_current_assets",
+        "totalNonCurrentAssets": "total_non_current_assets",
+        "otherAssets": "other_assets",
+        "totalAssets": "total_assets",
+        "accountPayables": "account_payables",
+        "shortTermDebt": "short_term_debt",
+        "taxPayables": "tax_payables",
+        "deferredRevenue": "deferred_revenue",
+        "otherCurrentLiabilities": "other_current_liabilities",
+        "totalCurrentLiabilities": "total_current_liabilities",
+        "longTermDebt": "long_term_debt",
+        "deferredRevenueNonCurrent": "deferred_revenue_non_current",
+        "deferredTaxLiabilitiesNonCurrent": "deferred_tax_liabilities_non_current",
+        "otherNonCurrentLiabilities": "other_non_current_liabilities",
+        "totalNonCurrentLiabilities": "total_non_current_liabilities",
+        "otherLiabilities": "other_liabilities",
+        "capitalLeaseObligations": "capital_lease_obligations",
+        "totalLiabilities": "total_liabilities",
+        "commonStock": "common_stock",
+        "retainedEarnings": "retained_earnings",
+        "accumulatedOtherComprehensiveIncomeLoss": "accumulated_other_comprehensive_income_loss",
+        "totalStockholdersEquity": "total_stockholders_equity",
+        "totalEquity": "total_equity",
+        "totalLiabilitiesAndStockholdersEquity": "total_liabilities_and_stockholders_equity",
+        "minorityInterest": "minority_interest",
+        "totalLiabilitiesAndTotalEquity": "total_liabilities_and_total_equity",
+        "totalInvestments": "total_investments",
+        "totalDebt": "total_debt",
+        "netDebt": "net_debt",
+        "link": "link",
+        "finalLink": "final_link",
+    }
+
+    BALANCE_SHEET_TYPES = {
+        "date": "datetime64[ns]",
+        "symbol": "str",
+        "reported_currency": "str",
+        "cik": "str",
+        "filling_date": "datetime64[ns]",
+        "accepted_date": "datetime64[ns]",
+        "calendar_year": "int",
+        "period": "str",
+        "cash_and_cash_equivalents": "int",
+        "short_term_investments": "int",
+        "cash_and_short_term_investments": "int",
+        "net_receivables": "int",
+        "inventory": "int",
+        "other_current_assets": "int",
+        "total_current_assets": "int",
+        "property_plant_equipment_net": "int",
+        "goodwill": "int",
+        "intangible_assets": "int",
+        "goodwill_and_intangible_assets": "int",
+        "long_term_investments": "int",
+        "tax_assets": "int",
+        "other_non_current_assets": "int",
+        "total_non_current_assets": "int",
+        "other_assets": "int",
+        "total_assets": "int",
+        "account_payables": "int",
+        "short_term_debt": "int",
+        "tax_payables": "int",
+        "deferred_revenue": "int",
+        "other_current_liabilities": "int",
+        "total_current_liabilities": "int",
+        "long_term_debt": "int",
+        "deferred_revenue_non_current": "int",
+        "deferred_tax_liabilities_non_current": "int",
+        "other_non_current_liabilities": "int",
+        "total_non_current_liabilities": "int",
+        "other_liabilities": "int",
+        "capital_lease_obligations": "int",
+        "total_liabilities": "int",
+        "common_stock": "int",
+        "retained_earnings": "int",
+        "accumulated_other_comprehensive_income_loss": "int",
+        "total_stockholders_equity": "int",
+        "total_equity": "int",
+        "total_liabilities_and_stockholders_equity": "int",
+        "minority_interest": "int",
+        "total_liabilities_and_total_equity": "int",
+        "total_investments": "int",
+        "total_debt": "int",
+        "net_debt": "int",
+        "link": "str",
+        "final_link": "str",
+    }
+
+    CASHFLOW_COLUMNS = {
+        "date": "date",
+        "symbol": "symbol",
+        "reportedCurrency": "reported_currency",
+        "cik": "cik",
+        "fillingDate": "filling_date",
+        "acceptedDate": "accepted_date",
+        "calendarYear": "calendar_year",
+        "period": "period",
+        "netIncome": "net_income",
+        "depreciationAndAmortization": "depreciation_and_amortization",
+        "deferredIncomeTax": "deferred_income_tax",
+        "stockBasedCompensation": "stock_based_compensation",
+        "changeInWorkingCapital": "change_in_working_capital",
+        "accountsReceivables": "accounts_receivables",
+        "inventory": "inventory",
+        "accountsPayables": "accounts_payables",
+        "otherWorkingCapital": "other_working_capital",
+        "otherNonCashItems": "other_non_cash_items",
+        "netCashProvidedByOperatingActivities": "net_cash_provided_by_operating_activities",
+        "investmentsInPropertyPlantAndEquipment": "investments_in_property_plant_and_equipment",
+        "acquisitionsNet": "acquisitions_net",
+        "purchasesOfInvestments": "purchases_of_investments",
+        "salesMaturitiesOfInvestments": "sales_maturities_of_investments",
+        "otherInvestingActivites": "other_investing_activites",
+        "netCashUsedForInvestingActivites": "net_cash_used_for_investing_activites",
+        "debtRepayment": "debt_repayment",
+        "commonStockIssued": "common_stock_issued",
+        "commonStockRepurchased": "common_stock_repurchased",
+        "dividendsPaid": "dividends_paid",
+        "otherFinancingActivites": "other_financing_activites",
+        "netCashUsedProvidedByFinancingActivities": "net_cash_used_provided_by_financing_activities",
+        "effectOfForexChangesOnCash": "effect_of_forex_changes_on_cash",
+        "netChangeInCash": "net_change_in_cash",
+        "cashAtEndOfPeriod": "cash_at_end_of_period",
+        "cashAtBeginningOfPeriod": "cash_at_beginning_of_period",
+        "operatingCashFlow": "operating_cash_flow",
+        "capitalExpenditure": "capital_expenditure",
+        "freeCashFlow": "free_cash_flow",
+        "link": "link",
+        "finalLink": "final_link",
+    }
+
+    CASHFLOW_TYPES = {
+        "date": "datetime64[ns]",
+        "symbol": "str",
+        "reported_currency": "str",
+        "cik": "str",
+        "filling_date": "datetime64[ns]",
+        "accepted_date": "datetime64[ns]",
+        "calendar_year": "int64",
+        "period": "str",
+        "net_income": "int",
+        "depreciation_and_amortization": "int",
+        "deferred_income_tax": "int",
+        "stock_based_compensation": "int",
+        "change_in_working_capital": "int",
+        "accounts_receivables": "int",
+        "inventory": "int",
+        "accounts_payables": "int",
+        "other_working_capital": "int",
+        "other_non_cash_items": "int",
+        "net_cash_provided_by_operating_activities": "int",
+        "investments_in_property_plant_and_equipment": "int",
+        "acquisitions_net": "int",
+        "purchases_of_investments": "int",
+        "sales_maturities_of_investments": "int",
+        "other_investing_activites": "int",
+        "net_cash_used_for_investing_activites": "int",
+        "debt_repayment": "int",
+        "common_stock_issued": "int",
+        "common_stock_repurchased": "int",
+        "dividends_paid": "int",
+        "other_financing_activites": "int",
+        "net_cash_used_provided_by_financing_activities": "int",
+        "effect_of_forex_changes_on_cash": "int",
+        "net_change_in_cash": "int",
+        "cash_at_end_of_period": "int",
+        "cash_at_beginning_of_period": "int",
+        "operating_cash_flow": "int",
+        "capital_expenditure": "int",
+        "free_cash_flow": "int",
+        "link": "str",
+        "final_link": "str",
+    }
+
     def __init__(self, api_key: str = os.getenv("FMP_API_KEY")):
         super().__init__(api_key)
 
@@ -38,7 +322,11 @@ class FmpFinancialStatements(FmpBase):
     # Cash Flow Statements as Reported
     ############################
     def cashflow_statements_as_reported(
-        self, symbol: str, period: str = "annual", limit: int = 20
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 20,
+        layout: str = "wide",
     ) -> pd.DataFrame:
         """
         Retrieves the cash flow statements for a given symbol as reported by the company.
@@ -47,12 +335,17 @@ class FmpFinancialStatements(FmpBase):
             symbol (str): The symbol of the company.
             period (str, optional): The period of the financial statements. Defaults to "annual".
             limit (int, optional): The maximum number of statements to retrieve. Defaults to 20.
+            layout (str, optional): "wide" for one column per line item, or "long" for one row per
+                (symbol, date, period, tag, value). Defaults to "wide".
 
         Returns:
             pd.DataFrame: A DataFrame containing the cash flow statements.
+                The long layout keeps every reported tag, with tag names as a category and
+                values as float64. See pivot_as_reported().
 
         Raises:
             ValueError: If an invalid period is provided.
+            ValueError: If an invalid layout is provided.
             ValueError: If no data is found for the provided symbol.
         """
 
@@ -62,6 +355,10 @@ class FmpFinancialStatements(FmpBase):
                 f"Invalid period. Allowed values are {', '.join(periods_allowed)}"
             )
 
+        layouts_allowed = ["wide", "long"]
+        if layout not in layouts_allowed:
+            raise ValueError(f"Invalid layout. Allowed layouts: {layouts_allowed}")
+
         url = f"v3/cash-flow-statement-as-reported/{symbol}"
         params = {"period": period, "limit": limit}
         response = self.get_request(url, params)
@@ -69,6 +366,9 @@ class FmpFinancialStatements(FmpBase):
         if not response:
             raise ValueError("No data found for the provided symbol.")
 
+        if layout == "long":
+            return self._as_reported_long(response)
+
         data_df = (
             pd.DataFrame(response)
             .fillna(0)
@@ -155,7 +455,11 @@ class FmpFinancialStatements(FmpBase):
     # Balance Sheet Statements as Reported
     ############################
     def balance_sheet_statements_as_reported(
-        self, symbol: str, period: str = "annual", limit: int = 20
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 20,
+        layout: str = "wide",
     ) -> pd.DataFrame:
         """
         Retrieves the balance sheet statements as reported for a given symbol.
@@ -164,18 +468,27 @@ class FmpFinancialStatements(FmpBase):
             symbol (str): The symbol of the company.
             period (str, optional): The period of the statements. Allowed values are "annual" and "quarter". Defaults to "annual".
             limit (int, optional): The maximum number of statements to retrieve. Defaults to 20.
+            layout (str, optional): "wide" for one column per line item, or "long" for one row per
+                (symbol, date, period, tag, value). Defaults to "wide".
 
         Returns:
             pd.DataFrame: A DataFrame containing the balance sheet statements.
+                The long layout keeps every reported tag, with tag names as a category and
+                values as float64. See pivot_as_reported().
 
         Raises:
             ValueError: If an invalid period is provided.
+            ValueError: If an invalid layout is provided.
             ValueError: If no data is found for the provided symbol.
         """
         periods_allowed = ["annual", "quarter"]
         if period not in periods_allowed:
             raise ValueError(f"Invalid period. Allowed periods: {periods_allowed}")
 
+        layouts_allowed = ["wide", "long"]
+        if layout not in layouts_allowed:
+            raise ValueError(f"Invalid layout. Allowed layouts: {layouts_allowed}")
+
         url = f"v3/balance-sheet-statement-as-reported/{symbol}"
         params = {"period": period, "limit": limit}
         response = self.get_request(url, params)
@@ -183,6 +496,9 @@ class FmpFinancialStatements(FmpBase):
         if not response:
             raise ValueError("No data found for the provided symbol.")
 
+        if layout == "long":
+            return self._as_reported_long(response)
+
         data_df = (
             pd.DataFrame(response)
             .fillna(0)
@@ -269,7 +585,11 @@ class FmpFinancialStatements(FmpBase):
     # Income Statements as Reported
     ############################
     def income_statements_as_reported(
-        self, symbol: str, period: str = "annual", limit: int = 20
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 20,
+        layout: str = "wide",
     ) -> pd.DataFrame:
         """
         Retrieves the income statements for a given symbol as reported by the company.
@@ -278,12 +598,17 @@ class FmpFinancialStatements(FmpBase):
             symbol (str): The symbol of the company.
             period (str, optional): The period of the income statements. Allowed values are "annual" and "quarter". Defaults to "annual".
             limit (int, optional): The maximum number of income statements to retrieve. Defaults to 20.
+            layout (str, optional): "wide" for one column per line item, or "long" for one row per
+                (symbol, date, period, tag, value). Defaults to "wide".
 
         Returns:
             pd.DataFrame: A DataFrame containing the income statements data.
+                The long layout keeps every reported tag, with tag names as a category and
+                values as float64. See pivot_as_reported().
 
         Raises:
             ValueError: If an invalid period is provided.
+            ValueError: If an invalid layout is provided.
             ValueError: If no data is found for the provided symbol.
         """
 
@@ -292,6 +617,10 @@ class FmpFinancialStatements(FmpBase):
         if period not in periods_allowed:
             raise ValueError(f"Invalid period. Allowed periods: {periods_allowed}")
 
+        layouts_allowed = ["wide", "long"]
+        if layout not in layouts_allowed:
+            raise ValueError(f"Invalid layout. Allowed layouts: {layouts_allowed}")
+
         url = f"v3/income-statement-as-reported/{symbol}"
         params = {"period": period, "limit": limit}
         response = self.get_request(url, params)
@@ -299,6 +628,9 @@ class FmpFinancialStatements(FmpBase):
         if not response:
             raise ValueError("No data found for the provided symbol.")
 
+        if layout == "long":
+            return self._as_reported_long(response)
+
         data_df = (
             pd.DataFrame(response)
             .fillna(0)
@@ -372,7 +704,11 @@ class FmpFinancialStatements(FmpBase):
     # Cash Flow Statements
     ############################
     def cashflow_statements(
-        self, symbol: str, period: str = "annual", limit: int = 20
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 20,
+        output: str = None,
     ) -> pd.DataFrame:
         """
         Retrieves the cash flow statements for a given symbol.
@@ -381,9 +717,12 @@ class FmpFinancialStatements(FmpBase):
             symbol (str): The stock symbol.
             period (str, optional): The period of the statements. Allowed values are "annual" and "quarter". Defaults to "annual".
             limit (int, optional): The maximum number of statements to retrieve. Defaults to 20.
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None,
+                which uses the client's output attribute.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the cash flow statements.
+            pd.DataFrame: A DataFrame containing the cash flow statements. Other outputs return a
+                pyarrow.Table, a polars.DataFrame or a dict of numpy arrays.
 
         Raises:
             ValueError: If an invalid period is provided.
@@ -395,6 +734,7 @@ class FmpFinancialStatements(FmpBase):
         if period not in periods_allowed:
             raise ValueError(f"Invalid period. Allowed periods: {periods_allowed}")
 
+        output = self.resolve_output(output)
         url = f"v3/cash-flow-statement/{symbol}"
         params = {"period": period, "limit": limit}
 
@@ -403,96 +743,19 @@ class FmpFinancialStatements(FmpBase):
         if not response:
             raise ValueError("No data found for the specified parameters.")
 
+        if output != "pandas":
+            return build_output(
+                response,
+                self.CASHFLOW_COLUMNS,
+                self.CASHFLOW_TYPES,
+                output,
+                sort_by="date",
+            )
+
         data_df = (
             pd.DataFrame(response)
-            .rename(
-                columns={
-                    "date": "date",
-                    "symbol": "symbol",
-                    "reportedCurrency": "reported_currency",
-                    "cik": "cik",
-                    "fillingDate": "filling_date",
-                    "acceptedDate": "accepted_date",
-                    "calendarYear": "calendar_year",
-                    "period": "period",
-                    "netIncome": "net_income",
-                    "depreciationAndAmortization": "depreciation_and_amortization",
-                    "deferredIncomeTax": "deferred_income_tax",
-                    "stockBasedCompensation": "stock_based_compensation",
-                    "changeInWorkingCapital": "change_in_working_capital",
-                    "accountsReceivables": "accounts_receivables",
-                    "inventory": "inventory",
-                    "accountsPayables": "accounts_payables",
-                    "otherWorkingCapital": "other_working_capital",
-                    "otherNonCashItems": "other_non_cash_items",
-                    "netCashProvidedByOperatingActivities": "net_cash_provided_by_operating_activities",
-                    "investmentsInPropertyPlantAndEquipment": "investments_in_property_plant_and_equipment",
-                    "acquisitionsNet": "acquisitions_net",
-                    "purchasesOfInvestments": "purchases_of_investments",
-                    "salesMaturitiesOfInvestments": "sales_maturities_of_investments",
-                    "otherInvestingActivites": "other_investing_activites",
-                    "netCashUsedForInvestingActivites": "net_cash_used_for_investing_activites",
-                    "debtRepayment": "debt_repayment",
-                    "commonStockIssued": "common_stock_issued",
-                    "commonStockRepurchased": "common_stock_repurchased",
-                    "dividendsPaid": "dividends_paid",
-                    "otherFinancingActivites": "other_financing_activites",
-                    "netCashUsedProvidedByFinancingActivities": "net_cash_used_provided_by_financing_activities",
-                    "effectOfForexChangesOnCash": "effect_of_forex_changes_on_cash",
-                    "netChangeInCash": "net_change_in_cash",
-                    "cashAtEndOfPeriod": "cash_at_end_of_period",
-                    "cashAtBeginningOfPeriod": "cash_at_beginning_of_period",
-                    "operatingCashFlow": "operating_cash_flow",
-                    "capitalExpenditure": "capital_expenditure",
-                    "freeCashFlow": "free_cash_flow",
-                    "link": "link",
-                    "finalLink": "final_link",
-                }
-            )
-            .astype(
-                {
-                    "date": "datetime64[ns]",
-                    "symbol": "str",
-                    "reported_currency": "str",
-                    "cik": "str",
-                    "filling_date": "datetime64[ns]",
-                    "accepted_date": "datetime64[ns]",
-                    "calendar_year": "int64",
-                    "period": "str",
-                    "net_income": "int",
-                    "depreciation_and_amortization": "int",
-                    "deferred_income_tax": "int",
-                    "stock_based_compensation": "int",
-                    "change_in_working_capital": "int",
-                    "accounts_receivables": "int",
-                    "inventory": "int",
-                    "accounts_payables": "int",
-                    "other_working_capital": "int",
-                    "other_non_cash_items": "int",
-                    "net_cash_provided_by_operating_activities": "int",
-                    "investments_in_property_plant_and_equipment": "int",
-                    "acquisitions_net": "int",
-                    "purchases_of_investments": "int",
-                    "sales_maturities_of_investments": "int",
-                    "other_investing_activites": "int",
-                    "net_cash_used_for_investing_activites": "int",
-                    "debt_repayment": "int",
-                    "common_stock_issued": "int",
-                    "common_stock_repurchased": "int",
-                    "dividends_paid": "int",
-                    "other_financing_activites": "int",
-                    "net_cash_used_provided_by_financing_activities": "int",
-                    "effect_of_forex_changes_on_cash": "int",
-                    "net_change_in_cash": "int",
-                    "cash_at_end_of_period": "int",
-                    "cash_at_beginning_of_period": "int",
-                    "operating_cash_flow": "int",
-                    "capital_expenditure": "int",
-                    "free_cash_flow": "int",
-                    "link": "str",
-                    "final_link": "str",
-                }
-            )
+            .rename(columns=self.CASHFLOW_COLUMNS)
+            .astype(self.CASHFLOW_TYPES)
         )
 
         return data_df.sort_values(by="date", ascending=True).reset_index(drop=True)
@@ -501,7 +764,11 @@ class FmpFinancialStatements(FmpBase):
     # Balance Sheet Statements
     ################################
     def balance_sheet_statements(
-        self, symbol: str, period: str = "annual", limit: int = 20
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 20,
+        output: str = None,
     ) -> pd.DataFrame:
         """
         Retrieves the balance sheet statements for a given symbol.
@@ -510,9 +777,12 @@ class FmpFinancialStatements(FmpBase):
             symbol (str): The stock symbol.
             period (str, optional): The period of the statements. Defaults to "annual".
             limit (int, optional): The maximum number of statements to retrieve. Defaults to 20.
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None,
+                which uses the client's output attribute.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the balance sheet statements.
+            pd.DataFrame: A DataFrame containing the balance sheet statements. Other outputs return a
+                pyarrow.Table, a polars.DataFrame or a dict of numpy arrays.
 
         Raises:
             ValueError: If no data is found for the provided symbol.
@@ -522,6 +792,7 @@ class FmpFinancialStatements(FmpBase):
         if period not in periods_allowed:
             raise ValueError(f"Invalid period. Allowed periods: {periods_allowed}")
 
+        output = self.resolve_output(output)
         url = f"v3/balance-sheet-statement/{symbol}"
         params = {"period": period, "limit": limit}
         response = self.get_request(url, params)
@@ -529,120 +800,19 @@ class FmpFinancialStatements(FmpBase):
         if not response:
             raise ValueError("No data found for the provided symbol.")
 
+        if output != "pandas":
+            return build_output(
+                response,
+                self.BALANCE_SHEET_COLUMNS,
+                self.BALANCE_SHEET_TYPES,
+                output,
+                sort_by="date",
+            )
+
         data_df = (
             pd.DataFrame(response)
-            .rename(
-                columns={
-                    "date": "date",
-                    "symbol": "symbol",
-                    "reportedCurrency": "reported_currency",
-                    "cik": "cik",
-                    "fillingDate": "filling_date",
-                    "acceptedDate": "accepted_date",
-                    "calendarYear": "calendar_year",
-                    "period": "period",
-                    "cashAndCashEquivalents": "cash_and_cash_equivalents",
-                    "shortTermInvestments": "short_term_investments",
-                    "cashAndShortTermInvestments": "cash_and_short_term_investments",
-                    "netReceivables": "net_receivables",
-                    "inventory": "inventory",
-                    "otherCurrentAssets": "other_current_assets",
-                    "totalCurrentAssets": "total_current_assets",
-                    "propertyPlantEquipmentNet": "property_plant_equipment_net",
-                    "goodwill": "goodwill",
-                    "intangibleAssets": "intangible_assets",
-                    "goodwillAndIntangibleAssets": "goodwill_and_intangible_assets",
-                    "longTermInvestments": "long_term_investments",
-                    "taxAssets": "tax_assets",
-                    "otherNonCurrentAssets": "other_non_current_assets",
-                    "totalNonCurrentAssets": "total_non_current_assets",
-                    "otherAssets": "other_assets",
-                    "totalAssets": "total_assets",
-                    "accountPayables": "account_payables",
-                    "shortTermDebt": "short_term_debt",
-                    "taxPayables": "tax_payables",
-                    "deferredRevenue": "deferred_revenue",
-                    "otherCurrentLiabilities": "other_current_liabilities",
-                    "totalCurrentLiabilities": "total_current_liabilities",
-                    "longTermDebt": "long_term_debt",
-                    "deferredRevenueNonCurrent": "deferred_revenue_non_current",
-                    "deferredTaxLiabilitiesNonCurrent": "deferred_tax_liabilities_non_current",
-                    "otherNonCurrentLiabilities": "other_non_current_liabilities",
-                    "totalNonCurrentLiabilities": "total_non_current_liabilities",
-                    "otherLiabilities": "other_liabilities",
-                    "capitalLeaseObligations": "capital_lease_obligations",
-                    "totalLiabilities": "total_liabilities",
-                    "commonStock": "common_stock",
-                    "retainedEarnings": "retained_earnings",
-                    "accumulatedOtherComprehensiveIncomeLoss": "accumulated_other_comprehensive_income_loss",
-                    "totalStockholdersEquity": "total_stockholders_equity",
-                    "totalEquity": "total_equity",
-                    "totalLiabilitiesAndStockholdersEquity": "total_liabilities_and_stockholders_equity",
-                    "minorityInterest": "minority_interest",
-                    "totalLiabilitiesAndTotalEquity": "total_liabilities_and_total_equity",
-                    "totalInvestments": "total_investments",
-                    "totalDebt": "total_debt",
-                    "netDebt": "net_debt",
-                    "link": "link",
-                    "finalLink": "final_link",
-                }
-            )
-            .astype(
-                {
-                    "date": "datetime64[ns]",
-                    "symbol": "str",
-                    "reported_currency": "str",
-                    "cik": "str",
-                    "filling_date": "datetime64[ns]",
-                    "accepted_date": "datetime64[ns]",
-                    "calendar_year": "int",
-                    "period": "str",
-                    "cash_and_cash_equivalents": "int",
-                    "short_term_investments": "int",
-                    "cash_and_short_term_investments": "int",
-                    "net_receivables": "int",
-                    "inventory": "int",
-                    "other_current_assets": "int",
-                    "total_current_assets": "int",
-                    "property_plant_equipment_net": "int",
-                    "goodwill": "int",
-                    "intangible_assets": "int",
-                    "goodwill_and_intangible_assets": "int",
-                    "long_term_investments": "int",
-                    "tax_assets": "int",
-                    "other_non_current_assets": "int",
-                    "total_non_current_assets": "int",
-                    "other_assets": "int",
-                    "total_assets": "int",
-                    "account_payables": "int",
-                    "short_term_debt": "int",
-                    "tax_payables": "int",
-                    "deferred_revenue": "int",
-                    "other_current_liabilities": "int",
-                    "total_current_liabilities": "int",
-                    "long_term_debt": "int",
-                    "deferred_revenue_non_current": "int",
-                    "deferred_tax_liabilities_non_current": "int",
-                    "other_non_current_liabilities": "int",
-                    "total_non_current_liabilities": "int",
-                    "other_liabilities": "int",
-                    "capital_lease_obligations": "int",
-                    "total_liabilities": "int",
-                    "common_stock": "int",
-                    "retained_earnings": "int",
-                    "accumulated_other_comprehensive_income_loss": "int",
-                    "total_stockholders_equity": "int",
-                    "total_equity": "int",
-                    "total_liabilities_and_stockholders_equity": "int",
-                    "minority_interest": "int",
-                    "total_liabilities_and_total_equity": "int",
-                    "total_investments": "int",
-                    "total_debt": "int",
-                    "net_debt": "int",
-                    "link": "str",
-                    "final_link": "str",
-                }
-            )
+            .rename(columns=self.BALANCE_SHEET_COLUMNS)
+            .astype(self.BALANCE_SHEET_TYPES)
         )
         return data_df.sort_values(by="date", ascending=True).reset_index(drop=True)
 
@@ -650,7 +820,11 @@ class FmpFinancialStatements(FmpBase):
     # Income Statements
     ################################
     def income_statements(
-        self, symbol: str, period: str = "annual", limit: int = 20
+        self,
+        symbol: str,
+        period: str = "annual",
+        limit: int = 20,
+        output: str = None,
     ) -> pd.DataFrame:
         """
         Retrieves the income statements for a given symbol.
@@ -659,9 +833,12 @@ class FmpFinancialStatements(FmpBase):
             symbol (str): The stock symbol.
             period (str, optional): The period of the income statements. Defaults to "annual".
             limit (int, optional): The maximum number of income statements to retrieve. Defaults to 20.
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None,
+                which uses the client's output attribute.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the income statements data.
+            pd.DataFrame: A DataFrame containing the income statements data. Other outputs return a
+                pyarrow.Table, a polars.DataFrame or a dict of numpy arrays.
 
         Raises:
             ValueError: If an invalid period is provided.
@@ -673,6 +850,7 @@ class FmpFinancialStatements(FmpBase):
         if period not in periods_allowed:
             raise ValueError(f"Invalid period. Allowed periods: {periods_allowed}")
 
+        output = self.resolve_output(output)
         url = f"v3/income-statement/{symbol}"
         params = {"period": period, "limit": limit}
         response = self.get_request(url, params)
@@ -680,92 +858,147 @@ class FmpFinancialStatements(FmpBase):
         if not response:
             raise ValueError("No data found for the specified parameters.")
 
+        if output != "pandas":
+            return build_output(
+                response,
+                self.INCOME_COLUMNS,
+                self.INCOME_TYPES,
+                output,
+                sort_by="date",
+            )
+
         data_df = (
             pd.DataFrame(response)
-            .rename(
-                columns={
-                    "symbol": "symbol",
-                    "date": "date",
-                    "reportedCurrency": "reported_currency",
-                    "cik": "cik",
-                    "fillingDate": "filling_date",
-                    "acceptedDate": "accepted_date",
-                    "calendarYear": "calendar_year",
-                    "period": "period",
-                    "revenue": "revenue",
-                    "costOfRevenue": "cost_of_revenue",
-                    "grossProfit": "gross_profit",
-                    "grossProfitRatio": "gross_profit_ratio",
-                    "researchAndDevelopmentExpenses": "research_and_development_expenses",
-                    "generalAndAdministrativeExpenses": "general_and_administrative_expenses",
-                    "sellingAndMarketingExpenses": "selling_and_marketing_expenses",
-                    "sellingGeneralAndAdministrativeExpenses": "selling_general_and_administrative_expenses",
-                    "otherExpenses": "other_expenses",
-                    "operatingExpenses": "operating_expenses",
-                    "costAndExpenses": "cost_and_expenses",
-                    "interestExpense": "interest_expense",
-                    "interestIncome": "interest_income",
-                    "depreciationAndAmortization": "depreciation_and_amortization",
-                    "ebitda": "ebitda",
-                    "ebitdaratio": "ebitda_ratio",
-                    "operatingIncome": "operating_income",
-                    "operatingIncomeRatio": "operating_income_ratio",
-                    "totalOtherIncomeExpensesNet": "total_other_income_expenses_net",
-                    "incomeBeforeTax": "income_before_tax",
-                    "incomeBeforeTaxRatio": "income_before_tax_ratio",
-                    "incomeTaxExpense": "income_tax_expense",
-                    "netIncome": "net_income",
-                    "netIncomeRatio": "net_income_ratio",
-                    "eps": "eps",
-                    "epsdiluted": "epsdiluted",
-                    "weightedAverageShsOut": "weighted_average_shs_out",
-                    "weightedAverageShsOutDil": "weighted_average_shs_out_dil",
-                    "link": "link",
-                    "finalLink": "final_link",
-                }
+            .rename(columns=self.INCOME_COLUMNS)
+            .astype(self.INCOME_TYPES)
+        )
+
+        return data_df.sort_values(by="date", ascending=True).reset_index(drop=True)
+
+    ############################
+    # Concat As Reported
+    ############################
+    @staticmethod
+    def concat_as_reported(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Stacks long as-reported frames from several calls. The symbol, period and tag
+        categories are unioned so the result stays categorical instead of falling back
+        to object columns.
+
+        Args:
+            frames (List[pd.DataFrame]): Frames returned with layout="long".
+
+        Returns:
+            pd.DataFrame: The stacked frame.
+
+        Raises:
+            ValueError: If no frames are given.
+        """
+        if not frames:
+            raise ValueError("No frames to concatenate.")
+
+        columns = {}
+        for column in ["symbol", "period", "tag"]:
+            columns[column] = pd.api.types.union_categoricals(
+                [frame[column] for frame in frames]
+            )
+
+        data_df = pd.DataFrame(
+            {
+                "symbol": columns["symbol"],
+                "date": pd.concat(
+                    [frame["date"] for frame in frames], ignore_index=True
+                ),
+                "period": columns["period"],
+                "tag": columns["tag"],
+                "value": pd.concat(
+                    [frame["value"] for frame in frames], ignore_index=True
+                ),
+            }
+        )
+
+        return data_df
+
+    ############################
+    # Pivot As Reported
+    ############################
+    @staticmethod
+    def pivot_as_reported(data_df: pd.DataFrame, sparse: bool = True) -> pd.DataFrame:
+        """
+        Pivots a long as-reported frame to one row per (symbol, date, period) and one
+        column per tag.
+
+        Args:
+            data_df (pd.DataFrame): A frame returned with layout="long" or by concat_as_reported.
+            sparse (bool, optional): Store the columns as Sparse[float64], so tags a company
+                does not report take no memory. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The wide frame, indexed by symbol, date and period.
+        """
+        index = pd.MultiIndex.from_frame(
+            data_df[["symbol", "date", "period"]].astype(
+                {"symbol": "str", "period": "str"}
             )
+        )
+        rows, row_index = pd.factorize(index, sort=True)
+        tags = data_df["tag"].astype("category")
+        cols = tags.cat.codes.to_numpy()
+        names = tags.cat.categories.astype(str)
+        values = data_df["value"].to_numpy(dtype="float64")
+
+        if not sparse:
+            dense = np.full((len(row_index), len(names)), np.nan)
+            dense[rows, cols] = values
+            wide = pd.DataFrame(dense, index=row_index, columns=names)
+        else:
+            # One tag at a time, so only a single dense column is ever allocated.
+            order = np.argsort(cols, kind="stable")
+            bounds = np.searchsorted(cols[order], np.arange(len(names) + 1))
+            columns = {}
+            for i, name in enumerate(names):
+                take = order[bounds[i] : bounds[i + 1]]
+                column = np.full(len(row_index), np.nan)
+                column[rows[take]] = values[take]
+                columns[name] = pd.arrays.SparseArray(column, fill_value=np.nan)
+            wide = pd.DataFrame(columns, index=row_index)
+
+        wide.index.names = ["symbol", "date", "period"]
+        return wide
+
+    ############################
+    # Private Methods
+    ############################
+    def _as_reported_long(self, response: List[dict]) -> pd.DataFrame:
+        """
+        Melts an as-reported payload into one row per reported value. Non-numeric
+        fields are dropped.
+
+        Args:
+            response (List[dict]): The as-reported payload.
+
+        Returns:
+            pd.DataFrame: Columns symbol, date, period, tag (category) and value (float64).
+        """
+        keys = ["symbol", "date", "period"]
+        data_df = pd.DataFrame(response)
+        tags = [column for column in data_df.columns if column not in keys]
+
+        long_df = data_df.melt(id_vars=keys, value_vars=tags, var_name="tag")
+        long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+        long_df = long_df.dropna(subset=["value"])
+
+        return (
+            long_df[["symbol", "date", "period", "tag", "value"]]
             .astype(
                 {
-                    "symbol": "str",
+                    "symbol": "category",
                     "date": "datetime64[ns]",
-                    "reported_currency": "str",
-                    "cik": "str",
-                    "filling_date": "datetime64[ns]",
-                    "accepted_date": "datetime64[ns]",
-                    "calendar_year": "int",
-                    "period": "str",
-                    "revenue": "int",
-                    "cost_of_revenue": "int",
-                    "gross_profit": "int",
-                    "gross_profit_ratio": "float",
-                    "research_and_development_expenses": "int",
-                    "general_and_administrative_expenses": "int",
-                    "selling_and_marketing_expenses": "int",
-                    "selling_general_and_administrative_expenses": "int",
-                    "other_expenses": "int",
-                    "operating_expenses": "int",
-                    "cost_and_expenses": "int",
-                    "interest_expense": "int",
-                    "interest_income": "int",
-                    "depreciation_and_amortization": "int",
-                    "ebitda": "int",
-                    "ebitda_ratio": "float",
-                    "operating_income": "int",
-                    "operating_income_ratio": "float",
-                    "total_other_income_expenses_net": "int",
-                    "income_before_tax": "int",
-                    "income_before_tax_ratio": "float",
-                    "income_tax_expense": "int",
-                    "net_income": "int",
-                    "net_income_ratio": "float",
-                    "eps": "float",
-                    "epsdiluted": "float",
-                    "weighted_average_shs_out": "int",
-                    "weighted_average_shs_out_dil": "int",
-                    "link": "str",
-                    "final_link": "str",
+                    "period": "category",
+                    "tag": "category",
+                    "value": "float64",
                 }
             )
+            .sort_values(by=["date", "tag"], ascending=True)
+            .reset_index(drop=True)
         )
-
-        return data_df.sort_values(by="date", ascending=True).reset_index(drop=True)
@@ -1,15 +1,23 @@
 import pendulum
 from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_quote_snapshot import FmpQuoteSnapshot
 import pandas as pd
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from typing import List
 
 
 class FmpForex(FmpBase):
-    def __init__(self, api_key: str = os.getenv("FMP_API_KEY")) -> None:
+    def __init__(
+        self, api_key: str = os.getenv("FMP_API_KEY"), quote_ttl: float = 0
+    ) -> None:
+        """
+        Initialize the FmpForex class.
+        Args:
+            api_key (str): The API key for Financial Modeling Prep.
+            quote_ttl (float, optional): Seconds a full_forex_quote_list snapshot stays fresh. While set, single pair quotes are served from the snapshot. Defaults to 0, which disables the snapshot.
+        """
         super().__init__(api_key)
+        self.quote_snapshot = FmpQuoteSnapshot(self._fetch_quote_list, quote_ttl)
 
     ####################
     # Forex Daily
@@ -168,70 +176,17 @@ class FmpForex(FmpBase):
         clean_symbol = symbol.replace("/", "")
         url = f"v3/quote/{clean_symbol}"
 
+        if self.quote_snapshot.ttl:
+            data_df = self.quote_snapshot.lookup([symbol])
+            if not data_df.empty:
+                return data_df
+
         response = self.get_request(url)
 
         if not response:
             raise ValueError(f"No data found for {symbol}")
 
-        data_df = (
-            pd.DataFrame(response)
-            .fillna(0)
-            .rename(
-                columns={
-                    "symbol": "symbol",
-                    "name": "name",
-                    "price": "price",
-                    "changesPercentage": "changes_percentage",
-                    "change": "change",
-                    "dayLow": "day_low",
-                    "dayHigh": "day_high",
-                    "yearHigh": "year_high",
-                    "yearLow": "year_low",
-                    "marketCap": "market_cap",
-                    "priceAvg50": "price_avg_50",
-                    "priceAvg200": "price_avg_200",
-                    "exhange": "exchange",
-                    "volume": "volume",
-                    "avgVolume": "avg_volume",
-                    "open": "open",
-                    "previousClose": "previous_close",
-                    "eps": "eps",
-                    "pe": "pe",
-                    "earningsAnnouncement": "earnings_announcement",
-                    "sharesOutstanding": "shares_outstanding",
-                    "timestamp": "timestamp",
-                }
-            )
-            .astype(
-                {
-                    "symbol": "str",
-                    "name": "str",
-                    "price": "float",
-                    "changes_percentage": "float",
-                    "change": "float",
-                    "day_low": "float",
-                    "day_high": "float",
-                    "year_high": "float",
-                    "year_low": "float",
-                    "market_cap": "int",
-                    "price_avg_50": "float",
-                    "price_avg_200": "float",
-                    "exchange": "str",
-                    "volume": "int",
-                    "avg_volume": "int",
-                    "open": "float",
-                    "previous_close": "float",
-                    "eps": "float",
-                    "pe": "float",
-                    "earnings_announcement": "str",
-                    "shares_outstanding": "int",
-                }
-            )
-        )
-
-        data_df["timestamp"] = pd.to_datetime(data_df["timestamp"], unit="s")
-
-        return data_df
+        return self._shape_quotes(response)
 
     ####################
     # Forex List
@@ -284,9 +239,12 @@ class FmpForex(FmpBase):
     ####################
     # Full Forex Quote List
     ####################
-    def full_forex_quote_list(self) -> pd.DataFrame:
+    def full_forex_quote_list(self, refresh: bool = False) -> pd.DataFrame:
         """
-        Retrieves a full list of forex quotes.
+        Retrieves a full list of forex quotes. While quote_ttl is set, the list is
+        downloaded at most once per quote_ttl seconds.
+        Args:
+            refresh (bool, optional): Download the list even when the snapshot is fresh. Defaults to False.
         Returns:
             pd.DataFrame: A DataFrame containing the forex quotes with the following columns:
                 - symbol (str): The symbol of the forex.
@@ -315,12 +273,50 @@ class FmpForex(FmpBase):
             ValueError: If no data is found.
         """
 
+        return self.quote_snapshot.get(refresh).copy()
+
+    ####################
+    # Full Forex Quotes
+    ####################
+    def full_forex_quotes(self, symbols: List[str]) -> pd.DataFrame:
+        """
+        Retrieves full forex quotes for many pairs from one quote list snapshot.
+        Args:
+            symbols (List[str]): The symbols, with or without "/".
+        Returns:
+            pd.DataFrame: One row per symbol found, in the order given, with the columns of full_forex_quote_list.
+        Raises:
+            ValueError: If none of the symbols is found.
+        """
+
+        data_df = self.quote_snapshot.lookup(symbols)
+
+        if data_df.empty:
+            raise ValueError(f"No data found for {symbols}")
+
+        return data_df
+
+    ####################
+    # Private Methods
+    ####################
+    def _fetch_quote_list(self) -> pd.DataFrame:
+        """
+        Downloads the full forex quote list.
+        """
+
         url = "v3/quotes/forex"
         response = self.get_request(url)
 
         if not response:
             raise ValueError("No data found")
 
+        return self._shape_quotes(response)
+
+    def _shape_quotes(self, response: list) -> pd.DataFrame:
+        """
+        Renames and types a quote response.
+        """
+
         data_df = (
             pd.DataFrame(response)
             .fillna(0)
@@ -377,6 +373,6 @@ class FmpForex(FmpBase):
             )
         )
 
-        data_df["timestamp"] = pd.to_datetime(data_df["timestamp"], unit="s")
+        data_df["timestamp"] = self.epoch_to_datetime(data_df["timestamp"], unit="s")
 
         return data_df
@@ -0,0 +1,612 @@
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+
+import pandas as pd
+import pendulum
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_earnings import FmpEarnings
+from fmp_py.fmp_financial_statements import FmpFinancialStatements
+from fmp_py.fmp_symbol_resolver import FmpSymbolResolver
+
+
+"""
+The FmpFundamentalsWarehouse class keeps financial statements in a local SQLite database
+keyed by (symbol, period, date), and refreshes only the symbols that are likely to have
+filed since the last download.
+
+def refresh(self, symbols: List[str], kinds: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Downloads new statements for symbols with a probable new filing.
+
+def statements(self, kind: str, symbols: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Reads stored statements without touching the network.
+
+def store(self, kind: str, data_df: pd.DataFrame) -> int:
+    Upserts a statements frame returned by FmpFinancialStatements.
+
+def adopt_aliases(self, symbols: List[str], kinds: List[str] = None) -> int:
+    Moves statements stored under a company's former tickers to its current one.
+"""
+
+
+class FmpFundamentalsWarehouse(FmpBase):
+    KINDS = {
+        "income": "income_statements",
+        "balance_sheet": "balance_sheet_statements",
+        "cashflow": "cashflow_statements",
+        "income_as_reported": "income_statements_as_reported",
+        "balance_sheet_as_reported": "balance_sheet_statements_as_reported",
+        "cashflow_as_reported": "cashflow_statements_as_reported",
+    }
+    DATE_COLUMNS = ["date", "filling_date", "accepted_date"]
+    PERIOD_DAYS = {"annual": 365, "quarter": 91}
+
+    def __init__(
+        self,
+        path: str = "fmp_fundamentals.db",
+        max_workers: int = 4,
+        resolver: FmpSymbolResolver = None,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> None:
+        """
+        Initialize the FmpFundamentalsWarehouse class.
+
+        Args:
+            path (str, optional): The SQLite database file. Defaults to "fmp_fundamentals.db".
+            max_workers (int, optional): Concurrent downloads during refresh. Defaults to 4.
+            resolver (FmpSymbolResolver, optional): Maps former tickers to current ones, so
+                statements stored before a rename are reused. Defaults to None.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.path = path
+        self.max_workers = max_workers
+        self.resolver = resolver
+        self.statements_client = FmpFinancialStatements(api_key)
+        self.earnings_client = FmpEarnings(api_key)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS refresh_log (
+                kind TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                period TEXT NOT NULL,
+                checked_at TEXT NOT NULL,
+                PRIMARY KEY (kind, symbol, period)
+            )
+            """
+        )
+        self._conn.commit()
+
+    ############################
+    # Refresh
+    ############################
+    def refresh(
+        self,
+        symbols: List[str],
+        kinds: List[str] = None,
+        period: str = "annual",
+        limit: int = 20,
+        incremental_limit: int = None,
+        force: bool = False,
+        lookback_days: int = 90,
+        min_filing_lag: int = 20,
+        recheck_days: int = 7,
+    ) -> pd.DataFrame:
+        """
+        Downloads statements only for symbols that are new to the warehouse or likely to
+        have filed since their latest stored statement.
+
+        A stored symbol is refreshed when the earnings calendar shows a report after its
+        latest filling date, or when its next period has ended more than min_filing_lag
+        days ago and it has not been checked in the last recheck_days.
+
+        Args:
+            symbols (List[str]): The symbols to refresh.
+            kinds (List[str], optional): Statement kinds, see KINDS. Defaults to the three standard statements.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            limit (int, optional): Periods to download for symbols not yet stored. Defaults to 20.
+            incremental_limit (int, optional): Periods to download for stored symbols. Defaults to 2 annual or 4 quarterly.
+            force (bool, optional): Refresh every symbol regardless of filings. Defaults to False.
+            lookback_days (int, optional): Days of earnings calendar to cross-reference. Defaults to 90.
+            min_filing_lag (int, optional): Days between period end and filing. Defaults to 20.
+            recheck_days (int, optional): Days before an overdue symbol is checked again. Defaults to 7.
+
+        Returns:
+            pd.DataFrame: One row per (kind, symbol) with the action taken and the rows written.
+
+        Raises:
+            ValueError: If symbols is not a list, or kinds or period are invalid.
+        """
+        if isinstance(symbols, str):
+            raise ValueError("symbols must be a list of symbols")
+
+        kinds = kinds or ["income", "balance_sheet", "cashflow"]
+        for kind in kinds:
+            self._validate_kind(kind)
+
+        if period not in self.PERIOD_DAYS:
+            raise ValueError(
+                f"Invalid period. Allowed periods: {list(self.PERIOD_DAYS.keys())}"
+            )
+
+        if incremental_limit is None:
+            incremental_limit = 2 if period == "annual" else 4
+
+        if self.resolver is not None:
+            symbols = [self.resolver.resolve(symbol) for symbol in symbols]
+            self.adopt_aliases(symbols, kinds)
+
+        today = pd.Timestamp(pendulum.today().to_date_string())
+        reported = {} if force else self._reported_since(today, lookback_days)
+
+        tasks = []
+        for kind in kinds:
+            latest = self._latest(kind, period)
+            checked = self._checked(kind, period)
+            for symbol in dict.fromkeys(symbols):
+                action = self._plan(
+                    symbol=symbol,
+                    latest=latest.get(symbol),
+                    checked=checked.get(symbol),
+                    reported=reported.get(symbol),
+                    period=period,
+                    today=today,
+                    force=force,
+                    min_filing_lag=min_filing_lag,
+                    recheck_days=recheck_days,
+                )
+                tasks.append((kind, symbol, action))
+
+        results = []
+        fetches = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for kind, symbol, action in tasks:
+                if action == "skipped":
+                    results.append(
+                        {"kind": kind, "symbol": symbol, "action": action, "rows": 0}
+                    )
+                    continue
+
+                method = getattr(self.statements_client, self.KINDS[kind])
+                future = executor.submit(
+                    method,
+                    symbol,
+                    period=period,
+                    limit=limit if action == "full" else incremental_limit,
+                )
+                fetches[future] = (kind, symbol, action)
+
+            for future in as_completed(fetches):
+                kind, symbol, action = fetches[future]
+                rows = 0
+                try:
+                    rows = self.store(kind, future.result())
+                except ValueError:
+                    action = "empty"
+                except Exception:
+                    action = "error"
+
+                if action != "error":
+                    self._mark_checked(kind, symbol, period, today)
+
+                results.append(
+                    {"kind": kind, "symbol": symbol, "action": action, "rows": rows}
+                )
+
+        return (
+            pd.DataFrame(results, columns=["kind", "symbol", "action", "rows"])
+            .astype({"kind": "str", "symbol": "str", "action": "str", "rows": "int"})
+            .sort_values(by=["kind", "symbol"], ascending=True)
+            .reset_index(drop=True)
+        )
+
+    ############################
+    # Store
+    ############################
+    def store(self, kind: str, data_df: pd.DataFrame) -> int:
+        """
+        Upserts a statements frame. Rows already stored under the same (symbol, period, date)
+        are replaced, and columns not yet in the table are added.
+
+        Args:
+            kind (str): The statement kind, see KINDS.
+            data_df (pd.DataFrame): A frame returned by the matching FmpFinancialStatements method.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            ValueError: If the kind is invalid or the frame lacks symbol, period or date.
+        """
+        self._validate_kind(kind)
+
+        missing = {"symbol", "period", "date"} - set(data_df.columns)
+        if missing:
+            raise ValueError(f"Statements are missing key columns: {sorted(missing)}")
+
+        if data_df.empty:
+            return 0
+
+        data_df = data_df.copy()
+        for column in self.DATE_COLUMNS:
+            if column in data_df.columns:
+                data_df[column] = pd.to_datetime(data_df[column]).dt.strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                )
+
+        with self._lock:
+            if self._table_exists(kind):
+                existing = self._table_columns(kind)
+                for column in data_df.columns:
+                    if column not in existing:
+                        self._conn.execute(
+                            f'ALTER TABLE "{kind}" ADD COLUMN "{column}"'
+                        )
+
+                self._conn.executemany(
+                    f'DELETE FROM "{kind}" WHERE symbol = ? AND period = ? AND date = ?',
+                    data_df[["symbol", "period", "date"]].itertuples(
+                        index=False, name=None
+                    ),
+                )
+                data_df.to_sql(kind, self._conn, if_exists="append", index=False)
+            else:
+                data_df.to_sql(kind, self._conn, if_exists="fail", index=False)
+                self._conn.execute(
+                    f'CREATE UNIQUE INDEX "{kind}_key" ON "{kind}" (symbol, period, date)'
+                )
+
+            self._conn.commit()
+
+        return len(data_df)
+
+    ############################
+    # Statements
+    ############################
+    def statements(
+        self,
+        kind: str,
+        symbols: List[str] = None,
+        period: str = "annual",
+        columns: List[str] = None,
+        from_date: str = None,
+        to_date: str = None,
+    ) -> pd.DataFrame:
+        """
+        Reads stored statements.
+
+        Args:
+            kind (str): The statement kind, see KINDS.
+            symbols (List[str], optional): Symbols to read. Defaults to every stored symbol.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            columns (List[str], optional): Fields to read besides symbol, period and date. Defaults to all.
+            from_date (str, optional): Earliest period end date, "YYYY-MM-DD". Defaults to None.
+            to_date (str, optional): Latest period end date, "YYYY-MM-DD". Defaults to None.
+
+        Returns:
+            pd.DataFrame: The statements sorted by symbol and date.
+
+        Raises:
+            ValueError: If the kind or period is invalid.
+        """
+        self._validate_kind(kind)
+
+        if period not in self.PERIOD_DAYS:
+            raise ValueError(
+                f"Invalid period. Allowed periods: {list(self.PERIOD_DAYS.keys())}"
+            )
+
+        with self._lock:
+            if not self._table_exists(kind):
+                return pd.DataFrame(columns=["symbol", "period", "date"])
+
+            available = self._table_columns(kind)
+
+        if columns is None:
+            selected = available
+        else:
+            unknown = [c for c in columns if c not in available]
+            if unknown:
+                raise ValueError(f"Unknown columns for {kind}: {unknown}")
+            selected = ["symbol", "period", "date"] + [
+                c for c in columns if c not in ("symbol", "period", "date")
+            ]
+
+        where, params = self._period_clause(period)
+        periods = []
+        if symbols is not None:
+            if isinstance(symbols, str):
+                symbols = [symbols]
+            if self.resolver is not None:
+                periods = [
+                    (alias, start, end, self.resolver.resolve(symbol))
+                    for symbol in dict.fromkeys(symbols)
+                    for alias, start, end in self.resolver.alias_periods(symbol)
+                ]
+                clause, clause_params = self._alias_clause(periods)
+                where += f" AND ({clause})"
+                params += clause_params
+            else:
+                where += f" AND symbol IN ({','.join('?' * len(symbols))})"
+                params += list(symbols)
+        if from_date:
+            where += " AND date >= ?"
+            params.append(pendulum.parse(from_date).format("YYYY-MM-DD"))
+        if to_date:
+            where += " AND date <= ?"
+            params.append(pendulum.parse(to_date).format("YYYY-MM-DD 23:59:59"))
+
+        fields = ", ".join(f'"{column}"' for column in selected)
+        query = f'SELECT {fields} FROM "{kind}" WHERE {where} ORDER BY symbol, date'
+
+        with self._lock:
+            data_df = pd.read_sql_query(query, self._conn, params=params)
+
+        for column in self.DATE_COLUMNS:
+            if column in data_df.columns:
+                data_df[column] = pd.to_datetime(data_df[column])
+
+        if periods:
+            # A row belongs to the company its ticker named on the row's date, so a
+            # reused ticker maps each row to the right company.
+            current = data_df["symbol"].copy()
+            dates = pd.to_datetime(data_df["date"])
+            for alias, start, end, symbol in periods:
+                rows = data_df["symbol"] == alias
+                if start is not None:
+                    rows &= dates >= pd.Timestamp(start)
+                if end is not None:
+                    rows &= dates < pd.Timestamp(end)
+                current[rows] = symbol
+            # Where both tickers have a row for a period, keep the current ticker's.
+            own = data_df["symbol"] == current
+            data_df["symbol"] = current
+            data_df = (
+                data_df.assign(_own=own)
+                .sort_values(["symbol", "date", "_own"], kind="stable")
+                .drop_duplicates(["symbol", "period", "date"], keep="last")
+                .drop(columns="_own")
+                .reset_index(drop=True)
+            )
+
+        return data_df
+
+    ############################
+    # Adopt Aliases
+    ############################
+    def adopt_aliases(self, symbols: List[str], kinds: List[str] = None) -> int:
+        """
+        Relabels statements and refresh history stored under a company's former tickers
+        with its current ticker, so a renamed symbol is refreshed incrementally instead of
+        downloaded again in full. Only rows dated while a former ticker named the company
+        move, so rows of another company that later took the ticker over stay put. Where
+        both tickers have a row for the same period, the row under the current ticker is
+        kept.
+
+        Args:
+            symbols (List[str]): The symbols to check.
+            kinds (List[str], optional): Statement kinds, see KINDS. Defaults to all.
+
+        Returns:
+            int: The number of statement rows relabeled.
+
+        Raises:
+            ValueError: If no resolver is set.
+        """
+        if self.resolver is None:
+            raise ValueError("A resolver is required to adopt aliases")
+
+        moved = 0
+        with self._lock:
+            for symbol in dict.fromkeys(symbols):
+                current = self.resolver.resolve(symbol)
+                former = [
+                    period
+                    for period in self.resolver.alias_periods(symbol)
+                    if period[0] != current
+                ]
+                for alias, start, end in former:
+                    clause, params = self._alias_clause([(alias, start, end)])
+                    for kind in kinds or list(self.KINDS):
+                        if self._table_exists(kind):
+                            moved += self._conn.execute(
+                                f'UPDATE OR IGNORE "{kind}" SET symbol = ? '
+                                f"WHERE {clause}",
+                                [current] + params,
+                            ).rowcount
+                            self._conn.execute(
+                                f'DELETE FROM "{kind}" WHERE {clause}', params
+                            )
+
+                        # The refresh history has no dates; it follows a former
+                        # ticker only while no other company has taken it over.
+                        if end is None:
+                            self._conn.execute(
+                                "UPDATE OR IGNORE refresh_log SET symbol = ? "
+                                "WHERE kind = ? AND symbol = ?",
+                                [current, kind, alias],
+                            )
+                            self._conn.execute(
+                                "DELETE FROM refresh_log WHERE kind = ? AND symbol = ?",
+                                [kind, alias],
+                            )
+
+            self._conn.commit()
+
+        return moved
+
+    ############################
+    # Stored Symbols
+    ############################
+    def stored_symbols(self, kind: str, period: str = "annual") -> List[str]:
+        """
+        Returns the symbols with at least one stored statement.
+
+        Args:
+            kind (str): The statement kind, see KINDS.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+
+        Returns:
+            List[str]: The stored symbols, sorted.
+        """
+        return sorted(self._latest(kind, period).keys())
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    ############################
+    # Private Methods
+    ############################
+    def _plan(
+        self,
+        symbol: str,
+        latest: dict,
+        checked: pd.Timestamp,
+        reported: pd.Timestamp,
+        period: str,
+        today: pd.Timestamp,
+        force: bool,
+        min_filing_lag: int,
+        recheck_days: int,
+    ) -> str:
+        """
+        Decides whether a symbol needs a full download, an incremental one or none.
+        """
+        if latest is None:
+            return "full"
+
+        if force:
+            return "incremental"
+
+        last_filed = latest["filling_date"] or latest["date"]
+        if reported is not None and reported > last_filed:
+            if checked is None or reported >= checked:
+                return "incremental"
+
+        next_period_filed = latest["date"] + pd.Timedelta(
+            days=self.PERIOD_DAYS[period] + min_filing_lag
+        )
+        recently_checked = checked is not None and checked > today - pd.Timedelta(
+            days=recheck_days
+        )
+        if next_period_filed <= today and not recently_checked:
+            return "incremental"
+
+        return "skipped"
+
+    def _reported_since(self, today: pd.Timestamp, lookback_days: int) -> Dict:
+        """
+        Returns the latest earnings report date per symbol within the lookback window.
+        """
+        from_date = (today - pd.Timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+        try:
+            calendar = self.earnings_client.earnings_calendar(
+                from_date, today.strftime("%Y-%m-%d")
+            )
+        except ValueError:
+            return {}
+
+        calendar = calendar[calendar["date"] <= today]
+        return calendar.groupby("symbol")["date"].max().to_dict()
+
+    def _latest(self, kind: str, period: str) -> Dict:
+        """
+        Returns the latest stored period end and filling date per symbol.
+        """
+        self._validate_kind(kind)
+        with self._lock:
+            if not self._table_exists(kind):
+                return {}
+
+            has_filling = "filling_date" in self._table_columns(kind)
+            filling = "MAX(filling_date)" if has_filling else "NULL"
+            where, params = self._period_clause(period)
+            rows = self._conn.execute(
+                f'SELECT symbol, MAX(date), {filling} FROM "{kind}" '
+                f"WHERE {where} GROUP BY symbol",
+                params,
+            ).fetchall()
+
+        return {
+            symbol: {
+                "date": pd.Timestamp(date),
+                "filling_date": pd.Timestamp(filling) if filling else None,
+            }
+            for symbol, date, filling in rows
+        }
+
+    def _checked(self, kind: str, period: str) -> Dict:
+        """
+        Returns when each symbol was last checked.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT symbol, checked_at FROM refresh_log WHERE kind = ? AND period = ?",
+                (kind, period),
+            ).fetchall()
+        return {symbol: pd.Timestamp(checked_at) for symbol, checked_at in rows}
+
+    def _mark_checked(
+        self, kind: str, symbol: str, period: str, today: pd.Timestamp
+    ) -> None:
+        """
+        Records that a symbol was checked today.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO refresh_log (kind, symbol, period, checked_at) "
+                "VALUES (?, ?, ?, ?)",
+                (kind, symbol, period, today.strftime("%Y-%m-%d")),
+            )
+            self._conn.commit()
+
+    def _period_clause(self, period: str) -> tuple:
+        """
+        Maps the request period onto the period labels stored in the statements.
+        """
+        if period == "annual":
+            return "period = ?", ["FY"]
+        return "period IN (?, ?, ?, ?)", ["Q1", "Q2", "Q3", "Q4"]
+
+    def _alias_clause(self, periods: List[tuple]) -> tuple:
+        """
+        Matches rows stored under each ticker within the dates it named a company, for
+        (ticker, start, end, ...) periods from FmpSymbolResolver.alias_periods.
+        """
+        clauses, params = [], []
+        for alias, start, end, *_ in periods:
+            clause = "symbol = ?"
+            params.append(alias)
+            if start is not None:
+                clause += " AND date >= ?"
+                params.append(start)
+            if end is not None:
+                clause += " AND date < ?"
+                params.append(end)
+            clauses.append(f"({clause})")
+        return " OR ".join(clauses), params
+
+    def _table_exists(self, kind: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (kind,)
+        ).fetchone()
+        return row is not None
+
+    def _table_columns(self, kind: str) -> List[str]:
+        return [row[1] for row in self._conn.execute(f'PRAGMA table_info("{kind}")')]
+
+    def _validate_kind(self, kind: str) -> None:
+        if kind not in self.KINDS:
+            raise ValueError(
+                f"Invalid kind. Allowed kinds: {', '.join(self.KINDS.keys())}"
+            )
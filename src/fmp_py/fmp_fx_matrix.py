@@ -0,0 +1,392 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_forex import FmpForex
+from fmp_py.fmp_panel import FmpPanel
+from fmp_py.fmp_quote import FmpQuote
+
+
+"""
+The FmpFxMatrix class turns FX quotes into a dense currency x currency matrix and converts
+statement frames or panels between currencies with one gather-multiply. Crosses without a
+direct quote are triangulated through the other quoted pairs.
+
+def snapshot(self) -> pd.DataFrame:
+    Builds the matrix from one FmpQuote.fx_prices download.
+
+def history(self, pairs: List[str]) -> pd.DataFrame:
+    Builds daily rates from FmpForex.forex_daily for the given pairs.
+
+def from_quotes(self, data_df: pd.DataFrame) -> pd.DataFrame:
+def from_history(self, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    Same, from frames already on hand.
+
+def rate(self, source: str, target: str, date: str = None) -> float:
+    Units of target per unit of source.
+
+def convert(self, data_df: pd.DataFrame, columns: List[str], target: str = None) -> pd.DataFrame:
+    Converts statement columns from each row's reported_currency to target.
+
+def convert_panel(self, panel: FmpPanel, currencies: List[str], target: str = None) -> FmpPanel:
+    Converts an FmpPanel whose symbols report in the given currencies.
+"""
+
+
+class FmpFxMatrix(FmpBase):
+    def __init__(
+        self,
+        base: str = "USD",
+        max_workers: int = 4,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> None:
+        """
+        Initialize the FmpFxMatrix class.
+
+        Args:
+            base (str, optional): The default target currency and triangulation pivot. Defaults to "USD".
+            max_workers (int, optional): Concurrent downloads in history(). Defaults to 4.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.base = base
+        self.max_workers = max_workers
+        self.quote_client = FmpQuote(api_key)
+        self.forex_client = FmpForex(api_key)
+
+        self.pairs = []
+        self.currencies = pd.Index([], name="currency")
+        self.matrix = np.empty((0, 0))
+        self.dates = np.array([], dtype="datetime64[ns]")
+        self.log_values = np.empty((0, 0))
+
+    ############################
+    # Snapshot
+    ############################
+    def snapshot(self) -> pd.DataFrame:
+        """
+        Downloads FmpQuote.fx_prices and builds the matrix from it.
+
+        Returns:
+            pd.DataFrame: The matrix, units of column currency per unit of row currency.
+        """
+        return self.from_quotes(self.quote_client.fx_prices())
+
+    def from_quotes(self, data_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Builds the matrix from one quote per pair. The rate of a pair is the bid/ask
+        midpoint, or its close or price when there is no bid and ask. Direct quotes are
+        kept as quoted and every other cross is triangulated.
+
+        Args:
+            data_df (pd.DataFrame): A frame with ticker ("EUR/USD" or "EURUSD") and bid and
+                ask, close or price columns.
+
+        Returns:
+            pd.DataFrame: The matrix, units of column currency per unit of row currency.
+
+        Raises:
+            ValueError: If the frame has no ticker or rate column.
+        """
+        if "ticker" not in data_df.columns:
+            raise ValueError("Quotes must have a ticker column")
+
+        if {"bid", "ask"}.issubset(data_df.columns):
+            rates = (data_df["bid"].astype(float) + data_df["ask"].astype(float)) / 2
+        elif "close" in data_df.columns:
+            rates = data_df["close"].astype(float)
+        elif "price" in data_df.columns:
+            rates = data_df["price"].astype(float)
+        else:
+            raise ValueError("Quotes must have bid and ask, close or price columns")
+
+        history = pd.DataFrame(
+            [rates.to_numpy()],
+            columns=data_df["ticker"].to_list(),
+            index=pd.DatetimeIndex([pd.Timestamp.now().floor("s")], name="date"),
+        )
+        self._index(history)
+
+        values = self.log_values[-1]
+        with np.errstate(invalid="ignore"):
+            self.matrix = np.exp(values[:, None] - values[None, :])
+
+        codes = self.currencies.get_indexer
+        for (base, quote), rate in zip(self.pairs, history.iloc[-1].to_numpy()):
+            if np.isfinite(rate) and rate > 0:
+                self.matrix[codes([base])[0], codes([quote])[0]] = rate
+                self.matrix[codes([quote])[0], codes([base])[0]] = 1.0 / rate
+
+        return pd.DataFrame(self.matrix, index=self.currencies, columns=self.currencies)
+
+    ############################
+    # History
+    ############################
+    def history(self, pairs: List[str]) -> pd.DataFrame:
+        """
+        Downloads FmpForex.forex_daily for each pair and builds daily rates.
+
+        Args:
+            pairs (List[str]): Pairs such as "EURUSD" or "EUR/USD".
+
+        Returns:
+            pd.DataFrame: The value of one unit of each currency in the base currency per date.
+        """
+
+        def fetch(pair: str) -> pd.DataFrame:
+            try:
+                return self.forex_client.forex_daily(pair)
+            except ValueError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = dict(zip(pairs, executor.map(fetch, pairs)))
+
+        return self.from_history({k: v for k, v in frames.items() if v is not None})
+
+    def from_history(self, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Builds daily rates from forex_daily frames. Dates are aligned on their union and
+        a pair without a close on a date keeps its previous close.
+
+        Args:
+            frames (Dict[str, pd.DataFrame]): forex_daily frames keyed by pair.
+
+        Returns:
+            pd.DataFrame: The value of one unit of each currency in the base currency per date.
+
+        Raises:
+            ValueError: If no frame is given.
+        """
+        if not frames:
+            raise ValueError("No FX history given")
+
+        history = (
+            pd.concat(
+                {
+                    pair: data_df.set_index("date")["close"].astype(float)
+                    for pair, data_df in frames.items()
+                },
+                axis=1,
+            )
+            .sort_index()
+            .ffill()
+        )
+        self._index(history)
+
+        base = self._code(self.base)
+        values = self.log_values - (self.log_values[:, [base]] if base >= 0 else 0.0)
+        return pd.DataFrame(
+            np.exp(values), index=pd.DatetimeIndex(self.dates), columns=self.currencies
+        )
+
+    ############################
+    # Rate
+    ############################
+    def rate(self, source: str, target: str, date: str = None) -> float:
+        """
+        Returns the units of target per unit of source, on the latest date on or before
+        date when history is loaded.
+
+        Args:
+            source (str): The currency converted from.
+            target (str): The currency converted to.
+            date (str, optional): The date of the rate. Defaults to the snapshot.
+
+        Returns:
+            float: The rate, NaN when either currency is unknown.
+        """
+        return float(
+            self._factors(
+                np.array([source]),
+                target,
+                None if date is None else np.array([pd.Timestamp(date)]),
+            )[0]
+        )
+
+    ############################
+    # Convert
+    ############################
+    def convert(
+        self,
+        data_df: pd.DataFrame,
+        columns: List[str],
+        target: str = None,
+        currency_column: str = "reported_currency",
+        date_column: str = None,
+    ) -> pd.DataFrame:
+        """
+        Converts monetary columns from each row's currency to target. With date_column,
+        each row uses the rate of the latest date on or before its own.
+
+        Args:
+            data_df (pd.DataFrame): Statements, e.g. from FmpFinancialStatements.
+            columns (List[str]): The monetary columns to convert.
+            target (str, optional): The currency converted to. Defaults to base.
+            currency_column (str, optional): The column holding each row's currency.
+                Defaults to "reported_currency".
+            date_column (str, optional): The column holding each row's date, e.g. "date".
+                Defaults to None, which uses the snapshot.
+
+        Returns:
+            pd.DataFrame: A copy with the columns converted and currency_column set to target.
+                Rows in an unknown currency are NaN.
+        """
+        target = target or self.base
+        dates = None if date_column is None else data_df[date_column].to_numpy()
+        factors = self._factors(data_df[currency_column].to_numpy(str), target, dates)
+
+        data_df = data_df.copy()
+        data_df[columns] = data_df[columns].to_numpy(dtype="float64") * factors[:, None]
+        data_df[currency_column] = target
+        return data_df
+
+    def convert_panel(
+        self,
+        panel: FmpPanel,
+        currencies: List[str],
+        target: str = None,
+        dates: np.ndarray = None,
+    ) -> FmpPanel:
+        """
+        Converts every field of an FmpPanel to target.
+
+        Args:
+            panel (FmpPanel): The panel, all of whose fields are monetary.
+            currencies (List[str]): The reporting currency of each panel symbol.
+            target (str, optional): The currency converted to. Defaults to base.
+            dates (np.ndarray, optional): A (symbols, periods) array of period end dates for
+                historical rates. Defaults to None, which uses the snapshot.
+
+        Returns:
+            FmpPanel: A new panel in target currency.
+        """
+        target = target or self.base
+        currencies = np.asarray(currencies, dtype=str)
+
+        if dates is None:
+            factors = self._factors(currencies, target)[:, None]
+        else:
+            symbols, periods = panel.values.shape[:2]
+            factors = self._factors(
+                np.repeat(currencies, periods), target, np.asarray(dates).ravel()
+            ).reshape(symbols, periods)
+
+        return FmpPanel(
+            values=panel.values * factors[:, :, None],
+            symbols=panel.symbols,
+            periods=panel.periods,
+            fields=list(panel.fields),
+        )
+
+    ############################
+    # Private Methods
+    ############################
+    def _index(self, history: pd.DataFrame) -> None:
+        """
+        Values every currency in one pivot currency per date. A breadth first search over
+        the quoted pairs gives each currency a path of pairs to the pivot, so the log values
+        are one matrix product of the pair log rates with a (pairs, currencies) sign matrix.
+        """
+        self.pairs = [self._parse_pair(pair) for pair in history.columns]
+        self.currencies = pd.Index(
+            sorted({c for pair in self.pairs for c in pair}), name="currency"
+        )
+        paths = self._paths(self.pairs)
+
+        signs = np.zeros((len(self.pairs), len(self.currencies)))
+        reached = np.zeros(len(self.currencies), dtype=bool)
+        for code, currency in enumerate(self.currencies):
+            if currency in paths:
+                reached[code] = True
+                for pair, sign in paths[currency]:
+                    signs[pair, code] += sign
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logs = np.log(history.to_numpy(dtype="float64"))
+        missing = ~np.isfinite(logs)
+
+        values = np.where(missing, 0.0, logs) @ signs
+        values[(missing.astype(float) @ np.abs(signs)) > 0] = np.nan
+        values[:, ~reached] = np.nan
+
+        self.dates = history.index.to_numpy(dtype="datetime64[ns]")
+        self.log_values = values
+
+    def _paths(self, pairs: List[Tuple[str, str]]) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Returns, for each currency connected to the pivot, the pairs leading to it with
+        the sign of their log rate. The pivot is base when quoted, else the most quoted
+        currency.
+        """
+        links = {}
+        for index, (base, quote) in enumerate(pairs):
+            links.setdefault(quote, []).append((base, index, 1))
+            links.setdefault(base, []).append((quote, index, -1))
+
+        if not links:
+            return {}
+
+        pivot = (
+            self.base if self.base in links else max(links, key=lambda c: len(links[c]))
+        )
+        paths = {pivot: []}
+        queue = deque([pivot])
+        while queue:
+            currency = queue.popleft()
+            for neighbour, index, sign in links[currency]:
+                if neighbour not in paths:
+                    paths[neighbour] = paths[currency] + [(index, sign)]
+                    queue.append(neighbour)
+
+        return paths
+
+    def _factors(
+        self, sources: np.ndarray, target: str, dates: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Returns units of target per unit of each source currency, gathered from the
+        snapshot matrix or, with dates, from the as-of rows of the history.
+        """
+        codes = self.currencies.get_indexer(sources)
+        target_code = self._code(target)
+        known = (codes >= 0) & (target_code >= 0)
+
+        if dates is None:
+            if len(self.matrix) == 0:
+                raise ValueError("No FX snapshot loaded. Call snapshot() first.")
+            factors = self.matrix[np.where(known, codes, 0), max(target_code, 0)]
+        else:
+            if len(self.dates) == 0:
+                raise ValueError("No FX history loaded. Call history() first.")
+            rows = np.searchsorted(
+                self.dates, np.asarray(dates, dtype="datetime64[ns]"), side="right"
+            )
+            known &= rows > 0
+            rows = np.maximum(rows - 1, 0)
+            factors = np.exp(
+                self.log_values[rows, np.where(known, codes, 0)]
+                - self.log_values[rows, max(target_code, 0)]
+            )
+
+        factors = np.where(known, factors, np.nan)
+        return np.where(sources == target, 1.0, factors)
+
+    def _code(self, currency: str) -> int:
+        """
+        Returns the position of a currency in the matrix, -1 when unknown.
+        """
+        return int(self.currencies.get_indexer([currency])[0])
+
+    @staticmethod
+    def _parse_pair(pair: str) -> Tuple[str, str]:
+        """
+        Splits "EUR/USD" or "EURUSD" into ("EUR", "USD").
+        """
+        pair = pair.replace("/", "").upper()
+        return pair[:3], pair[3:]
@@ -5,9 +5,6 @@ from fmp_py.fmp_base import FmpBase
 
 # from typing import Dict, Any
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 class FmpHistoricalData(FmpBase):
@@ -0,0 +1,305 @@
+import os
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""
+The FmpIndicatorPool class computes FmpChartData indicators for many symbols on a pool of
+worker processes. The OHLCV bars of every symbol are packed into one shared memory block,
+with the bar timestamps in a second, and the indicator columns are written into a third,
+so workers receive only row ranges and no DataFrame is pickled in either direction.
+
+def compute(self, charts: Dict[str, pd.DataFrame], indicators: List) -> Dict[str, pd.DataFrame]:
+    Returns each chart with the indicator columns added.
+"""
+
+OHLCV = ["open", "high", "low", "close", "volume"]
+PROBE_ROWS = 256
+TIMESTAMP_INDICATORS = ("session_vwap", "anchored_vwap", "cumulative_delta")
+
+_worker = {}
+
+
+class FmpIndicatorPool:
+    def __init__(self, processes: int = None, shards_per_process: int = 4) -> None:
+        """
+        Initialize the FmpIndicatorPool class.
+
+        Args:
+            processes (int, optional): Worker processes. 1 computes in this process.
+                Defaults to the number of CPUs.
+            shards_per_process (int, optional): Shards of symbols per process, so a slow
+                shard does not leave the other processes idle. Defaults to 4.
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.shards_per_process = shards_per_process
+
+    ############################
+    # Compute
+    ############################
+    def compute(
+        self,
+        charts: Dict[str, pd.DataFrame],
+        indicators: List[Union[str, Tuple[str, Dict]]],
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Runs the indicators in order on every chart, as calling the FmpChartData methods
+        one after another would, including dropping the rows an indicator such as
+        bxtrender drops.
+
+        Args:
+            charts (Dict[str, pd.DataFrame]): Symbol to bars with open, high, low, close
+                and volume columns, oldest first.
+            indicators (List[Union[str, Tuple[str, Dict]]]): FmpChartData method names, or
+                (name, kwargs) pairs, e.g. ["rsi", ("sma", {"period": 50})].
+
+        Returns:
+            Dict[str, pd.DataFrame]: Symbol to a copy of its chart with the indicator
+                columns added.
+
+        Raises:
+            ValueError: If an indicator is unknown, a chart lacks an OHLCV column or an
+                indicator that needs timestamps gets a chart without a DatetimeIndex.
+        """
+        specs = self._specs(indicators)
+        for symbol, chart in charts.items():
+            missing = [column for column in OHLCV if column not in chart.columns]
+            if missing:
+                raise ValueError(f"Chart of {symbol} is missing columns: {missing}")
+
+        timestamps = all(
+            isinstance(chart.index, pd.DatetimeIndex) for chart in charts.values()
+        )
+        if not timestamps and any(name in TIMESTAMP_INDICATORS for name, _ in specs):
+            raise ValueError(
+                f"{', '.join(TIMESTAMP_INDICATORS)} need charts indexed by timestamp."
+            )
+
+        columns, dtypes = self._probe(specs)
+        symbols = list(charts)
+        lengths = np.array([len(charts[symbol]) for symbol in symbols], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        total = int(offsets[-1])
+
+        if not symbols or not columns or total == 0:
+            return {symbol: charts[symbol].copy() for symbol in symbols}
+
+        inputs = SharedMemory(create=True, size=(len(OHLCV) + 1) * total * 8)
+        # The last output row marks the bars each chart keeps, for indicators such as
+        # bxtrender that drop rows.
+        outputs = SharedMemory(create=True, size=(len(columns) + 1) * total * 8)
+        try:
+            # The last row holds the timestamps as int64 nanoseconds since the epoch,
+            # in UTC for charts with a time zone, which zones records by row range.
+            bars = np.ndarray((len(OHLCV), total), dtype=np.float64, buffer=inputs.buf)
+            stamps = np.ndarray(
+                total, dtype=np.int64, buffer=inputs.buf, offset=len(OHLCV) * total * 8
+            )
+            zones = {}
+            for position, symbol in enumerate(symbols):
+                start, stop = offsets[position], offsets[position + 1]
+                chart = charts[symbol]
+                for row, column in enumerate(OHLCV):
+                    bars[row, start:stop] = chart[column].to_numpy(np.float64)
+                if timestamps:
+                    stamps[start:stop] = chart.index.as_unit("ns").asi8
+                    if chart.index.tz is not None:
+                        zones[int(start)] = str(chart.index.tz)
+            del bars, stamps
+
+            setup = (
+                inputs.name,
+                outputs.name,
+                total,
+                columns,
+                specs,
+                timestamps,
+                zones,
+            )
+            shards = self._shards(offsets)
+            if self.processes == 1:
+                _attach(*setup)
+                try:
+                    for shard in shards:
+                        _compute(shard)
+                finally:
+                    _detach()
+            else:
+                context = get_context()
+                with context.Pool(
+                    min(self.processes, len(shards)),
+                    initializer=_attach,
+                    initargs=setup,
+                ) as pool:
+                    pool.map(_compute, shards, chunksize=1)
+
+            values = np.ndarray(
+                (len(columns) + 1, total), dtype=np.float64, buffer=outputs.buf
+            )
+            results = {}
+            for position, symbol in enumerate(symbols):
+                start, stop = offsets[position], offsets[position + 1]
+                kept = values[-1, start:stop] > 0
+                chart = charts[symbol][kept].copy()
+                for row, column in enumerate(columns):
+                    chart[column] = values[row, start:stop][kept].astype(dtypes[column])
+                results[symbol] = chart
+            del values
+            return results
+        finally:
+            for block in (inputs, outputs):
+                block.close()
+                block.unlink()
+
+    ############################
+    # Helpers
+    ############################
+    def _shards(self, offsets: np.ndarray) -> List[List[Tuple[int, int]]]:
+        """
+        Splits the symbols into runs of about equal row counts, cutting at the symbol
+        boundaries nearest to equal shares of the rows.
+        """
+        count = len(offsets) - 1
+        shards = min(count, self.processes * self.shards_per_process)
+        if shards <= 1:
+            groups = [np.arange(count)]
+        else:
+            boundaries = offsets[1:-1]
+            targets = np.linspace(0, offsets[-1], shards + 1)[1:-1]
+            nearest = np.abs(boundaries[None, :] - targets[:, None]).argmin(axis=1)
+            groups = np.split(np.arange(count), np.unique(nearest + 1))
+        return [
+            [(int(offsets[i]), int(offsets[i + 1])) for i in group]
+            for group in groups
+            if len(group)
+        ]
+
+    @staticmethod
+    def _specs(indicators: List) -> List[Tuple[str, Dict]]:
+        from fmp_py.fmp_chart_data import FmpChartData
+
+        specs = []
+        for indicator in indicators:
+            name, kwargs = (
+                (indicator, {}) if isinstance(indicator, str) else tuple(indicator)
+            )
+            method = getattr(FmpChartData, name, None)
+            if (
+                name.startswith("_")
+                or name in ("return_chart", "sweep", "volume_profile")
+                or not callable(method)
+            ):
+                raise ValueError(f"Unknown indicator: {name}")
+            specs.append((name, dict(kwargs)))
+        return specs
+
+    @staticmethod
+    def _probe(specs: List[Tuple[str, Dict]]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Runs the indicators on a short synthetic chart to learn their columns and dtypes.
+        """
+        rng = np.random.default_rng(0)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, PROBE_ROWS)))
+        chart = pd.DataFrame(
+            {
+                "open": close * np.exp(rng.normal(0, 0.003, PROBE_ROWS)),
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "volume": rng.integers(1_000, 1_000_000, PROBE_ROWS),
+            },
+            index=pd.date_range("2024-01-02 09:30", periods=PROBE_ROWS, freq="min"),
+        )
+        chart["high"] = chart[["open", "high"]].max(axis=1)
+        chart["low"] = chart[["open", "low"]].min(axis=1)
+
+        chart = _run(_chart_data(), chart, specs)
+        columns = [column for column in chart.columns if column not in OHLCV]
+        return columns, {column: str(chart[column].dtype) for column in columns}
+
+
+def _chart_data():
+    from fmp_py.fmp_chart_data import FmpChartData
+
+    return FmpChartData.from_chart(pd.DataFrame(columns=OHLCV), api_key="offline")
+
+
+def _run(chart_data, chart: pd.DataFrame, specs: List[Tuple[str, Dict]]):
+    chart_data.chart = chart
+    for name, kwargs in specs:
+        getattr(chart_data, name)(**kwargs)
+    return chart_data.chart
+
+
+def _attach(
+    inputs: str,
+    outputs: str,
+    total: int,
+    columns: List[str],
+    specs: List[Tuple[str, Dict]],
+    timestamps: bool,
+    zones: Dict[int, str],
+) -> None:
+    """
+    Maps the shared blocks into a worker process.
+    """
+    blocks = [SharedMemory(name=inputs), SharedMemory(name=outputs)]
+    _worker.update(
+        blocks=blocks,
+        bars=np.ndarray((len(OHLCV), total), dtype=np.float64, buffer=blocks[0].buf),
+        stamps=np.ndarray(
+            total, dtype=np.int64, buffer=blocks[0].buf, offset=len(OHLCV) * total * 8
+        )
+        if timestamps
+        else None,
+        zones=zones,
+        values=np.ndarray(
+            (len(columns) + 1, total), dtype=np.float64, buffer=blocks[1].buf
+        ),
+        columns=columns,
+        specs=specs,
+        chart_data=_chart_data(),
+    )
+
+
+def _detach() -> None:
+    blocks = _worker.pop("blocks")
+    _worker.clear()
+    for block in blocks:
+        block.close()
+
+
+def _compute(shard: List[Tuple[int, int]]) -> int:
+    """
+    Computes the indicators for one shard of row ranges and writes them to the output block.
+    """
+    bars, values, stamps = _worker["bars"], _worker["values"], _worker["stamps"]
+    for start, stop in shard:
+        index = None
+        if stamps is not None:
+            index = pd.DatetimeIndex(stamps[start:stop].view("datetime64[ns]"))
+            if start in _worker["zones"]:
+                index = index.tz_localize("UTC").tz_convert(_worker["zones"][start])
+        chart = pd.DataFrame(
+            {column: bars[row, start:stop] for row, column in enumerate(OHLCV)},
+            index=index,
+        )
+        result = _run(_worker["chart_data"], chart, _worker["specs"])
+
+        rows = np.arange(stop - start)
+        if len(result) != len(chart):
+            if not chart.index.is_unique:
+                raise ValueError(
+                    "Indicators that drop rows need charts with a unique index."
+                )
+            rows = chart.index.get_indexer(result.index)
+        values[:, start:stop] = np.nan
+        values[-1, start:stop] = 0.0
+        values[-1, start + rows] = 1.0
+        for row, column in enumerate(_worker["columns"]):
+            values[row, start + rows] = result[column].to_numpy(np.float64)
+    return len(shard)
@@ -2,9 +2,6 @@ import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
 import pendulum
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 """
@@ -45,9 +42,7 @@ class FmpIpoCalendar(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v3/ipo_calendar"
-        params = {"from": from_date, "to": to_date}
-
-        response = self.get_request(url, params)
+        response = self.get_calendar_request(url, from_date, to_date)
 
         if not response:
             raise ValueError("Error fetching IPO calendar data")
@@ -119,9 +114,9 @@ class FmpIpoCalendar(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v4/ipo-calendar-prospectus"
-        params = {"from": from_date, "to": to_date}
-
-        response = self.get_request(url, params)
+        response = self.get_calendar_request(
+            url, from_date, to_date, keys=("symbol", "form", "acceptedDate")
+        )
 
         if not response:
             raise ValueError("Error fetching IPO calendar data")
@@ -190,9 +185,9 @@ class FmpIpoCalendar(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v4/ipo-calendar-confirmed"
-        params = {"from": from_date, "to": to_date}
-
-        response = self.get_request(url, params)
+        response = self.get_calendar_request(
+            url, from_date, to_date, keys=("symbol", "form", "acceptedDate")
+        )
 
         if not response:
             raise ValueError("Error fetching IPO calendar data")
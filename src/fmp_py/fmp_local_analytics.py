@@ -0,0 +1,711 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_fundamentals_warehouse import FmpFundamentalsWarehouse
+
+
+"""
+The FmpLocalAnalytics class derives the FmpStatementAnalysis ratio and growth tables from
+statements already on hand (an FmpFundamentalsWarehouse or frames returned by
+FmpFinancialStatements), for any number of symbols at once and without API calls.
+
+def ratios(self, symbols: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Mirrors FmpStatementAnalysis.ratios.
+
+def income_growth(self, symbols: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Mirrors FmpStatementAnalysis.income_growth.
+
+def balance_sheet_growth(self, symbols: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Mirrors FmpStatementAnalysis.balance_sheet_growth.
+
+def cashflow_growth(self, symbols: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Mirrors FmpStatementAnalysis.cashflow_growth.
+
+def financial_growth(self, symbols: List[str] = None, period: str = "annual") -> pd.DataFrame:
+    Mirrors FmpStatementAnalysis.financial_growth.
+
+def ttm(self, kind: str, symbols: List[str] = None) -> pd.DataFrame:
+    Trailing twelve month sums of quarterly income or cash flow statements.
+"""
+
+
+class FmpLocalAnalytics:
+    KEYS = ["symbol", "date", "calendar_year", "period"]
+
+    INCOME_GROWTH = {
+        "growth_revenue": "revenue",
+        "growth_cost_of_revenue": "cost_of_revenue",
+        "growth_gross_profit": "gross_profit",
+        "growth_gross_profit_ratio": "gross_profit_ratio",
+        "growth_research_and_development_expenses": "research_and_development_expenses",
+        "growth_general_and_administrative_expenses": "general_and_administrative_expenses",
+        "growth_selling_and_marketing_expenses": "selling_and_marketing_expenses",
+        "growth_other_expenses": "other_expenses",
+        "growth_operating_expenses": "operating_expenses",
+        "growth_cost_and_expenses": "cost_and_expenses",
+        "growth_interest_expense": "interest_expense",
+        "growth_depreciation_and_amortization": "depreciation_and_amortization",
+        "growth_ebitda": "ebitda",
+        "growth_ebitda_ratio": "ebitda_ratio",
+        "growth_operating_income": "operating_income",
+        "growth_operating_income_ratio": "operating_income_ratio",
+        "growth_total_other_income_expenses_net": "total_other_income_expenses_net",
+        "growth_income_before_tax": "income_before_tax",
+        "growth_income_before_tax_ratio": "income_before_tax_ratio",
+        "growth_income_tax_expense": "income_tax_expense",
+        "growth_net_income": "net_income",
+        "growth_net_income_ratio": "net_income_ratio",
+        "growth_eps": "eps",
+        "growth_eps_diluted": "epsdiluted",
+        "growth_weighted_average_shs_out": "weighted_average_shs_out",
+        "growth_weighted_average_shs_out_dil": "weighted_average_shs_out_dil",
+    }
+
+    BALANCE_SHEET_GROWTH = {
+        "growth_cash_and_cash_equivalents": "cash_and_cash_equivalents",
+        "growth_short_term_investments": "short_term_investments",
+        "growth_cash_and_short_term_investments": "cash_and_short_term_investments",
+        "growth_net_receivables": "net_receivables",
+        "growth_inventory": "inventory",
+        "growth_other_current_assets": "other_current_assets",
+        "growth_total_current_assets": "total_current_assets",
+        "growth_property_plant_equipment_net": "property_plant_equipment_net",
+        "growth_goodwill": "goodwill",
+        "growth_intangible_assets": "intangible_assets",
+        "growth_goodwill_and_intangible_assets": "goodwill_and_intangible_assets",
+        "growth_long_term_investments": "long_term_investments",
+        "growth_tax_assets": "tax_assets",
+        "growth_other_non_current_assets": "other_non_current_assets",
+        "growth_total_non_current_assets": "total_non_current_assets",
+        "growth_other_assets": "other_assets",
+        "growth_total_assets": "total_assets",
+        "growth_account_payables": "account_payables",
+        "growth_short_term_debt": "short_term_debt",
+        "growth_tax_payables": "tax_payables",
+        "growth_deferred_revenue": "deferred_revenue",
+        "growth_other_current_liabilities": "other_current_liabilities",
+        "growth_total_current_liabilities": "total_current_liabilities",
+        "growth_long_term_debt": "long_term_debt",
+        "growth_deferred_revenue_non_current": "deferred_revenue_non_current",
+        "growth_deferrred_tax_liabilities_non_current": "deferred_tax_liabilities_non_current",
+        "growth_other_non_current_liabilities": "other_non_current_liabilities",
+        "growth_total_non_current_liabilities": "total_non_current_liabilities",
+        "growth_other_liabilities": "other_liabilities",
+        "growth_total_liabilities": "total_liabilities",
+        "growth_common_stock": "common_stock",
+        "growth_retained_earnings": "retained_earnings",
+        "growth_accumulated_other_comprehensive_income_loss": "accumulated_other_comprehensive_income_loss",
+        "growth_othertotal_stockholders_equity": "othertotal_stockholders_equity",
+        "growth_total_stockholders_equity": "total_stockholders_equity",
+        "growth_total_liabilities_and_stockholders_equity": "total_liabilities_and_stockholders_equity",
+        "growth_total_investments": "total_investments",
+        "growth_total_debt": "total_debt",
+        "growth_net_debt": "net_debt",
+    }
+
+    CASHFLOW_GROWTH = {
+        "growth_net_income": "net_income",
+        "growth_depreciation_and_amortization": "depreciation_and_amortization",
+        "growth_stock_based_compensation": "stock_based_compensation",
+        "growth_change_in_working_capital": "change_in_working_capital",
+        "growth_accounts_receivables": "accounts_receivables",
+        "growth_inventory": "inventory",
+        "growth_accounts_payables": "accounts_payables",
+        "growth_other_working_capital": "other_working_capital",
+        "growth_other_non_cash_items": "other_non_cash_items",
+        "growth_net_cash_provided_by_operating_activities": "net_cash_provided_by_operating_activities",
+        "growth_investments_in_property_plant_and_equipment": "investments_in_property_plant_and_equipment",
+        "growth_acquisitions_net": "acquisitions_net",
+        "growth_purchases_of_investments": "purchases_of_investments",
+        "growth_sales_maturities_of_investments": "sales_maturities_of_investments",
+        "growth_net_cash_used_for_investing_activities": "net_cash_used_for_investing_activites",
+        "growth_debt_repayment": "debt_repayment",
+        "growth_common_stock_issued": "common_stock_issued",
+        "growth_common_stock_repurchased": "common_stock_repurchased",
+        "growth_deferred_income_tax": "deferred_income_tax",
+        "growth_dividends_paid": "dividends_paid",
+        "growth_net_cash_used_provided_by_financing_activities": "net_cash_used_provided_by_financing_activities",
+        "growth_effect_of_forex_changes_on_cash": "effect_of_forex_changes_on_cash",
+        "growth_net_change_in_cash": "net_change_in_cash",
+        "growth_cash_at_end_of_period": "cash_at_end_of_period",
+        "growth_cash_at_beginning_of_period": "cash_at_beginning_of_period",
+        "growth_operating_cash_flow": "operating_cash_flow",
+        "growth_capital_expenditure": "capital_expenditure",
+        "growth_free_cash_flow": "free_cash_flow",
+        "growth_other_investing_activites": "other_investing_activites",
+        "growth_other_financing_activites": "other_financing_activites",
+    }
+
+    # Ratio columns recomputed from the summed flows in ttm().
+    TTM_RATIOS = {
+        "gross_profit_ratio": "gross_profit",
+        "ebitda_ratio": "ebitda",
+        "operating_income_ratio": "operating_income",
+        "income_before_tax_ratio": "income_before_tax",
+        "net_income_ratio": "net_income",
+    }
+    TTM_LAST = ["weighted_average_shs_out", "weighted_average_shs_out_dil"]
+
+    def __init__(self, warehouse: FmpFundamentalsWarehouse = None) -> None:
+        """
+        Initialize the FmpLocalAnalytics class.
+
+        Args:
+            warehouse (FmpFundamentalsWarehouse, optional): Where to read statements from when
+                frames are not passed to a method. Defaults to None.
+        """
+        self.warehouse = warehouse
+
+    ############################
+    # Ratios
+    ############################
+    def ratios(
+        self,
+        symbols: List[str] = None,
+        period: str = "annual",
+        income_df: pd.DataFrame = None,
+        balance_sheet_df: pd.DataFrame = None,
+        cashflow_df: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Computes the financial ratios returned by FmpStatementAnalysis.ratios: every
+        renamed column from current_ratio to asset_turnover. The fields the endpoint also
+        returns under their camelCase names are not computed, in particular the
+        price-based ones that need a share price (priceEarningsRatio, priceToBookRatio,
+        priceBookValueRatio, priceToSalesRatio, priceSalesRatio, priceCashFlowRatio,
+        priceToFreeCashFlowsRatio, priceToOperatingCashFlowsRatio,
+        priceEarningsToGrowthRatio, priceFairValue, dividendYield and
+        enterpriseValueMultiple).
+
+        Args:
+            symbols (List[str], optional): Symbols to read from the warehouse. Defaults to all.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            income_df (pd.DataFrame, optional): Income statements. Defaults to the warehouse.
+            balance_sheet_df (pd.DataFrame, optional): Balance sheets. Defaults to the warehouse.
+            cashflow_df (pd.DataFrame, optional): Cash flow statements. Defaults to the warehouse.
+
+        Returns:
+            pd.DataFrame: The ratios, one row per symbol and period.
+
+        Raises:
+            ValueError: If the period is not 'annual' or 'quarter'.
+        """
+        self._validate_period(period)
+        days = 365 if period == "annual" else 90
+
+        data = self._merge(
+            self._load("income", income_df, symbols, period),
+            self._load("balance_sheet", balance_sheet_df, symbols, period),
+            self._load("cashflow", cashflow_df, symbols, period),
+            {
+                "income": [
+                    "revenue",
+                    "cost_of_revenue",
+                    "gross_profit",
+                    "operating_income",
+                    "income_before_tax",
+                    "income_tax_expense",
+                    "net_income",
+                    "interest_expense",
+                ],
+                "balance_sheet": [
+                    "total_current_assets",
+                    "total_current_liabilities",
+                    "cash_and_cash_equivalents",
+                    "cash_and_short_term_investments",
+                    "net_receivables",
+                    "inventory",
+                    "account_payables",
+                    "property_plant_equipment_net",
+                    "total_assets",
+                    "total_liabilities",
+                    "total_stockholders_equity",
+                    "long_term_debt",
+                    "total_debt",
+                ],
+                "cashflow": ["operating_cash_flow"],
+            },
+        )
+
+        ratios = pd.DataFrame(index=data.index)
+        ratios["current_ratio"] = self._divide(
+            data["total_current_assets"], data["total_current_liabilities"]
+        )
+        ratios["quick_ratio"] = self._divide(
+            data["cash_and_short_term_investments"] + data["net_receivables"],
+            data["total_current_liabilities"],
+        )
+        ratios["cash_ratio"] = self._divide(
+            data["cash_and_cash_equivalents"], data["total_current_liabilities"]
+        )
+        ratios["days_of_sales_outstanding"] = (
+            self._divide(data["net_receivables"], data["revenue"]) * days
+        )
+        ratios["days_of_inventory_outstanding"] = (
+            self._divide(data["inventory"], data["cost_of_revenue"]) * days
+        )
+        ratios["operating_cycle"] = (
+            ratios["days_of_sales_outstanding"]
+            + ratios["days_of_inventory_outstanding"]
+        )
+        ratios["days_of_payables_outstanding"] = (
+            self._divide(data["account_payables"], data["cost_of_revenue"]) * days
+        )
+        ratios["cash_conversion_cycle"] = (
+            ratios["operating_cycle"] - ratios["days_of_payables_outstanding"]
+        )
+        ratios["gross_profit_margin"] = self._divide(
+            data["gross_profit"], data["revenue"]
+        )
+        ratios["operating_profit_margin"] = self._divide(
+            data["operating_income"], data["revenue"]
+        )
+        ratios["pretax_profit_margin"] = self._divide(
+            data["income_before_tax"], data["revenue"]
+        )
+        ratios["net_profit_margin"] = self._divide(data["net_income"], data["revenue"])
+        ratios["effective_tax_rate"] = self._divide(
+            data["income_tax_expense"], data["income_before_tax"]
+        )
+        ratios["return_on_assets"] = self._divide(
+            data["net_income"], data["total_assets"]
+        )
+        ratios["return_on_equity"] = self._divide(
+            data["net_income"], data["total_stockholders_equity"]
+        )
+        ratios["return_on_capital_employed"] = self._divide(
+            data["operating_income"],
+            data["total_assets"] - data["total_current_liabilities"],
+        )
+        ratios["net_income_per_ebt"] = self._divide(
+            data["net_income"], data["income_before_tax"]
+        )
+        ratios["ebt_per_ebit"] = self._divide(
+            data["income_before_tax"], data["operating_income"]
+        )
+        ratios["ebit_per_revenue"] = self._divide(
+            data["operating_income"], data["revenue"]
+        )
+        ratios["debt_ratio"] = self._divide(
+            data["total_liabilities"], data["total_assets"]
+        )
+        ratios["debt_equity_ratio"] = self._divide(
+            data["total_debt"], data["total_stockholders_equity"]
+        )
+        ratios["longterm_debt_to_capitalization"] = self._divide(
+            data["long_term_debt"],
+            data["long_term_debt"] + data["total_stockholders_equity"],
+        )
+        ratios["total_debt_to_capitalization"] = self._divide(
+            data["total_debt"], data["total_debt"] + data["total_stockholders_equity"]
+        )
+        ratios["interest_coverage"] = self._divide(
+            data["operating_income"], data["interest_expense"]
+        )
+        ratios["cash_flow_to_debt_ratio"] = self._divide(
+            data["operating_cash_flow"], data["total_debt"]
+        )
+        ratios["company_equity_multiplier"] = self._divide(
+            data["total_assets"], data["total_stockholders_equity"]
+        )
+        ratios["receivables_turnover"] = self._divide(
+            data["revenue"], data["net_receivables"]
+        )
+        ratios["payables_turnover"] = self._divide(
+            data["cost_of_revenue"], data["account_payables"]
+        )
+        ratios["inventory_turnover"] = self._divide(
+            data["cost_of_revenue"], data["inventory"]
+        )
+        ratios["fixed_asset_turnover"] = self._divide(
+            data["revenue"], data["property_plant_equipment_net"]
+        )
+        ratios["asset_turnover"] = self._divide(data["revenue"], data["total_assets"])
+
+        return self._finish(data, ratios)
+
+    ############################
+    # Income Growth
+    ############################
+    def income_growth(
+        self,
+        symbols: List[str] = None,
+        period: str = "annual",
+        income_df: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Computes the period over period growth returned by FmpStatementAnalysis.income_growth.
+
+        Args:
+            symbols (List[str], optional): Symbols to read from the warehouse. Defaults to all.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            income_df (pd.DataFrame, optional): Income statements. Defaults to the warehouse.
+
+        Returns:
+            pd.DataFrame: The growth rates, one row per symbol and period.
+
+        Raises:
+            ValueError: If the period is not 'annual' or 'quarter'.
+        """
+        self._validate_period(period)
+        data = self._sort(self._load("income", income_df, symbols, period))
+        return self._growth_table(data, self.INCOME_GROWTH)
+
+    ############################
+    # Balance Sheet Growth
+    ############################
+    def balance_sheet_growth(
+        self,
+        symbols: List[str] = None,
+        period: str = "annual",
+        balance_sheet_df: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Computes the period over period growth returned by FmpStatementAnalysis.balance_sheet_growth.
+
+        Args:
+            symbols (List[str], optional): Symbols to read from the warehouse. Defaults to all.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            balance_sheet_df (pd.DataFrame, optional): Balance sheets. Defaults to the warehouse.
+
+        Returns:
+            pd.DataFrame: The growth rates, one row per symbol and period.
+
+        Raises:
+            ValueError: If the period is not 'annual' or 'quarter'.
+        """
+        self._validate_period(period)
+        data = self._sort(
+            self._load("balance_sheet", balance_sheet_df, symbols, period)
+        )
+        return self._growth_table(data, self.BALANCE_SHEET_GROWTH)
+
+    ############################
+    # Cashflow Growth
+    ############################
+    def cashflow_growth(
+        self,
+        symbols: List[str] = None,
+        period: str = "annual",
+        cashflow_df: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Computes the period over period growth returned by FmpStatementAnalysis.cashflow_growth.
+
+        Args:
+            symbols (List[str], optional): Symbols to read from the warehouse. Defaults to all.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            cashflow_df (pd.DataFrame, optional): Cash flow statements. Defaults to the warehouse.
+
+        Returns:
+            pd.DataFrame: The growth rates, one row per symbol and period.
+
+        Raises:
+            ValueError: If the period is not 'annual' or 'quarter'.
+        """
+        self._validate_period(period)
+        data = self._sort(self._load("cashflow", cashflow_df, symbols, period))
+        return self._growth_table(data, self.CASHFLOW_GROWTH)
+
+    ############################
+    # Financial Growth
+    ############################
+    def financial_growth(
+        self,
+        symbols: List[str] = None,
+        period: str = "annual",
+        income_df: pd.DataFrame = None,
+        balance_sheet_df: pd.DataFrame = None,
+        cashflow_df: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Computes the growth summary returned by FmpStatementAnalysis.financial_growth,
+        including the 3, 5 and 10 year per share growth rates.
+
+        Args:
+            symbols (List[str], optional): Symbols to read from the warehouse. Defaults to all.
+            period (str, optional): "annual" or "quarter". Defaults to "annual".
+            income_df (pd.DataFrame, optional): Income statements. Defaults to the warehouse.
+            balance_sheet_df (pd.DataFrame, optional): Balance sheets. Defaults to the warehouse.
+            cashflow_df (pd.DataFrame, optional): Cash flow statements. Defaults to the warehouse.
+
+        Returns:
+            pd.DataFrame: The growth rates, one row per symbol and period.
+
+        Raises:
+            ValueError: If the period is not 'annual' or 'quarter'.
+        """
+        self._validate_period(period)
+        periods_per_year = 1 if period == "annual" else 4
+
+        data = self._merge(
+            self._load("income", income_df, symbols, period),
+            self._load("balance_sheet", balance_sheet_df, symbols, period),
+            self._load("cashflow", cashflow_df, symbols, period),
+            {
+                "income": [
+                    "revenue",
+                    "gross_profit",
+                    "operating_income",
+                    "net_income",
+                    "eps",
+                    "epsdiluted",
+                    "weighted_average_shs_out",
+                    "weighted_average_shs_out_dil",
+                    "research_and_development_expenses",
+                    "selling_general_and_administrative_expenses",
+                ],
+                "balance_sheet": [
+                    "net_receivables",
+                    "inventory",
+                    "total_assets",
+                    "total_stockholders_equity",
+                    "total_debt",
+                ],
+                "cashflow": ["operating_cash_flow", "free_cash_flow", "dividends_paid"],
+            },
+        )
+
+        shares = data["weighted_average_shs_out"]
+        per_share = {
+            "revenue": self._divide(data["revenue"], shares),
+            "operating_cf": self._divide(data["operating_cash_flow"], shares),
+            "net_income": self._divide(data["net_income"], shares),
+            "shareholders_equity": self._divide(
+                data["total_stockholders_equity"], shares
+            ),
+            "dividend": self._divide(-data["dividends_paid"], shares),
+        }
+
+        sources = pd.DataFrame(
+            {
+                "revenue_growth": data["revenue"],
+                "gross_profit_growth": data["gross_profit"],
+                "ebit_growth": data["operating_income"],
+                "operating_income_growth": data["operating_income"],
+                "net_income_growth": data["net_income"],
+                "eps_growth": data["eps"],
+                "eps_diluted_growth": data["epsdiluted"],
+                "weighted_average_shares_growth": shares,
+                "weighted_average_shares_diluted_growth": data[
+                    "weighted_average_shs_out_dil"
+                ],
+                "dividends_per_share_growth": per_share["dividend"],
+                "operating_cash_flow_growth": data["operating_cash_flow"],
+                "free_cash_flow_growth": data["free_cash_flow"],
+                "receivables_growth": data["net_receivables"],
+                "inventory_growth": data["inventory"],
+                "asset_growth": data["total_assets"],
+                "book_value_per_share_growth": per_share["shareholders_equity"],
+                "debt_growth": data["total_debt"],
+                "rdexpense_growth": data["research_and_development_expenses"],
+                "sgaexpenses_growth": data[
+                    "selling_general_and_administrative_expenses"
+                ],
+            },
+            index=data.index,
+        )
+        growth = self._growth(sources, data["symbol"], 1)
+
+        per_share_df = pd.DataFrame(per_share, index=data.index)
+        for years, prefix in [(10, "ten_y"), (5, "five_y"), (3, "three_y")]:
+            long_growth = self._growth(
+                per_share_df, data["symbol"], years * periods_per_year
+            )
+            for name, column in long_growth.items():
+                growth[f"{prefix}_{name}_growth_per_share"] = column
+
+        growth = growth[
+            [
+                "revenue_growth",
+                "gross_profit_growth",
+                "ebit_growth",
+                "operating_income_growth",
+                "net_income_growth",
+                "eps_growth",
+                "eps_diluted_growth",
+                "weighted_average_shares_growth",
+                "weighted_average_shares_diluted_growth",
+                "dividends_per_share_growth",
+                "operating_cash_flow_growth",
+                "free_cash_flow_growth",
+                "ten_y_revenue_growth_per_share",
+                "five_y_revenue_growth_per_share",
+                "three_y_revenue_growth_per_share",
+                "ten_y_operating_cf_growth_per_share",
+                "five_y_operating_cf_growth_per_share",
+                "three_y_operating_cf_growth_per_share",
+                "ten_y_net_income_growth_per_share",
+                "five_y_net_income_growth_per_share",
+                "three_y_net_income_growth_per_share",
+                "ten_y_shareholders_equity_growth_per_share",
+                "five_y_shareholders_equity_growth_per_share",
+                "three_y_shareholders_equity_growth_per_share",
+                "ten_y_dividend_growth_per_share",
+                "five_y_dividend_growth_per_share",
+                "three_y_dividend_growth_per_share",
+                "receivables_growth",
+                "inventory_growth",
+                "asset_growth",
+                "book_value_per_share_growth",
+                "debt_growth",
+                "rdexpense_growth",
+                "sgaexpenses_growth",
+            ]
+        ].rename(
+            columns={
+                "ten_y_dividend_growth_per_share": "ten_y_dividend_per_share_growth_per_share",
+                "five_y_dividend_growth_per_share": "five_y_dividend_per_share_growth_per_share",
+                "three_y_dividend_growth_per_share": "three_y_dividend_per_share_growth_per_share",
+            }
+        )
+
+        return self._finish(data, growth)
+
+    ############################
+    # TTM
+    ############################
+    def ttm(
+        self,
+        kind: str,
+        symbols: List[str] = None,
+        data_df: pd.DataFrame = None,
+    ) -> pd.DataFrame:
+        """
+        Sums the last four quarters of income or cash flow statements for every quarter with
+        four consecutive quarters behind it. Ratio columns are recomputed from the sums and
+        share counts are taken from the latest quarter.
+
+        Args:
+            kind (str): "income" or "cashflow".
+            symbols (List[str], optional): Symbols to read from the warehouse. Defaults to all.
+            data_df (pd.DataFrame, optional): Quarterly statements. Defaults to the warehouse.
+
+        Returns:
+            pd.DataFrame: One row per symbol and quarter end with the trailing twelve month values.
+
+        Raises:
+            ValueError: If the kind is not 'income' or 'cashflow'.
+        """
+        if kind not in ["income", "cashflow"]:
+            raise ValueError("Kind must be either 'income' or 'cashflow'")
+
+        data = self._sort(self._load(kind, data_df, symbols, "quarter"))
+        keys = [k for k in self.KEYS if k in data.columns]
+
+        numeric = [
+            c
+            for c in data.select_dtypes(include="number").columns
+            if c not in keys and c not in self.TTM_RATIOS and c not in self.TTM_LAST
+        ]
+
+        grouped = data.groupby("symbol", sort=False)
+        sums = grouped[numeric].rolling(4).sum().reset_index(level=0, drop=True)
+
+        # Four rows only make a year if they are four consecutive quarters.
+        span = data["date"] - grouped["date"].shift(3)
+        complete = span <= pd.Timedelta(days=300)
+
+        ttm = data[keys].copy()
+        ttm[numeric] = sums[numeric]
+        for column in self.TTM_LAST:
+            if column in data.columns:
+                ttm[column] = data[column]
+        for column, source in self.TTM_RATIOS.items():
+            if column in data.columns and "revenue" in ttm.columns:
+                ttm[column] = self._divide(ttm[source], ttm["revenue"])
+
+        return ttm[complete].reset_index(drop=True)
+
+    ############################
+    # Private Methods
+    ############################
+    def _load(
+        self,
+        kind: str,
+        data_df: pd.DataFrame,
+        symbols: List[str],
+        period: str,
+    ) -> pd.DataFrame:
+        """
+        Returns the frame passed in, or reads the statements from the warehouse.
+        """
+        if data_df is not None:
+            if symbols is not None:
+                data_df = data_df[data_df["symbol"].isin(symbols)]
+            return data_df
+
+        if self.warehouse is None:
+            raise ValueError(f"No {kind} statements given and no warehouse configured")
+
+        return self.warehouse.statements(kind, symbols, period)
+
+    def _merge(
+        self,
+        income_df: pd.DataFrame,
+        balance_sheet_df: pd.DataFrame,
+        cashflow_df: pd.DataFrame,
+        columns: Dict[str, List[str]],
+    ) -> pd.DataFrame:
+        """
+        Joins the needed columns of the three statements on symbol and date.
+        """
+        keys = [k for k in self.KEYS if k in income_df.columns]
+        data = income_df[keys + columns["income"]]
+        for frame, name in [
+            (balance_sheet_df, "balance_sheet"),
+            (cashflow_df, "cashflow"),
+        ]:
+            data = data.merge(
+                frame[["symbol", "date"] + columns[name]],
+                on=["symbol", "date"],
+                how="inner",
+            )
+        return self._sort(data)
+
+    def _growth_table(
+        self, data: pd.DataFrame, columns: Dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Builds a growth table from a mapping of output column to statement column.
+        """
+        available = {k: v for k, v in columns.items() if v in data.columns}
+        sources = pd.DataFrame(
+            {name: data[source] for name, source in available.items()},
+            index=data.index,
+        )
+        return self._finish(data, self._growth(sources, data["symbol"], 1))
+
+    @staticmethod
+    def _growth(sources: pd.DataFrame, symbol: pd.Series, periods: int) -> pd.DataFrame:
+        """
+        Period over period growth within each symbol, vectorized over every column.
+        """
+        sources = sources.astype("float64")
+        previous = sources.groupby(symbol, sort=False).shift(periods)
+        growth = (sources - previous) / previous
+        return growth.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    @staticmethod
+    def _divide(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+        """
+        Element-wise division with zero instead of inf or NaN, as the API reports it.
+        """
+        result = numerator.astype("float64") / denominator.astype("float64")
+        return result.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    def _sort(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data.sort_values(by=["symbol", "date"], ascending=True).reset_index(
+            drop=True
+        )
+
+    def _finish(self, data: pd.DataFrame, values: pd.DataFrame) -> pd.DataFrame:
+        keys = [k for k in self.KEYS if k in data.columns]
+        return pd.concat([data[keys], values], axis=1).reset_index(drop=True)
+
+    @staticmethod
+    def _validate_period(period: str) -> None:
+        if period not in ["annual", "quarter"]:
+            raise ValueError("Period must be either 'annual' or 'quarter'")
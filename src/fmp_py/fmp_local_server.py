@@ -0,0 +1,315 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_transport import fixture_key, fixture_path
+
+
+"""
+The FmpLocalServer class is a local stand-in for the FMP API for offline tests and load
+or latency benchmarks. It serves recorded fixtures when it has one for a request and
+synthetic payloads otherwise, after a configurable latency and with configurable error
+and 429 rates. Point clients at it with FMP_BASE_URL=server.url.
+
+def start(self) -> FmpLocalServer:
+    Starts serving on a background thread.
+
+def stop(self) -> None:
+    Stops the server.
+
+def register(self, prefix: str, payload: Callable) -> None:
+    Serves endpoints starting with prefix from a custom payload function.
+
+Run from the command line with:
+    python -m fmp_py.fmp_local_server --port 8000 --rows 1000 --latency 0.05
+"""
+
+
+class FmpLocalServer:
+    def __init__(
+        self,
+        fixtures: str = None,
+        rows: int = 100,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the FmpLocalServer class.
+
+        Args:
+            fixtures (str, optional): A directory recorded by FmpRecordReplayAdapter.
+                Defaults to None, which serves synthetic payloads only.
+            rows (int, optional): Records per synthetic payload. Requests with a limit
+                parameter get at most that many. Defaults to 100.
+            latency (float, optional): Seconds to wait before each response. Defaults to 0.
+            error_rate (float, optional): Share of requests answered with a 500. Defaults to 0.
+            throttle_rate (float, optional): Share of requests answered with a 429. Defaults to 0.
+            seed (int, optional): Seed for the error and 429 draws. Defaults to None.
+            host (str, optional): The interface to listen on. Defaults to "127.0.0.1".
+            port (int, optional): The port to listen on, 0 for any free one. Defaults to 0.
+        """
+        self.fixtures = fixtures
+        self.rows = rows
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.host = host
+        self.port = port
+
+        self.payloads = {}
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL to use as FMP_BASE_URL.
+        """
+        return f"http://{self.host}:{self.port}/api/"
+
+    def __enter__(self) -> "FmpLocalServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ############################
+    # Start and Stop
+    ############################
+    def start(self) -> "FmpLocalServer":
+        """
+        Starts serving on a background thread.
+
+        Returns:
+            FmpLocalServer: The server itself, with port set to the bound port.
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                status, body, headers = server.respond(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    ############################
+    # Payloads
+    ############################
+    def register(self, prefix: str, payload: Callable[[str, Dict, int], Any]) -> None:
+        """
+        Serves endpoints starting with prefix from a custom payload function.
+
+        Args:
+            prefix (str): An endpoint prefix such as "v3/quote/".
+            payload (Callable[[str, Dict, int], Any]): Called with the endpoint, the query
+                parameters and the row count. Returns the JSON payload.
+        """
+        self.payloads[prefix] = payload
+        self._cache.clear()
+
+    def respond(self, path: str) -> tuple:
+        """
+        Returns the status, body and extra headers of a request path.
+        """
+        with self._lock:
+            self.requests += 1
+            draw = self._random.random()
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if draw < self.throttle_rate:
+            return 429, b'{"Error Message": "Limit Reach"}', {"Retry-After": "1"}
+        if draw < self.throttle_rate + self.error_rate:
+            return 500, b'{"Error Message": "Internal Server Error"}', {}
+
+        endpoint, digest = fixture_key(path)
+        key = (endpoint, digest)
+        if key not in self._cache:
+            self._cache[key] = self._payload(path, endpoint)
+        return self._cache[key] + ({},)
+
+    def _payload(self, path: str, endpoint: str) -> tuple:
+        """
+        Returns the status and encoded body for a path, from its fixture when there is one.
+        """
+        if self.fixtures:
+            fixture = fixture_path(self.fixtures, path)
+            if os.path.exists(fixture):
+                with open(fixture, encoding="utf-8") as file:
+                    recorded = json.load(file)
+                body = (
+                    recorded["text"]
+                    if "text" in recorded
+                    else json.dumps(recorded["body"])
+                )
+                return recorded["status"], body.encode("utf-8")
+
+        params = dict(parse_qsl(urlsplit(path).query))
+        rows = min(self.rows, int(params.get("limit") or self.rows))
+
+        for prefix, payload in self.payloads.items():
+            if endpoint.startswith(prefix):
+                return 200, json.dumps(payload(endpoint, params, rows)).encode("utf-8")
+
+        return 200, json.dumps(self.synthetic(endpoint, params, rows)).encode("utf-8")
+
+    @staticmethod
+    def synthetic(endpoint: str, params: Dict, rows: int) -> Any:
+        """
+        Returns a synthetic payload with the fields of FMP price data: daily bars for
+        historical-price-full, intraday bars for historical-chart and full quotes with a
+        daily bar for anything else, newest first. The values are a random walk seeded by
+        the endpoint, so a request always gets the same payload.
+
+        Args:
+            endpoint (str): The endpoint, e.g. "v3/historical-price-full/AAPL".
+            params (Dict): The query parameters.
+            rows (int): The number of records.
+
+        Returns:
+            Any: A list of records, or a dict with symbol and historical for
+                historical-price-full endpoints.
+        """
+        last = endpoint.rsplit("/", 1)[-1]
+        symbol = params.get("symbol") or (last if last.isupper() else None)
+        rng = np.random.default_rng(zlib.crc32(endpoint.encode()))
+
+        intraday = endpoint.startswith("v3/historical-chart/")
+        end = pd.Timestamp(params.get("to") or "2024-06-28")
+        if intraday:
+            dates = pd.date_range(
+                end=end + pd.Timedelta(hours=16), periods=rows, freq="min"
+            )
+        else:
+            dates = pd.bdate_range(end=end, periods=rows)
+
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+        open_ = close * np.exp(rng.normal(0, 0.003, rows))
+        high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, rows))
+        low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, rows))
+        volume = rng.integers(1_000, 10_000_000, rows)
+        change = close - open_
+
+        bars = pd.DataFrame(
+            {
+                "date": dates.strftime("%Y-%m-%d %H:%M:%S" if intraday else "%Y-%m-%d"),
+                "open": open_.round(4),
+                "high": high.round(4),
+                "low": low.round(4),
+                "close": close.round(4),
+                "volume": volume,
+            }
+        )
+
+        if intraday:
+            return bars.iloc[::-1].to_dict("records")
+
+        bars["adjClose"] = bars["close"]
+        bars["unadjustedVolume"] = volume
+        bars["change"] = change.round(4)
+        bars["changePercent"] = (change / open_ * 100).round(4)
+        bars["vwap"] = ((high + low + close) / 3).round(4)
+        bars["label"] = dates.strftime("%B %d, %y")
+        bars["changeOverTime"] = (change / open_).round(6)
+
+        if endpoint.startswith("v3/historical-price-full/"):
+            return {"symbol": symbol, "historical": bars.iloc[::-1].to_dict("records")}
+
+        quotes = bars.assign(
+            symbol=symbol or [f"SYM{i:05d}" for i in range(rows)],
+            name=symbol or "Synthetic",
+            price=bars["close"],
+            changesPercentage=bars["changePercent"],
+            dayLow=bars["low"],
+            dayHigh=bars["high"],
+            yearHigh=(high * 1.2).round(4),
+            yearLow=(low * 0.8).round(4),
+            marketCap=volume * 100,
+            priceAvg50=bars["close"],
+            priceAvg200=bars["close"],
+            exchange="SYNTHETIC",
+            avgVolume=volume,
+            previousClose=bars["open"],
+            eps=1.0,
+            pe=(close / 1.0).round(4),
+            earningsAnnouncement="2024-07-25T20:00:00.000+0000",
+            sharesOutstanding=1_000_000,
+            timestamp=dates.to_numpy().astype("datetime64[s]").astype("int64"),
+        )
+        return quotes.iloc[::-1].to_dict("records")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the FMP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--fixtures", default=None)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FmpLocalServer(
+        fixtures=args.fixtures,
+        rows=args.rows,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    ).start()
+    print(f"Serving FMP stand-in at {server.url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
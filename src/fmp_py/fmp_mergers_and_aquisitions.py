@@ -1,9 +1,7 @@
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from typing import Iterator, Set
 
 
 """
@@ -13,12 +11,31 @@ Refer to the official documentation (https://site.financialmodelingprep.com/deve
 def ma_rss_feed(self, page: int = 0) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#m&a-rss-feed-mergers-&-acquisitions
 
+def ma_rss_feed_pages(self, cutoff: str = None, seen: Set[tuple] = None, prefetch: int = 4) -> Iterator[pd.DataFrame]:
+    Streams the RSS feed page by page while the next pages download concurrently.
+
+def ma_rss_feed_bulk(self, cutoff: str = None, seen: Set[tuple] = None, prefetch: int = 4) -> pd.DataFrame:
+    Downloads the RSS feed up to a cutoff date or already seen items as one DataFrame.
+
 def search_ma(self, query: str) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#search-m&a-mergers-&-acquisitions
 """
 
 
 class FmpMergersAndAquisitions(FmpBase):
+    RSS_COLUMNS = {
+        "companyName": "company_name",
+        "cik": "cik",
+        "symbol": "symbol",
+        "targetedCompanyName": "targeted_company_name",
+        "targetedCik": "targeted_cik",
+        "targetedSymbol": "targeted_symbol",
+        "transactionDate": "transaction_date",
+        "acceptanceTime": "acceptance_time",
+        "url": "url",
+    }
+    RSS_KEYS = ["symbol", "targeted_company_name", "acceptance_time", "url"]
+
     def __init__(self, api_key: str = os.getenv("FMP_API_KEY")) -> None:
         super().__init__(api_key)
 
@@ -92,21 +109,89 @@ class FmpMergersAndAquisitions(FmpBase):
         if not response:
             raise ValueError("No data found for the specified parameters.")
 
+        return self._shape_rss(response)
+
+    def ma_rss_feed_pages(
+        self,
+        cutoff: str = None,
+        seen: Set[tuple] = None,
+        start_page: int = 0,
+        prefetch: int = 4,
+        max_pages: int = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams the mergers and acquisitions RSS feed one page at a time while the next
+        pages are downloaded concurrently. Items repeated across page boundaries are
+        yielded once.
+
+        Args:
+            cutoff (str, optional): Stop at items accepted before this date. Defaults to None.
+            seen (Set[tuple], optional): RSS_KEYS tuples already processed. Iteration stops
+                at the first page containing one, and new keys are added. Defaults to None.
+            start_page (int, optional): The first page. Defaults to 0.
+            prefetch (int, optional): Pages downloaded ahead. Defaults to 4.
+            max_pages (int, optional): The maximum number of pages. Defaults to no limit.
+
+        Yields:
+            pd.DataFrame: The new items of each page, typed as in ma_rss_feed.
+        """
+        return self.iter_feed(
+            fetch_page=lambda page: self.get_request(
+                "v4/mergers-acquisitions-rss-feed", {"page": page}
+            ),
+            shape=self._shape_rss,
+            keys=self.RSS_KEYS,
+            date_column="acceptance_time",
+            cutoff=cutoff,
+            seen=seen,
+            start_page=start_page,
+            prefetch=prefetch,
+            max_pages=max_pages,
+        )
+
+    def ma_rss_feed_bulk(
+        self,
+        cutoff: str = None,
+        seen: Set[tuple] = None,
+        start_page: int = 0,
+        prefetch: int = 4,
+        max_pages: int = None,
+    ) -> pd.DataFrame:
+        """
+        Downloads the mergers and acquisitions RSS feed until the cutoff date, an already
+        seen item or the last page, and returns it as one DataFrame.
+
+        Args:
+            cutoff (str, optional): Stop at items accepted before this date. Defaults to None.
+            seen (Set[tuple], optional): RSS_KEYS tuples already processed. Defaults to None.
+            start_page (int, optional): The first page. Defaults to 0.
+            prefetch (int, optional): Pages downloaded ahead. Defaults to 4.
+            max_pages (int, optional): The maximum number of pages. Defaults to no limit.
+
+        Returns:
+            pd.DataFrame: The new items, newest first. Empty when nothing is new.
+        """
+        frames = list(
+            self.ma_rss_feed_pages(cutoff, seen, start_page, prefetch, max_pages)
+        )
+        if not frames:
+            return self._shape_rss([])
+
+        return pd.concat(frames, ignore_index=True)
+
+    ############################
+    # Private Methods
+    ############################
+    def _shape_rss(self, response: list) -> pd.DataFrame:
+        """
+        Converts raw RSS feed records into a typed DataFrame.
+        """
         data_df = (
-            pd.DataFrame(response)
-            .fillna("")
-            .rename(
-                columns={
-                    "companyName": "company_name",
-                    "symbol": "symbol",
-                    "targetedCompanyName": "targeted_company_name",
-                    "targetedCik": "targeted_cik",
-                    "targetedSymbol": "targeted_symbol",
-                    "transactionDate": "transaction_date",
-                    "acceptanceTime": "acceptance_time",
-                    "url": "url",
-                }
+            pd.DataFrame(
+                response or None, columns=None if response else self.RSS_COLUMNS
             )
+            .fillna("")
+            .rename(columns=self.RSS_COLUMNS)
             .astype(
                 {
                     "company_name": "str",
@@ -0,0 +1,209 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+"""
+Builds endpoint results in formats other than pandas straight from the decoded JSON
+records, using the same rename and astype schemas as the pandas path of the endpoint.
+
+def check_output(output: str) -> str:
+    Validates an output name.
+
+def build_output(records: List[dict], columns: Dict[str, str], types: Dict[str, str], output: str, sort_by: str = None) -> Any:
+    Returns the records as a pyarrow Table, a polars DataFrame or a dict of numpy arrays.
+
+pyarrow and polars are optional and only imported when their output is asked for.
+"""
+
+OUTPUTS = ("pandas", "arrow", "polars", "numpy")
+
+KINDS = {
+    "str": "str",
+    "string": "str",
+    "object": "str",
+    "category": "category",
+    "float": "float",
+    "float64": "float",
+    "int": "int",
+    "int64": "int",
+    "Int64": "int",
+    "bool": "bool",
+    "datetime64[ns]": "datetime",
+    "auto": "auto",
+}
+
+
+def check_output(output: str) -> str:
+    """
+    Validates an output name.
+
+    Args:
+        output (str): One of "pandas", "arrow", "polars" or "numpy".
+
+    Returns:
+        str: The output name.
+
+    Raises:
+        ValueError: If the output is not supported.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Invalid output. Allowed outputs: {list(OUTPUTS)}")
+    return output
+
+
+def build_output(
+    records: List[dict],
+    columns: Dict[str, str],
+    types: Dict[str, str],
+    output: str,
+    sort_by: str = None,
+) -> Any:
+    """
+    Returns decoded records in a non-pandas output format. Fields are renamed with
+    columns and cast with types, as the pandas path does with rename() and astype();
+    fields that are not in columns keep their name and inferred type. Missing values stay null in arrow
+    and polars; in numpy they are NaN, NaT, 0, False or "" depending on the type, and
+    strings are object arrays that share the decoded str objects.
+
+    Args:
+        records (List[dict]): The decoded JSON records.
+        columns (Dict[str, str]): Raw field name to column name.
+        types (Dict[str, str]): Column name to pandas dtype name.
+        output (str): "arrow", "polars" or "numpy".
+        sort_by (str, optional): A column to sort ascending by. Defaults to None.
+
+    Returns:
+        Any: A pyarrow.Table, a polars.DataFrame or a dict of column name to numpy array.
+
+    Raises:
+        ValueError: If the output is not supported or a dtype has no equivalent.
+        ImportError: If pyarrow or polars is needed and not installed.
+    """
+    check_output(output)
+    if output == "pandas":
+        raise ValueError("build_output does not build pandas output.")
+
+    fields = list(columns)
+    seen = set(fields)
+    for record in records:
+        for field in record:
+            if field not in seen:
+                seen.add(field)
+                fields.append(field)
+
+    kinds = {}
+    for field in fields:
+        name = columns.get(field, field)
+        dtype = str(types.get(name, "auto"))
+        if dtype not in KINDS:
+            raise ValueError(f"No {output} type for dtype '{dtype}' of '{name}'.")
+        kinds[field] = KINDS[dtype]
+
+    if output == "arrow":
+        return _arrow(records, columns, kinds, sort_by)
+    if output == "polars":
+        return _polars(records, columns, kinds, sort_by)
+    return _numpy(records, columns, kinds, sort_by)
+
+
+def _import(module: str, extra: str):
+    """
+    Imports an optional dependency with an install hint when it is missing.
+    """
+    try:
+        return __import__(module)
+    except ImportError as error:
+        raise ImportError(
+            f"{extra} output needs {module}. Install it with 'pip install {extra}'."
+        ) from error
+
+
+def _arrow(records, columns, kinds, sort_by):
+    pa = _import("pyarrow", "pyarrow")
+    targets = {
+        "str": pa.string(),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "bool": pa.bool_(),
+        "datetime": pa.timestamp("ns"),
+    }
+
+    arrays, names = [], []
+    for field, kind in kinds.items():
+        array = pa.array([record.get(field) for record in records])
+        if kind == "category":
+            array = array.cast(pa.string()).dictionary_encode()
+        elif kind != "auto":
+            array = array.cast(targets[kind], safe=False)
+        arrays.append(array)
+        names.append(columns.get(field, field))
+
+    table = pa.table(arrays, names=names)
+    return table.sort_by(sort_by) if sort_by else table
+
+
+def _polars(records, columns, kinds, sort_by):
+    pl = _import("polars", "polars")
+    targets = {
+        "str": pl.Utf8,
+        "float": pl.Float64,
+        "int": pl.Int64,
+        "bool": pl.Boolean,
+    }
+
+    data_df = pl.from_dicts(records, infer_schema_length=None)
+    expressions = []
+    for field, kind in kinds.items():
+        if field in data_df.columns:
+            expression = pl.col(field)
+        else:
+            expression = pl.lit(None)
+        if kind == "datetime":
+            expression = expression.cast(pl.Utf8).str.to_datetime(
+                time_unit="ns", strict=False
+            )
+        elif kind == "category":
+            expression = expression.cast(pl.Utf8).cast(pl.Categorical)
+        elif kind != "auto":
+            expression = expression.cast(targets[kind], strict=False)
+        expressions.append(expression.alias(columns.get(field, field)))
+
+    data_df = data_df.select(expressions)
+    return data_df.sort(sort_by) if sort_by else data_df
+
+
+def _numpy(records, columns, kinds, sort_by) -> Dict[str, np.ndarray]:
+    arrays = {}
+    for field, kind in kinds.items():
+        values = [record.get(field) for record in records]
+        if kind == "float":
+            array = np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            )
+        elif kind == "int":
+            array = np.array(
+                [0 if value is None else int(value) for value in values],
+                dtype=np.int64,
+            )
+        elif kind == "bool":
+            array = np.array([bool(value) for value in values], dtype=bool)
+        elif kind == "datetime":
+            array = np.array(
+                ["NaT" if value is None else value for value in values],
+                dtype="datetime64[ns]",
+            )
+        elif kind == "auto":
+            array = np.array(values)
+        else:
+            array = np.array(
+                ["" if value is None else str(value) for value in values], dtype=object
+            )
+        arrays[columns.get(field, field)] = array
+
+    if sort_by:
+        order = np.argsort(arrays[sort_by], kind="stable")
+        arrays = {name: array[order] for name, array in arrays.items()}
+
+    return arrays
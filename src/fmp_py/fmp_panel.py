@@ -0,0 +1,229 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_financial_statements import FmpFinancialStatements
+from fmp_py.fmp_fundamentals_warehouse import FmpFundamentalsWarehouse
+from fmp_py.fmp_statement_analysis import FmpStatementAnalysis
+
+
+"""
+The FmpPanelBuilder class assembles statement or key metric fields for many symbols into a
+single contiguous float64 array of shape (symbols, periods, fields). Fiscal periods are
+aligned on calendar_year and period, so "2023Q4" lines up across every symbol.
+
+def build(self, fields: List[str], symbols: List[str] = None, kind: str = "cashflow", period: str = "quarter") -> FmpPanel:
+    Reads only the requested fields from the warehouse, or fetches them when no warehouse is set.
+
+def from_frame(self, data_df: pd.DataFrame, fields: List[str]) -> FmpPanel:
+    Builds a panel from any frame with symbol, calendar_year and period columns.
+"""
+
+
+@dataclass
+class FmpPanel:
+    values: np.ndarray
+    symbols: pd.Index
+    periods: pd.Index
+    fields: List[str]
+
+    def field(self, name: str) -> pd.DataFrame:
+        """
+        Returns one field as a symbols x periods frame backed by the panel's array.
+
+        Args:
+            name (str): The field to return.
+
+        Returns:
+            pd.DataFrame: The field, indexed by symbol with one column per period.
+
+        Raises:
+            ValueError: If the field is not in the panel.
+        """
+        if name not in self.fields:
+            raise ValueError(f"Field not in panel: {name}")
+
+        return pd.DataFrame(
+            self.values[:, :, self.fields.index(name)],
+            index=self.symbols,
+            columns=self.periods,
+            copy=False,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the panel in long format with one row per symbol and period.
+        """
+        index = pd.MultiIndex.from_product([self.symbols, self.periods])
+        return pd.DataFrame(
+            self.values.reshape(-1, len(self.fields)),
+            index=index,
+            columns=self.fields,
+        )
+
+
+class FmpPanelBuilder(FmpBase):
+    KINDS = ["income", "balance_sheet", "cashflow", "key_metrics"]
+    PERIOD_ORDER = {"Q1": 0, "Q2": 1, "Q3": 2, "Q4": 3, "FY": 4}
+
+    def __init__(
+        self,
+        warehouse: FmpFundamentalsWarehouse = None,
+        max_workers: int = 4,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> None:
+        """
+        Initialize the FmpPanelBuilder class.
+
+        Args:
+            warehouse (FmpFundamentalsWarehouse, optional): Where statements are read from.
+                Without one, statements are fetched from the API. Defaults to None.
+            max_workers (int, optional): Concurrent downloads when fetching. Defaults to 4.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.warehouse = warehouse
+        self.max_workers = max_workers
+        self.statements_client = FmpFinancialStatements(api_key)
+        self.analysis_client = FmpStatementAnalysis(api_key)
+
+    ############################
+    # Build
+    ############################
+    def build(
+        self,
+        fields: List[str],
+        symbols: List[str] = None,
+        kind: str = "cashflow",
+        period: str = "quarter",
+        limit: int = 40,
+    ) -> FmpPanel:
+        """
+        Builds a panel of the requested fields.
+
+        Statement kinds are read from the warehouse with only the requested columns selected.
+        Key metrics, or statements when no warehouse is set, are fetched per symbol and
+        reduced to the requested fields as each response arrives.
+
+        Args:
+            fields (List[str]): The fields to include, e.g. ["free_cash_flow"].
+            symbols (List[str], optional): The symbols. Defaults to every stored symbol.
+            kind (str, optional): "income", "balance_sheet", "cashflow" or "key_metrics". Defaults to "cashflow".
+            period (str, optional): "annual" or "quarter". Defaults to "quarter".
+            limit (int, optional): Periods per symbol when fetching. Defaults to 40.
+
+        Returns:
+            FmpPanel: The panel, with symbols sorted and periods in fiscal order.
+
+        Raises:
+            ValueError: If the kind or period is invalid, or symbols are needed but missing.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Invalid kind. Allowed kinds: {', '.join(self.KINDS)}")
+
+        if period not in ["annual", "quarter"]:
+            raise ValueError("Period must be either 'annual' or 'quarter'")
+
+        if isinstance(fields, str):
+            fields = [fields]
+
+        if self.warehouse is not None and kind != "key_metrics":
+            data_df = self.warehouse.statements(
+                kind,
+                symbols,
+                period,
+                columns=["calendar_year"] + [f for f in fields if f != "calendar_year"],
+            )
+            return self.from_frame(data_df, fields)
+
+        if symbols is None:
+            raise ValueError("symbols are required when fetching from the API")
+
+        if kind == "key_metrics":
+            method = self.analysis_client.key_metrics
+        else:
+            method = getattr(
+                self.statements_client, FmpFundamentalsWarehouse.KINDS[kind]
+            )
+
+        columns = ["symbol", "date", "calendar_year", "period"] + list(fields)
+
+        def fetch(symbol: str) -> pd.DataFrame:
+            try:
+                return method(symbol, period=period, limit=limit)[columns]
+            except ValueError:
+                return pd.DataFrame(columns=columns)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = list(executor.map(fetch, dict.fromkeys(symbols)))
+
+        return self.from_frame(pd.concat(frames, ignore_index=True), fields)
+
+    ############################
+    # From Frame
+    ############################
+    def from_frame(self, data_df: pd.DataFrame, fields: List[str]) -> FmpPanel:
+        """
+        Builds a panel from a long frame of statements or metrics. When a symbol has more
+        than one row for a fiscal period, the row with the latest date wins.
+
+        Args:
+            data_df (pd.DataFrame): A frame with symbol, calendar_year and period columns.
+            fields (List[str]): The fields to include.
+
+        Returns:
+            FmpPanel: The panel, with symbols sorted and periods in fiscal order.
+
+        Raises:
+            ValueError: If a field or key column is missing from the frame.
+        """
+        if isinstance(fields, str):
+            fields = [fields]
+
+        missing = [
+            c
+            for c in ["symbol", "calendar_year", "period"] + list(fields)
+            if c not in data_df.columns
+        ]
+        if missing:
+            raise ValueError(f"Columns missing from frame: {missing}")
+
+        if "date" in data_df.columns:
+            data_df = data_df.sort_values(by="date", kind="stable")
+
+        years = data_df["calendar_year"].astype("int64").to_numpy()
+        ranks = data_df["period"].map(self.PERIOD_ORDER).fillna(-1).astype("int64")
+        period_keys = years * 10 + ranks.to_numpy()
+
+        symbol_codes, symbols = pd.factorize(data_df["symbol"], sort=True)
+        period_codes, period_keys = pd.factorize(period_keys, sort=True)
+
+        labels = {
+            key: f"{year}{period}"
+            for key, year, period in zip(
+                years * 10 + ranks.to_numpy(), years, data_df["period"]
+            )
+        }
+        periods = pd.Index([labels[key] for key in period_keys], name="period")
+
+        flat = symbol_codes * len(periods) + period_codes
+        keep = ~pd.Series(flat).duplicated(keep="last").to_numpy()
+
+        values = np.full(
+            (len(symbols), len(periods), len(fields)), np.nan, dtype="float64"
+        )
+        values[symbol_codes[keep], period_codes[keep], :] = data_df[
+            list(fields)
+        ].to_numpy(dtype="float64")[keep]
+
+        return FmpPanel(
+            values=values,
+            symbols=pd.Index(symbols, name="symbol"),
+            periods=periods,
+            fields=list(fields),
+        )
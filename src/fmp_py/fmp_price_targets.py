@@ -1,13 +1,10 @@
 import json
-import pendulum
 from fmp_py.fmp_base import FmpBase
-from dotenv import load_dotenv
 import os
 import pandas as pd
 
 from fmp_py.models.price_targets import PriceTargetConsensus, PriceTargetSummary
 
-load_dotenv()
 
 """
 The FmpPriceTargets class provides methods for retrieving price targets data from the Financial Modeling Prep API.
@@ -138,9 +135,9 @@ class FmpPriceTargets(FmpBase):
             )
         )
 
-        data_df["published_date"] = data_df["published_date"].apply(
-            lambda x: pendulum.parse(x).to_datetime_string()
-        )
+        data_df["published_date"] = self.parse_datetime(
+            data_df["published_date"]
+        ).dt.floor("s")
 
         return (
             data_df.astype(
@@ -2,8 +2,6 @@ from typing import List
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-import pendulum
-from dotenv import load_dotenv
 
 from fmp_py.models.quote import (
     AftermarketTrade,
@@ -18,7 +16,6 @@ from fmp_py.models.quote import (
     SimpleQuote,
 )
 
-load_dotenv()
 
 """
 def full_quote(self, symbol: str) -> Quote:
@@ -92,7 +89,10 @@ class FmpQuote(FmpBase):
         if not response:
             raise ValueError("Error retrieving data")
 
-        data_df = pd.DataFrame(response).astype(
+        data_df = pd.DataFrame(response)
+        data_df["date"] = self.parse_datetime(data_df["date"])
+
+        data_df = data_df.astype(
             {
                 "ticker": "str",
                 "bid": "float",
@@ -139,7 +139,7 @@ class FmpQuote(FmpBase):
             "low": self.clean_value(response.get("low", 0.0), float),
             "high": self.clean_value(response.get("high", 0.0), float),
             "changes": self.clean_value(response.get("changes", 0.0), float),
-            "date": pendulum.parse(response["date"]).strftime("%Y-%m-%d %H:%M:%S"),
+            "date": self.format_datetime(response["date"]),
         }
 
         return FxPrice(**data_dict)
@@ -178,8 +178,8 @@ class FmpQuote(FmpBase):
             }
         )
 
-        data_df["last_sale_time"] = pd.to_datetime(data_df["last_sale_time"], unit="ms")
-        data_df["last_updated"] = pd.to_datetime(data_df["last_updated"], unit="ms")
+        data_df["last_sale_time"] = self.epoch_to_datetime(data_df["last_sale_time"])
+        data_df["last_updated"] = self.epoch_to_datetime(data_df["last_updated"])
 
         return (
             data_df.astype(
@@ -236,13 +236,13 @@ class FmpQuote(FmpBase):
                 response.get("lastSalePrice", 0.0), float
             ),
             "last_sale_size": self.clean_value(response.get("lastSaleSize", 0), int),
-            "last_sale_time": pendulum.from_timestamp(
-                response["lastSaleTime"] / 1000, tz="America/New_York"
-            ).strftime("%Y-%m-%d %H:%M:%S"),
+            "last_sale_time": self.format_epoch(
+                response["lastSaleTime"], unit="ms", tz="America/New_York"
+            ),
             "fmp_last": self.clean_value(response.get("fmpLast", 0.0), float),
-            "last_updated": pendulum.from_timestamp(
-                response["lastUpdated"] / 1000, tz="America/New_York"
-            ).strftime("%Y-%m-%d %H:%M:%S"),
+            "last_updated": self.format_epoch(
+                response["lastUpdated"], unit="ms", tz="America/New_York"
+            ),
         }
 
         return RealtimeFullPrice(**data_dict)
@@ -280,9 +280,9 @@ class FmpQuote(FmpBase):
             "symbol": self.clean_value(response.get("symbol", ""), str),
             "price": self.clean_value(response.get("price", 0.0), float),
             "size": self.clean_value(response.get("size", 0), float),
-            "timestamp": pendulum.from_timestamp(
-                response["timestamp"] / 1000, tz="America/New_York"
-            ).strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": self.format_epoch(
+                response["timestamp"], unit="ms", tz="America/New_York"
+            ),
         }
 
         return CryptoQuote(**data_dict)
@@ -318,9 +318,9 @@ class FmpQuote(FmpBase):
             "symbol": self.clean_value(response.get("symbol", ""), str),
             "ask": self.clean_value(response.get("ask", 0.0), float),
             "bid": self.clean_value(response.get("bid", 0.0), float),
-            "timestamp": pendulum.from_timestamp(
-                response["timestamp"], tz="America/New_York"
-            ).strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": self.format_epoch(
+                response["timestamp"], unit="s", tz="America/New_York"
+            ),
         }
 
         return ForexQuote(**data_dict)
@@ -355,7 +355,7 @@ class FmpQuote(FmpBase):
 
         data_df = pd.DataFrame(response)
 
-        data_df["timestamp"] = pd.to_datetime(data_df["timestamp"], unit="ms")
+        data_df["timestamp"] = self.epoch_to_datetime(data_df["timestamp"])
 
         return data_df.astype(
             {
@@ -396,7 +396,7 @@ class FmpQuote(FmpBase):
 
         data_df = pd.DataFrame(response)
 
-        data_df["timestamp"] = pd.to_datetime(data_df["timestamp"], unit="ms")
+        data_df["timestamp"] = self.epoch_to_datetime(data_df["timestamp"])
 
         return data_df.astype(
             {
@@ -437,9 +437,9 @@ class FmpQuote(FmpBase):
                 "bid": self.clean_value(response.get("bid", 0.0), float),
                 "asize": self.clean_value(response.get("asize", 0), int),
                 "bsize": self.clean_value(response.get("bsize", 0), int),
-                "timestamp": pendulum.from_timestamp(
-                    response["timestamp"] / 1000, tz="America/New_York"
-                ).strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": self.format_epoch(
+                    response["timestamp"], unit="ms", tz="America/New_York"
+                ),
             }
         except KeyError:
             raise ValueError(f"Invalid symbol: {symbol}")
@@ -471,9 +471,9 @@ class FmpQuote(FmpBase):
                 "symbol": self.clean_value(response.get("symbol", ""), str),
                 "price": self.clean_value(response.get("price", 0.0), float),
                 "size": self.clean_value(response.get("size", 0), int),
-                "timestamp": pendulum.from_timestamp(
-                    response["timestamp"] / 1000, tz="America/New_York"
-                ).strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": self.format_epoch(
+                    response["timestamp"], unit="ms", tz="America/New_York"
+                ),
             }
         except KeyError:
             raise ValueError(f"No data found for symbol: {symbol}")
@@ -635,9 +635,7 @@ class FmpQuote(FmpBase):
             volume=self.clean_value(response.get("volume", 0), int),
             last_sale_price=self.clean_value(response.get("lastSalePrice", 0.0), float),
             fmp_last=self.clean_value(response.get("fmpLast", 0.0), float),
-            last_updated=pendulum.parse(response["lastUpdated"]).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
+            last_updated=self.format_datetime(response["lastUpdated"]),
             symbol=self.clean_value(response.get("symbol", ""), str),
         )
 
@@ -749,15 +747,11 @@ class FmpQuote(FmpBase):
             ),
             "eps": self.clean_value(response.get("eps", 0.0), float),
             "pe": self.clean_value(response.get("pe", 0.0), float),
-            "earnings_date": pendulum.parse(response["earningsAnnouncement"]).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
+            "earnings_date": self.format_datetime(response["earningsAnnouncement"]),
             "shares_outstanding": self.clean_value(
                 response.get("sharesOutstanding", 0), int
             ),
-            "timestamp": pendulum.from_timestamp(response["timestamp"]).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
+            "timestamp": self.format_epoch(response["timestamp"], unit="s"),
         }
 
         return Quote(**data_dict)
@@ -0,0 +1,375 @@
+import os
+import threading
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.models.quote import BookQuote
+
+
+"""
+The FmpQuoteBook class keeps the latest quote for a universe of symbols in memory.
+Quotes live in preallocated NumPy columns (price, bid, ask, volume, timestamp) with a
+symbol -> row index, so reads never touch the network once the book has been fed.
+
+def refresh(self, symbols: List[str] = None) -> int:
+    Reference: https://site.financialmodelingprep.com/developer/docs#real-time-full-price-quote
+
+def update(self, symbols, price, bid, ask, volume, timestamp) -> None:
+    Feeds the book from any batched source (e.g. FmpQuote.all_live_full_stock_prices).
+
+def get(self, symbol: str) -> BookQuote:
+    Reads one row from memory.
+
+def snapshot(self, copy: bool = False) -> pd.DataFrame:
+    Returns the whole book as a DataFrame backed by the book's columns.
+"""
+
+
+class FmpQuoteBook(FmpBase):
+    COLUMNS = ["price", "bid", "ask", "volume"]
+
+    def __init__(
+        self,
+        symbols: List[str] = None,
+        capacity: int = 1024,
+        batch_size: int = 500,
+        max_age: float = 60.0,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> None:
+        """
+        Initialize the FmpQuoteBook class.
+
+        Args:
+            symbols (List[str], optional): Symbols to register up front. Defaults to None.
+            capacity (int, optional): Number of rows to preallocate. Defaults to 1024.
+            batch_size (int, optional): Symbols per request in refresh(). Defaults to 500.
+            max_age (float, optional): Seconds after which a row counts as stale. Defaults to 60.0.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.batch_size = batch_size
+        self.max_age = max_age
+
+        self._lock = threading.RLock()
+        self._index: Dict[str, int] = {}
+        self._symbols = np.empty(0, dtype=object)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._timestamp = np.empty(0, dtype="datetime64[ns]")
+        self._received = np.empty(0, dtype="float64")
+        self._size = 0
+        self._allocate(max(capacity, len(symbols or [])))
+
+        self._poll_thread = None
+        self._poll_stop = threading.Event()
+        self.poll_errors = 0
+        self.last_error = None
+
+        if symbols:
+            self.add_symbols(symbols)
+
+    ############################
+    # Symbols
+    ############################
+    @property
+    def symbols(self) -> List[str]:
+        """
+        Returns the registered symbols in row order.
+        """
+        return self._symbols[: self._size].tolist()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def add_symbols(self, symbols: List[str]) -> None:
+        """
+        Registers symbols in the book. Existing symbols are ignored.
+
+        Args:
+            symbols (List[str]): The symbols to register.
+        """
+        if isinstance(symbols, str):
+            raise ValueError("symbols must be a list of symbols")
+
+        with self._lock:
+            new_symbols = [s for s in dict.fromkeys(symbols) if s not in self._index]
+            if not new_symbols:
+                return
+
+            needed = self._size + len(new_symbols)
+            if needed > len(self._symbols):
+                self._allocate(max(needed, 2 * len(self._symbols)))
+
+            for symbol in new_symbols:
+                self._index[symbol] = self._size
+                self._symbols[self._size] = symbol
+                self._size += 1
+
+    ############################
+    # Refresh
+    ############################
+    def refresh(self, symbols: List[str] = None) -> int:
+        """
+        Fetches real-time prices for the given symbols in batches and writes them into the book.
+
+        Args:
+            symbols (List[str], optional): The symbols to refresh. Defaults to every registered symbol.
+
+        Returns:
+            int: The number of rows updated.
+        """
+        if symbols is None:
+            symbols = self.symbols
+        else:
+            self.add_symbols(symbols)
+
+        updated = 0
+        for start in range(0, len(symbols), self.batch_size):
+            batch = symbols[start : start + self.batch_size]
+            url = f"v3/stock/full/real-time-price/{','.join(batch)}"
+            params = {"apikey": self.api_key}
+            response = self.get_request(url, params)
+
+            if not response:
+                continue
+
+            self.update(
+                symbols=[row.get("symbol", "") for row in response],
+                price=[row.get("lastSalePrice") for row in response],
+                bid=[row.get("bidPrice") for row in response],
+                ask=[row.get("askPrice") for row in response],
+                volume=[row.get("volume") for row in response],
+                timestamp=pd.to_datetime(
+                    [row.get("lastUpdated") for row in response], unit="ms"
+                ),
+            )
+            updated += len(response)
+
+        return updated
+
+    ############################
+    # Update
+    ############################
+    def update(
+        self,
+        symbols: List[str],
+        price=None,
+        bid=None,
+        ask=None,
+        volume=None,
+        timestamp=None,
+    ) -> None:
+        """
+        Writes a batch of quotes into the book. Unknown symbols are registered first.
+        Columns passed as None are left untouched.
+
+        Args:
+            symbols (List[str]): The symbols being updated.
+            price (array-like, optional): Last prices.
+            bid (array-like, optional): Bid prices.
+            ask (array-like, optional): Ask prices.
+            volume (array-like, optional): Volumes.
+            timestamp (array-like, optional): Quote times. Defaults to the time of the update.
+        """
+        if isinstance(symbols, str):
+            raise ValueError("symbols must be a list of symbols")
+
+        self.add_symbols(symbols)
+        now = time.time()
+
+        with self._lock:
+            rows = np.fromiter(
+                (self._index[s] for s in symbols), dtype=np.intp, count=len(symbols)
+            )
+            values = {"price": price, "bid": bid, "ask": ask, "volume": volume}
+            for name, value in values.items():
+                if value is not None:
+                    self._columns[name][rows] = np.asarray(value, dtype="float64")
+
+            if timestamp is None:
+                self._timestamp[rows] = np.datetime64(int(now * 1e9), "ns")
+            else:
+                self._timestamp[rows] = np.asarray(timestamp, dtype="datetime64[ns]")
+
+            self._received[rows] = now
+
+    ############################
+    # Reads
+    ############################
+    def price(self, symbol: str) -> float:
+        """
+        Returns the last price for a symbol.
+
+        Args:
+            symbol (str): The symbol to look up.
+
+        Returns:
+            float: The last price, or NaN if the symbol has not been fed yet.
+
+        Raises:
+            ValueError: If the symbol is not in the book.
+        """
+        try:
+            return float(self._columns["price"][self._index[symbol]])
+        except KeyError:
+            raise ValueError(f"Symbol not in quote book: {symbol}")
+
+    def get(self, symbol: str) -> BookQuote:
+        """
+        Returns a consistent copy of one row of the book.
+
+        Args:
+            symbol (str): The symbol to look up.
+
+        Returns:
+            BookQuote: The quote, with its age in seconds since it was written.
+
+        Raises:
+            ValueError: If the symbol is not in the book.
+        """
+        with self._lock:
+            try:
+                row = self._index[symbol]
+            except KeyError:
+                raise ValueError(f"Symbol not in quote book: {symbol}")
+
+            timestamp = self._timestamp[row]
+            return BookQuote(
+                symbol=symbol,
+                price=float(self._columns["price"][row]),
+                bid=float(self._columns["bid"][row]),
+                ask=float(self._columns["ask"][row]),
+                volume=float(self._columns["volume"][row]),
+                timestamp=""
+                if np.isnat(timestamp)
+                else str(timestamp.astype("datetime64[s]")).replace("T", " "),
+                age=time.time() - float(self._received[row]),
+            )
+
+    ############################
+    # Staleness
+    ############################
+    def age(self) -> pd.Series:
+        """
+        Returns the seconds since each row was last written. Rows never written are NaN.
+        """
+        with self._lock:
+            ages = time.time() - self._received[: self._size]
+            return pd.Series(ages, index=self.symbols, name="age")
+
+    def stale(self, max_age: float = None) -> List[str]:
+        """
+        Returns the symbols whose quotes are older than max_age or were never written.
+
+        Args:
+            max_age (float, optional): Age threshold in seconds. Defaults to the book's max_age.
+
+        Returns:
+            List[str]: The stale symbols.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            ages = time.time() - self._received[: self._size]
+            mask = ~(ages <= max_age)
+            return self._symbols[: self._size][mask].tolist()
+
+    ############################
+    # Snapshot
+    ############################
+    def snapshot(self, copy: bool = False) -> pd.DataFrame:
+        """
+        Returns the book as a DataFrame indexed by symbol.
+
+        Without copy the frame's columns are views over the book's arrays, so building it
+        costs no data movement and later updates show through (until the book grows past
+        its capacity). Pass copy=True for a frame frozen at the time of the call.
+
+        Args:
+            copy (bool, optional): Whether to copy the columns. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Columns price, bid, ask, volume, timestamp and received.
+        """
+        with self._lock:
+            n = self._size
+            data = {name: self._columns[name][:n] for name in self.COLUMNS}
+            data["timestamp"] = self._timestamp[:n]
+            data["received"] = self._received[:n]
+            index = pd.Index(self._symbols[:n], name="symbol", copy=copy)
+            return pd.DataFrame(data, index=index, copy=copy)
+
+    ############################
+    # Polling
+    ############################
+    def start_polling(self, interval: float = 5.0) -> None:
+        """
+        Refreshes every registered symbol in a background thread. A failed refresh does
+        not stop polling: it adds one to poll_errors and leaves its repr in last_error.
+
+        Args:
+            interval (float, optional): Seconds between refreshes. Defaults to 5.0.
+
+        Raises:
+            ValueError: If polling is already running.
+        """
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            raise ValueError("Polling is already running")
+
+        self._poll_stop.clear()
+
+        def poll():
+            while not self._poll_stop.is_set():
+                try:
+                    self.refresh()
+                except Exception as error:
+                    self.poll_errors += 1
+                    self.last_error = repr(error)
+                self._poll_stop.wait(interval)
+
+        self._poll_thread = threading.Thread(target=poll, daemon=True)
+        self._poll_thread.start()
+
+    def stop_polling(self) -> None:
+        """
+        Stops the background refresh thread, if any.
+        """
+        self._poll_stop.set()
+        if self._poll_thread is not None:
+            self._poll_thread.join()
+            self._poll_thread = None
+
+    ############################
+    # Private Methods
+    ############################
+    def _allocate(self, capacity: int) -> None:
+        """
+        Grows every column to the given capacity, keeping existing rows.
+
+        Args:
+            capacity (int): The new number of rows.
+        """
+        n = self._size
+
+        symbols = np.empty(capacity, dtype=object)
+        symbols[:n] = self._symbols[:n]
+        self._symbols = symbols
+
+        for name in self.COLUMNS:
+            column = np.full(capacity, np.nan, dtype="float64")
+            if name in self._columns:
+                column[:n] = self._columns[name][:n]
+            self._columns[name] = column
+
+        timestamp = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[ns]")
+        timestamp[:n] = self._timestamp[:n]
+        self._timestamp = timestamp
+
+        received = np.full(capacity, np.nan, dtype="float64")
+        received[:n] = self._received[:n]
+        self._received = received
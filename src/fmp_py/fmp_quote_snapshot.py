@@ -0,0 +1,116 @@
+import threading
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+
+"""
+The FmpQuoteSnapshot class keeps the last download of a quote list endpoint, such as
+FmpCrypto.full_crypto_quote_list or FmpForex.full_forex_quote_list, together with a
+symbol -> row index, so single pair quotes can be served from it while it is fresh.
+
+def get(self, refresh: bool = False) -> pd.DataFrame:
+    The snapshot, downloaded again when older than ttl.
+
+def fresh(self) -> bool:
+    Whether the snapshot is younger than ttl.
+
+def lookup(self, symbols: List[str]) -> pd.DataFrame:
+    The snapshot rows of the given symbols.
+"""
+
+
+class FmpQuoteSnapshot:
+    def __init__(
+        self, fetch: Callable[[], pd.DataFrame], ttl: float = 0, key: str = "symbol"
+    ) -> None:
+        """
+        Initialize the FmpQuoteSnapshot class.
+
+        Args:
+            fetch (Callable[[], pd.DataFrame]): Downloads the quote list.
+            ttl (float, optional): Seconds a snapshot stays fresh. 0 downloads the list on
+                every get(). Defaults to 0.
+            key (str, optional): The column holding the symbol. Defaults to "symbol".
+        """
+        self.fetch = fetch
+        self.ttl = ttl
+        self.key = key
+        self.state = None
+        self._lock = threading.Lock()
+
+    def fresh(self) -> bool:
+        """
+        Returns whether a snapshot was taken less than ttl seconds ago.
+        """
+        return self._fresh(self.state)
+
+    def get(self, refresh: bool = False) -> pd.DataFrame:
+        """
+        Returns the snapshot, downloading it first when it is stale or refresh is set.
+        Callers arriving during a download wait for it instead of starting their own.
+
+        Args:
+            refresh (bool, optional): Download even when fresh. Defaults to False.
+
+        Returns:
+            pd.DataFrame: The quote list. It is shared, so callers must not modify it.
+        """
+        return self._state(refresh)[0]
+
+    def lookup(self, symbols: List[str]) -> pd.DataFrame:
+        """
+        Returns the rows of the given symbols from the snapshot, downloading it first
+        when it is stale. Symbols match regardless of case and "/".
+
+        Args:
+            symbols (List[str]): Symbols such as "BTCUSD" or "EUR/USD".
+
+        Returns:
+            pd.DataFrame: One row per symbol found, in the order asked. Unknown symbols
+                are left out.
+        """
+        frame, rows, _ = self._state()
+        positions = [rows.get(self.normalize(symbol)) for symbol in symbols]
+        positions = np.array([p for p in positions if p is not None], dtype="int64")
+
+        data_df = frame.take(positions)
+        data_df.index = pd.RangeIndex(len(positions))
+        return data_df
+
+    def _state(self, refresh: bool = False) -> tuple:
+        """
+        Returns the (frame, rows, taken_at) of the current snapshot. The three are replaced
+        in one assignment, so a reader never pairs a frame with another snapshot's rows.
+        """
+        state = self.state
+        if not refresh and self._fresh(state):
+            return state
+
+        with self._lock:
+            if self.state is not state and (refresh or self._fresh(self.state)):
+                return self.state
+
+            frame = self.fetch().reset_index(drop=True)
+            rows = {
+                self.normalize(symbol): row
+                for row, symbol in enumerate(frame[self.key].to_numpy())
+            }
+            self.state = (frame, rows, time.monotonic())
+
+        return self.state
+
+    def _fresh(self, state: tuple) -> bool:
+        """
+        Returns whether a snapshot state is younger than ttl.
+        """
+        return state is not None and time.monotonic() - state[2] < self.ttl
+
+    @staticmethod
+    def normalize(symbol: str) -> str:
+        """
+        Returns a symbol without "/" and in upper case.
+        """
+        return str(symbol).replace("/", "").upper()
@@ -0,0 +1,422 @@
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List
+
+import pandas as pd
+
+
+"""
+The FmpScheduler class runs refresh jobs, such as quotes every few seconds, calendars
+hourly and statements daily, on one worker pool under one API budget. Due jobs are
+dispatched in priority order. Jobs whose fetch returns a generator run one step (one
+yield) per dispatch and go back in the queue between steps, so a long bulk job gives up
+its worker to a higher-priority job that has come due.
+
+def add(self, name: str, fetch: Callable, interval: float, priority: int = 0, deadline: float = None, cost: int = 1) -> FmpJob:
+    Declares a job.
+
+def remove(self, name: str) -> None:
+    Removes a job.
+
+def start(self) -> FmpScheduler:
+    Starts dispatching on a background thread.
+
+def stop(self) -> None:
+    Stops dispatching and waits for running steps.
+
+def result(self, name: str) -> Any:
+    The latest result of a job.
+
+def metrics(self) -> pd.DataFrame:
+    Runs, errors, lag and staleness per job.
+"""
+
+
+@dataclass
+class FmpJob:
+    name: str
+    fetch: Callable[[], Any]
+    interval: float
+    priority: int = 0
+    deadline: float = None
+    cost: int = 1
+    due: float = 0.0
+    running: bool = False
+    steps: Iterator = None
+    partial: List[Any] = field(default_factory=list)
+    started: float = None
+    result: Any = None
+    runs: int = 0
+    errors: int = 0
+    last_error: str = None
+    last_success: float = None
+    last_lag: float = None
+    max_lag: float = 0.0
+    last_duration: float = None
+
+
+class FmpScheduler:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        calls_per_minute: int = None,
+        reserved_workers: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the FmpScheduler class.
+
+        Args:
+            max_workers (int, optional): Steps running at once. Defaults to 4.
+            calls_per_minute (int, optional): The API budget shared by all jobs. Each step
+                spends the cost of its job. Defaults to None, which does not pace steps.
+            reserved_workers (int, optional): Workers only jobs of the highest declared
+                priority may use, so bulk jobs cannot take every worker. Defaults to 1.
+            clock (Callable[[], float], optional): Monotonic seconds. Defaults to time.monotonic.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.calls_per_minute = calls_per_minute
+        self.reserved_workers = min(max(reserved_workers, 0), max_workers - 1)
+        self.clock = clock
+        self.jobs: Dict[str, FmpJob] = {}
+
+        self._condition = threading.Condition()
+        self._tokens = float(max_workers)
+        self._refilled = clock()
+        self._busy = 0
+        self._executor = None
+        self._thread = None
+        self._stopping = False
+
+    def __enter__(self) -> "FmpScheduler":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ############################
+    # Jobs
+    ############################
+    def add(
+        self,
+        name: str,
+        fetch: Callable[[], Any],
+        interval: float,
+        priority: int = 0,
+        deadline: float = None,
+        cost: int = 1,
+    ) -> FmpJob:
+        """
+        Declares a job. It is due immediately and then interval seconds after each run
+        started.
+
+        Args:
+            name (str): A unique job name.
+            fetch (Callable[[], Any]): Called with no arguments, e.g.
+                lambda: quote.batch_quote(symbols). When it returns a generator, each yield
+                is one step and the result is the list of yielded values.
+            interval (float): Seconds between runs.
+            priority (int, optional): Higher runs first. Defaults to 0.
+            deadline (float, optional): Seconds after which an unrefreshed result counts as
+                stale in metrics(). Defaults to twice the interval.
+            cost (int, optional): API calls spent per run, or per step of a generator job.
+                Defaults to 1.
+
+        Returns:
+            FmpJob: The job.
+
+        Raises:
+            ValueError: If the name is taken or the interval or cost is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if cost < 1:
+            raise ValueError("cost must be at least 1")
+
+        job = FmpJob(
+            name=name,
+            fetch=fetch,
+            interval=interval,
+            priority=priority,
+            deadline=deadline if deadline is not None else 2 * interval,
+            cost=cost,
+            due=self.clock(),
+        )
+        with self._condition:
+            if name in self.jobs:
+                raise ValueError(f"A job named '{name}' already exists.")
+            self.jobs[name] = job
+            self._condition.notify_all()
+        return job
+
+    def remove(self, name: str) -> None:
+        """
+        Removes a job. A step already running finishes but its result is dropped.
+        """
+        with self._condition:
+            self.jobs.pop(name, None)
+
+    def result(self, name: str) -> Any:
+        """
+        Returns the latest complete result of a job, None before its first success.
+        """
+        with self._condition:
+            return self.jobs[name].result
+
+    ############################
+    # Start and Stop
+    ############################
+    def start(self) -> "FmpScheduler":
+        """
+        Starts dispatching on a background thread.
+
+        Returns:
+            FmpScheduler: The scheduler itself.
+        """
+        with self._condition:
+            if self._thread is not None:
+                return self
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops dispatching and waits for running steps to finish.
+        """
+        with self._condition:
+            if self._thread is None:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        thread.join()
+        self._executor.shutdown(wait=True)
+        with self._condition:
+            self._thread = None
+            self._executor = None
+
+    ############################
+    # Metrics
+    ############################
+    def metrics(self) -> pd.DataFrame:
+        """
+        Returns one row per job: runs and errors, the lag of its last and worst start
+        behind its due time, the duration of its last run, the seconds since its last
+        success and whether that exceeds its deadline.
+
+        Returns:
+            pd.DataFrame: The metrics, highest priority first.
+        """
+        now = self.clock()
+        rows = []
+        with self._condition:
+            for job in self.jobs.values():
+                staleness = (
+                    now - job.last_success if job.last_success is not None else None
+                )
+                rows.append(
+                    {
+                        "job": job.name,
+                        "priority": job.priority,
+                        "interval": job.interval,
+                        "runs": job.runs,
+                        "errors": job.errors,
+                        "last_lag": job.last_lag,
+                        "max_lag": job.max_lag,
+                        "last_duration": job.last_duration,
+                        "staleness": staleness,
+                        "stale": staleness is None or staleness > job.deadline,
+                        "running": job.running,
+                        "last_error": job.last_error,
+                    }
+                )
+
+        return (
+            pd.DataFrame(
+                rows,
+                columns=[
+                    "job",
+                    "priority",
+                    "interval",
+                    "runs",
+                    "errors",
+                    "last_lag",
+                    "max_lag",
+                    "last_duration",
+                    "staleness",
+                    "stale",
+                    "running",
+                    "last_error",
+                ],
+            )
+            .astype(
+                {
+                    "last_lag": "float",
+                    "max_lag": "float",
+                    "last_duration": "float",
+                    "staleness": "float",
+                }
+            )
+            .sort_values(by=["priority", "job"], ascending=[False, True])
+            .reset_index(drop=True)
+        )
+
+    ############################
+    # Dispatch
+    ############################
+    def dispatch(self) -> List[str]:
+        """
+        Starts every due step that a worker and the API budget allow, highest priority
+        first, and returns the names of the jobs started. When the most urgent due job
+        has to wait for budget, nothing of lower priority is started ahead of it.
+
+        start() calls this from its thread; call it directly to drive the scheduler
+        without one.
+        """
+        with self._condition:
+            return [job.name for job in self._dispatch(self.clock())]
+
+    def _dispatch(self, now: float) -> List[FmpJob]:
+        self._refill(now)
+        ready = sorted(
+            (job for job in self.jobs.values() if not job.running and job.due <= now),
+            key=lambda job: (-job.priority, job.due),
+        )
+        if not ready:
+            return []
+
+        top = max(job.priority for job in self.jobs.values())
+        started = []
+        for job in ready:
+            if self._busy >= self._limit(job, top):
+                continue
+            if self.calls_per_minute and self._tokens < job.cost:
+                break
+
+            if self.calls_per_minute:
+                self._tokens -= job.cost
+            self._busy += 1
+            job.running = True
+            if job.started is None:
+                job.started = now
+                job.last_lag = now - job.due
+                job.max_lag = max(job.max_lag, job.last_lag)
+
+            if self._executor is not None:
+                self._executor.submit(self._step, job)
+            else:
+                self._step(job, locked=True)
+            started.append(job)
+
+        return started
+
+    def _step(self, job: FmpJob, locked: bool = False) -> None:
+        """
+        Runs one call or generator step of a job and records the outcome.
+        """
+        if locked:
+            self._condition.release()
+        try:
+            outcome, value, done = "ok", None, True
+            try:
+                if job.steps is None:
+                    value = job.fetch()
+                    if inspect.isgenerator(value):
+                        job.steps = value
+                if job.steps is not None:
+                    try:
+                        job.partial.append(next(job.steps))
+                        done = False
+                    except StopIteration:
+                        value = job.partial
+            except Exception as error:
+                outcome, value = "error", repr(error)
+        finally:
+            if locked:
+                self._condition.acquire()
+
+        self._finish(job, outcome, value, done, locked)
+
+    def _finish(
+        self, job: FmpJob, outcome: str, value: Any, done: bool, locked: bool
+    ) -> None:
+        if not locked:
+            self._condition.acquire()
+        try:
+            now = self.clock()
+            self._busy -= 1
+            job.running = False
+            if done:
+                if outcome == "ok":
+                    job.result = value
+                    job.last_success = now
+                else:
+                    job.errors += 1
+                    job.last_error = value
+                job.runs += 1
+                job.last_duration = now - job.started
+                job.due = job.started + job.interval
+                job.steps, job.partial, job.started = None, [], None
+            self._condition.notify_all()
+        finally:
+            if not locked:
+                self._condition.release()
+
+    def _refill(self, now: float) -> None:
+        if not self.calls_per_minute:
+            return
+        rate = self.calls_per_minute / 60.0
+        burst = max([self.max_workers] + [job.cost for job in self.jobs.values()])
+        self._tokens = min(float(burst), self._tokens + (now - self._refilled) * rate)
+        self._refilled = now
+
+    def _limit(self, job: FmpJob, top: int) -> int:
+        """
+        Returns the busy workers at which a job has to wait for a free one.
+        """
+        if job.priority < top:
+            return self.max_workers - self.reserved_workers
+        return self.max_workers
+
+    def _wait(self, now: float) -> float:
+        """
+        Returns the seconds until something may become dispatchable. A due job waiting
+        for a worker is left out, since _finish wakes the loop when one frees up. The
+        first due job waiting for budget, which holds back those after it, waits until
+        the budget covers its cost.
+        """
+        idle = [job for job in self.jobs.values() if not job.running]
+        waits = [job.due - now for job in idle if job.due > now]
+        if idle:
+            top = max(job.priority for job in self.jobs.values())
+            due = sorted(
+                (job for job in idle if job.due <= now),
+                key=lambda job: (-job.priority, job.due),
+            )
+            for job in due:
+                if self._busy >= self._limit(job, top):
+                    continue
+                if self.calls_per_minute and self._tokens < job.cost:
+                    short = job.cost - self._tokens
+                    waits.append(short * 60.0 / self.calls_per_minute)
+                else:
+                    waits.append(0.0)
+                break
+        return min([max(wait, 0.001) for wait in waits] or [1.0])
+
+    def _loop(self) -> None:
+        with self._condition:
+            while not self._stopping:
+                now = self.clock()
+                self._dispatch(now)
+                self._condition.wait(timeout=min(self._wait(now), 1.0))
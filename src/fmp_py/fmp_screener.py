@@ -0,0 +1,333 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_company_information import FmpCompanyInformation
+from fmp_py.fmp_company_search import AVAILABLE_EXCHANGES
+
+
+"""
+The FmpScreener class answers FmpCompanyInformation.stock_screener queries locally. It takes a
+full snapshot of the universe, one stock_screener request per exchange, and keeps it as
+columnar arrays with a sorted index on every numeric field and a bitmap per sector, industry,
+exchange and flag value. Queries take the same parameters as stock_screener and have no
+result cap.
+
+def snapshot(self, exchanges: List[str] = None) -> pd.DataFrame:
+    Downloads the universe and rebuilds the indexes.
+
+def load(self, data_df: pd.DataFrame) -> None:
+    Indexes a stock_screener frame already on hand.
+
+def screen(self, market_cap_more_than: int = None, ..., limit: int = None, columns: List[str] = None) -> pd.DataFrame:
+    Filters the snapshot. Refreshes it first when it is older than ttl, once for all
+    concurrent callers.
+"""
+
+
+class FmpScreener(FmpBase):
+    NUMERIC = {
+        "market_cap": "market_cap",
+        "price": "price",
+        "beta": "beta",
+        "volume": "volume",
+        "dividend": "last_annual_dividend",
+    }
+    CATEGORICAL = {
+        "sector": "sector",
+        "industry": "industry",
+        "exchange": "exchange_short_name",
+    }
+    FLAGS = ["is_etf", "is_fund", "is_actively_trading"]
+    SNAPSHOT_LIMIT = 100000
+    SELECTIVE_FRACTION = 8
+
+    def __init__(
+        self,
+        ttl: int = 3600,
+        max_workers: int = 8,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> None:
+        """
+        Initialize the FmpScreener class.
+
+        Args:
+            ttl (int, optional): Seconds before screen() refreshes the snapshot. None never
+                refreshes automatically. Defaults to 3600.
+            max_workers (int, optional): Concurrent requests when taking a snapshot. Defaults to 8.
+            api_key (str): The API key for Financial Modeling Prep.
+        """
+        super().__init__(api_key)
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.company_client = FmpCompanyInformation(api_key)
+        self.index = None
+        self.snapshot_time = None
+        self._lock = threading.Lock()
+
+    ############################
+    # Snapshot
+    ############################
+    def snapshot(self, exchanges: List[str] = None) -> pd.DataFrame:
+        """
+        Downloads the whole universe, one stock_screener request per exchange, and
+        rebuilds the indexes.
+
+        Args:
+            exchanges (List[str], optional): The exchanges to include. Defaults to every
+                exchange in FmpCompanySearch.
+
+        Returns:
+            pd.DataFrame: The snapshot, sorted by market cap in descending order.
+
+        Raises:
+            ValueError: If no exchange returned data.
+        """
+        exchanges = list(exchanges or AVAILABLE_EXCHANGES)
+
+        def fetch(exchange: str) -> pd.DataFrame:
+            try:
+                return self.company_client.stock_screener(
+                    exchange=exchange, limit=self.SNAPSHOT_LIMIT
+                )
+            except (KeyError, ValueError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = [f for f in executor.map(fetch, exchanges) if f is not None]
+
+        if not frames:
+            raise ValueError("No data found for the given exchanges")
+
+        self.load(pd.concat(frames, ignore_index=True))
+        return self.index["frame"]
+
+    def load(self, data_df: pd.DataFrame) -> None:
+        """
+        Indexes a stock_screener frame. Numeric fields get their row order sorted by
+        value, categorical fields and flags get one boolean bitmap per value. The new
+        index replaces the old one in a single assignment, so screens running meanwhile
+        see either snapshot in full.
+
+        Args:
+            data_df (pd.DataFrame): A frame with the stock_screener columns.
+
+        Raises:
+            ValueError: If a screened column is missing.
+        """
+        required = (
+            ["symbol"]
+            + list(self.NUMERIC.values())
+            + list(self.CATEGORICAL.values())
+            + self.FLAGS
+        )
+        missing = [c for c in required if c not in data_df.columns]
+        if missing:
+            raise ValueError(f"Screener frame is missing columns: {missing}")
+
+        frame = (
+            data_df.drop_duplicates("symbol")
+            .sort_values("market_cap", ascending=False, kind="stable")
+            .reset_index(drop=True)
+        )
+
+        numeric = {}
+        for column in self.NUMERIC.values():
+            values = pd.to_numeric(frame[column], errors="coerce").to_numpy("float64")
+            order = np.argsort(values, kind="stable")
+            numeric[column] = (
+                values,
+                order,
+                values[order][: np.count_nonzero(~np.isnan(values))],
+            )
+
+        bitmaps = {}
+        for column in list(self.CATEGORICAL.values()) + self.FLAGS:
+            values = frame[column]
+            if column in self.FLAGS:
+                values = values.astype(bool).astype(str)
+            codes, uniques = pd.factorize(values.astype(str).str.lower())
+            bitmaps[column] = {
+                value: codes == code for code, value in enumerate(uniques)
+            }
+
+        self.index = {
+            "frame": frame,
+            "columns": {c: frame[c].to_numpy() for c in frame.columns},
+            "numeric": numeric,
+            "bitmaps": bitmaps,
+            "taken_at": time.monotonic(),
+        }
+        self.snapshot_time = self.index["taken_at"]
+
+    def _current(self) -> dict:
+        """
+        Returns the index, taking a snapshot first when there is none or it is older than
+        ttl. Only one caller downloads; the others wait under the lock and reuse it.
+        """
+        index = self.index
+        if not self._stale(index):
+            return index
+
+        with self._lock:
+            if self.index is index or self._stale(self.index):
+                self.snapshot()
+            return self.index
+
+    def _stale(self, index: dict) -> bool:
+        """
+        Returns whether an index is missing or older than ttl.
+        """
+        return index is None or (
+            self.ttl is not None and time.monotonic() - index["taken_at"] > self.ttl
+        )
+
+    ############################
+    # Screen
+    ############################
+    def screen(
+        self,
+        market_cap_more_than: int = None,
+        market_cap_lower_than: int = None,
+        price_more_than: int = None,
+        price_lower_than: int = None,
+        beta_more_than: float = None,
+        beta_lower_than: float = None,
+        volume_more_than: int = None,
+        volume_lower_than: int = None,
+        dividend_more_than: float = None,
+        dividend_lower_than: float = None,
+        is_etf: bool = None,
+        is_fund: bool = None,
+        is_actively_trading: bool = None,
+        sector: str = None,
+        industry: str = None,
+        exchange: str = None,
+        limit: int = None,
+        columns: List[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Filters the snapshot with the stock_screener parameters. Bounds are exclusive and
+        text filters are case insensitive. When the most selective numeric range covers
+        few rows, it is read from its sorted index and the remaining filters are applied
+        to those rows only; otherwise every filter is applied to whole columns. A stale
+        snapshot is refreshed once: callers arriving during the download wait for it
+        instead of starting their own.
+
+        Args:
+            market_cap_more_than (int, optional): Filter stocks with market cap greater than this value.
+            market_cap_lower_than (int, optional): Filter stocks with market cap lower than this value.
+            price_more_than (int, optional): Filter stocks with price greater than this value.
+            price_lower_than (int, optional): Filter stocks with price lower than this value.
+            beta_more_than (float, optional): Filter stocks with beta greater than this value.
+            beta_lower_than (float, optional): Filter stocks with beta lower than this value.
+            volume_more_than (int, optional): Filter stocks with volume greater than this value.
+            volume_lower_than (int, optional): Filter stocks with volume lower than this value.
+            dividend_more_than (float, optional): Filter stocks with dividend greater than this value.
+            dividend_lower_than (float, optional): Filter stocks with dividend lower than this value.
+            is_etf (bool, optional): Filter stocks that are ETFs.
+            is_fund (bool, optional): Filter stocks that are funds.
+            is_actively_trading (bool, optional): Filter stocks that are actively trading.
+            sector (str, optional): Filter stocks by sector.
+            industry (str, optional): Filter stocks by industry.
+            exchange (str, optional): Filter stocks by exchange short name.
+            limit (int, optional): Limit the number of results. Defaults to no limit.
+            columns (List[str], optional): The columns to return, e.g. ["symbol"]. Defaults to all.
+
+        Returns:
+            pd.DataFrame: The matching rows, sorted by market cap in descending order.
+        """
+        index = self._current()
+        ranges = {
+            "market_cap": (market_cap_more_than, market_cap_lower_than),
+            "price": (price_more_than, price_lower_than),
+            "beta": (beta_more_than, beta_lower_than),
+            "volume": (volume_more_than, volume_lower_than),
+            "dividend": (dividend_more_than, dividend_lower_than),
+        }
+        categories = {
+            "sector": sector,
+            "industry": industry,
+            "exchange_short_name": exchange,
+            "is_etf": is_etf,
+            "is_fund": is_fund,
+            "is_actively_trading": is_actively_trading,
+        }
+
+        slices = []
+        for name, (low, high) in ranges.items():
+            if low is None and high is None:
+                continue
+            values, order, sorted_values = index["numeric"][self.NUMERIC[name]]
+            start = 0 if low is None else np.searchsorted(sorted_values, low, "right")
+            stop = (
+                len(sorted_values)
+                if high is None
+                else np.searchsorted(sorted_values, high, "left")
+            )
+            slices.append((max(stop - start, 0), values, order, start, stop, low, high))
+
+        masks = [
+            self._bitmap(index, column, value)
+            for column, value in categories.items()
+            if value is not None
+        ]
+
+        size = len(index["frame"])
+        slices.sort(key=lambda s: s[0])
+
+        if slices and slices[0][0] * self.SELECTIVE_FRACTION <= size:
+            _, _, order, start, stop, _, _ = slices[0]
+            rows = np.sort(order[start:stop])
+            keep = np.ones(len(rows), dtype=bool)
+            for _, values, _, _, _, low, high in slices[1:]:
+                selected = values[rows]
+                if low is not None:
+                    keep &= selected > low
+                if high is not None:
+                    keep &= selected < high
+            for mask in masks:
+                keep &= mask[rows]
+            rows = rows[keep]
+        else:
+            keep = np.ones(size, dtype=bool)
+            for _, values, _, _, _, low, high in slices:
+                if low is not None:
+                    keep &= values > low
+                if high is not None:
+                    keep &= values < high
+            for mask in masks:
+                keep &= mask
+            rows = np.flatnonzero(keep)
+
+        if limit:
+            rows = rows[:limit]
+
+        if columns is None:
+            result = index["frame"].take(rows)
+            result.index = pd.RangeIndex(len(rows))
+            return result
+
+        return pd.DataFrame({c: index["columns"][c][rows] for c in columns})
+
+    ############################
+    # Private Methods
+    ############################
+    @staticmethod
+    def _bitmap(index: Dict, column: str, value) -> np.ndarray:
+        """
+        Returns the bitmap of rows whose column equals value, all False when no row does.
+        """
+        bitmaps = index["bitmaps"][column]
+        key = (
+            str(bool(value)).lower() if isinstance(value, bool) else str(value).lower()
+        )
+        if key not in bitmaps:
+            return np.zeros(len(index["frame"]), dtype=bool)
+        return bitmaps[key]
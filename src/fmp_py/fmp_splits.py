@@ -2,9 +2,7 @@ import pandas as pd
 import pendulum
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
 
 """
 Retrieves Stock Spilts Data from Financial Modeling Prep API
@@ -95,8 +93,7 @@ class FmpSplits(FmpBase):
             raise ValueError("from_date must be less than or equal to to_date")
 
         url = "v3/stock_split_calendar"
-        params = {"from": from_date, "to": to_date}
-        response = self.get_request(url=url, params=params)
+        response = self.get_calendar_request(url, from_date, to_date)
 
         if not response:
             raise ValueError("No data found for the given date range")
@@ -3,11 +3,9 @@
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
 
 from fmp_py.models.statement_analysis import FinancialScore, Ratios, KeyMetrics
 
-load_dotenv()
 
 """
 The FmpStatementAnalysis class provides methods for retrieving financial statement analysis data from the Financial Modeling Prep API.
@@ -170,18 +168,18 @@ class FmpStatementAnalysis(FmpBase):
 
         Args:
             symbol (str): The stock symbol.
-            period (str, optional): The period of the data (e.g., "annual", "quarterly"). Defaults to "annual".
+            period (str, optional): "annual", or "quarter" (also accepted as "quarterly"). Defaults to "annual".
             limit (int, optional): The maximum number of records to retrieve. Defaults to 20.
 
         Returns:
             pd.DataFrame: A DataFrame containing the financial growth data.
 
         Raises:
-            ValueError: If the period is not "annual" or "quarterly".
+            ValueError: If the period is not "annual", "quarter" or "quarterly".
             ValueError: If no data is found for the given symbol.
         """
-        if period not in ["annual", "quarterly"]:
-            raise ValueError("Invalid period. Must be either 'annual' or 'quarterly'.")
+        if period not in ["annual", "quarter", "quarterly"]:
+            raise ValueError("Invalid period. Must be either 'annual' or 'quarter'.")
 
         url = f"v3/financial-growth/{symbol}"
         params = {"period": period, "limit": limit, "apikey": self.api_key}
@@ -292,7 +290,7 @@ class FmpStatementAnalysis(FmpBase):
 
         Args:
             symbol (str): The stock symbol.
-            period (str, optional): The period of the data. Can be 'annual' or 'quarterly'. Defaults to 'annual'.
+            period (str, optional): The period of the data. Can be 'annual' or 'quarter' (also accepted as 'quarterly'). Defaults to 'annual'.
             limit (int, optional): The maximum number of records to retrieve. Defaults to 20.
 
         Returns:
@@ -303,8 +301,8 @@ class FmpStatementAnalysis(FmpBase):
             ValueError: If no data is found for the given symbol.
         """
 
-        if period not in ["annual", "quarterly"]:
-            raise ValueError("Invalid period. Please choose 'annual' or 'quarterly'.")
+        if period not in ["annual", "quarter", "quarterly"]:
+            raise ValueError("Invalid period. Please choose 'annual' or 'quarter'.")
 
         url = f"v3/balance-sheet-statement-growth/{symbol}"
         params = {"period": period, "limit": limit, "apikey": self.api_key}
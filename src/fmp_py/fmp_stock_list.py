@@ -1,10 +1,9 @@
 from typing import List
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
+from fmp_py.fmp_output import build_output
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
 
 """
 Defines the FmpStockList class that inherits from FmpBase.
@@ -12,16 +11,16 @@ This class is used to interact with the Financial Modeling Prep API to retrieve
 https://site.financialmodelingprep.com/developer/docs#stock-list
 
 
-def stock_list(self) -> pd.DataFrame:
+def stock_list(self, output: str = None) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#symbol-list-stock-list
     
-def exchange_traded_fund_search(self) -> pd.DataFrame:
+def exchange_traded_fund_search(self, output: str = None) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#exchange-traded-fund-search-stock-list
     
 def statement_symbols_list(self) -> List[str]:
     Reference: https://site.financialmodelingprep.com/developer/docs#statement-symbols-list-stock-list
     
-def tradable_stocks_search(self) -> pd.DataFrame:
+def tradable_stocks_search(self, output: str = None) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs/tradable-list-api
     
 def commitment_of_traders_report(self) -> pd.DataFrame:
@@ -45,6 +44,24 @@ def available_indexes(self) -> pd.DataFrame:
 
 
 class FmpStockList(FmpBase):
+    LIST_COLUMNS = {
+        "symbol": "symbol",
+        "name": "name",
+        "exchange": "exchange",
+        "price": "price",
+        "exchangeShortName": "exchange_short_name",
+        "type": "type",
+    }
+
+    LIST_TYPES = {
+        "symbol": "str",
+        "name": "str",
+        "exchange": "str",
+        "price": "float",
+        "exchange_short_name": "str",
+        "type": "str",
+    }
+
     def __init__(self, api_key: str = os.getenv("FMP_API_KEY")) -> None:
         super().__init__(api_key)
 
@@ -301,9 +318,9 @@ class FmpStockList(FmpBase):
     #################################
     # Tradable Stocks Search
     #################################
-    def tradable_stocks_search(self) -> pd.DataFrame:
+    def tradable_stocks_search(self, output: str = None) -> pd.DataFrame:
         url = "v3/available-traded/list"
-        return self._process_data(url)
+        return self._process_data(url, output)
 
     #################################
     # Statement Symbols List
@@ -330,10 +347,14 @@ class FmpStockList(FmpBase):
     #################################
     # Exchange Traded Fund Search
     #################################
-    def exchange_traded_fund_search(self) -> pd.DataFrame:
+    def exchange_traded_fund_search(self, output: str = None) -> pd.DataFrame:
         """
         Retrieves a list of exchange-traded funds (ETFs) from the API.
 
+        Args:
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None,
+                which uses the client's output attribute.
+
         Returns:
             pd.DataFrame: A DataFrame containing the ETF data, with columns for symbol, name, price, exchange,
             exchange_short_name, and type. The DataFrame is sorted by symbol in ascending order and has its index reset.
@@ -342,15 +363,19 @@ class FmpStockList(FmpBase):
             ValueError: If no data is found in the API response.
         """
         url = "v3/etf/list"
-        return self._process_data(url)
+        return self._process_data(url, output)
 
     #################################
     # Stock List
     #################################
-    def stock_list(self) -> pd.DataFrame:
+    def stock_list(self, output: str = None) -> pd.DataFrame:
         """
         Retrieves a list of stocks from the API.
 
+        Args:
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None,
+                which uses the client's output attribute.
+
         Returns:
             pd.DataFrame: A DataFrame containing the stock information with the following columns:
                 - symbol: The stock symbol.
@@ -361,53 +386,44 @@ class FmpStockList(FmpBase):
                 - type: The type of the stock.
         """
         url = "v3/stock/list"
-        return self._process_data(url)
+        return self._process_data(url, output)
 
     #################################
     # _Process Data
     #################################
-    def _process_data(self, url: str) -> pd.DataFrame:
+    def _process_data(self, url: str, output: str = None) -> pd.DataFrame:
         """
         Process the data returned from the API.
 
         Args:
             url (str): The URL to make the API request.
+            output (str, optional): "pandas", "arrow", "polars" or "numpy". Defaults to None,
+                which uses the client's output attribute.
 
         Returns:
-            pd.DataFrame: Processed data as a pandas DataFrame.
+            pd.DataFrame: Processed data as a pandas DataFrame, or the data in the requested
+                output format.
 
         Raises:
             ValueError: If no data is returned from the API.
         """
+        output = self.resolve_output(output)
         params = {"apikey": self.api_key}
         response = self.get_request(url, params)
 
         if not response:
             raise ValueError("No data returned from API")
 
+        if output != "pandas":
+            return build_output(
+                response, self.LIST_COLUMNS, self.LIST_TYPES, output, sort_by="symbol"
+            )
+
         return (
             (
                 pd.DataFrame(response)
-                .rename(
-                    columns={
-                        "symbol": "symbol",
-                        "name": "name",
-                        "exchange": "exchange",
-                        "price": "price",
-                        "exchangeShortName": "exchange_short_name",
-                        "type": "type",
-                    }
-                )
-                .astype(
-                    {
-                        "symbol": "str",
-                        "name": "str",
-                        "exchange": "str",
-                        "price": "float",
-                        "exchange_short_name": "str",
-                        "type": "str",
-                    }
-                )
+                .rename(columns=self.LIST_COLUMNS)
+                .astype(self.LIST_TYPES)
             )
             .sort_values(by=["symbol"], ascending=True)
             .reset_index(drop=True)
@@ -0,0 +1,306 @@
+from typing import Callable, Dict, Iterable, Iterator
+
+import numpy as np
+
+
+"""
+Computes one indicator for many periods at once, for FmpChartData.sweep. Moving windows
+come from shared prefix sums and exponential averages from one blocked pass of their
+recursion, instead of one pandas rolling or ewm call per period. Results match the
+FmpChartData methods, which use ta with fillna=True, up to floating point rounding.
+
+def sweep(close: np.ndarray, indicator: str, periods: Iterable[int], decimals: int = 2, **kwargs) -> np.ndarray:
+    Returns a (periods, bars) array of the indicator.
+"""
+
+BLOCK = 32
+WMA_BLOCK = 1024
+
+
+def sweep(
+    close: np.ndarray,
+    indicator: str,
+    periods: Iterable[int],
+    decimals: int = 2,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Returns an indicator for every period.
+
+    Args:
+        close (np.ndarray): Close prices, oldest first, without missing values.
+        indicator (str): One of SWEEPS: "sma", "ema", "wma", "rsi", "roc" or "bb".
+        periods (Iterable[int]): The periods, e.g. range(5, 201).
+        decimals (int, optional): Decimals to round to, as the FmpChartData methods do.
+            None skips rounding. Defaults to 2.
+        **kwargs: Options of the indicator: std and band ("hband", "mband", "lband",
+            "wband", "pband", "hband_ind" or "lband_ind") for "bb".
+
+    Returns:
+        np.ndarray: A float64 array of shape (len(periods), len(close)).
+
+    Raises:
+        ValueError: If the indicator is not supported, a period is below 1 or close
+            has missing values.
+    """
+    if indicator not in SWEEPS:
+        raise ValueError(f"Invalid indicator. Allowed indicators: {list(SWEEPS)}")
+
+    periods = np.asarray(list(periods), dtype=np.int64)
+    if periods.size == 0 or periods.min() < 1:
+        raise ValueError("periods must be one or more integers of at least 1")
+
+    close = np.asarray(close, dtype=np.float64)
+    if np.isnan(close).any():
+        raise ValueError("close must not have missing values")
+
+    values = np.empty((len(periods), len(close)))
+    for row, series in enumerate(SWEEPS[indicator](close, periods, **kwargs)):
+        values[row] = series
+        if decimals is not None:
+            np.round(values[row], decimals, out=values[row])
+    return values
+
+
+############################
+# Kernels
+############################
+# Each kernel yields the series of one period after another, so the caller rounds a
+# row while it is still in cache. A yielded array may be reused for the next period.
+def _window_sums(values: np.ndarray, periods: np.ndarray) -> Iterator:
+    """
+    Yields each period with the sums of its trailing windows, where the first
+    period - 1 windows are partial, and the lengths of those partial windows.
+    """
+    n = len(values)
+    sums = np.concatenate([[0.0], np.cumsum(values)])
+    counts = np.arange(1, n + 1, dtype=np.float64)
+    window = np.empty(n)
+    for period in periods:
+        head = min(period, n)
+        window[:head] = sums[1 : head + 1]
+        np.subtract(sums[head + 1 :], sums[1 : n - head + 1], out=window[head:])
+        yield period, window, counts[:head]
+
+
+def _ewm(values: np.ndarray, alphas: np.ndarray) -> Iterator[np.ndarray]:
+    """
+    Yields ewm(alpha=alpha, adjust=False).mean() for every alpha:
+    y[0] = x[0] and y[t] = (1 - alpha) * y[t - 1] + alpha * x[t].
+
+    The series is cut into blocks of BLOCK bars. Within a block the recursion is a
+    product with a decay matrix. What each block carries into the next is a much
+    shorter recursion over blocks, solved for all alphas together first.
+    """
+    n = len(values)
+    blocks = -(-n // BLOCK)
+    # The last column holds what each block carries in, so one product per alpha
+    # adds the carry too.
+    x = np.zeros((blocks, BLOCK + 1))
+    flat = np.zeros(blocks * BLOCK)
+    flat[:n] = values
+    x[:, :BLOCK] = flat.reshape(blocks, BLOCK)
+
+    alphas = np.asarray(alphas, dtype=np.float64)
+    betas = 1.0 - alphas
+    lags = np.arange(BLOCK)
+
+    # The value at the end of each block when it starts from zero.
+    ends = x[:, :BLOCK] @ (alphas[:, None] * betas[:, None] ** (BLOCK - 1 - lags)).T
+    carries = np.empty((len(alphas), blocks))
+    carry = np.full(len(alphas), values[0] if n else 0.0)
+    hops = betas**BLOCK
+    for block in range(blocks):
+        carries[:, block] = carry
+        carry = hops * carry + ends[block]
+
+    distance = lags[None, :] - lags[:, None]
+    upper = distance >= 0
+    powers = np.maximum(distance, 0)
+    kernel = np.empty((BLOCK + 1, BLOCK))
+    series = np.empty((blocks, BLOCK))
+    for row, alpha in enumerate(alphas):
+        beta = betas[row]
+        np.multiply(alpha, beta**powers, out=kernel[:BLOCK])
+        kernel[:BLOCK][~upper] = 0.0
+        kernel[BLOCK] = beta ** (lags + 1)
+        x[:, BLOCK] = carries[row]
+        np.matmul(x, kernel, out=series)
+        yield series.reshape(-1)[:n]
+
+
+def _sma(close: np.ndarray, periods: np.ndarray) -> Iterator[np.ndarray]:
+    """
+    rolling(period, min_periods=0).mean() for every period.
+    """
+    shift = close[0] if len(close) else 0.0
+    for period, window, counts in _window_sums(close - shift, periods):
+        head = len(counts)
+        window[:head] /= counts
+        window[head:] *= 1.0 / period
+        window += shift
+        yield window
+
+
+def _ema(close: np.ndarray, periods: np.ndarray) -> Iterator[np.ndarray]:
+    return _ewm(close, 2.0 / (periods + 1.0))
+
+
+def _wma(close: np.ndarray, periods: np.ndarray) -> Iterator[np.ndarray]:
+    """
+    Linearly weighted mean of full windows, 0 before the first full window. The
+    weighted sum of a window is period * S[t] minus the period previous S, with S the
+    prefix sums of close, so one prefix sum of S serves every period. The bars are cut
+    into blocks of WMA_BLOCK, each with its own prefix sums over the block and the
+    longest window before it, less its first close. The sums stay small next to the
+    prices, so their differences keep full precision on long, high-priced series.
+    """
+    n = len(close)
+    longest = int(periods.max())
+    blocks = max(-(-n // WMA_BLOCK), 1)
+    first, last = close[[0, -1]] if n else (0.0, 0.0)
+    padded = np.concatenate(
+        [
+            np.full(longest - 1, first),
+            close,
+            np.full(blocks * WMA_BLOCK - n, last),
+        ]
+    )
+    span = WMA_BLOCK + longest - 1
+    chunks = np.lib.stride_tricks.sliding_window_view(padded, span)[::WMA_BLOCK]
+    shifts = chunks[:, :1]
+    sums = np.zeros((blocks, WMA_BLOCK + longest))
+    np.subtract(chunks, shifts, out=sums[:, 1:])
+    np.cumsum(sums[:, 1:], axis=1, out=sums[:, 1:])
+    nested = np.zeros((blocks, WMA_BLOCK + longest))
+    np.cumsum(sums[:, :-1], axis=1, out=nested[:, 1:])
+
+    ends = slice(longest, longest + WMA_BLOCK)
+    weighted = np.empty((blocks, WMA_BLOCK))
+    scaled = np.empty((blocks, WMA_BLOCK))
+    series = weighted.reshape(-1)[:n]
+    for period in periods:
+        starts = slice(longest - period, longest - period + WMA_BLOCK)
+        np.subtract(nested[:, starts], nested[:, ends], out=weighted)
+        np.multiply(sums[:, ends], period, out=scaled)
+        weighted += scaled
+        weighted *= 2.0 / (period * (period + 1))
+        weighted += shifts
+        series[: period - 1] = 0.0
+        yield series
+
+
+def _rsi(close: np.ndarray, periods: np.ndarray) -> Iterator[np.ndarray]:
+    diff = np.diff(close, prepend=close[:1])
+    alphas = 1.0 / periods
+    ups = _ewm(np.where(diff > 0, diff, 0.0), alphas)
+    downs = _ewm(np.where(diff < 0, -diff, 0.0), alphas)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for up, down in zip(ups, downs):
+            # 100 - 100 / (1 + up / down), in place.
+            series = np.divide(up, down, out=up)
+            series += 1.0
+            np.divide(100.0, series, out=series)
+            np.subtract(100.0, series, out=series)
+            series[down == 0] = 100.0
+            yield series
+
+
+def _roc(close: np.ndarray, periods: np.ndarray) -> Iterator[np.ndarray]:
+    n = len(close)
+    series = np.empty(n)
+    for period in periods:
+        head = min(period, n)
+        series[:head] = 0.0
+        tail = series[head:]
+        past = close[: n - head]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.subtract(close[head:], past, out=tail)
+            tail /= past
+        tail *= 100.0
+        yield _fill(series, 0.0)
+
+
+def _bb(
+    close: np.ndarray, periods: np.ndarray, std: float = 2, band: str = "pband"
+) -> Iterator[np.ndarray]:
+    """
+    Bollinger Bands with the population standard deviation, from prefix sums of close
+    and of its squares.
+    """
+    if band not in BANDS:
+        raise ValueError(f"Invalid band. Allowed bands: {list(BANDS)}")
+
+    shift = close[0] if len(close) else 0.0
+    centered = close - shift
+    squares = _window_sums(centered * centered, periods)
+    for (period, mavg, counts), (_, deviation, _) in zip(
+        _window_sums(centered, periods), squares
+    ):
+        head = len(counts)
+        mavg[:head] /= counts
+        mavg[head:] *= 1.0 / period
+        deviation[:head] /= counts
+        deviation[head:] *= 1.0 / period
+        deviation -= mavg * mavg
+        np.maximum(deviation, 0.0, out=deviation)
+        np.sqrt(deviation, out=deviation)
+        mavg += shift
+        # A single bar has no spread; keep rounding noise out of it.
+        deviation[0] = 0.0
+        if period == 1:
+            deviation[:] = 0.0
+            mavg[:] = close
+
+        if band == "mband":
+            yield mavg
+            continue
+
+        deviation *= std
+        hband = mavg + deviation
+        lband = np.subtract(mavg, deviation, out=deviation)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if band == "hband":
+                yield hband
+            elif band == "lband":
+                yield lband
+            elif band == "wband":
+                hband -= lband
+                hband /= mavg
+                hband *= 100.0
+                yield _fill(hband, 0.0)
+            elif band == "pband":
+                hband -= lband
+                hband[hband == 0] = np.nan
+                np.subtract(close, lband, out=lband)
+                lband /= hband
+                yield _fill(lband, 0.0)
+            elif band == "hband_ind":
+                yield close > hband
+            else:
+                yield close < lband
+
+
+def _fill(values: np.ndarray, value: float) -> np.ndarray:
+    """
+    Replaces inf with NaN, carries the last valid value forward and fills what is left
+    with value, as ta does with fillna=True.
+    """
+    finite = np.isfinite(values)
+    if finite.all():
+        return values
+    positions = np.where(finite, np.arange(len(values)), -1)
+    np.maximum.accumulate(positions, out=positions)
+    return np.where(positions >= 0, values[np.maximum(positions, 0)], value)
+
+
+BANDS = ("hband", "mband", "lband", "wband", "pband", "hband_ind", "lband_ind")
+
+SWEEPS: Dict[str, Callable] = {
+    "sma": _sma,
+    "ema": _ema,
+    "wma": _wma,
+    "rsi": _rsi,
+    "roc": _roc,
+    "bb": _bb,
+}
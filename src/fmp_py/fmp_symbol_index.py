@@ -0,0 +1,492 @@
+import os
+import re
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_stock_list import FmpStockList
+
+
+"""
+The FmpSymbolIndex class answers FmpCompanySearch style lookups offline. It is built once from
+FmpStockList.stock_list and cik_list (plus any CUSIP/ISIN table on hand) and saved as a
+directory of .npy arrays that are memory-mapped on load, so many processes can share one
+index without reading it into memory.
+
+def build(self, identifiers_df: pd.DataFrame = None, api_key: str = None) -> FmpSymbolIndex:
+    Downloads the stock and CIK lists and indexes them.
+
+def from_frames(self, stock_df: pd.DataFrame, cik_df: pd.DataFrame = None, identifiers_df: pd.DataFrame = None) -> FmpSymbolIndex:
+    Indexes frames already on hand.
+
+def ticker_search(self, prefix: str, limit: int = None, exchange: str = None) -> pd.DataFrame:
+    Symbols starting with a prefix.
+
+def name_search(self, query: str, limit: int = 10, min_score: float = 0.3, exchange: str = None) -> pd.DataFrame:
+    Company names ranked by trigram similarity to the query.
+
+def cik_search(self, cik: str) -> pd.DataFrame:
+def cusip_search(self, cusip: str) -> pd.DataFrame:
+def isin_search(self, isin: str) -> pd.DataFrame:
+    Exact identifier lookups.
+
+def resolve(self, values: List[str], by: str = "cik") -> pd.Series:
+    Maps many identifiers to symbols in one vectorized lookup.
+"""
+
+
+class FmpSymbolIndex:
+    COLUMNS = ["symbol", "name", "exchange_short_name", "type", "cik", "cusip", "isin"]
+    IDENTIFIERS = ["symbol", "cik", "cusip", "isin"]
+    GRAM = 3
+    LEGAL_SUFFIXES = frozenset(
+        ["ag", "co", "company", "corp", "corporation", "inc", "incorporated", "limited"]
+        + ["llc", "lp", "ltd", "nv", "plc", "sa", "se", "the"]
+    )
+
+    def __init__(self, path: str = None) -> None:
+        """
+        Initialize the FmpSymbolIndex class. An index already saved at path is loaded.
+
+        Args:
+            path (str, optional): Directory the index is saved to and loaded from.
+                Defaults to None, which keeps the index in memory only.
+        """
+        self.path = path
+        self.arrays: Dict[str, np.ndarray] = {}
+
+        if path is not None and (Path(path) / "symbol.npy").exists():
+            self.load(path)
+
+    ############################
+    # Build
+    ############################
+    def build(
+        self,
+        identifiers_df: pd.DataFrame = None,
+        api_key: str = os.getenv("FMP_API_KEY"),
+    ) -> "FmpSymbolIndex":
+        """
+        Downloads FmpStockList.stock_list and cik_list and indexes them. The index is saved
+        when a path is set.
+
+        Args:
+            identifiers_df (pd.DataFrame, optional): symbol with any of cik, cusip and isin,
+                e.g. collected company profiles. Defaults to None.
+            api_key (str): The API key for Financial Modeling Prep.
+
+        Returns:
+            FmpSymbolIndex: The index itself.
+        """
+        client = FmpStockList(api_key)
+        return self.from_frames(client.stock_list(), client.cik_list(), identifiers_df)
+
+    def from_frames(
+        self,
+        stock_df: pd.DataFrame,
+        cik_df: pd.DataFrame = None,
+        identifiers_df: pd.DataFrame = None,
+    ) -> "FmpSymbolIndex":
+        """
+        Indexes frames already on hand. CIKs from cik_df are attached to stocks whose
+        name matches once case, punctuation and legal suffixes such as "Inc" or "Corp"
+        are ignored. Values in identifiers_df take precedence.
+
+        Args:
+            stock_df (pd.DataFrame): A stock_list frame with symbol and name.
+            cik_df (pd.DataFrame, optional): A cik_list frame with cik and name. Defaults to None.
+            identifiers_df (pd.DataFrame, optional): symbol with any of cik, cusip and isin.
+                Defaults to None.
+
+        Returns:
+            FmpSymbolIndex: The index itself.
+
+        Raises:
+            ValueError: If stock_df has no symbol or name column.
+        """
+        if not {"symbol", "name"}.issubset(stock_df.columns):
+            raise ValueError("stock_df must have symbol and name columns")
+
+        data_df = (
+            stock_df.reindex(columns=self.COLUMNS)
+            .astype("object")
+            .fillna("")
+            .astype(str)
+        )
+        data_df["symbol"] = data_df["symbol"].str.upper()
+
+        if cik_df is not None and not cik_df.empty:
+            ciks = (
+                cik_df.assign(key=cik_df["name"].map(self._entity_key))
+                .drop_duplicates("key")
+                .set_index("key")["cik"]
+                .map(self._normalize_cik)
+            )
+            matched = data_df["name"].map(self._entity_key).map(ciks)
+            data_df["cik"] = matched.where(matched.notna(), data_df["cik"])
+
+        if identifiers_df is not None and not identifiers_df.empty:
+            overrides = (
+                identifiers_df.assign(symbol=identifiers_df["symbol"].str.upper())
+                .drop_duplicates("symbol")
+                .set_index("symbol")
+            )
+            for column in ["cik", "cusip", "isin"]:
+                if column in overrides.columns:
+                    values = data_df["symbol"].map(overrides[column].dropna())
+                    data_df[column] = values.where(values.notna(), data_df[column])
+
+        data_df["cik"] = data_df["cik"].map(self._normalize_cik)
+        for column in ["cusip", "isin"]:
+            data_df[column] = data_df[column].astype(str).str.strip().str.upper()
+
+        data_df = (
+            data_df[data_df["symbol"] != ""]
+            .drop_duplicates("symbol")
+            .sort_values("symbol")
+            .reset_index(drop=True)
+        )
+
+        self.arrays = {c: data_df[c].to_numpy(dtype=str) for c in self.COLUMNS}
+
+        for column in ["cik", "cusip", "isin"]:
+            values = self.arrays[column]
+            rows = np.flatnonzero(values != "")
+            order = np.argsort(values[rows], kind="stable")
+            self.arrays[f"{column}_keys"] = values[rows][order]
+            self.arrays[f"{column}_rows"] = rows[order].astype("int32")
+
+        self._index_names()
+
+        if self.path is not None:
+            self.save(self.path)
+
+        return self
+
+    ############################
+    # Save / Load
+    ############################
+    def save(self, path: str = None) -> None:
+        """
+        Writes every index array to path as a .npy file.
+
+        Args:
+            path (str, optional): The directory. Defaults to the index path.
+
+        Raises:
+            ValueError: If the index is empty or no path is given.
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("A path is required to save the index")
+        self._require_index()
+
+        Path(path).mkdir(parents=True, exist_ok=True)
+        for name, values in self.arrays.items():
+            np.save(Path(path) / f"{name}.npy", values)
+
+    def load(self, path: str = None) -> "FmpSymbolIndex":
+        """
+        Memory-maps an index saved by save().
+
+        Args:
+            path (str, optional): The directory. Defaults to the index path.
+
+        Returns:
+            FmpSymbolIndex: The index itself.
+        """
+        path = Path(path or self.path)
+        self.arrays = {
+            file.stem: np.load(file, mmap_mode="r") for file in path.glob("*.npy")
+        }
+        return self
+
+    ############################
+    # Ticker Search
+    ############################
+    def ticker_search(
+        self, prefix: str, limit: int = None, exchange: str = None
+    ) -> pd.DataFrame:
+        """
+        Finds the symbols starting with a prefix with two binary searches over the sorted
+        symbol array.
+
+        Args:
+            prefix (str): The start of the symbol, case insensitive.
+            limit (int, optional): The maximum number of results. Defaults to None.
+            exchange (str, optional): Only symbols of this exchange short name. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The matching rows sorted by symbol.
+
+        Raises:
+            ValueError: If no symbol matches.
+        """
+        self._require_index()
+        symbols = self.arrays["symbol"]
+        prefix = prefix.strip().upper()
+
+        start = np.searchsorted(symbols, prefix, side="left")
+        stop = np.searchsorted(symbols, prefix + "\U0010ffff", side="left")
+        rows = np.arange(start, stop)
+
+        return self._rows(rows, exchange=exchange, limit=limit)
+
+    ############################
+    # Name Search
+    ############################
+    def name_search(
+        self,
+        query: str,
+        limit: int = 10,
+        min_score: float = 0.3,
+        exchange: str = None,
+    ) -> pd.DataFrame:
+        """
+        Ranks company names by the Jaccard similarity of their character trigrams with the
+        query's, so misspellings and word order changes still match.
+
+        Args:
+            query (str): The company name.
+            limit (int, optional): The maximum number of results. Defaults to 10.
+            min_score (float, optional): The lowest similarity returned. Defaults to 0.3.
+            exchange (str, optional): Only symbols of this exchange short name. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The matching rows with a score column, best match first.
+
+        Raises:
+            ValueError: If no name matches.
+        """
+        self._require_index()
+        grams = np.unique(self._grams(self._normalize(query)))
+        keys = self.arrays["gram_keys"]
+        offsets = self.arrays["gram_offsets"]
+        postings = self.arrays["gram_rows"]
+
+        position = np.searchsorted(keys, grams)
+        position = position[position < len(keys)]
+        position = position[np.isin(keys[position], grams)]
+
+        if len(position) == 0:
+            raise ValueError("No data found for the specified parameters.")
+
+        rows = np.concatenate([postings[offsets[p] : offsets[p + 1]] for p in position])
+        rows, hits = np.unique(rows, return_counts=True)
+        scores = hits / (len(grams) + self.arrays["gram_counts"][rows] - hits)
+
+        keep = scores >= min_score
+        rows, scores = rows[keep], scores[keep]
+        order = np.lexsort((self.arrays["symbol"][rows], -scores))
+
+        return self._rows(rows[order], scores[order], exchange=exchange, limit=limit)
+
+    ############################
+    # Identifier Search
+    ############################
+    def cik_search(self, cik: str) -> pd.DataFrame:
+        """
+        Finds the symbols filed under a CIK.
+
+        Args:
+            cik (str): The CIK, with or without leading zeros.
+
+        Returns:
+            pd.DataFrame: The matching rows.
+
+        Raises:
+            ValueError: If no symbol matches.
+        """
+        return self._identifier_search("cik", cik)
+
+    def cusip_search(self, cusip: str) -> pd.DataFrame:
+        """
+        Finds the symbols with a CUSIP.
+
+        Args:
+            cusip (str): The CUSIP.
+
+        Returns:
+            pd.DataFrame: The matching rows.
+
+        Raises:
+            ValueError: If no symbol matches.
+        """
+        return self._identifier_search("cusip", cusip)
+
+    def isin_search(self, isin: str) -> pd.DataFrame:
+        """
+        Finds the symbols with an ISIN.
+
+        Args:
+            isin (str): The ISIN.
+
+        Returns:
+            pd.DataFrame: The matching rows.
+
+        Raises:
+            ValueError: If no symbol matches.
+        """
+        return self._identifier_search("isin", isin)
+
+    ############################
+    # Resolve
+    ############################
+    def resolve(self, values: List[str], by: str = "cik") -> pd.Series:
+        """
+        Maps many identifiers to symbols with one vectorized binary search. When an
+        identifier belongs to several symbols, the first in symbol order is returned.
+
+        Args:
+            values (List[str]): The identifiers.
+            by (str, optional): "symbol", "cik", "cusip" or "isin". Defaults to "cik".
+
+        Returns:
+            pd.Series: The symbol for each value, or None when it is unknown, indexed by value.
+
+        Raises:
+            ValueError: If by is invalid.
+        """
+        if by not in self.IDENTIFIERS:
+            raise ValueError(
+                f"Invalid identifier. Allowed identifiers: {', '.join(self.IDENTIFIERS)}"
+            )
+        self._require_index()
+
+        index = pd.Index(values)
+        queries = pd.Series(index.astype(str), dtype="object")
+        if by == "cik":
+            queries = queries.map(self._normalize_cik)
+        else:
+            queries = queries.str.strip().str.upper()
+        queries = queries.to_numpy(dtype=str)
+
+        if by == "symbol":
+            keys = self.arrays["symbol"]
+            rows = np.arange(len(keys))
+        else:
+            keys = self.arrays[f"{by}_keys"]
+            rows = self.arrays[f"{by}_rows"]
+
+        position = np.minimum(np.searchsorted(keys, queries), max(len(keys) - 1, 0))
+        found = keys[position] == queries if len(keys) else np.zeros(len(queries), bool)
+        symbols = np.where(
+            found, self.arrays["symbol"][rows[position]] if len(keys) else "", ""
+        )
+
+        return pd.Series(
+            np.where(found, symbols, None), index=index, name="symbol", dtype="object"
+        )
+
+    ############################
+    # Private Methods
+    ############################
+    def _index_names(self) -> None:
+        """
+        Builds the trigram postings of the normalized names in CSR form: gram_keys sorted,
+        gram_rows holding the rows of gram_keys[i] between gram_offsets[i] and
+        gram_offsets[i + 1], and gram_counts holding the number of distinct grams per row.
+        """
+        names = pd.Series(self.arrays["name"]).map(self._normalize)
+        grams = names.map(lambda name: list(dict.fromkeys(self._grams(name))))
+        counts = grams.map(len).to_numpy(dtype="int32")
+
+        flat = np.array(
+            [g for row in grams for g in row], dtype=f"<U{self.GRAM}"
+        ).reshape(-1)
+        rows = np.repeat(np.arange(len(names), dtype="int32"), counts)
+
+        codes, keys = pd.factorize(flat, sort=True)
+        order = np.argsort(codes, kind="stable")
+
+        self.arrays["gram_keys"] = np.asarray(keys, dtype=f"<U{self.GRAM}")
+        self.arrays["gram_rows"] = rows[order]
+        self.arrays["gram_offsets"] = np.concatenate(
+            [[0], np.cumsum(np.bincount(codes, minlength=len(keys)))]
+        ).astype("int64")
+        self.arrays["gram_counts"] = counts
+
+    def _identifier_search(self, by: str, value: str) -> pd.DataFrame:
+        """
+        Returns every row whose identifier equals value.
+        """
+        self._require_index()
+        value = (
+            self._normalize_cik(value) if by == "cik" else str(value).strip().upper()
+        )
+        keys = self.arrays[f"{by}_keys"]
+
+        start = np.searchsorted(keys, value, side="left")
+        stop = np.searchsorted(keys, value, side="right")
+
+        return self._rows(np.sort(self.arrays[f"{by}_rows"][start:stop]))
+
+    def _rows(
+        self,
+        rows: np.ndarray,
+        scores: np.ndarray = None,
+        exchange: str = None,
+        limit: int = None,
+    ) -> pd.DataFrame:
+        """
+        Returns the index rows as a frame, optionally filtered by exchange and limited.
+        """
+        data_df = pd.DataFrame({c: self.arrays[c][rows] for c in self.COLUMNS})
+        if scores is not None:
+            data_df["score"] = scores
+
+        if exchange:
+            data_df = data_df[data_df["exchange_short_name"] == exchange.upper()]
+
+        if limit:
+            data_df = data_df.head(limit)
+
+        if data_df.empty:
+            raise ValueError("No data found for the specified parameters.")
+
+        return data_df.reset_index(drop=True)
+
+    def _require_index(self) -> None:
+        """
+        Raises a ValueError when nothing has been built or loaded.
+        """
+        if "symbol" not in self.arrays:
+            raise ValueError("The index is empty. Call build() or load() first.")
+
+    @classmethod
+    def _grams(cls, name: str) -> List[str]:
+        """
+        Returns the character trigrams of a normalized name padded with spaces.
+        """
+        padded = f"  {name} "
+        return [padded[i : i + cls.GRAM] for i in range(len(padded) - cls.GRAM + 1)]
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """
+        Lowercases a name and collapses everything but letters and digits to single spaces.
+        """
+        return " ".join(re.sub(r"[^0-9a-z]+", " ", str(name).lower()).split())
+
+    @classmethod
+    def _entity_key(cls, name: str) -> str:
+        """
+        Returns a normalized name without legal suffixes, for joining lists that spell
+        them differently.
+        """
+        tokens = cls._normalize(name).split()
+        return " ".join(t for t in tokens if t not in cls.LEGAL_SUFFIXES)
+
+    @staticmethod
+    def _normalize_cik(cik) -> str:
+        """
+        Returns a CIK as ten digits, or "" when it is missing.
+        """
+        cik = str(cik).strip()
+        if cik in ["", "nan", "None"]:
+            return ""
+        if cik.endswith(".0"):
+            cik = cik[:-2]
+        return cik.zfill(10) if cik.isdigit() else cik.upper()
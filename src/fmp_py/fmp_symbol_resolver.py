@@ -0,0 +1,252 @@
+import os
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fmp_py.fmp_stock_list import FmpStockList
+
+
+"""
+The FmpSymbolResolver class follows ticker renames from FmpStockList.symbol_changes over time.
+Every ticker is stored as a set of intervals during which it named one company, so a symbol
+can be translated to the ticker the same company used on any date with two binary searches.
+
+def build(self, api_key: str = None) -> FmpSymbolResolver:
+    Downloads the symbol changes and indexes them.
+
+def from_frame(self, changes_df: pd.DataFrame) -> FmpSymbolResolver:
+    Indexes a symbol_changes frame already on hand.
+
+def resolve(self, symbol: str, as_of: str = None, known_at: str = None) -> str:
+    The ticker of the company named symbol at known_at, as it was on as_of.
+
+def aliases(self, symbol: str, known_at: str = None) -> List[str]:
+    Every ticker the company named symbol has used.
+
+def alias_periods(self, symbol: str, known_at: str = None) -> List[Tuple[str, str, str]]:
+    The dates during which each of those tickers named the company.
+"""
+
+
+class FmpSymbolResolver:
+    FIRST_DAY = np.iinfo("int64").min // 2
+
+    def __init__(self) -> None:
+        """
+        Initialize the FmpSymbolResolver class with an empty index.
+        """
+        self.from_frame(pd.DataFrame(columns=["date", "old_symbol", "new_symbol"]))
+
+    ############################
+    # Build
+    ############################
+    def build(self, api_key: str = os.getenv("FMP_API_KEY")) -> "FmpSymbolResolver":
+        """
+        Downloads FmpStockList.symbol_changes and indexes it.
+
+        Args:
+            api_key (str): The API key for Financial Modeling Prep.
+
+        Returns:
+            FmpSymbolResolver: The resolver itself.
+        """
+        return self.from_frame(FmpStockList(api_key).symbol_changes())
+
+    def from_frame(self, changes_df: pd.DataFrame) -> "FmpSymbolResolver":
+        """
+        Indexes a frame of renames. Each rename closes the old ticker's interval and opens
+        one for the new ticker under the same company. A ticker that is taken over by
+        another company has its previous interval closed at that date.
+
+        Args:
+            changes_df (pd.DataFrame): date, old_symbol and new_symbol columns.
+
+        Returns:
+            FmpSymbolResolver: The resolver itself.
+
+        Raises:
+            ValueError: If a column is missing.
+        """
+        missing = [
+            c for c in ["date", "old_symbol", "new_symbol"] if c not in changes_df
+        ]
+        if missing:
+            raise ValueError(f"Symbol changes are missing columns: {missing}")
+
+        changes_df = changes_df.sort_values("date", kind="stable")
+        days = self._day_numbers(changes_df["date"])
+
+        opened = {}
+        intervals = []
+        companies = 0
+        for day, old, new in zip(
+            days, changes_df["old_symbol"], changes_df["new_symbol"]
+        ):
+            if old == new:
+                continue
+
+            if old in opened:
+                entity, start = opened.pop(old)
+            else:
+                entity, start = companies, self.FIRST_DAY
+                companies += 1
+            intervals.append((old, start, entity))
+
+            if new in opened:
+                other, other_start = opened.pop(new)
+                intervals.append((new, other_start, other))
+
+            opened[new] = (entity, day)
+
+        intervals += [(t, start, entity) for t, (entity, start) in opened.items()]
+        index_df = pd.DataFrame(intervals, columns=["ticker", "start", "entity"])
+
+        by_ticker = index_df.sort_values(["ticker", "start"], kind="stable")
+        self.tickers = by_ticker["ticker"].to_numpy(dtype=str)
+        self.ticker_starts = by_ticker["start"].to_numpy(dtype="int64")
+        self.ticker_entities = by_ticker["entity"].to_numpy(dtype="int64")
+
+        by_entity = index_df.sort_values(["entity", "start"], kind="stable")
+        self.entities = by_entity["entity"].to_numpy(dtype="int64")
+        self.entity_starts = by_entity["start"].to_numpy(dtype="int64")
+        self.entity_tickers = by_entity["ticker"].to_numpy(dtype=str)
+
+        return self
+
+    ############################
+    # Resolve
+    ############################
+    def resolve(self, symbol: str, as_of: str = None, known_at: str = None) -> str:
+        """
+        Translates a ticker to the one its company used on as_of.
+
+        Args:
+            symbol (str): The ticker.
+            as_of (str, optional): The date of the ticker wanted. Defaults to the latest.
+            known_at (str, optional): A date on which symbol named the company meant, which
+                matters when a ticker was reused. Defaults to the ticker's latest use.
+
+        Returns:
+            str: The ticker on as_of. A ticker without renames resolves to itself.
+        """
+        entity = self._entity(symbol, known_at)
+        if entity is None:
+            return symbol
+
+        start, stop = self._range(self.entities, entity)
+        if as_of is None:
+            return str(self.entity_tickers[stop - 1])
+
+        day = self._day_numbers([as_of])[0]
+        position = np.searchsorted(self.entity_starts[start:stop], day, side="right")
+        return str(self.entity_tickers[start + max(position - 1, 0)])
+
+    def aliases(self, symbol: str, known_at: str = None) -> List[str]:
+        """
+        Returns every ticker the company has used, oldest first.
+
+        Args:
+            symbol (str): The ticker.
+            known_at (str, optional): A date on which symbol named the company meant.
+                Defaults to the ticker's latest use.
+
+        Returns:
+            List[str]: The tickers, including symbol.
+        """
+        entity = self._entity(symbol, known_at)
+        if entity is None:
+            return [symbol]
+
+        start, stop = self._range(self.entities, entity)
+        return list(dict.fromkeys(self.entity_tickers[start:stop].tolist()))
+
+    def alias_periods(
+        self, symbol: str, known_at: str = None
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Returns the dates on which each ticker of the company named it, oldest first. A
+        ticker keeps naming the company after a rename until another company takes it
+        over, so a late record under the old ticker still counts as the company's, and
+        a ticker's first use reaches back over the history listed under it.
+
+        Args:
+            symbol (str): The ticker.
+            known_at (str, optional): A date on which symbol named the company meant.
+                Defaults to the ticker's latest use.
+
+        Returns:
+            List[Tuple[str, str, str]]: (ticker, start, end) with "YYYY-MM-DD" dates, from
+                start inclusive to end exclusive. None leaves a side open.
+        """
+        entity = self._entity(symbol, known_at)
+        if entity is None:
+            return [(symbol, None, None)]
+
+        periods = []
+        start, stop = self._range(self.entities, entity)
+        for ticker, first in zip(
+            self.entity_tickers[start:stop].tolist(),
+            self.entity_starts[start:stop].tolist(),
+        ):
+            low, high = self._range(self.tickers, ticker)
+            position = low + int(
+                np.searchsorted(self.ticker_starts[low:high], first, side="right")
+            )
+            # A ticker's first use also covers the history listed under it before then.
+            first = None if position - 1 == low else first
+            last = self.ticker_starts[position] if position < high else None
+            periods.append((ticker, self._date(first), self._date(last)))
+        return periods
+
+    ############################
+    # Private Methods
+    ############################
+    def _entity(self, symbol: str, known_at: str = None):
+        """
+        Returns the company a ticker named on known_at, or on its latest use.
+        """
+        start, stop = self._range(self.tickers, symbol)
+        if start == stop:
+            return None
+
+        if known_at is None:
+            return int(self.ticker_entities[stop - 1])
+
+        day = self._day_numbers([known_at])[0]
+        position = np.searchsorted(self.ticker_starts[start:stop], day, side="right")
+        if position == 0:
+            return None
+
+        return int(self.ticker_entities[start + position - 1])
+
+    @staticmethod
+    def _range(keys: np.ndarray, value) -> tuple:
+        """
+        Returns the slice of a sorted array holding value.
+        """
+        return (
+            int(np.searchsorted(keys, value, side="left")),
+            int(np.searchsorted(keys, value, side="right")),
+        )
+
+    @classmethod
+    def _date(cls, day) -> str:
+        """
+        Returns a day number as "YYYY-MM-DD", or None for an open end.
+        """
+        if day is None or day == cls.FIRST_DAY:
+            return None
+        return str(np.datetime64(int(day), "D"))
+
+    @staticmethod
+    def _day_numbers(values) -> np.ndarray:
+        """
+        Returns dates as days since the epoch.
+        """
+        return (
+            pd.to_datetime(pd.Series(values, dtype="object"))
+            .to_numpy()
+            .astype("datetime64[D]")
+            .astype("int64")
+        )
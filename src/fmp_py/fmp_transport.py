@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+from typing import Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+"""
+The FmpRecordReplayAdapter is a requests transport adapter that records FMP responses to
+fixture files and replays them without a network. FmpBase mounts it on every client when
+FMP_TRANSPORT is set to "record", "replay" or "auto", with fixtures under FMP_FIXTURES.
+Fixtures are stored per endpoint as <root>/<endpoint>/<params digest>.json and never
+contain the API key.
+
+def fixture_key(url: str) -> Tuple[str, str]:
+    The endpoint and params digest a URL is stored under.
+
+def fixture_path(root: str, url: str) -> str:
+    The fixture file of a URL.
+"""
+
+MODES = ("record", "replay", "auto")
+API_PREFIX = "/api/"
+SECRET_PARAMS = {"apikey"}
+
+
+def fixture_key(url: str) -> Tuple[str, str]:
+    """
+    Returns the endpoint of a URL, its path after /api/, and a digest of its query
+    parameters without the API key.
+
+    Args:
+        url (str): The full request URL.
+
+    Returns:
+        Tuple[str, str]: The endpoint, e.g. "v3/quote/AAPL", and the digest.
+    """
+    parts = urlsplit(url)
+    path = parts.path
+    if API_PREFIX in path:
+        path = path.split(API_PREFIX, 1)[1]
+    endpoint = path.strip("/") or "index"
+
+    params = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in SECRET_PARAMS
+    )
+    if not params:
+        return endpoint, "index"
+    return endpoint, hashlib.sha1(urlencode(params).encode()).hexdigest()[:16]
+
+
+def fixture_path(root: str, url: str) -> str:
+    """
+    Returns the fixture file of a URL under root.
+
+    Args:
+        root (str): The fixtures directory.
+        url (str): The full request URL.
+
+    Returns:
+        str: The path of the JSON fixture.
+    """
+    endpoint, digest = fixture_key(url)
+    return os.path.join(root, *endpoint.split("/"), f"{digest}.json")
+
+
+def _redact(url: str) -> str:
+    """
+    Returns a URL without its API key.
+    """
+    parts = urlsplit(url)
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in SECRET_PARAMS
+    ]
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+class FmpRecordReplayAdapter(HTTPAdapter):
+    def __init__(self, mode: str = "replay", root: str = "tests/fixtures", **kwargs):
+        """
+        Initialize the FmpRecordReplayAdapter class.
+
+        Args:
+            mode (str, optional): "record" sends every request and stores the response,
+                "replay" answers from fixtures only, "auto" replays when a fixture exists
+                and records otherwise. Defaults to "replay".
+            root (str, optional): The fixtures directory. Defaults to "tests/fixtures".
+            **kwargs: Passed to HTTPAdapter, e.g. max_retries.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Invalid transport mode: {mode}. Use one of {MODES}")
+
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.root = root
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """
+        Answers a request from its fixture or sends it and records the response.
+
+        Raises:
+            requests.exceptions.ConnectionError: In replay mode, if the request has no fixture.
+        """
+        path = fixture_path(self.root, request.url)
+
+        if self.mode != "record" and os.path.exists(path):
+            return self._replay(request, path)
+
+        if self.mode == "replay":
+            raise requests.exceptions.ConnectionError(
+                f"No fixture for {_redact(request.url)} at {path}", request=request
+            )
+
+        response = super().send(request, **kwargs)
+        self._record(response, path)
+        return response
+
+    def _record(self, response: requests.Response, path: str) -> None:
+        """
+        Stores a response as a fixture.
+        """
+        fixture = {"url": _redact(response.url), "status": response.status_code}
+        try:
+            fixture["body"] = response.json()
+        except ValueError:
+            fixture["text"] = response.text
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(fixture, file)
+
+    def _replay(
+        self, request: requests.PreparedRequest, path: str
+    ) -> requests.Response:
+        """
+        Builds a response from a fixture.
+        """
+        with open(path, encoding="utf-8") as file:
+            fixture = json.load(file)
+
+        response = requests.Response()
+        response.status_code = fixture["status"]
+        response.reason = "Replayed"
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = (
+            fixture["text"] if "text" in fixture else json.dumps(fixture["body"])
+        ).encode("utf-8")
+        return response
@@ -1,12 +1,9 @@
 import pandas as pd
-import pendulum
 from fmp_py.fmp_base import FmpBase
 from fmp_py.models.upgrades_downgrades import UpgradesDowngrades
 
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from typing import Iterator, Set
 
 
 """
@@ -18,6 +15,12 @@ def upgrades_downgrades(self, symbol: str) -> pd.DataFrame:
     
 def upgrades_downgrades_rss_feed(self, page: int = 0) -> pd.DataFrame:
      Reference: https://site.financialmodelingprep.com/developer/docs#up-down-grades-rss-feed
+
+def upgrades_downgrades_rss_feed_pages(self, cutoff: str = None, seen: Set[tuple] = None, prefetch: int = 4) -> Iterator[pd.DataFrame]:
+    Streams the RSS feed page by page while the next pages download concurrently.
+
+def upgrades_downgrades_rss_feed_bulk(self, cutoff: str = None, seen: Set[tuple] = None, prefetch: int = 4) -> pd.DataFrame:
+    Downloads the RSS feed up to a cutoff date or already seen items as one DataFrame.
      
 def upgrades_downgrades_by_company(self, company: str) -> pd.DataFrame:
     Reference: https://site.financialmodelingprep.com/developer/docs#up-down-grades-by-company
@@ -28,6 +31,21 @@ def upgrades_downgrades_consensus(self, symbol: str) -> UpgradesDowngrades:
 
 
 class FMPUpgradesDowngrades(FmpBase):
+    COLUMNS = {
+        "symbol": "symbol",
+        "publishedDate": "published_date",
+        "newsURL": "news_url",
+        "newsTitle": "news_title",
+        "newsBaseURL": "news_base_url",
+        "newsPublisher": "news_publisher",
+        "newGrade": "new_grade",
+        "previousGrade": "previous_grade",
+        "gradingCompany": "grading_company",
+        "action": "action",
+        "priceWhenPosted": "price_when_posted",
+    }
+    RSS_KEYS = ["symbol", "published_date", "grading_company", "news_url"]
+
     def __init__(self, api_key: str = os.getenv("FMP_API_KEY")) -> None:
         super().__init__(api_key)
 
@@ -115,6 +133,80 @@ class FMPUpgradesDowngrades(FmpBase):
         except ValueError:
             raise ValueError("No data found for the specified parameters.")
 
+    def upgrades_downgrades_rss_feed_pages(
+        self,
+        cutoff: str = None,
+        seen: Set[tuple] = None,
+        start_page: int = 0,
+        prefetch: int = 4,
+        max_pages: int = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams the upgrades and downgrades RSS feed one page at a time while the next
+        pages are downloaded concurrently. Items repeated across page boundaries are
+        yielded once.
+
+        Args:
+            cutoff (str, optional): Stop at items published before this date. Defaults to None.
+            seen (Set[tuple], optional): RSS_KEYS tuples already processed. Iteration stops
+                at the first page containing one, and new keys are added. Defaults to None.
+            start_page (int, optional): The first page. Defaults to 0.
+            prefetch (int, optional): Pages downloaded ahead. Defaults to 4.
+            max_pages (int, optional): The maximum number of pages. Defaults to no limit.
+
+        Yields:
+            pd.DataFrame: The new items of each page, sorted by published date.
+        """
+        return self.iter_feed(
+            fetch_page=lambda page: self.get_request(
+                "v4/upgrades-downgrades-rss-feed", {"page": page}
+            ),
+            shape=self._shape_data,
+            keys=self.RSS_KEYS,
+            date_column="published_date",
+            cutoff=cutoff,
+            seen=seen,
+            start_page=start_page,
+            prefetch=prefetch,
+            max_pages=max_pages,
+        )
+
+    def upgrades_downgrades_rss_feed_bulk(
+        self,
+        cutoff: str = None,
+        seen: Set[tuple] = None,
+        start_page: int = 0,
+        prefetch: int = 4,
+        max_pages: int = None,
+    ) -> pd.DataFrame:
+        """
+        Downloads the upgrades and downgrades RSS feed until the cutoff date, an already
+        seen item or the last page, and returns it as one DataFrame.
+
+        Args:
+            cutoff (str, optional): Stop at items published before this date. Defaults to None.
+            seen (Set[tuple], optional): RSS_KEYS tuples already processed. Defaults to None.
+            start_page (int, optional): The first page. Defaults to 0.
+            prefetch (int, optional): Pages downloaded ahead. Defaults to 4.
+            max_pages (int, optional): The maximum number of pages. Defaults to no limit.
+
+        Returns:
+            pd.DataFrame: The new items sorted by published date. Empty when nothing is new.
+        """
+        frames = list(
+            self.upgrades_downgrades_rss_feed_pages(
+                cutoff, seen, start_page, prefetch, max_pages
+            )
+        )
+        if not frames:
+            return self._shape_data([])
+
+        return (
+            pd.concat(frames, ignore_index=True)
+            .sort_values("published_date", ascending=True, kind="stable")
+            .reset_index(drop=True)
+        )
+
     ############################
     # Upgrades Downgrades
     ############################
@@ -162,29 +254,22 @@ class FMPUpgradesDowngrades(FmpBase):
         if not response:
             raise ValueError("No data found for the given symbol.")
 
+        return self._shape_data(response)
+
+    def _shape_data(self, response: list) -> pd.DataFrame:
+        """
+        Converts raw upgrades and downgrades records into a typed DataFrame sorted by
+        published date.
+        """
         data_df = (
-            pd.DataFrame(response)
+            pd.DataFrame(response or None, columns=None if response else self.COLUMNS)
             .fillna(0)
-            .rename(
-                columns={
-                    "symbol": "symbol",
-                    "publishedDate": "published_date",
-                    "newsURL": "news_url",
-                    "newsTitle": "news_title",
-                    "newsBaseURL": "news_base_url",
-                    "newsPublisher": "news_publisher",
-                    "newGrade": "new_grade",
-                    "previousGrade": "previous_grade",
-                    "gradingCompany": "grading_company",
-                    "action": "action",
-                    "priceWhenPosted": "price_when_posted",
-                }
-            )
+            .rename(columns=self.COLUMNS)
         )
 
-        data_df["published_date"] = data_df["published_date"].apply(
-            lambda x: pendulum.parse(x).to_datetime_string()
-        )
+        data_df["published_date"] = self.parse_datetime(
+            data_df["published_date"]
+        ).dt.floor("s")
 
         return (
             data_df.sort_values("published_date", ascending=True)
@@ -2,12 +2,9 @@ from fmp_py.fmp_base import FmpBase
 import os
 import pandas as pd
 
-from dotenv import load_dotenv
 
 from fmp_py.models.valuation import CompanyRating, DiscountedCashFlow
 
-load_dotenv()
-
 
 """
 FmpValuation class inherits from FmpBase.
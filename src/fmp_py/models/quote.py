@@ -122,3 +122,14 @@ class Quote:
     earnings_date: str
     shares_outstanding: int
     timestamp: str
+
+
+@dataclass
+class BookQuote:
+    symbol: str
+    price: float
+    bid: float
+    ask: float
+    volume: float
+    timestamp: str
+    age: float
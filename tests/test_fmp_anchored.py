@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_anchored import (
+    FmpAnchoredVwap,
+    anchor_mask,
+    session_mask,
+    volume_profile,
+)
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(0)
+    day = pd.date_range("2024-01-02 09:30", periods=390, freq="min")
+    index = day.append([day + pd.Timedelta(days=offset) for offset in (1, 2)])
+    close = 100 + np.cumsum(rng.normal(0, 0.05, len(index)))
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.02, len(index)),
+            "high": close + 0.05,
+            "low": close - 0.05,
+            "close": close,
+            "volume": rng.integers(100, 1_000, len(index)),
+        },
+        index=index.rename("date"),
+    )
+
+
+def grouped(bars, keys):
+    typical = (bars["high"] + bars["low"] + bars["close"]) / 3
+    vwap = (typical * bars["volume"]).groupby(keys).cumsum() / bars["volume"].groupby(
+        keys
+    ).cumsum()
+    delta = (bars["volume"] * np.sign(bars["close"] - bars["open"])).groupby(keys)
+    return vwap, delta.cumsum()
+
+
+def test_fmp_anchored_vwap_sessions(bars):
+    result = FmpAnchoredVwap().update(bars)
+    vwap, delta = grouped(bars, bars.index.normalize())
+
+    np.testing.assert_allclose(result["vwap"], vwap, rtol=1e-12)
+    np.testing.assert_allclose(result["cumulative_delta"], delta)
+    assert result["anchor"].unique().tolist() == list(bars.index[[0, 390, 780]])
+
+
+def test_fmp_anchored_vwap_incremental(bars):
+    whole = FmpAnchoredVwap(step=0.25).update(bars)
+    anchored = FmpAnchoredVwap(step=0.25)
+    parts = [
+        anchored.update(bars.iloc[start:stop])
+        for start, stop in [(0, 100), (100, 101), (101, 390), (390, 700), (700, 1170)]
+    ]
+
+    pd.testing.assert_frame_equal(pd.concat(parts), whole, rtol=1e-12)
+    profile = volume_profile(bars, 0.25, session_mask(bars.index, "00:00"))
+    pd.testing.assert_frame_equal(
+        anchored.profile(), profile.loc[bars.index[780]], check_names=False
+    )
+    assert anchored.profile()["volume"].sum() == bars["volume"].iloc[780:].sum()
+
+    anchored.reset()
+    assert anchored.update(bars.iloc[800:801])["anchor"].iloc[0] == bars.index[800]
+
+
+def test_fmp_anchored_vwap_session_start(bars):
+    # Sessions from 12:00 run from each afternoon into the next morning.
+    result = FmpAnchoredVwap(session_start="12:00").update(bars)
+    keys = (bars.index - pd.Timedelta(hours=12)).normalize()
+    vwap, _ = grouped(bars, keys)
+    np.testing.assert_allclose(result["vwap"], vwap, rtol=1e-12)
+    assert result["anchor"].nunique() == 4
+
+
+def test_fmp_anchored_vwap_events(bars):
+    events = ["2024-01-02 12:00:30", "2024-01-03 10:00"]
+    result = FmpAnchoredVwap(session_start=None).update(bars, anchors=events)
+    starts = anchor_mask(bars.index, events)
+    assert np.flatnonzero(starts).tolist() == [151, 420]
+    zoned = bars.index.tz_localize("America/New_York")
+    assert np.flatnonzero(anchor_mask(zoned, events)).tolist() == [151, 420]
+
+    starts[0] = True
+    vwap, _ = grouped(bars, np.cumsum(starts))
+    np.testing.assert_allclose(result["vwap"], vwap, rtol=1e-12)
+
+    marked = bars.assign(event=starts)
+    np.testing.assert_array_equal(anchor_mask(bars.index, "event", marked), starts)
+
+
+def test_fmp_anchored_vwap_incremental_events(bars):
+    events = ["2024-01-02 09:35", "2024-01-02 09:41:30", "2024-01-03 10:00"]
+    whole = FmpAnchoredVwap(session_start=None).update(bars, anchors=events)
+
+    anchored = FmpAnchoredVwap(session_start=None)
+    parts = [
+        anchored.update(bars.iloc[row : row + 1], anchors=events)
+        for row in range(len(bars))
+    ]
+    pd.testing.assert_frame_equal(pd.concat(parts), whole, rtol=1e-12)
+    assert whole["anchor"].nunique() == 4
+
+
+def test_fmp_anchored_vwap_invalid(bars):
+    with pytest.raises(ValueError):
+        FmpAnchoredVwap(session_start="9h30")
+    with pytest.raises(ValueError):
+        FmpAnchoredVwap(step=0)
+    with pytest.raises(ValueError):
+        FmpAnchoredVwap().update(bars.drop(columns="open"))
+    with pytest.raises(ValueError):
+        FmpAnchoredVwap().update(bars.reset_index(drop=True))
+    with pytest.raises(ValueError):
+        FmpAnchoredVwap().update(bars, anchors="missing")
+    with pytest.raises(ValueError):
+        FmpAnchoredVwap().update(bars, anchors=np.ones(3, dtype=bool))
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_backtest import FmpBacktest, FmpBacktestResult
+from fmp_py.fmp_chart_data import FmpChartData
+
+
+def bars(rows, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, rows),
+            "entry": rng.random(rows) < 0.05,
+            "exit": rng.random(rows) < 0.05,
+            "score": rng.normal(0, 1, rows),
+        },
+        index=pd.date_range("2024-01-01", periods=rows, name="date"),
+    )
+
+
+def loop(close, entries, exits, cost=0.0, sign=1.0, lag=1):
+    """
+    A per-bar reference: the equity curve and the (entry bar, exit bar) of each trade.
+    """
+    states, state = [], 0
+    for entry, exit in zip(entries, exits):
+        state = 0 if exit else 1 if entry else state
+        states.append(state)
+    positions = [0] * lag + states[: len(states) - lag]
+
+    equity, curve, previous, trades = 1.0, [], 0.0, []
+    for t, held in enumerate(positions):
+        change = 0.0 if t == 0 else close[t] / close[t - 1] - 1
+        position = sign * held
+        equity *= 1 + position * change - abs(position - previous) * cost
+        curve.append(equity)
+        if position and not previous:
+            trades.append([t - 1, None])
+        if previous and not position:
+            trades[-1][1] = t - 1
+        previous = position
+    return np.array(curve), trades
+
+
+@pytest.mark.parametrize(
+    "cost, direction, lag", [(0.0, "long", 1), (0.001, "long", 2), (0.002, "short", 1)]
+)
+def test_fmp_backtest_run(cost, direction, lag):
+    chart = bars(400, 1)
+    result = FmpBacktest(cost=cost, direction=direction, lag=lag).run(
+        chart, "entry", "exit"
+    )
+    curve, trades = loop(
+        chart["close"].to_numpy(),
+        chart["entry"],
+        chart["exit"],
+        cost,
+        1.0 if direction == "long" else -1.0,
+        lag,
+    )
+
+    assert isinstance(result, FmpBacktestResult)
+    np.testing.assert_allclose(result.equity[0], curve, rtol=1e-12)
+    assert result.trades["entry_bar"].tolist() == [entry for entry, _ in trades]
+    assert result.trades["exit_bar"].tolist()[:-1] == [exit for _, exit in trades][:-1]
+    assert result.trades["entry_date"].iloc[0] == chart.index[trades[0][0]]
+    assert result.summary.loc["entry", "trades"] == len(trades)
+    assert result.summary.loc["entry", "total_return"] == pytest.approx(curve[-1] - 1)
+    assert result.summary.loc["entry", "max_drawdown"] == pytest.approx(
+        (curve / np.maximum.accumulate(curve) - 1).min()
+    )
+
+    trade = result.trades.iloc[0]
+    held = result.equity[0]
+    assert trade["return"] == pytest.approx(
+        held[trade["exit_bar"] + 1] / held[trade["entry_bar"]] - 1
+    )
+    assert result.frame("equity")["entry"].index.equals(chart.index)
+
+
+def test_fmp_backtest_scores_and_sweep():
+    chart = bars(300, 2)
+    result = FmpBacktest(entry_threshold=0.5, exit_threshold=-0.5).run(
+        chart, "score", "score"
+    )
+    curve, _ = loop(
+        chart["close"].to_numpy(), chart["score"] > 0.5, chart["score"] < -0.5
+    )
+    np.testing.assert_allclose(result.equity[0], curve, rtol=1e-12)
+
+    holding = FmpBacktest().run(chart, chart["score"] > 0)
+    np.testing.assert_array_equal(
+        holding.positions[0, 1:], (chart["score"] > 0).to_numpy()[:-1]
+    )
+
+    rsi = FmpChartData.from_chart(chart, api_key="test").sweep("rsi", range(5, 15))
+    batch = FmpBacktest(cost=0.001).run(chart, rsi < 30, rsi > 70)
+    assert list(batch.variants) == [f"rsi{period}" for period in range(5, 15)]
+    assert batch.equity.shape == (10, 300)
+    curve, _ = loop(
+        chart["close"].to_numpy(), rsi["rsi9"] < 30, rsi["rsi9"] > 70, 0.001
+    )
+    np.testing.assert_allclose(batch.frame("equity")["rsi9"], curve, rtol=1e-12)
+
+
+def test_fmp_backtest_run_many():
+    charts = {"AAA": bars(250, 3), "BBB": bars(180, 4)}
+    result = FmpBacktest(cost=0.001).run_many(charts, "entry", "exit")
+
+    assert list(result.summary.index) == ["AAA", "BBB"]
+    for row, (symbol, chart) in enumerate(charts.items()):
+        curve, trades = loop(
+            chart["close"].to_numpy(), chart["entry"], chart["exit"], 0.001
+        )
+        np.testing.assert_allclose(result.equity[row, : len(chart)], curve)
+        assert (result.equity[row, len(chart) :] == curve[-1]).all()
+        symbol_trades = result.trades[result.trades["variant"] == symbol]
+        assert len(symbol_trades) == len(trades)
+        assert symbol_trades["entry_date"].iloc[-1] == chart.index[trades[-1][0]]
+        assert symbol_trades["exit_bar"].max() < len(chart)
+
+
+def test_fmp_backtest_run_many_last_bar_entry():
+    # An entry on the last bar of the shorter chart fills after its data ends.
+    charts = {"AAA": bars(8, 6), "BBB": bars(4, 7)}
+    for chart in charts.values():
+        chart["entry"] = False
+        chart["exit"] = False
+    charts["BBB"].iloc[3, charts["BBB"].columns.get_loc("entry")] = True
+
+    result = FmpBacktest().run_many(charts, "entry", "exit")
+    single = FmpBacktest().run(charts["BBB"], "entry", "exit")
+    assert result.summary.loc["BBB", "trades"] == single.summary["trades"].iloc[0] == 0
+    assert np.isnan(result.summary.loc["BBB", "win_rate"])
+    assert result.trades.empty
+    assert (result.positions[1] == 0).all()
+
+
+def test_fmp_backtest_invalid():
+    chart = bars(50, 5)
+    with pytest.raises(ValueError):
+        FmpBacktest(direction="sideways")
+    with pytest.raises(ValueError):
+        FmpBacktest(lag=0)
+    with pytest.raises(ValueError):
+        FmpBacktest().run(chart, "missing")
+    with pytest.raises(ValueError):
+        FmpBacktest().run(chart, np.ones(10, dtype=bool))
+    with pytest.raises(ValueError):
+        FmpBacktest().run(chart, "entry").frame("cash")
@@ -0,0 +1,201 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pendulum
+import pytest
+
+from fmp_py.fmp_base import CALENDAR_CACHE_TTL, FmpBase, clear_calendar_cache
+
+
+@pytest.fixture
+def fmp_base():
+    return FmpBase(api_key="test")
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2024-07-19T14:32:00.000Z", "2024-07-18T09:05:13.000Z"],
+        ["2024-07-19T14:32:00Z", "2024-07-18T09:05:13Z"],
+        ["2024-07-19T14:32:00.000+02:00", "2024-07-18T09:05:13.000-05:00"],
+        ["2024-07-19 14:32:00", "2024-07-18 09:05:13"],
+        ["2024-07-19", "2024-07-18"],
+        ["2024-07-19T14:32:00.000Z", "2024-07-18 09:05:13"],
+    ],
+)
+def test_fmp_base_parse_datetime_matches_pendulum(fmp_base, values):
+    expected = pd.to_datetime([pendulum.parse(v).to_datetime_string() for v in values])
+    parsed = fmp_base.parse_datetime(pd.Series(values)).dt.floor("s")
+    assert parsed.tolist() == expected.tolist()
+
+    for value in values:
+        assert fmp_base.format_datetime(value) == pendulum.parse(value).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+
+
+def test_fmp_base_parse_datetime_invalid(fmp_base):
+    parsed = fmp_base.parse_datetime(pd.Series(["2024-07-19", None, "invalid"]))
+    assert parsed.iloc[0] == pd.Timestamp("2024-07-19")
+    assert parsed.iloc[1:].isna().all()
+
+
+def test_fmp_base_epoch(fmp_base):
+    values = [1721419200123, 1721419260000]
+    converted = fmp_base.epoch_to_datetime(values, unit="ms", tz="America/New_York")
+    assert converted.iloc[0] == pd.Timestamp("2024-07-19 16:00:00.123")
+
+    utc = fmp_base.epoch_to_datetime(pd.Series(values))
+    assert utc.equals(pd.to_datetime(pd.Series(values), unit="ms"))
+
+    assert fmp_base.format_epoch(
+        1721419200123, unit="ms", tz="America/New_York"
+    ) == pendulum.from_timestamp(1721419200.123, tz="America/New_York").strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+    assert fmp_base.format_epoch(1721419200) == "2024-07-19 20:00:00"
+
+
+def test_fmp_base_iter_pages(fmp_base):
+    requested = []
+
+    def fetch_page(page):
+        requested.append(page)
+        return [{"page": page}] if page < 5 else []
+
+    pages = list(fmp_base.iter_pages(fetch_page, prefetch=3))
+    assert [page for page, _ in pages] == [0, 1, 2, 3, 4]
+    assert max(requested) <= 5 + 3
+
+    pages = list(fmp_base.iter_pages(fetch_page, start_page=1, max_pages=2))
+    assert [page for page, _ in pages] == [1, 2]
+
+
+def test_fmp_base_iter_feed(fmp_base):
+    feed = [
+        [{"id": 9, "date": "2024-07-09"}, {"id": 8, "date": "2024-07-08"}],
+        [{"id": 8, "date": "2024-07-08"}, {"id": 7, "date": "2024-07-07"}],
+        [{"id": 6, "date": "2024-07-06"}, {"id": 5, "date": "2024-07-05"}],
+    ]
+
+    def fetch_page(page):
+        return feed[page] if page < len(feed) else []
+
+    def shape(records):
+        data_df = pd.DataFrame(records)
+        data_df["date"] = pd.to_datetime(data_df["date"])
+        return data_df
+
+    def ids(**kwargs):
+        frames = fmp_base.iter_feed(fetch_page, shape, ["id"], "date", **kwargs)
+        return [df["id"].tolist() for df in frames]
+
+    assert ids() == [[9, 8], [7], [6, 5]]
+    assert ids(cutoff="2024-07-07") == [[9, 8], [7]]
+
+    seen = {(7,)}
+    assert ids(seen=seen) == [[9, 8]]
+    assert seen == {(7,), (8,), (9,)}
+    assert ids(seen=seen) == []
+
+
+def test_fmp_base_get_calendar_request(fmp_base, mocker):
+    requests_made = []
+
+    def get_request(url, params):
+        requests_made.append((params["from"], params["to"]))
+        return [
+            {"symbol": "AAPL", "date": "2023-03-31"},
+            {"symbol": params["from"], "date": params["to"]},
+        ]
+
+    mocker.patch.object(fmp_base, "get_request", side_effect=get_request)
+
+    records = fmp_base.get_calendar_request(
+        "test/calendar-windows", "2023-01-01", "2023-12-31", window_days=100
+    )
+    assert sorted(requests_made) == [
+        ("2023-01-01", "2023-02-11"),
+        ("2023-02-12", "2023-05-22"),
+        ("2023-05-23", "2023-08-30"),
+        ("2023-08-31", "2023-12-08"),
+        ("2023-12-09", "2023-12-31"),
+    ]
+    assert len(records) == 6
+    assert records[0] == {"symbol": "AAPL", "date": "2023-03-31"}
+
+    requests_made.clear()
+    fmp_base.get_calendar_request(
+        "test/calendar-windows", "2023-01-01", "2023-12-31", window_days=100
+    )
+    assert requests_made == []
+
+    # A backfill starting on another day reuses the windows it shares.
+    fmp_base.get_calendar_request(
+        "test/calendar-windows", "2023-01-10", "2023-10-01", window_days=100
+    )
+    assert sorted(requests_made) == [
+        ("2023-01-10", "2023-02-11"),
+        ("2023-08-31", "2023-10-01"),
+    ]
+
+    requests_made.clear()
+    fmp_base.get_calendar_request(
+        "test/calendar-windows",
+        "2023-02-12",
+        "2023-05-22",
+        window_days=100,
+        cache=False,
+    )
+    assert requests_made == [("2023-02-12", "2023-05-22")]
+
+    requests_made.clear()
+    clear_calendar_cache()
+    fmp_base.get_calendar_request(
+        "test/calendar-windows", "2023-02-12", "2023-05-22", window_days=100
+    )
+    assert requests_made == [("2023-02-12", "2023-05-22")]
+
+
+def test_fmp_base_get_calendar_request_recent(fmp_base, mocker):
+    requests_made = []
+
+    def get_request(url, params):
+        requests_made.append((params["from"], params["to"]))
+        return [{"symbol": "AAPL", "date": params["to"]}]
+
+    mocker.patch.object(fmp_base, "get_request", side_effect=get_request)
+    clock = mocker.patch("fmp_py.fmp_base.time.monotonic", return_value=1000.0)
+
+    # Windows ending within the grace period are still being revised.
+    recent = (date.today() - timedelta(days=3)).isoformat()
+    for _ in range(2):
+        fmp_base.get_calendar_request("test/calendar-recent", recent, recent)
+    assert requests_made == [(recent, recent)] * 2
+
+    requests_made.clear()
+    for _ in range(2):
+        fmp_base.get_calendar_request(
+            "test/calendar-recent", "2023-01-01", "2023-01-05"
+        )
+    assert requests_made == [("2023-01-01", "2023-01-05")]
+
+    # Settled windows expire after the TTL.
+    clock.return_value = 1000.0 + CALENDAR_CACHE_TTL
+    fmp_base.get_calendar_request("test/calendar-recent", "2023-01-01", "2023-01-05")
+    assert requests_made == [("2023-01-01", "2023-01-05")] * 2
+
+
+def test_fmp_base_get_calendar_request_truncated(fmp_base, mocker):
+    mocker.patch("fmp_py.fmp_base.CALENDAR_ROW_LIMIT", 3)
+
+    def get_request(url, params):
+        days = pd.date_range(params["from"], params["to"]).strftime("%Y-%m-%d")
+        return [{"symbol": "AAPL", "date": day} for day in days[:3]]
+
+    mocker.patch.object(fmp_base, "get_request", side_effect=get_request)
+
+    records = fmp_base.get_calendar_request(
+        "test/calendar-truncated", "2023-01-01", "2023-01-08"
+    )
+    assert [r["date"] for r in records] == [f"2023-01-0{d}" for d in range(1, 9)]
@@ -0,0 +1,130 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_bulk_export import FmpBulkExport
+
+
+def statements(symbol, period="annual", limit=20):
+    if symbol == "NONE":
+        raise ValueError("No data found for the specified parameters.")
+    if symbol == "FAIL":
+        raise ConnectionError("connection reset")
+    if symbol == "NULL":
+        # A ValueError subclass from a failed cast is a failure, not missing data.
+        return (
+            pd.DataFrame({"revenue": [None]})
+            .astype({"revenue": "float"})
+            .astype({"revenue": "int"})
+        )
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2022-09-24", "2023-09-30"]),
+            "symbol": symbol,
+            "revenue": [394328000000, 383285000000],
+        }
+    )
+
+
+@pytest.fixture
+def fmp_bulk_export(tmp_path, mocker):
+    exporter = FmpBulkExport(path=str(tmp_path), max_workers=2, api_key="test")
+    mocker.patch.object(
+        exporter.statements_client, "income_statements", side_effect=statements
+    )
+    return exporter
+
+
+def test_fmp_bulk_export_invalid(fmp_bulk_export):
+    with pytest.raises(ValueError):
+        fmp_bulk_export.export("AAPL")
+    with pytest.raises(ValueError):
+        fmp_bulk_export.export(["AAPL"], datasets=["quotes"])
+    with pytest.raises(ValueError):
+        fmp_bulk_export.export(["AAPL"], period="monthly")
+    with pytest.raises(ValueError):
+        fmp_bulk_export.export(["AAPL"], datasets=["daily_history"])
+
+
+def test_fmp_bulk_export_checkpoint(fmp_bulk_export):
+    request = {"period": "annual", "limit": 20}
+    entries = [
+        {"dataset": "income", "symbol": "AAPL", "status": "done", "request": request},
+        {"dataset": "income", "symbol": "MSFT", "status": "done", "request": request},
+        {"dataset": "income", "symbol": "MSFT", "status": "error", "request": request},
+    ]
+    with open(os.path.join(fmp_bulk_export.path, FmpBulkExport.CHECKPOINT), "w") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
+        f.write('{"dataset": "income", "sym')
+
+    assert fmp_bulk_export._finished() == {("income", "AAPL"): request}
+    assert list(fmp_bulk_export.progress()["status"]) == ["done", "error"]
+
+
+def test_fmp_bulk_export_resume(fmp_bulk_export):
+    pytest.importorskip("pyarrow")
+    symbols = ["AAPL", "NONE", "FAIL", "NULL", "BRK/B"]
+
+    first = fmp_bulk_export.export(symbols, datasets=["income"])
+    assert dict(zip(first["symbol"], first["status"])) == {
+        "AAPL": "done",
+        "BRK/B": "done",
+        "FAIL": "error",
+        "NONE": "empty",
+        "NULL": "error",
+    }
+    errors = fmp_bulk_export.progress().set_index("symbol")["error"]
+    assert "IntCastingNaNError" in errors["NULL"]
+
+    second = fmp_bulk_export.export(symbols, datasets=["income"])
+    statuses = dict(zip(second["symbol"], second["status"]))
+    assert statuses["FAIL"] == statuses["NULL"] == "error"
+    assert (second["status"] == "skipped").sum() == 3
+    assert fmp_bulk_export.statements_client.income_statements.call_count == 7
+
+    third = fmp_bulk_export.export(symbols, datasets=["income"], limit=5)
+    assert (third["status"] != "skipped").all()
+
+    data_df = fmp_bulk_export.read("income")
+    assert sorted(data_df["symbol"].unique()) == ["AAPL", "BRK/B"]
+    assert len(fmp_bulk_export.read("income", ["BRK/B"])) == 2
+
+
+def test_fmp_bulk_export_write_error(fmp_bulk_export, mocker):
+    pytest.importorskip("pyarrow")
+    mocker.patch.object(
+        fmp_bulk_export, "_write", side_effect=ValueError("cannot convert column")
+    )
+    result = fmp_bulk_export.export(["AAPL"], datasets=["income"])
+    assert result["status"].tolist() == ["error"]
+    assert fmp_bulk_export._finished() == {}
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [dataset for dataset in FmpBulkExport.DATASETS if dataset != "daily_history"],
+)
+def test_fmp_bulk_export_quarter(tmp_path, mocker, dataset):
+    pytest.importorskip("pyarrow")
+    exporter = FmpBulkExport(path=str(tmp_path), api_key="test")
+    client = getattr(exporter, FmpBulkExport.DATASETS[dataset][0])
+    get_request = mocker.patch.object(client, "get_request", return_value=[])
+
+    result = exporter.export(["AAPL"], datasets=[dataset], period="quarter")
+    assert result["status"].tolist() == ["empty"]
+    call = get_request.call_args
+    params = call.kwargs["params"] if "params" in call.kwargs else call.args[1]
+    assert params["period"] == "quarter"
+
+
+def test_fmp_bulk_export_throttle(fmp_bulk_export, mocker):
+    sleep = mocker.patch("fmp_py.fmp_bulk_export.time.sleep")
+    fmp_bulk_export.calls_per_minute = 600
+    for _ in range(3):
+        fmp_bulk_export._throttle()
+
+    waits = [call.args[0] for call in sleep.call_args_list]
+    assert len(waits) == 2
+    assert waits[-1] == pytest.approx(0.2, abs=0.05)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from fmp_py.fmp_chart_data import FmpChartData
@@ -134,3 +135,168 @@ def test_fmp_chart_data_kama(fmp):
     fmp_chart = fmp.return_chart()
     assert isinstance(fmp_chart, pd.DataFrame)
     assert "kama10" in fmp_chart.columns
+
+
+def test_fmp_chart_data_from_chart():
+    chart = pd.DataFrame(
+        {
+            "open": [1.0, 2.0, 3.0, 4.0],
+            "high": [1.5, 2.5, 3.5, 4.5],
+            "low": [0.5, 1.5, 2.5, 3.5],
+            "close": [1.2, 2.2, 3.2, 4.2],
+            "volume": [100, 200, 300, 400],
+        },
+        index=pd.date_range("2024-01-01", periods=4, name="date"),
+    )
+    fmp = FmpChartData.from_chart(chart, api_key="test")
+    fmp.sma(2)
+    assert fmp.return_chart()["sma2"].tolist()[1:] == [1.7, 2.7, 3.7]
+    assert "sma2" not in chart.columns
+
+
+@pytest.fixture
+def offline_chart():
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 600)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, 600),
+        },
+        index=pd.date_range("2022-01-01", periods=600, name="date"),
+    )
+
+
+@pytest.mark.parametrize(
+    "indicator, kwargs, column",
+    [
+        ("sma", {}, "sma{}"),
+        ("ema", {}, "ema{}"),
+        ("wma", {}, "wma{}"),
+        ("rsi", {}, "rsi{}"),
+        ("roc", {}, "roc{}"),
+        ("bb", {"band": "pband"}, "bb_pband{}"),
+        ("bb", {"band": "wband", "std": 3}, "bb_wband{}"),
+        ("bb", {"band": "hband_ind"}, "bb_hband_ind{}"),
+    ],
+)
+def test_fmp_chart_data_sweep(offline_chart, indicator, kwargs, column):
+    periods = [1, 2, 5, 14, 50, 200]
+    fmp = FmpChartData.from_chart(offline_chart, api_key="test")
+    swept = fmp.sweep(indicator, periods=periods, **kwargs)
+
+    assert list(swept.columns) == [column.format(period) for period in periods]
+    assert swept.index.equals(offline_chart.index)
+    assert list(fmp.return_chart().columns) == list(offline_chart.columns)
+
+    for period in periods:
+        single = FmpChartData.from_chart(offline_chart, api_key="test")
+        if indicator == "bb":
+            single.bb(period=period, std=kwargs.get("std", 2))
+            expected = single.return_chart()[f"bb_{kwargs['band']}"]
+        else:
+            getattr(single, indicator)(period=period)
+            expected = single.return_chart()[column.format(period)]
+        np.testing.assert_allclose(
+            swept[column.format(period)].to_numpy(), expected.to_numpy(float), atol=0.01
+        )
+
+
+def test_fmp_chart_data_sweep_array(offline_chart):
+    fmp = FmpChartData.from_chart(offline_chart, api_key="test")
+    values = fmp.sweep("ema", periods=range(5, 21), wide=False, decimals=None)
+    assert isinstance(values, np.ndarray)
+    assert values.shape == (16, 600)
+    expected = offline_chart["close"].ewm(span=20, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(values[-1], expected, rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        fmp.sweep("kama", periods=[10])
+    with pytest.raises(ValueError):
+        fmp.sweep("bb", periods=[20], band="middle")
+    with pytest.raises(ValueError):
+        fmp.sweep("sma", periods=[0, 5])
+
+
+def test_fmp_chart_data_sweep_wma_precision():
+    # 100k bars drifting from 100 into the hundreds of thousands.
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0001, 0.01, 100_000)))
+    assert close[-1] > 10_000
+    chart = pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1},
+        index=pd.date_range("1990-01-01", periods=len(close), freq="min", name="date"),
+    )
+    periods = [1, 2, 5, 14, 50, 200]
+    fmp = FmpChartData.from_chart(chart, api_key="test")
+    values = fmp.sweep("wma", periods=periods, wide=False, decimals=None)
+
+    for row, period in enumerate(periods):
+        weights = np.arange(period, 0, -1.0)
+        expected = np.convolve(close, weights, "valid") / weights.sum()
+        assert (values[row, : period - 1] == 0).all()
+        np.testing.assert_allclose(values[row, period - 1 :], expected, rtol=1e-10)
+
+
+@pytest.fixture
+def minute_chart():
+    rng = np.random.default_rng(3)
+    day = pd.date_range("2024-01-02 09:30", periods=390, freq="min")
+    index = day.append(day + pd.Timedelta(days=1)).rename("date")
+    close = 100 + np.cumsum(rng.normal(0, 0.05, len(index)))
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.02, len(index)),
+            "high": close + 0.05,
+            "low": close - 0.05,
+            "close": close,
+            "volume": rng.integers(100, 1_000, len(index)),
+        },
+        index=index,
+    )
+
+
+def test_fmp_chart_data_session_vwap(minute_chart):
+    fmp = FmpChartData.from_chart(minute_chart, api_key="test")
+    fmp.session_vwap()
+    fmp.cumulative_delta()
+    chart = fmp.return_chart()
+
+    days = minute_chart.index.normalize()
+    typical = (minute_chart["high"] + minute_chart["low"] + minute_chart["close"]) / 3
+    volume = minute_chart["volume"]
+    expected = (typical * volume).groupby(days).cumsum() / volume.groupby(days).cumsum()
+    np.testing.assert_allclose(chart["session_vwap"], expected.round(2), atol=0.01)
+
+    signed = volume * np.sign(minute_chart["close"] - minute_chart["open"])
+    assert chart["cumulative_delta"].tolist() == signed.groupby(days).cumsum().tolist()
+
+
+def test_fmp_chart_data_anchored_vwap(minute_chart):
+    fmp = FmpChartData.from_chart(minute_chart, api_key="test")
+    fmp.anchored_vwap(["2024-01-02 12:00", "2024-01-03 10:00"])
+    vwap = fmp.return_chart()["anchored_vwap"]
+
+    assert vwap.iloc[:150].isna().all()
+    assert vwap.iloc[150] == round(
+        (minute_chart.iloc[150][["high", "low", "close"]].mean()), 2
+    )
+    assert vwap.iloc[150:].notna().all()
+
+
+def test_fmp_chart_data_volume_profile(minute_chart):
+    fmp = FmpChartData.from_chart(minute_chart, api_key="test")
+    profile = fmp.volume_profile(step=0.5)
+
+    assert profile.index.names == ["anchor", "price"]
+    assert list(profile.index.get_level_values("anchor").unique()) == list(
+        minute_chart.index[[0, 390]]
+    )
+    assert profile["volume"].sum() == minute_chart["volume"].sum()
+    assert "volume_profile" not in fmp.return_chart().columns
+
+    with pytest.raises(ValueError):
+        fmp.volume_profile(step=0)
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_dcf import FmpDcf
+
+
+def make_dcf(symbol, flows, wacc, growth, net_debt, shares, price):
+    return pd.DataFrame(
+        {
+            "year": [2024 + i for i in range(len(flows))],
+            "symbol": symbol,
+            "price": price,
+            "diluted_shares_outstanding": shares,
+            "wacc": wacc,
+            "ufcf": flows,
+            "long_term_growth_rate": growth,
+            "net_debt": net_debt,
+        }
+    )
+
+
+def expected_per_share(flows, wacc, growth, net_debt, shares):
+    w, g = wacc / 100, growth / 100
+    pv = sum(f / (1 + w) ** (i + 1) for i, f in enumerate(flows))
+    terminal = flows[-1] * (1 + g) / (w - g) / (1 + w) ** len(flows)
+    return (pv + terminal - net_debt) / shares
+
+
+@pytest.fixture
+def data():
+    return pd.concat(
+        [
+            make_dcf("MSFT", [100, 110, 120], 8.0, 3.0, 50, 10, 150.0),
+            make_dcf("AAPL", [200, 220, 240, 260, 280], 9.0, 4.0, -100, 20, 200.0),
+        ],
+        ignore_index=True,
+    )
+
+
+@pytest.fixture
+def dcf():
+    return FmpDcf(api_key="test")
+
+
+def test_fmp_dcf_value(dcf, data):
+    result = dcf.value(data)
+    assert result["symbol"].tolist() == ["AAPL", "MSFT"]
+    aapl = expected_per_share([200, 220, 240, 260, 280], 9.0, 4.0, -100, 20)
+    msft = expected_per_share([100, 110, 120], 8.0, 3.0, 50, 10)
+    assert result["equity_value_per_share"].tolist() == pytest.approx([aapl, msft])
+    assert result["upside"].iloc[1] == pytest.approx(msft / 150.0 - 1)
+
+
+def test_fmp_dcf_grid(dcf, data):
+    result = dcf.grid(data, wacc=[7.0, 8.0, 9.0], growth=[2.0, 3.0])
+    assert len(result) == 2 * 3 * 2
+    row = result[
+        (result["symbol"] == "MSFT")
+        & (result["wacc"] == 7.0)
+        & (result["long_term_growth_rate"] == 2.0)
+    ]
+    assert row["equity_value_per_share"].iloc[0] == pytest.approx(
+        expected_per_share([100, 110, 120], 7.0, 2.0, 50, 10)
+    )
+
+    relative = dcf.grid(data, wacc=[0.0, 1.0], growth=[0.0], relative=True)
+    base = relative.groupby("symbol").first()
+    assert base["wacc"].tolist() == [9.0, 8.0]
+    assert base["equity_value_per_share"].tolist() == pytest.approx(
+        dcf.value(data)["equity_value_per_share"].tolist()
+    )
+
+    invalid = dcf.grid(data, wacc=[3.0], growth=[3.0])
+    assert invalid["equity_value_per_share"].isna().all()
+
+
+def test_fmp_dcf_monte_carlo(dcf, data):
+    exact = dcf.monte_carlo(
+        data, draws=10, wacc_std=0.0, growth_std=0.0, flow_std=0.0, seed=1
+    )
+    assert exact["mean"].tolist() == pytest.approx(
+        dcf.value(data)["equity_value_per_share"].tolist()
+    )
+    assert exact["std"].tolist() == pytest.approx([0.0, 0.0], abs=1e-9)
+
+    values = dcf.monte_carlo(data, draws=2500, seed=1, chunk_size=1000, summary=False)
+    assert values.shape == (2500, 2)
+    again = dcf.monte_carlo(data, draws=2500, seed=1, chunk_size=1000, summary=False)
+    assert np.array_equal(values, again, equal_nan=True)
+
+    stats = dcf.monte_carlo(data, draws=2500, seed=1)
+    assert (stats["p5"] < stats["p50"]).all()
+    assert stats["prob_above_price"].between(0, 1).all()
+
+
+def test_fmp_dcf_fetch(dcf, data, mocker):
+    def advanced_dcf(symbol):
+        if symbol == "INVALID":
+            raise ValueError("No data found in API response")
+        return data[data["symbol"] == symbol]
+
+    mocker.patch.object(dcf.valuation_client, "advanced_dcf", side_effect=advanced_dcf)
+    fetched = dcf.fetch(["MSFT", "AAPL", "INVALID"])
+    assert fetched["symbol"].unique().tolist() == ["AAPL", "MSFT"]
+
+    with pytest.raises(ValueError):
+        dcf.fetch(["AAPL"], model="invalid")
+
+
+def test_fmp_dcf_invalid_frame(dcf):
+    with pytest.raises(ValueError):
+        dcf.value(pd.DataFrame({"symbol": ["AAPL"]}))
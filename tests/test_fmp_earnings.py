@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+import pendulum
 from fmp_py.fmp_earnings import FmpEarnings
 
 
@@ -95,3 +96,44 @@ def test_fmp_earning_within_weeks(fmp_earnings):
 def test_fmp_earning_within_weeks_invalid_symbol(fmp_earnings):
     result = fmp_earnings.earnings_within_weeks("INVALID_SYMBOL", 2)
     assert not result
+
+
+def test_fmp_earning_within_weeks_bulk(mocker):
+    client = FmpEarnings(api_key="test")
+    today = pendulum.today()
+    calendar = pd.DataFrame(
+        {
+            "symbol": ["MSFT", "AAPL", "NVDA", "AAPL", "TSLA"],
+            "date": pd.to_datetime(
+                [
+                    today.add(days=3).to_date_string(),
+                    today.add(days=30).to_date_string(),
+                    today.to_date_string(),
+                    today.add(days=10).to_date_string(),
+                    today.add(weeks=3).to_date_string(),
+                ]
+            ),
+        }
+    )
+    earnings_calendar = mocker.patch.object(
+        client, "earnings_calendar", return_value=calendar
+    )
+
+    result = client.earnings_within_weeks_bulk(["AAPL", "TSLA", "NVDA", "IBM", "MSFT"])
+    assert result.tolist() == [True, False, True, False, True]
+    assert result.index.tolist() == ["AAPL", "TSLA", "NVDA", "IBM", "MSFT"]
+
+    result = client.earnings_within_weeks_bulk(["MSFT"], weeks_ahead=1)
+    assert result.tolist() == [True]
+    assert earnings_calendar.call_count == 1
+
+    result = client.earnings_within_weeks_bulk(["TSLA"], weeks_ahead=4)
+    assert result.tolist() == [True]
+    assert earnings_calendar.call_count == 2
+
+    client.earnings_within_weeks_bulk(["TSLA"], refresh=True)
+    assert earnings_calendar.call_count == 3
+
+    earnings_calendar.side_effect = ValueError("Error fetching earnings calendar data")
+    result = client.earnings_within_weeks_bulk(["AAPL"], refresh=True)
+    assert result.tolist() == [False]
@@ -538,3 +538,87 @@ def test_fmp_financial_statements_income_statements_check_limit(
 ):
     statements = fmp_financial_statements.income_statements("AAPL", "annual", limit=1)
     assert len(statements) == 1
+
+
+AS_REPORTED = [
+    {
+        "date": "2023-09-30",
+        "symbol": "AAPL",
+        "period": "FY",
+        "documenttype": "10-K",
+        "netincomeloss": 96995000000,
+        "sharebasedcompensation": 10833000000,
+    },
+    {
+        "date": "2022-09-24",
+        "symbol": "AAPL",
+        "period": "FY",
+        "documenttype": "10-K",
+        "netincomeloss": 99803000000,
+    },
+]
+
+
+@pytest.fixture
+def offline_statements():
+    return FmpFinancialStatements(api_key="test")
+
+
+def test_fmp_financial_statements_as_reported_long(offline_statements, mocker):
+    mocker.patch.object(offline_statements, "get_request", return_value=AS_REPORTED)
+    data = offline_statements.cashflow_statements_as_reported("AAPL", layout="long")
+    assert list(data.columns) == ["symbol", "date", "period", "tag", "value"]
+    assert len(data) == 3
+    assert data["tag"].dtype == "category"
+    assert data["value"].dtype == np.float64
+    assert "documenttype" not in data["tag"].cat.categories
+
+    with pytest.raises(ValueError):
+        offline_statements.income_statements_as_reported("AAPL", layout="invalid")
+
+
+def test_fmp_financial_statements_as_reported_pivot(offline_statements, mocker):
+    other = [{"date": "2023-12-31", "symbol": "MSFT", "period": "FY", "revenues": 1.5}]
+    mocker.patch.object(
+        offline_statements, "get_request", side_effect=[AS_REPORTED, other]
+    )
+    frames = [
+        offline_statements.income_statements_as_reported("AAPL", layout="long"),
+        offline_statements.income_statements_as_reported("MSFT", layout="long"),
+    ]
+    data = FmpFinancialStatements.concat_as_reported(frames)
+    assert data["tag"].dtype == "category"
+    assert len(data) == 4
+
+    wide = FmpFinancialStatements.pivot_as_reported(data)
+    assert wide.shape == (3, 3)
+    assert isinstance(wide["revenues"].dtype, pd.SparseDtype)
+    assert wide.loc[("MSFT", pd.Timestamp("2023-12-31"), "FY"), "revenues"] == 1.5
+    assert np.isnan(
+        wide.loc[("AAPL", pd.Timestamp("2022-09-24"), "FY"), "sharebasedcompensation"]
+    )
+
+    dense = FmpFinancialStatements.pivot_as_reported(data, sparse=False)
+    assert dense["netincomeloss"].dtype == np.float64
+    assert dense.equals(wide.sparse.to_dense())
+
+
+def test_fmp_financial_statements_income_statements_output(offline_statements, mocker):
+    response = [
+        {"date": "2023-09-30", "symbol": "AAPL", "revenue": 383285000000, "eps": 6.16},
+        {"date": "2022-09-24", "symbol": "AAPL", "revenue": 394328000000, "eps": 6.15},
+    ]
+    mocker.patch.object(offline_statements, "get_request", return_value=response)
+
+    data = offline_statements.income_statements("AAPL", output="numpy")
+    assert isinstance(data, dict)
+    assert data["revenue"].dtype == np.int64
+    assert list(data["revenue"]) == [394328000000, 383285000000]
+    assert data["date"][0] == np.datetime64("2022-09-24")
+
+    offline_statements.output = "numpy"
+    assert isinstance(offline_statements.income_statements("AAPL"), dict)
+    assert offline_statements.resolve_output("pandas") == "pandas"
+
+    with pytest.raises(ValueError):
+        offline_statements.income_statements("AAPL", output="excel")
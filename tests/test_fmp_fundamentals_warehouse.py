@@ -0,0 +1,208 @@
+import pandas as pd
+import pendulum
+import pytest
+
+from fmp_py.fmp_fundamentals_warehouse import FmpFundamentalsWarehouse
+from fmp_py.fmp_symbol_resolver import FmpSymbolResolver
+
+
+def make_income(symbol, dates, revenue, filling_lag_days=30):
+    dates = pd.to_datetime(dates)
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "symbol": symbol,
+            "reported_currency": "USD",
+            "filling_date": dates + pd.Timedelta(days=filling_lag_days),
+            "accepted_date": dates + pd.Timedelta(days=filling_lag_days),
+            "calendar_year": [d.year for d in dates],
+            "period": "FY",
+            "revenue": revenue,
+        }
+    )
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    warehouse = FmpFundamentalsWarehouse(
+        path=str(tmp_path / "fundamentals.db"), api_key="test"
+    )
+    yield warehouse
+    warehouse.close()
+
+
+def test_fmp_fundamentals_warehouse_init(warehouse):
+    assert isinstance(warehouse, FmpFundamentalsWarehouse)
+    assert warehouse.stored_symbols("income") == []
+    assert warehouse.statements("income").empty
+
+
+def test_fmp_fundamentals_warehouse_store_and_read(warehouse):
+    data_df = make_income("AAPL", ["2022-09-24", "2023-09-30"], [394, 383])
+    assert warehouse.store("income", data_df) == 2
+
+    stored = warehouse.statements("income", ["AAPL"])
+    assert len(stored) == 2
+    assert stored["revenue"].tolist() == [394, 383]
+    assert stored["date"].dtype == "datetime64[ns]"
+    assert stored["filling_date"].iloc[1] == pd.Timestamp("2023-10-30")
+
+    subset = warehouse.statements("income", columns=["revenue"])
+    assert list(subset.columns) == ["symbol", "period", "date", "revenue"]
+
+    assert warehouse.statements("income", period="quarter").empty
+    assert len(warehouse.statements("income", from_date="2023-01-01")) == 1
+
+
+def test_fmp_fundamentals_warehouse_upsert(warehouse):
+    warehouse.store("income", make_income("AAPL", ["2023-09-30"], [1]))
+    restated = make_income("AAPL", ["2023-09-30"], [2])
+    restated["eps"] = 6.13
+    warehouse.store("income", restated)
+
+    stored = warehouse.statements("income")
+    assert len(stored) == 1
+    assert stored["revenue"].iloc[0] == 2
+    assert stored["eps"].iloc[0] == 6.13
+
+
+def test_fmp_fundamentals_warehouse_invalid(warehouse):
+    with pytest.raises(ValueError):
+        warehouse.statements("invalid")
+    with pytest.raises(ValueError):
+        warehouse.statements("income", period="quarterly")
+    with pytest.raises(ValueError):
+        warehouse.refresh("AAPL")
+    with pytest.raises(ValueError):
+        warehouse.store("income", pd.DataFrame({"symbol": ["AAPL"]}))
+
+    warehouse.store("income", make_income("AAPL", ["2023-09-30"], [1]))
+    with pytest.raises(ValueError):
+        warehouse.statements("income", columns=["invalid"])
+
+
+def test_fmp_fundamentals_warehouse_refresh(warehouse, mocker):
+    today = pd.Timestamp(pendulum.today().to_date_string())
+    recent = today - pd.Timedelta(days=100)
+
+    # AAPL reported after its last filing, MSFT did not, TSLA is new.
+    warehouse.store("income", make_income("AAPL", [recent], [1], filling_lag_days=5))
+    warehouse.store("income", make_income("MSFT", [recent], [1], filling_lag_days=5))
+
+    calendar = pd.DataFrame(
+        {
+            "date": [today - pd.Timedelta(days=10), recent - pd.Timedelta(days=30)],
+            "symbol": ["AAPL", "MSFT"],
+        }
+    )
+    mocker.patch.object(
+        warehouse.earnings_client, "earnings_calendar", return_value=calendar
+    )
+
+    def income_statements(symbol, period="annual", limit=20):
+        return make_income(symbol, [today - pd.Timedelta(days=5)], [limit])
+
+    fetch = mocker.patch.object(
+        warehouse.statements_client,
+        "income_statements",
+        side_effect=income_statements,
+    )
+
+    result = warehouse.refresh(["AAPL", "MSFT", "TSLA"], kinds=["income"])
+
+    actions = dict(zip(result["symbol"], result["action"]))
+    assert actions == {"AAPL": "incremental", "MSFT": "skipped", "TSLA": "full"}
+    assert fetch.call_count == 2
+
+    stored = warehouse.statements("income", ["TSLA"])
+    assert stored["revenue"].tolist() == [20]
+    assert len(warehouse.statements("income", ["AAPL"])) == 2
+
+    # Everything was checked today, so a second pass has nothing to do.
+    fetch.reset_mock()
+    result = warehouse.refresh(["AAPL", "MSFT", "TSLA"], kinds=["income"])
+    assert (result["action"] == "skipped").all()
+    assert fetch.call_count == 0
+
+
+def test_fmp_fundamentals_warehouse_refresh_overdue(warehouse, mocker):
+    warehouse.store("income", make_income("AAPL", ["2020-09-26"], [1]))
+    mocker.patch.object(
+        warehouse.earnings_client,
+        "earnings_calendar",
+        side_effect=ValueError("Error fetching earnings calendar data"),
+    )
+    fetch = mocker.patch.object(
+        warehouse.statements_client,
+        "income_statements",
+        side_effect=ValueError("No data found for the provided symbol."),
+    )
+
+    result = warehouse.refresh(["AAPL"], kinds=["income"])
+    assert result["action"].tolist() == ["empty"]
+    assert fetch.call_args.kwargs["limit"] == 2
+
+
+def test_fmp_fundamentals_warehouse_resolver(tmp_path, mocker):
+    resolver = FmpSymbolResolver().from_frame(
+        pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2022-06-09"]),
+                "old_symbol": ["FB"],
+                "new_symbol": ["META"],
+            }
+        )
+    )
+    warehouse = FmpFundamentalsWarehouse(
+        path=str(tmp_path / "fundamentals.db"), resolver=resolver, api_key="test"
+    )
+    today = pendulum.today()
+    recent = today.subtract(days=60).to_date_string()
+    warehouse.store("income", make_income("FB", ["2021-12-31", recent], [118, 134]))
+    warehouse.store("income", make_income("META", [recent], [135]))
+
+    read = warehouse.statements("income", ["FB"])
+    assert read["symbol"].tolist() == ["META", "META"]
+    assert read["revenue"].tolist() == [118, 135]
+
+    mocker.patch.object(warehouse, "_reported_since", return_value={})
+    fetch = mocker.patch.object(warehouse.statements_client, "income_statements")
+    result = warehouse.refresh(["FB"], kinds=["income"])
+
+    assert result["symbol"].tolist() == ["META"]
+    assert result["action"].tolist() == ["skipped"]
+    fetch.assert_not_called()
+    assert warehouse.stored_symbols("income") == ["META"]
+    assert warehouse.statements("income", ["META"])["revenue"].tolist() == [118, 135]
+    warehouse.close()
+
+
+def test_fmp_fundamentals_warehouse_reused_ticker(tmp_path):
+    # Company A renamed X to Y, then company B renamed Z to X.
+    resolver = FmpSymbolResolver().from_frame(
+        pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2020-01-01", "2022-01-01"]),
+                "old_symbol": ["X", "Z"],
+                "new_symbol": ["Y", "X"],
+            }
+        )
+    )
+    warehouse = FmpFundamentalsWarehouse(
+        path=str(tmp_path / "fundamentals.db"), resolver=resolver, api_key="test"
+    )
+    warehouse.store("income", make_income("X", ["2019-12-31", "2023-12-31"], [1, 30]))
+    warehouse.store("income", make_income("Y", ["2021-12-31"], [2]))
+    warehouse.store("income", make_income("Z", ["2021-12-31"], [20]))
+
+    read = warehouse.statements("income", ["Y"])
+    assert read["symbol"].tolist() == ["Y", "Y"]
+    assert read["revenue"].tolist() == [1, 2]
+    read = warehouse.statements("income", ["X"])
+    assert read["symbol"].tolist() == ["X", "X"]
+    assert read["revenue"].tolist() == [20, 30]
+
+    assert warehouse.adopt_aliases(["Y", "X"], kinds=["income"]) == 2
+    stored = warehouse.statements("income").set_index("revenue")["symbol"]
+    assert stored.to_dict() == {1: "Y", 2: "Y", 20: "X", 30: "X"}
+    warehouse.close()
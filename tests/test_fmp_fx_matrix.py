@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_fx_matrix import FmpFxMatrix
+from fmp_py.fmp_panel import FmpPanel
+
+
+@pytest.fixture
+def quotes():
+    return pd.DataFrame(
+        {
+            "ticker": ["EUR/USD", "GBP/USD", "USD/JPY", "EUR/CHF"],
+            "bid": [1.09, 1.27, 149.0, 0.95],
+            "ask": [1.11, 1.29, 151.0, 0.97],
+        }
+    )
+
+
+@pytest.fixture
+def fx(quotes):
+    fx = FmpFxMatrix(api_key="test")
+    fx.from_quotes(quotes)
+    return fx
+
+
+def make_history(dates, closes):
+    return pd.DataFrame({"date": pd.to_datetime(dates), "close": closes})
+
+
+def test_fmp_fx_matrix_from_quotes(fx):
+    matrix = pd.DataFrame(fx.matrix, index=fx.currencies, columns=fx.currencies)
+    assert matrix.index.tolist() == ["CHF", "EUR", "GBP", "JPY", "USD"]
+    assert np.allclose(np.diag(matrix), 1.0)
+
+    assert matrix.loc["EUR", "USD"] == pytest.approx(1.10)
+    assert matrix.loc["USD", "EUR"] == pytest.approx(1 / 1.10)
+    assert matrix.loc["GBP", "JPY"] == pytest.approx(1.28 * 150.0)
+    assert matrix.loc["CHF", "USD"] == pytest.approx(1.10 / 0.96)
+    assert fx.rate("JPY", "GBP") == pytest.approx(1 / (1.28 * 150.0))
+    assert np.isnan(fx.rate("XYZ", "USD"))
+    assert fx.rate("XYZ", "XYZ") == 1.0
+
+
+def test_fmp_fx_matrix_convert(fx):
+    statements = pd.DataFrame(
+        {
+            "symbol": ["SAP", "SONY", "AAPL", "BP", "XX"],
+            "reported_currency": ["EUR", "JPY", "USD", "GBP", "ZZZ"],
+            "revenue": [100.0, 15000.0, 100.0, 50.0, 1.0],
+            "net_income": [10, 1500, 10, 5, 1],
+        }
+    )
+    converted = fx.convert(statements, ["revenue", "net_income"])
+
+    assert converted["revenue"].tolist()[:4] == pytest.approx(
+        [110.0, 100.0, 100.0, 64.0]
+    )
+    assert converted["net_income"].tolist()[:4] == pytest.approx(
+        [11.0, 10.0, 10.0, 6.4]
+    )
+    assert np.isnan(converted["revenue"].iloc[4])
+    assert (converted["reported_currency"] == "USD").all()
+    assert statements["reported_currency"].iloc[0] == "EUR"
+
+    in_eur = fx.convert(statements, ["revenue"], target="EUR")
+    assert in_eur["revenue"].iloc[2] == pytest.approx(100 / 1.10)
+
+
+def test_fmp_fx_matrix_history(mocker):
+    fx = FmpFxMatrix(api_key="test")
+    frames = {
+        "EURUSD": make_history(
+            ["2024-01-03", "2024-01-02", "2024-01-01"], [1.2, 1.1, 1.0]
+        ),
+        "USDJPY": make_history(["2024-01-03", "2024-01-01"], [150.0, 140.0]),
+    }
+    mocked = mocker.patch.object(
+        fx.forex_client, "forex_daily", side_effect=lambda pair: frames[pair]
+    )
+    values = fx.history(["EURUSD", "USDJPY"])
+    assert mocked.call_count == 2
+    assert values.index.is_monotonic_increasing
+    assert values.loc["2024-01-02", "EUR"] == pytest.approx(1.1)
+    assert values.loc["2024-01-02", "JPY"] == pytest.approx(1 / 140.0)
+
+    assert fx.rate("EUR", "JPY", "2024-01-02") == pytest.approx(1.1 * 140.0)
+    assert fx.rate("EUR", "JPY", "2024-01-10") == pytest.approx(1.2 * 150.0)
+    assert np.isnan(fx.rate("EUR", "USD", "2023-12-31"))
+
+    statements = pd.DataFrame(
+        {
+            "reported_currency": ["EUR", "EUR", "JPY"],
+            "date": ["2024-01-01", "2024-01-03", "2024-01-02"],
+            "revenue": [10.0, 10.0, 1400.0],
+        }
+    )
+    converted = fx.convert(statements, ["revenue"], date_column="date")
+    assert converted["revenue"].tolist() == pytest.approx([10.0, 12.0, 10.0])
+
+
+def test_fmp_fx_matrix_convert_panel(fx):
+    panel = FmpPanel(
+        values=np.ones((2, 3, 2)),
+        symbols=pd.Index(["SAP", "BP"]),
+        periods=pd.Index(["2023Q2", "2023Q3", "2023Q4"]),
+        fields=["revenue", "net_income"],
+    )
+    converted = fx.convert_panel(panel, ["EUR", "GBP"])
+    assert converted.field("revenue").loc["SAP"].tolist() == pytest.approx([1.10] * 3)
+    assert converted.field("net_income").loc["BP"].tolist() == pytest.approx([1.28] * 3)
+    assert panel.values.sum() == 12
+
+
+def test_fmp_fx_matrix_errors(quotes):
+    fx = FmpFxMatrix(api_key="test")
+    with pytest.raises(ValueError):
+        fx.rate("EUR", "USD")
+    with pytest.raises(ValueError):
+        fx.from_quotes(quotes.drop(columns=["ticker"]))
+    with pytest.raises(ValueError):
+        fx.from_history({})
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_chart_data import FmpChartData
+from fmp_py.fmp_indicator_pool import FmpIndicatorPool
+
+INDICATORS = ["rsi", ("sma", {"period": 5}), "macd", "bb", "obv", "vpt"]
+
+
+def bars(rows, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, rows),
+        },
+        index=pd.date_range("2024-01-01", periods=rows, freq="min", name="date"),
+    )
+
+
+@pytest.fixture
+def charts():
+    return {f"SYM{i}": bars(60 + 13 * i, i) for i in range(7)}
+
+
+def sequential(chart):
+    chart_data = FmpChartData.from_chart(chart, api_key="test")
+    chart_data.rsi()
+    chart_data.sma(period=5)
+    chart_data.macd()
+    chart_data.bb()
+    chart_data.obv()
+    chart_data.vpt()
+    return chart_data.return_chart()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fmp_indicator_pool_compute(charts, processes):
+    results = FmpIndicatorPool(processes=processes).compute(charts, INDICATORS)
+
+    assert list(results) == list(charts)
+    for symbol, chart in charts.items():
+        pd.testing.assert_frame_equal(results[symbol], sequential(chart))
+    assert "sma5" not in charts["SYM0"].columns
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fmp_indicator_pool_timestamps(charts, processes):
+    # Bars span midnight, so sessions and anchors depend on the timestamps.
+    charts = {
+        symbol: chart.set_axis(chart.index + pd.Timedelta(hours=23, minutes=30))
+        for symbol, chart in charts.items()
+    }
+    charts["SYM1"] = charts["SYM1"].tz_localize("America/New_York")
+    indicators = [
+        ("session_vwap", {"session_start": "00:00"}),
+        "cumulative_delta",
+        ("anchored_vwap", {"anchors": ["2024-01-02 00:05"]}),
+    ]
+    results = FmpIndicatorPool(processes=processes).compute(charts, indicators)
+
+    for symbol, chart in charts.items():
+        chart_data = FmpChartData.from_chart(chart, api_key="test")
+        chart_data.session_vwap()
+        chart_data.cumulative_delta()
+        chart_data.anchored_vwap(["2024-01-02 00:05"])
+        pd.testing.assert_frame_equal(results[symbol], chart_data.return_chart())
+
+    unindexed = {"SYM0": charts["SYM0"].reset_index(drop=True)}
+    with pytest.raises(ValueError):
+        FmpIndicatorPool(processes=1).compute(unindexed, ["cumulative_delta"])
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fmp_indicator_pool_dropped_rows(charts, processes):
+    charts = {symbol: bars(200 + 7 * i, i) for i, symbol in enumerate(charts)}
+    results = FmpIndicatorPool(processes=processes).compute(
+        charts, ["bxtrender", "rsi"]
+    )
+
+    for symbol, chart in charts.items():
+        chart_data = FmpChartData.from_chart(chart, api_key="test")
+        chart_data.bxtrender()
+        chart_data.rsi()
+        expected = chart_data.return_chart()
+        assert len(expected) < len(chart)
+        pd.testing.assert_frame_equal(results[symbol], expected)
+
+
+def test_fmp_indicator_pool_shards():
+    pool = FmpIndicatorPool(processes=2, shards_per_process=1)
+    shards = pool._shards(np.array([0, 10, 20, 25, 100]))
+    assert shards == [[(0, 10), (10, 20), (20, 25)], [(25, 100)]]
+
+
+def test_fmp_indicator_pool_invalid(charts):
+    pool = FmpIndicatorPool(processes=1)
+    with pytest.raises(ValueError):
+        pool.compute(charts, ["return_chart"])
+    with pytest.raises(ValueError):
+        pool.compute(charts, ["not_an_indicator"])
+    with pytest.raises(ValueError):
+        pool.compute({"AAPL": charts["SYM0"].drop(columns="volume")}, ["rsi"])
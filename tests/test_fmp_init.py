@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+import fmp_py
+
+
+def modules_after(statement: str) -> set:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(' '.join(sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_fmp_init_lazy_attributes():
+    from fmp_py.fmp_quote import FmpQuote
+
+    assert fmp_py.FmpQuote is FmpQuote
+    assert fmp_py.fmp_quote.FmpQuote is FmpQuote
+    assert "FmpChartData" in dir(fmp_py)
+    assert all(hasattr(fmp_py, name) for name in fmp_py.__all__)
+
+    with pytest.raises(AttributeError):
+        fmp_py.NotAClient
+    with pytest.raises(AttributeError):
+        fmp_py.fmp_not_a_module
+
+
+def test_fmp_init_import_cost():
+    assert "pandas" not in modules_after("import fmp_py")
+
+    loaded = modules_after("from fmp_py import FmpQuote")
+    assert "fmp_py.fmp_quote" in loaded
+    assert "fmp_py.fmp_chart_data" not in loaded
+    assert "pendulum" not in loaded
+
+    assert "ta" not in modules_after("import fmp_py.fmp_chart_data")
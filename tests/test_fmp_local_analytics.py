@@ -0,0 +1,238 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_financial_statements import FmpFinancialStatements
+from fmp_py.fmp_fundamentals_warehouse import FmpFundamentalsWarehouse
+from fmp_py.fmp_local_analytics import FmpLocalAnalytics
+from fmp_py.fmp_statement_analysis import FmpStatementAnalysis
+
+
+def make_statements(symbol, periods, period="FY", freq="365D"):
+    dates = pd.date_range("2015-12-31", periods=periods, freq=freq)
+    base = np.arange(1, periods + 1, dtype="int64")
+    keys = {
+        "date": dates,
+        "symbol": symbol,
+        "calendar_year": dates.year,
+        "period": period,
+    }
+    income = pd.DataFrame(
+        {
+            **keys,
+            "revenue": base * 100,
+            "cost_of_revenue": base * 60,
+            "gross_profit": base * 40,
+            "gross_profit_ratio": 0.4,
+            "operating_income": base * 20,
+            "income_before_tax": base * 18,
+            "income_tax_expense": base * 3,
+            "net_income": base * 15,
+            "interest_expense": 2,
+            "eps": base * 1.5,
+            "epsdiluted": base * 1.4,
+            "weighted_average_shs_out": 10,
+            "weighted_average_shs_out_dil": 11,
+            "research_and_development_expenses": base * 5,
+            "selling_general_and_administrative_expenses": base * 7,
+        }
+    )
+    balance_sheet = pd.DataFrame(
+        {
+            **keys,
+            "total_current_assets": base * 50,
+            "total_current_liabilities": base * 25,
+            "cash_and_cash_equivalents": base * 10,
+            "cash_and_short_term_investments": base * 12,
+            "net_receivables": base * 8,
+            "inventory": base * 6,
+            "account_payables": base * 9,
+            "property_plant_equipment_net": base * 30,
+            "total_assets": base * 200,
+            "total_liabilities": base * 120,
+            "total_stockholders_equity": base * 80,
+            "long_term_debt": base * 40,
+            "total_debt": base * 50,
+        }
+    )
+    cashflow = pd.DataFrame(
+        {
+            **keys,
+            "net_income": base * 15,
+            "operating_cash_flow": base * 25,
+            "free_cash_flow": base * 20,
+            "dividends_paid": base * -4,
+        }
+    )
+    return income, balance_sheet, cashflow
+
+
+@pytest.fixture
+def statements():
+    frames = [make_statements(s, 12) for s in ["AAPL", "MSFT"]]
+    return [pd.concat(parts, ignore_index=True) for parts in zip(*frames)]
+
+
+def test_fmp_local_analytics_ratios(statements):
+    income, balance_sheet, cashflow = statements
+    analytics = FmpLocalAnalytics()
+    ratios = analytics.ratios(
+        income_df=income, balance_sheet_df=balance_sheet, cashflow_df=cashflow
+    )
+    assert len(ratios) == 24
+    assert list(ratios.columns[:4]) == ["symbol", "date", "calendar_year", "period"]
+    assert np.allclose(ratios["current_ratio"], 2.0)
+    assert np.allclose(ratios["gross_profit_margin"], 0.4)
+    assert np.allclose(ratios["return_on_equity"], 15 / 80)
+    assert np.allclose(ratios["days_of_sales_outstanding"], 8 / 100 * 365)
+    assert ratios["interest_coverage"].iloc[1] == 20.0
+
+
+def test_fmp_local_analytics_growth(statements):
+    income, balance_sheet, cashflow = statements
+    analytics = FmpLocalAnalytics()
+
+    growth = analytics.income_growth(income_df=income)
+    aapl = growth[growth["symbol"] == "AAPL"]["growth_revenue"].tolist()
+    assert aapl[0] == 0.0
+    assert aapl[1] == pytest.approx(1.0)
+    assert aapl[2] == pytest.approx(0.5)
+    # Growth never crosses from one symbol into the next.
+    assert growth[growth["symbol"] == "MSFT"]["growth_revenue"].iloc[0] == 0.0
+
+    assert "growth_total_assets" in analytics.balance_sheet_growth(
+        balance_sheet_df=balance_sheet
+    )
+    assert "growth_free_cash_flow" in analytics.cashflow_growth(cashflow_df=cashflow)
+
+    financial = analytics.financial_growth(
+        income_df=income, balance_sheet_df=balance_sheet, cashflow_df=cashflow
+    )
+    last = financial[financial["symbol"] == "AAPL"].iloc[-1]
+    assert last["revenue_growth"] == pytest.approx(12 / 11 - 1)
+    assert last["ten_y_revenue_growth_per_share"] == pytest.approx(12 / 2 - 1)
+    assert last["three_y_dividend_per_share_growth_per_share"] == pytest.approx(
+        12 / 9 - 1
+    )
+
+
+def test_fmp_local_analytics_ttm():
+    income, _, _ = make_statements("AAPL", 6, period="Q1", freq="91D")
+    ttm = FmpLocalAnalytics().ttm("income", data_df=income)
+    assert len(ttm) == 3
+    assert ttm["revenue"].tolist() == [1000, 1400, 1800]
+    assert ttm["weighted_average_shs_out"].tolist() == [10, 10, 10]
+    assert np.allclose(ttm["gross_profit_ratio"], 0.4)
+
+    gapped = income.drop(index=2)
+    assert FmpLocalAnalytics().ttm("income", data_df=gapped).empty
+
+
+def test_fmp_local_analytics_warehouse(statements, tmp_path):
+    warehouse = FmpFundamentalsWarehouse(
+        path=str(tmp_path / "fundamentals.db"), api_key="test"
+    )
+    income, balance_sheet, cashflow = statements
+    warehouse.store("income", income)
+    warehouse.store("balance_sheet", balance_sheet)
+    warehouse.store("cashflow", cashflow)
+
+    ratios = FmpLocalAnalytics(warehouse).ratios(["MSFT"])
+    assert ratios["symbol"].unique().tolist() == ["MSFT"]
+    assert np.allclose(ratios["current_ratio"], 2.0)
+    warehouse.close()
+
+
+def test_fmp_local_analytics_invalid():
+    analytics = FmpLocalAnalytics()
+    with pytest.raises(ValueError):
+        analytics.ratios(period="quarterly")
+    with pytest.raises(ValueError):
+        analytics.income_growth()
+    with pytest.raises(ValueError):
+        analytics.ttm("balance_sheet")
+
+
+@pytest.fixture(scope="module")
+def live_statements():
+    if not os.getenv("FMP_API_KEY"):
+        pytest.skip("requires FMP_API_KEY")
+    statements = FmpFinancialStatements()
+    return {
+        "income_df": statements.income_statements("AAPL", limit=5),
+        "balance_sheet_df": statements.balance_sheet_statements("AAPL", limit=5),
+        "cashflow_df": statements.cashflow_statements("AAPL", limit=5),
+    }
+
+
+@pytest.mark.parametrize(
+    "table, sources, columns",
+    [
+        (
+            "ratios",
+            ["income_df", "balance_sheet_df", "cashflow_df"],
+            [
+                "current_ratio",
+                "gross_profit_margin",
+                "net_profit_margin",
+                "return_on_equity",
+                "asset_turnover",
+                "debt_equity_ratio",
+                "cash_flow_to_debt_ratio",
+            ],
+        ),
+        ("income_growth", ["income_df"], ["growth_revenue", "growth_net_income"]),
+        (
+            "balance_sheet_growth",
+            ["balance_sheet_df"],
+            ["growth_total_assets", "growth_total_stockholders_equity"],
+        ),
+        (
+            "cashflow_growth",
+            ["cashflow_df"],
+            ["growth_operating_cash_flow", "growth_free_cash_flow"],
+        ),
+        (
+            "financial_growth",
+            ["income_df", "balance_sheet_df", "cashflow_df"],
+            [
+                "revenue_growth",
+                "net_income_growth",
+                "operating_cash_flow_growth",
+                "asset_growth",
+                "debt_growth",
+            ],
+        ),
+    ],
+)
+def test_fmp_local_analytics_parity(live_statements, table, sources, columns):
+    local = getattr(FmpLocalAnalytics(), table)(
+        **{source: live_statements[source] for source in sources}
+    ).set_index("date")
+    if table != "ratios":
+        # The first period has no previous one to grow from.
+        local = local.iloc[1:]
+    remote = getattr(FmpStatementAnalysis(), table)("AAPL", limit=5).set_index("date")
+    for column in columns:
+        assert np.allclose(
+            local[column], remote.loc[local.index, column], rtol=1e-3
+        ), column
+
+
+@pytest.mark.skipif(not os.getenv("FMP_API_KEY"), reason="requires FMP_API_KEY")
+def test_fmp_local_analytics_ttm_parity():
+    statements = FmpFinancialStatements()
+    income = statements.income_statements("AAPL", period="quarter", limit=4)
+
+    ttm = FmpLocalAnalytics().ttm("income", data_df=income).iloc[-1]
+    assert ttm["revenue"] == income["revenue"].sum()
+
+    remote = FmpStatementAnalysis().ratios_ttm("AAPL")
+    assert ttm["gross_profit_ratio"] == pytest.approx(
+        remote.gross_profit_margin_ttm, rel=1e-2
+    )
+    assert ttm["net_income_ratio"] == pytest.approx(
+        remote.net_profit_margin_ttm, rel=1e-2
+    )
@@ -0,0 +1,69 @@
+import json
+import time
+
+import pytest
+import requests
+
+from fmp_py.fmp_historical_data import FmpHistoricalData
+from fmp_py.fmp_local_server import FmpLocalServer
+
+
+def test_fmp_local_server_synthetic():
+    with FmpLocalServer(rows=50) as server:
+        daily = requests.get(f"{server.url}v3/historical-price-full/AAPL").json()
+        assert daily["symbol"] == "AAPL"
+        assert len(daily["historical"]) == 50
+        assert daily["historical"][0]["date"] > daily["historical"][-1]["date"]
+        assert (
+            daily == requests.get(f"{server.url}v3/historical-price-full/AAPL").json()
+        )
+
+        limited = requests.get(f"{server.url}v3/quotes/forex", params={"limit": 3})
+        assert len(limited.json()) == 3
+
+        server.register("v3/quote/", lambda endpoint, params, rows: [{"price": 1.5}])
+        assert requests.get(f"{server.url}v3/quote/AAPL").json() == [{"price": 1.5}]
+        assert server.requests == 4
+
+
+def test_fmp_local_server_fixtures(tmp_path):
+    path = tmp_path / "v3" / "quote" / "AAPL" / "index.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"status": 200, "body": [{"symbol": "AAPL"}]}))
+
+    with FmpLocalServer(fixtures=str(tmp_path)) as server:
+        response = requests.get(f"{server.url}v3/quote/AAPL?apikey=x")
+        assert response.json() == [{"symbol": "AAPL"}]
+
+
+def test_fmp_local_server_faults():
+    with FmpLocalServer(throttle_rate=1.0) as server:
+        response = requests.get(f"{server.url}v3/quote/AAPL")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+    with FmpLocalServer(error_rate=1.0) as server:
+        assert requests.get(f"{server.url}v3/quote/AAPL").status_code == 500
+
+    with FmpLocalServer(error_rate=0.5, seed=1) as server:
+        codes = [requests.get(f"{server.url}v3/x").status_code for _ in range(40)]
+        assert 0 < codes.count(500) < 40
+
+    with FmpLocalServer(latency=0.05) as server:
+        start = time.perf_counter()
+        requests.get(f"{server.url}v3/quote/AAPL")
+        assert time.perf_counter() - start >= 0.05
+
+
+def test_fmp_local_server_client(monkeypatch):
+    with FmpLocalServer(rows=30) as server:
+        monkeypatch.setenv("FMP_BASE_URL", server.url)
+        data_df = FmpHistoricalData(api_key="test").intraday_history(
+            "AAPL", "5min", "2024-06-01", "2024-06-28"
+        )
+        assert len(data_df) == 30
+        assert data_df.index.is_monotonic_increasing
+        assert server.requests == 1
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        requests.get(f"{server.url}v3/quote/AAPL", timeout=1)
@@ -88,3 +88,52 @@ def test_fmp_mergers_and_aquisitions_search_ma(fmp_mergers_and_aquisitions):
     assert isinstance(result["transaction_date"].iloc[0], pd.Timestamp)
     assert isinstance(result["acceptance_time"].iloc[0], pd.Timestamp)
     assert isinstance(result["url"].iloc[0], str)
+
+
+def make_ma_page(items):
+    return [
+        {
+            "companyName": f"Acquirer {i}",
+            "cik": "0000000001",
+            "symbol": "ACQ",
+            "targetedCompanyName": f"Target {i}",
+            "targetedCik": "0000000002",
+            "targetedSymbol": "TGT",
+            "transactionDate": "2024-07-01",
+            "acceptanceTime": accepted,
+            "url": f"https://www.sec.gov/{i}",
+        }
+        for i, accepted in items
+    ]
+
+
+def test_fmp_mergers_and_aquisitions_ma_rss_feed_bulk(mocker):
+    client = FmpMergersAndAquisitions(api_key="test")
+    feed = [
+        make_ma_page([(5, "2024-07-05 16:00:00"), (4, "2024-07-04 16:00:00")]),
+        make_ma_page([(4, "2024-07-04 16:00:00"), (3, "2024-07-03 16:00:00")]),
+        make_ma_page([(2, "2024-07-02 16:00:00")]),
+    ]
+
+    def get_request(url, params):
+        page = params["page"]
+        return feed[page] if page < len(feed) else []
+
+    mocker.patch.object(client, "get_request", side_effect=get_request)
+
+    result = client.ma_rss_feed_bulk()
+    assert result["targeted_company_name"].tolist() == [
+        f"Target {i}" for i in [5, 4, 3, 2]
+    ]
+    assert result["acceptance_time"].dtype == "datetime64[ns]"
+
+    result = client.ma_rss_feed_bulk(cutoff="2024-07-03 12:00:00")
+    assert len(result) == 3
+
+    seen = set()
+    client.ma_rss_feed_bulk(seen=seen, max_pages=1)
+    assert client.ma_rss_feed_bulk(seen=seen).empty
+
+    feed[0] = make_ma_page([(6, "2024-07-06 16:00:00")]) + feed[0]
+    pages = list(client.ma_rss_feed_pages(seen=seen))
+    assert [page["targeted_company_name"].tolist() for page in pages] == [["Target 6"]]
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_output import build_output, check_output
+
+COLUMNS = {"date": "date", "symbol": "symbol", "netIncome": "net_income", "eps": "eps"}
+TYPES = {"date": "datetime64[ns]", "symbol": "str", "net_income": "int", "eps": "float"}
+RECORDS = [
+    {"date": "2023-09-30", "symbol": "AAPL", "netIncome": 96995000000, "eps": 6.16},
+    {"date": "2022-09-24", "symbol": "AAPL", "netIncome": 99803000000.0, "eps": None},
+    {"date": "2021-09-25", "symbol": "AAPL", "netIncome": 94680000000, "extra": 1},
+]
+
+
+def pandas_frame():
+    return (
+        pd.DataFrame(RECORDS)
+        .rename(columns=COLUMNS)
+        .astype(TYPES)
+        .sort_values(by="date")
+        .reset_index(drop=True)
+    )
+
+
+def test_fmp_output_check_output():
+    assert check_output("numpy") == "numpy"
+    with pytest.raises(ValueError):
+        check_output("excel")
+    with pytest.raises(ValueError):
+        build_output(RECORDS, COLUMNS, TYPES, "pandas")
+
+
+def test_fmp_output_numpy():
+    data = build_output(RECORDS, COLUMNS, TYPES, "numpy", sort_by="date")
+    expected = pandas_frame()
+
+    assert list(data) == list(expected.columns)
+    assert data["date"].dtype == np.dtype("datetime64[ns]")
+    assert data["net_income"].dtype == np.int64
+    np.testing.assert_array_equal(data["date"], expected["date"].to_numpy())
+    np.testing.assert_array_equal(data["net_income"], expected["net_income"])
+    np.testing.assert_array_equal(data["eps"], expected["eps"])
+    np.testing.assert_array_equal(data["extra"], [1, None, None])
+
+
+def test_fmp_output_numpy_bad_dtype():
+    with pytest.raises(ValueError):
+        build_output(RECORDS, COLUMNS, {"date": "period[D]"}, "numpy")
+
+
+def test_fmp_output_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = build_output(RECORDS, COLUMNS, TYPES, "arrow", sort_by="date")
+
+    assert table.column_names == list(pandas_frame().columns)
+    assert table.schema.field("date").type == pa.timestamp("ns")
+    assert table.schema.field("net_income").type == pa.int64()
+    assert table["eps"].null_count == 2
+    assert table["net_income"].to_pylist() == [94680000000, 99803000000, 96995000000]
+
+
+def test_fmp_output_polars():
+    pl = pytest.importorskip("polars")
+    data_df = build_output(RECORDS, COLUMNS, TYPES, "polars", sort_by="date")
+
+    assert data_df.columns == list(pandas_frame().columns)
+    assert data_df["date"].dtype == pl.Datetime("ns")
+    assert data_df["net_income"].dtype == pl.Int64
+    assert data_df["net_income"].to_list() == [94680000000, 99803000000, 96995000000]
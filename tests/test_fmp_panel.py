@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_fundamentals_warehouse import FmpFundamentalsWarehouse
+from fmp_py.fmp_panel import FmpPanel, FmpPanelBuilder
+
+
+def make_cashflow(symbol, quarters, offset=0.0):
+    rows = []
+    for i, (year, period) in enumerate(quarters):
+        rows.append(
+            {
+                "date": pd.Timestamp(f"{year}-{3 * int(period[1]):02d}-28"),
+                "symbol": symbol,
+                "calendar_year": year,
+                "period": period,
+                "free_cash_flow": offset + i,
+                "operating_cash_flow": offset + 10 * i,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def frame():
+    return pd.concat(
+        [
+            make_cashflow("MSFT", [(2023, "Q3"), (2023, "Q4"), (2024, "Q1")], 100),
+            make_cashflow("AAPL", [(2023, "Q4"), (2024, "Q1")]),
+        ],
+        ignore_index=True,
+    )
+
+
+def test_fmp_panel_from_frame(frame):
+    builder = FmpPanelBuilder(api_key="test")
+    panel = builder.from_frame(frame, ["free_cash_flow", "operating_cash_flow"])
+
+    assert isinstance(panel, FmpPanel)
+    assert panel.values.shape == (2, 3, 2)
+    assert panel.values.dtype == np.float64
+    assert panel.values.flags["C_CONTIGUOUS"]
+    assert panel.symbols.tolist() == ["AAPL", "MSFT"]
+    assert panel.periods.tolist() == ["2023Q3", "2023Q4", "2024Q1"]
+
+    fcf = panel.field("free_cash_flow")
+    assert np.isnan(fcf.loc["AAPL", "2023Q3"])
+    assert fcf.loc["AAPL", "2024Q1"] == 1.0
+    assert fcf.loc["MSFT", "2023Q3"] == 100.0
+    assert np.shares_memory(fcf.to_numpy(), panel.values)
+
+    long = panel.to_frame()
+    assert long.loc[("MSFT", "2024Q1"), "operating_cash_flow"] == 120.0
+
+
+def test_fmp_panel_restatement_keeps_latest(frame):
+    restated = frame.iloc[[0]].copy()
+    restated["date"] = restated["date"] + pd.Timedelta(days=60)
+    restated["free_cash_flow"] = -1.0
+    panel = FmpPanelBuilder(api_key="test").from_frame(
+        pd.concat([restated, frame]), ["free_cash_flow"]
+    )
+    assert panel.field("free_cash_flow").loc["MSFT", "2023Q3"] == -1.0
+
+
+def test_fmp_panel_warehouse(frame, tmp_path):
+    warehouse = FmpFundamentalsWarehouse(
+        path=str(tmp_path / "fundamentals.db"), api_key="test"
+    )
+    warehouse.store("cashflow", frame)
+    panel = FmpPanelBuilder(warehouse, api_key="test").build(["free_cash_flow"])
+    assert panel.fields == ["free_cash_flow"]
+    assert panel.values.shape == (2, 3, 1)
+    warehouse.close()
+
+
+def test_fmp_panel_fetch(frame, mocker):
+    builder = FmpPanelBuilder(api_key="test")
+
+    def key_metrics(symbol, period="annual", limit=20):
+        data_df = frame[frame["symbol"] == symbol].copy()
+        data_df["pe_ratio"] = 20.0
+        return data_df
+
+    mocker.patch.object(builder.analysis_client, "key_metrics", side_effect=key_metrics)
+    panel = builder.build(["pe_ratio"], ["AAPL", "MSFT"], kind="key_metrics")
+    assert np.nansum(panel.values) == 100.0
+
+
+def test_fmp_panel_invalid(frame):
+    builder = FmpPanelBuilder(api_key="test")
+    with pytest.raises(ValueError):
+        builder.build(["free_cash_flow"], kind="invalid")
+    with pytest.raises(ValueError):
+        builder.build(["free_cash_flow"])
+    with pytest.raises(ValueError):
+        builder.from_frame(frame, ["invalid"])
+    with pytest.raises(ValueError):
+        builder.from_frame(frame, ["free_cash_flow"]).field("invalid")
@@ -0,0 +1,163 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_quote_book import FmpQuoteBook
+from fmp_py.models.quote import BookQuote
+
+
+@pytest.fixture
+def book():
+    return FmpQuoteBook(symbols=["AAPL", "MSFT"], capacity=2, api_key="test")
+
+
+def test_fmp_quote_book_init(book):
+    assert isinstance(book, FmpQuoteBook)
+    assert book.symbols == ["AAPL", "MSFT"]
+    assert len(book) == 2
+    assert "AAPL" in book
+
+
+def test_fmp_quote_book_update_and_get(book):
+    book.update(
+        ["MSFT", "AAPL"],
+        price=[410.5, 190.25],
+        bid=[410.4, 190.2],
+        ask=[410.6, 190.3],
+        volume=[1000, 2000],
+        timestamp=pd.to_datetime([1721419200000, 1721419200000], unit="ms"),
+    )
+    quote = book.get("AAPL")
+    assert isinstance(quote, BookQuote)
+    assert quote.price == 190.25
+    assert quote.bid == 190.2
+    assert quote.ask == 190.3
+    assert quote.volume == 2000.0
+    assert quote.timestamp == "2024-07-19 20:00:00"
+    assert quote.age < 5
+    assert book.price("MSFT") == 410.5
+
+
+def test_fmp_quote_book_unknown_symbol(book):
+    with pytest.raises(ValueError):
+        book.get("INVALID")
+    with pytest.raises(ValueError):
+        book.price("INVALID")
+
+
+def test_fmp_quote_book_grows(book):
+    book.update(["TSLA", "NVDA", "AMZN"], price=[1.0, 2.0, 3.0])
+    assert len(book) == 5
+    assert book.price("AMZN") == 3.0
+    assert np.isnan(book.price("AAPL"))
+
+
+def test_fmp_quote_book_partial_update_keeps_columns(book):
+    book.update(["AAPL"], price=[1.0], bid=[0.9])
+    book.update(["AAPL"], price=[2.0])
+    quote = book.get("AAPL")
+    assert quote.price == 2.0
+    assert quote.bid == 0.9
+
+
+def test_fmp_quote_book_snapshot_is_view(book):
+    book.update(["AAPL", "MSFT"], price=[1.0, 2.0])
+    df = book.snapshot()
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.index) == ["AAPL", "MSFT"]
+    assert list(df.columns) == [
+        "price",
+        "bid",
+        "ask",
+        "volume",
+        "timestamp",
+        "received",
+    ]
+    assert isinstance(df["timestamp"].iloc[0], pd.Timestamp)
+    assert np.shares_memory(df["price"].to_numpy(), book._columns["price"])
+
+    frozen = book.snapshot(copy=True)
+    book.update(["AAPL"], price=[5.0])
+    assert df.loc["AAPL", "price"] == 5.0
+    assert frozen.loc["AAPL", "price"] == 1.0
+
+
+def test_fmp_quote_book_stale(book):
+    assert book.stale() == ["AAPL", "MSFT"]
+    book.update(["AAPL"], price=[1.0])
+    assert book.stale() == ["MSFT"]
+    assert book.stale(max_age=-1) == ["AAPL", "MSFT"]
+    ages = book.age()
+    assert ages["AAPL"] < 5
+    assert np.isnan(ages["MSFT"])
+
+
+def test_fmp_quote_book_refresh(book, mocker):
+    response = [
+        {
+            "symbol": "AAPL",
+            "lastSalePrice": 190.25,
+            "bidPrice": 190.2,
+            "askPrice": 190.3,
+            "volume": 2000,
+            "lastUpdated": 1721419200000,
+        },
+        {
+            "symbol": "MSFT",
+            "lastSalePrice": 410.5,
+            "bidPrice": 410.4,
+            "askPrice": 410.6,
+            "volume": 1000,
+            "lastUpdated": 1721419200000,
+        },
+    ]
+    get_request = mocker.patch.object(book, "get_request", return_value=response)
+    book.batch_size = 1
+    assert book.refresh() == 4
+    assert get_request.call_count == 2
+    assert get_request.call_args_list[0].args[0] == "v3/stock/full/real-time-price/AAPL"
+    assert book.price("MSFT") == 410.5
+    assert book.get("AAPL").timestamp == "2024-07-19 20:00:00"
+
+
+def test_fmp_quote_book_polling_errors(book, mocker):
+    failed = threading.Event()
+
+    def refresh():
+        failed.set()
+        raise ValueError("boom")
+
+    mocker.patch.object(book, "refresh", side_effect=refresh)
+    book.start_polling(interval=0.01)
+    assert failed.wait(5)
+    book.stop_polling()
+    assert book.poll_errors >= 1
+    assert book.last_error == "ValueError('boom')"
+
+
+def test_fmp_quote_book_concurrent_reads(book):
+    stop = threading.Event()
+
+    def writer():
+        i = 0.0
+        while not stop.is_set():
+            i += 1.0
+            book.update(["AAPL"], price=[i], bid=[i], ask=[i])
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            quote = book.get("AAPL")
+            if not np.isnan(quote.price):
+                assert quote.price == quote.bid == quote.ask
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_fmp_quote_book_invalid_symbols(book):
+    with pytest.raises(ValueError):
+        book.add_symbols("AAPL")
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_crypto import FmpCrypto
+from fmp_py.fmp_forex import FmpForex
+from fmp_py.fmp_quote_snapshot import FmpQuoteSnapshot
+
+
+def make_quotes(symbols, price=1.0):
+    return [
+        {
+            "symbol": symbol,
+            "name": symbol,
+            "price": price + i,
+            "changesPercentage": 0.1,
+            "change": 0.1,
+            "dayLow": 1.0,
+            "dayHigh": 2.0,
+            "yearHigh": 3.0,
+            "yearLow": 0.5,
+            "marketCap": 0,
+            "priceAvg50": 1.0,
+            "priceAvg200": 1.0,
+            "exhange": "FOREX",
+            "volume": 10,
+            "avgVolume": 10,
+            "open": 1.0,
+            "previousClose": 1.0,
+            "eps": None,
+            "pe": None,
+            "earningsAnnouncement": None,
+            "sharesOutstanding": None,
+            "timestamp": 1700000000,
+        }
+        for i, symbol in enumerate(symbols)
+    ]
+
+
+def test_fmp_quote_snapshot_lookup():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return pd.DataFrame({"symbol": ["BTCUSD", "ETHUSD"], "price": [1.0, 2.0]})
+
+    snapshot = FmpQuoteSnapshot(fetch, ttl=60)
+    result = snapshot.lookup(["eth/usd", "XYZ", "BTCUSD"])
+    assert result["symbol"].tolist() == ["ETHUSD", "BTCUSD"]
+    assert result.index.tolist() == [0, 1]
+    assert snapshot.fresh()
+
+    snapshot.get()
+    assert len(calls) == 1
+    snapshot.get(refresh=True)
+    assert len(calls) == 2
+
+    snapshot.ttl = 0
+    assert not snapshot.fresh()
+    snapshot.lookup(["BTCUSD"])
+    assert len(calls) == 3
+
+
+def test_fmp_quote_snapshot_single_flight():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return pd.DataFrame({"symbol": ["BTCUSD"], "price": [1.0]})
+
+    snapshot = FmpQuoteSnapshot(fetch, ttl=60)
+    threads = [
+        threading.Thread(target=snapshot.lookup, args=(["BTCUSD"],)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("client_class", [FmpForex, FmpCrypto])
+def test_fmp_quote_snapshot_clients(mocker, client_class):
+    name = "forex" if client_class is FmpForex else "crypto"
+    client = client_class(api_key="test", quote_ttl=60)
+    mocked = mocker.patch.object(
+        client, "get_request", return_value=make_quotes(["EURUSD", "GBPUSD"])
+    )
+
+    quote_list = getattr(client, f"full_{name}_quote_list")()
+    assert quote_list["timestamp"].iloc[0] == pd.Timestamp("2023-11-14 22:13:20")
+    assert mocked.call_args.args[0].startswith("v3/quotes/")
+
+    single = getattr(client, f"full_{name}_quote")("GBP/USD")
+    assert single.columns.tolist() == quote_list.columns.tolist()
+    assert single["price"].iloc[0] == 2.0
+
+    bulk = getattr(client, f"full_{name}_quotes")(["GBPUSD", "EURUSD"])
+    assert bulk["symbol"].tolist() == ["GBPUSD", "EURUSD"]
+    assert mocked.call_count == 1
+
+    mocked.return_value = make_quotes(["USDJPY"], price=150.0)
+    single = getattr(client, f"full_{name}_quote")("USDJPY")
+    assert single["price"].iloc[0] == 150.0
+    assert mocked.call_args.args[0] == "v3/quote/USDJPY"
+
+    with pytest.raises(ValueError):
+        getattr(client, f"full_{name}_quotes")(["XYZ"])
+
+
+def test_fmp_quote_snapshot_disabled(mocker):
+    client = FmpForex(api_key="test")
+    mocked = mocker.patch.object(
+        client, "get_request", return_value=make_quotes(["EURUSD"])
+    )
+    client.full_forex_quote_list()
+    client.full_forex_quote("EURUSD")
+    client.full_forex_quote_list()
+    assert mocked.call_count == 3
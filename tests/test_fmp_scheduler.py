@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from fmp_py.fmp_scheduler import FmpScheduler
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_fmp_scheduler_add(clock):
+    scheduler = FmpScheduler(clock=clock)
+    job = scheduler.add("quotes", lambda: 1, interval=5)
+    assert job.deadline == 10
+
+    with pytest.raises(ValueError):
+        scheduler.add("quotes", lambda: 1, interval=5)
+    with pytest.raises(ValueError):
+        scheduler.add("calendar", lambda: 1, interval=0)
+
+
+def test_fmp_scheduler_priority_and_budget(clock):
+    calls = []
+    scheduler = FmpScheduler(max_workers=4, calls_per_minute=60, clock=clock)
+    scheduler.add("fundamentals", lambda: calls.append("f"), interval=86400, cost=3)
+    scheduler.add("quotes", lambda: calls.append("q"), interval=5, priority=10)
+    scheduler.add("calendar", lambda: calls.append("c"), interval=3600, priority=5)
+
+    assert scheduler.dispatch() == ["quotes", "calendar"]
+    assert calls == ["q", "c"]
+
+    clock.now = 0.5
+    assert scheduler.dispatch() == []
+
+    clock.now = 1.0
+    assert scheduler.dispatch() == ["fundamentals"]
+
+    clock.now = 5.0
+    assert scheduler.dispatch() == ["quotes"]
+    assert calls == ["q", "c", "f", "q"]
+
+    metrics = scheduler.metrics().set_index("job")
+    assert list(metrics.index) == ["quotes", "calendar", "fundamentals"]
+    assert metrics.loc["quotes", "runs"] == 2
+    assert metrics.loc["fundamentals", "last_lag"] == 1.0
+    assert not metrics.loc["quotes", "stale"]
+
+
+def test_fmp_scheduler_generator_steps(clock):
+    calls = []
+
+    def fundamentals():
+        for symbol in ["AAPL", "MSFT", "NVDA"]:
+            calls.append(symbol)
+            yield symbol.lower()
+
+    scheduler = FmpScheduler(max_workers=1, clock=clock)
+    scheduler.add("fundamentals", fundamentals, interval=100)
+    scheduler.add("ratios", lambda: (s for s in "ab"), interval=100, priority=-1)
+    scheduler.add("quotes", lambda: calls.append("q"), interval=1, priority=1)
+
+    scheduler.dispatch()
+    clock.now = 1.0
+    scheduler.dispatch()
+    clock.now = 1.5
+    scheduler.dispatch()
+    scheduler.dispatch()
+
+    assert calls == ["q", "AAPL", "q", "MSFT", "NVDA"]
+    assert scheduler.result("fundamentals") == ["aapl", "msft", "nvda"]
+    scheduler.dispatch()
+    scheduler.dispatch()
+    scheduler.dispatch()
+    assert scheduler.result("ratios") == ["a", "b"]
+    assert scheduler.jobs["fundamentals"].due == 100.0
+
+
+def test_fmp_scheduler_errors_and_staleness(clock):
+    def fail():
+        raise ConnectionError("reset")
+
+    scheduler = FmpScheduler(clock=clock)
+    scheduler.add("calendar", fail, interval=10, deadline=15)
+    scheduler.dispatch()
+    clock.now = 20.0
+
+    metrics = scheduler.metrics().iloc[0]
+    assert metrics["errors"] == 1
+    assert metrics["stale"]
+    assert "reset" in metrics["last_error"]
+
+
+def test_fmp_scheduler_threads():
+    quotes = threading.Event()
+    with FmpScheduler(max_workers=2) as scheduler:
+        scheduler.add("quotes", quotes.set, interval=0.05, priority=1)
+        scheduler.add("fundamentals", lambda: time.sleep(0.2), interval=10)
+        assert quotes.wait(1.0)
+        time.sleep(0.15)
+
+    metrics = scheduler.metrics().set_index("job")
+    assert metrics.loc["quotes", "runs"] >= 2
+    assert metrics.loc["fundamentals", "runs"] == 1
+
+
+def test_fmp_scheduler_wait(clock):
+    scheduler = FmpScheduler(max_workers=1, calls_per_minute=120, clock=clock)
+    scheduler.add("quotes", lambda: None, interval=5, priority=10, cost=3)
+    scheduler.add("calendar", lambda: None, interval=30)
+
+    # Waiting on budget: 1 call short of the top job's cost at 2 calls per second.
+    scheduler._tokens = 2.0
+    assert scheduler._wait(clock.now) == pytest.approx(0.5)
+
+    # Waiting on a worker: only the next due time counts.
+    scheduler._tokens = 3.0
+    scheduler._busy = 1
+    assert scheduler._wait(clock.now) == 1.0
+    scheduler.jobs["calendar"].due = 0.25
+    clock.now = 0.1
+    assert scheduler._wait(clock.now) == pytest.approx(0.15)
+
+
+def test_fmp_scheduler_blocked_job_sleeps():
+    passes = []
+    scheduler = FmpScheduler(max_workers=1, reserved_workers=0)
+    dispatch = scheduler._dispatch
+    scheduler._dispatch = lambda now: passes.append(now) or dispatch(now)
+    with scheduler:
+        scheduler.add("fundamentals", lambda: time.sleep(0.3), interval=10)
+        scheduler.add("calendar", lambda: None, interval=10)
+        time.sleep(0.2)
+        assert len(passes) < 10
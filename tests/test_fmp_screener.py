@@ -0,0 +1,159 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_screener import FmpScreener
+
+
+def make_universe(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "symbol": [f"S{i:05d}" for i in range(n)],
+            "company_name": [f"Company {i}" for i in range(n)],
+            "market_cap": rng.integers(1_000_000, 3_000_000_000_000, n),
+            "sector": rng.choice(["Technology", "Energy", "Utilities"], n),
+            "industry": rng.choice(["Software", "Oil & Gas", "Semiconductors"], n),
+            "beta": rng.normal(1.0, 0.5, n),
+            "price": rng.uniform(1, 500, n),
+            "last_annual_dividend": rng.uniform(0, 5, n),
+            "volume": rng.integers(0, 50_000_000, n),
+            "exchange": "Nasdaq",
+            "exchange_short_name": rng.choice(["NASDAQ", "NYSE", "AMEX"], n),
+            "country": "US",
+            "is_etf": rng.random(n) < 0.1,
+            "is_fund": False,
+            "is_actively_trading": rng.random(n) < 0.95,
+        }
+    )
+
+
+@pytest.fixture
+def universe():
+    return make_universe(5000)
+
+
+@pytest.fixture
+def screener(universe):
+    screener = FmpScreener(ttl=None, api_key="test")
+    screener.load(universe)
+    return screener
+
+
+def expected(universe, query):
+    mask = pd.Series(True, index=universe.index)
+    for column, (low, high) in query.items():
+        if low is not None:
+            mask &= universe[column] > low
+        if high is not None:
+            mask &= universe[column] < high
+    return mask
+
+
+@pytest.mark.parametrize(
+    "kwargs, query",
+    [
+        (
+            {"market_cap_more_than": 10**11, "price_lower_than": 100},
+            {"market_cap": (10**11, None), "price": (None, 100)},
+        ),
+        (
+            {"beta_more_than": 0.5, "beta_lower_than": 1.5, "volume_more_than": 10**7},
+            {"beta": (0.5, 1.5), "volume": (10**7, None)},
+        ),
+        (
+            {"dividend_more_than": 4.5},
+            {"last_annual_dividend": (4.5, None)},
+        ),
+    ],
+)
+def test_fmp_screener_numeric(screener, universe, kwargs, query):
+    result = screener.screen(**kwargs)
+    symbols = universe.loc[expected(universe, query), "symbol"]
+    assert sorted(result["symbol"]) == sorted(symbols)
+    assert result["market_cap"].is_monotonic_decreasing
+
+
+def test_fmp_screener_categorical(screener, universe):
+    result = screener.screen(
+        sector="technology",
+        exchange="NYSE",
+        is_etf=False,
+        is_actively_trading=True,
+        price_more_than=250,
+    )
+    mask = (
+        (universe["sector"] == "Technology")
+        & (universe["exchange_short_name"] == "NYSE")
+        & ~universe["is_etf"]
+        & universe["is_actively_trading"]
+        & (universe["price"] > 250)
+    )
+    assert sorted(result["symbol"]) == sorted(universe.loc[mask, "symbol"])
+
+    assert screener.screen(sector="Unknown").empty
+    assert len(screener.screen(industry="Software", limit=10)) == 10
+    assert len(screener.screen()) == len(universe)
+
+    projected = screener.screen(sector="Energy", columns=["symbol", "price"])
+    assert projected.columns.tolist() == ["symbol", "price"]
+    assert projected.equals(screener.screen(sector="Energy")[["symbol", "price"]])
+
+
+def test_fmp_screener_snapshot(mocker):
+    screener = FmpScreener(ttl=0, api_key="test")
+    universe = make_universe(100)
+
+    def stock_screener(exchange=None, limit=None):
+        data_df = universe[universe["exchange_short_name"] == exchange]
+        if data_df.empty:
+            raise KeyError("symbol")
+        return data_df
+
+    mocked = mocker.patch.object(
+        screener.company_client, "stock_screener", side_effect=stock_screener
+    )
+    snapshot = screener.snapshot(["NASDAQ", "NYSE", "AMEX", "LSE"])
+    assert len(snapshot) == 100
+    assert mocked.call_count == 4
+
+    screener.screen(price_more_than=10)
+    assert mocked.call_count == 4 + 72
+
+    with pytest.raises(ValueError):
+        screener.snapshot(["LSE"])
+
+
+def test_fmp_screener_single_refresh(mocker, universe):
+    screener = FmpScreener(ttl=60, api_key="test")
+    screener.load(universe)
+    screener.index["taken_at"] -= 120
+    started = threading.Event()
+    release = threading.Event()
+
+    def snapshot(exchanges=None):
+        started.set()
+        release.wait(5)
+        screener.load(universe)
+        return screener.index["frame"]
+
+    mocked = mocker.patch.object(screener, "snapshot", side_effect=snapshot)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        first = executor.submit(screener.screen, sector="Energy")
+        started.wait(5)
+        others = [executor.submit(screener.screen, sector="Energy") for _ in range(7)]
+        release.set()
+        results = [first.result()] + [f.result() for f in others]
+
+    assert mocked.call_count == 1
+    assert all(r.equals(results[0]) for r in results)
+    screener.screen(sector="Energy")
+    assert mocked.call_count == 1
+
+
+def test_fmp_screener_invalid_frame(screener):
+    with pytest.raises(ValueError):
+        screener.load(pd.DataFrame({"symbol": ["AAPL"]}))
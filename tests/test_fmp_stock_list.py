@@ -165,3 +165,22 @@ def test_fmp_stock_list_stock_list(fmp_stock_list):
 def test_fmp_stock_list_stock_list_no_data(fmp_stock_list):
     with pytest.raises(ValueError):
         fmp_stock_list.stock_list() == []
+
+
+def test_fmp_stock_list_stock_list_output(mocker):
+    offline = FmpStockList(api_key="test")
+    response = [
+        {"symbol": "MSFT", "name": "Microsoft", "price": 420.5, "exchange": "NASDAQ"},
+        {
+            "symbol": "AAPL",
+            "name": "Apple",
+            "price": 214,
+            "exchangeShortName": "NASDAQ",
+        },
+    ]
+    mocker.patch.object(offline, "get_request", return_value=response)
+
+    data = offline.stock_list(output="numpy")
+    assert list(data["symbol"]) == ["AAPL", "MSFT"]
+    assert data["price"].dtype == np.float64
+    assert list(data["exchange_short_name"]) == ["NASDAQ", ""]
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_company_search import AVAILABLE_EXCHANGES, FmpCompanySearch
+from fmp_py.fmp_symbol_index import FmpSymbolIndex
+
+
+@pytest.fixture
+def stock_df():
+    return pd.DataFrame(
+        {
+            "symbol": ["AAPL", "AAP", "MSFT", "AMZN", "AAPL.NE", "BRK-B"],
+            "name": [
+                "Apple Inc.",
+                "Advance Auto Parts, Inc.",
+                "Microsoft Corporation",
+                "Amazon.com, Inc.",
+                "Apple Inc.",
+                "Berkshire Hathaway Inc.",
+            ],
+            "exchange_short_name": [
+                "NASDAQ",
+                "NYSE",
+                "NASDAQ",
+                "NASDAQ",
+                "NEO",
+                "NYSE",
+            ],
+            "type": "stock",
+            "price": 1.0,
+        }
+    )
+
+
+@pytest.fixture
+def cik_df():
+    return pd.DataFrame(
+        {
+            "cik": ["0000320193", "0000789019", "0001018724"],
+            "name": ["APPLE INC", "MICROSOFT CORP", "AMAZON COM INC"],
+        }
+    )
+
+
+@pytest.fixture
+def identifiers_df():
+    return pd.DataFrame(
+        {
+            "symbol": ["aapl", "MSFT"],
+            "cusip": ["037833100", "594918104"],
+            "isin": ["US0378331005", "US5949181045"],
+        }
+    )
+
+
+@pytest.fixture
+def index(stock_df, cik_df, identifiers_df):
+    return FmpSymbolIndex().from_frames(stock_df, cik_df, identifiers_df)
+
+
+def test_fmp_symbol_index_ticker_search(index):
+    result = index.ticker_search("aap")
+    assert result["symbol"].tolist() == ["AAP", "AAPL", "AAPL.NE"]
+    assert index.ticker_search("AAP", exchange="NASDAQ")["symbol"].tolist() == ["AAPL"]
+    assert len(index.ticker_search("A", limit=2)) == 2
+
+    with pytest.raises(ValueError):
+        index.ticker_search("ZZZ")
+
+
+def test_fmp_symbol_index_name_search(index):
+    result = index.name_search("Microsft Corp")
+    assert result["symbol"].iloc[0] == "MSFT"
+    assert result["score"].is_monotonic_decreasing
+
+    result = index.name_search("apple", exchange="NASDAQ")
+    assert result["symbol"].tolist() == ["AAPL"]
+
+    with pytest.raises(ValueError):
+        index.name_search("qqqqqq")
+
+
+def test_fmp_symbol_index_identifiers(index):
+    assert index.cik_search("320193")["symbol"].tolist() == ["AAPL", "AAPL.NE"]
+    assert index.cusip_search("594918104")["symbol"].tolist() == ["MSFT"]
+    assert index.isin_search("us0378331005")["symbol"].tolist() == ["AAPL"]
+
+    with pytest.raises(ValueError):
+        index.cusip_search("000000000")
+
+    resolved = index.resolve(["0001018724", "789019", "1"], by="cik")
+    assert resolved.tolist() == ["AMZN", "MSFT", None]
+    assert index.resolve(["brk-b", "XYZ"], by="symbol").tolist() == ["BRK-B", None]
+
+    with pytest.raises(ValueError):
+        index.resolve(["AAPL"], by="invalid")
+
+
+def test_fmp_symbol_index_memory_mapped(stock_df, cik_df, identifiers_df, tmp_path):
+    path = str(tmp_path / "symbols")
+    FmpSymbolIndex(path).from_frames(stock_df, cik_df, identifiers_df)
+
+    loaded = FmpSymbolIndex(path)
+    assert isinstance(loaded.arrays["symbol"], np.memmap)
+    assert loaded.ticker_search("MS")["symbol"].tolist() == ["MSFT"]
+    assert loaded.name_search("amazon")["symbol"].iloc[0] == "AMZN"
+    assert loaded.resolve(["US5949181045"], by="isin").tolist() == ["MSFT"]
+
+
+def test_fmp_symbol_index_empty():
+    with pytest.raises(ValueError):
+        FmpSymbolIndex().ticker_search("A")
+
+
+def test_fmp_company_search_exchanges_constant():
+    assert FmpCompanySearch._available_exchanges() == list(AVAILABLE_EXCHANGES)
+    assert len(AVAILABLE_EXCHANGES) == 72
@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from fmp_py.fmp_symbol_resolver import FmpSymbolResolver
+
+
+@pytest.fixture
+def resolver():
+    changes_df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2022-06-09", "2021-01-01", "2023-01-05", "2016-04-11", "2022-03-01"]
+            ),
+            "name": ["Meta", "Alpha", "Other", "Alpha", "Beta"],
+            "old_symbol": ["FB", "ABC", "XYZ", "ABC0", "BBB"],
+            "new_symbol": ["META", "ABD", "FB", "ABC", "BBB"],
+        }
+    )
+    return FmpSymbolResolver().from_frame(changes_df)
+
+
+def test_fmp_symbol_resolver_resolve(resolver):
+    assert resolver.resolve("META") == "META"
+    assert resolver.resolve("META", as_of="2021-01-01") == "FB"
+    assert resolver.resolve("FB", known_at="2020-01-01") == "META"
+    assert resolver.resolve("FB") == "FB"
+    assert resolver.resolve("FB", as_of="2022-01-01") == "XYZ"
+
+    assert resolver.resolve("ABC0") == "ABD"
+    assert resolver.resolve("ABD", as_of="2018-06-30") == "ABC"
+    assert resolver.resolve("ABD", as_of="2010-01-01") == "ABC0"
+
+    assert resolver.resolve("MSFT") == "MSFT"
+    assert resolver.resolve("BBB") == "BBB"
+    assert resolver.resolve("META", known_at="2020-01-01") == "META"
+
+
+def test_fmp_symbol_resolver_aliases(resolver):
+    assert resolver.aliases("ABD") == ["ABC0", "ABC", "ABD"]
+    assert resolver.aliases("META") == ["FB", "META"]
+    assert resolver.aliases("FB") == ["XYZ", "FB"]
+    assert resolver.aliases("MSFT") == ["MSFT"]
+
+
+def test_fmp_symbol_resolver_alias_periods(resolver):
+    assert resolver.alias_periods("META") == [
+        ("FB", None, "2023-01-05"),
+        ("META", None, None),
+    ]
+    assert resolver.alias_periods("FB") == [
+        ("XYZ", None, None),
+        ("FB", "2023-01-05", None),
+    ]
+    assert resolver.alias_periods("MSFT") == [("MSFT", None, None)]
+
+
+def test_fmp_symbol_resolver_build(mocker):
+    changes_df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2022-06-09"]),
+            "name": ["Meta"],
+            "old_symbol": ["FB"],
+            "new_symbol": ["META"],
+        }
+    )
+    mocker.patch(
+        "fmp_py.fmp_symbol_resolver.FmpStockList.symbol_changes",
+        return_value=changes_df,
+    )
+    resolver = FmpSymbolResolver().build(api_key="test")
+    assert resolver.resolve("FB") == "META"
+
+
+def test_fmp_symbol_resolver_invalid():
+    with pytest.raises(ValueError):
+        FmpSymbolResolver().from_frame(pd.DataFrame({"date": []}))
@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+from fmp_py.fmp_forex import FmpForex
+from fmp_py.fmp_local_server import FmpLocalServer
+from fmp_py.fmp_transport import FmpRecordReplayAdapter, fixture_key, fixture_path
+
+
+@pytest.fixture
+def server():
+    with FmpLocalServer(rows=5) as server:
+        yield server
+
+
+def test_fmp_transport_fixture_key():
+    url = "https://financialmodelingprep.com/api/v3/quote/AAPL?apikey=secret"
+    assert fixture_key(url) == ("v3/quote/AAPL", "index")
+
+    endpoint, digest = fixture_key("http://x/api/v4/feed?page=1&limit=5&apikey=a")
+    assert endpoint == "v4/feed"
+    assert digest == fixture_key("http://y/api/v4/feed?limit=5&page=1&apikey=b")[1]
+    assert digest != fixture_key("http://y/api/v4/feed?limit=5&page=2")[1]
+
+    assert fixture_path("root", url) == os.path.join(
+        "root", "v3", "quote", "AAPL", "index.json"
+    )
+
+
+def test_fmp_transport_record_replay(monkeypatch, server, tmp_path):
+    monkeypatch.setenv("FMP_BASE_URL", server.url)
+    monkeypatch.setenv("FMP_TRANSPORT", "record")
+    monkeypatch.setenv("FMP_FIXTURES", str(tmp_path))
+
+    recorded = FmpForex(api_key="secret").forex_daily("EURUSD")
+    assert server.requests == 1
+
+    path = tmp_path / "v3" / "historical-price-full" / "EURUSD" / "index.json"
+    fixture = json.loads(path.read_text())
+    assert fixture["status"] == 200
+    assert "secret" not in path.read_text()
+
+    monkeypatch.setenv("FMP_TRANSPORT", "replay")
+    monkeypatch.setenv("FMP_BASE_URL", "http://127.0.0.1:9/api/")
+    replayed = FmpForex(api_key="other").forex_daily("EUR/USD")
+    assert replayed.equals(recorded)
+    assert server.requests == 1
+
+    with pytest.raises(Exception, match="No fixture"):
+        FmpForex(api_key="other").forex_daily("GBPUSD")
+
+
+def test_fmp_transport_auto(server, tmp_path):
+    client = FmpForex(api_key="test")
+    client.base_url = server.url
+    client.use_transport(FmpRecordReplayAdapter("auto", str(tmp_path)))
+
+    client.full_forex_quote_list()
+    client.full_forex_quote_list()
+    assert server.requests == 1
+
+    with pytest.raises(ValueError):
+        FmpRecordReplayAdapter("invalid")
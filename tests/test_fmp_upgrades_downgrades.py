@@ -99,3 +99,56 @@ def test_fmp_upgrades_downgrades_upgrades_downgrades_rss_feed(fmp_upgrades_downg
     assert isinstance(upgrades_downgrades["grading_company"][0], str)
     assert isinstance(upgrades_downgrades["action"][0], str)
     assert isinstance(upgrades_downgrades["price_when_posted"][0], float)
+
+
+def make_grade_page(items):
+    return [
+        {
+            "symbol": symbol,
+            "publishedDate": published,
+            "newsURL": f"https://news.example.com/{symbol}/{published}",
+            "newsTitle": "Rating change",
+            "newsBaseURL": "news.example.com",
+            "newsPublisher": "Example",
+            "newGrade": "Buy",
+            "previousGrade": "Hold",
+            "gradingCompany": "Example Securities",
+            "action": "upgrade",
+            "priceWhenPosted": 100.0,
+        }
+        for symbol, published in items
+    ]
+
+
+def test_fmp_upgrades_downgrades_rss_feed_bulk(mocker):
+    client = FMPUpgradesDowngrades(api_key="test")
+    feed = [
+        make_grade_page(
+            [("MSFT", "2024-07-05T10:00:00.000Z"), ("AAPL", "2024-07-04T10:00:00.000Z")]
+        ),
+        make_grade_page(
+            [("AAPL", "2024-07-04T10:00:00.000Z"), ("NVDA", "2024-07-03T10:00:00.000Z")]
+        ),
+    ]
+
+    def get_request(url, params):
+        page = params["page"]
+        return feed[page] if page < len(feed) else []
+
+    mocker.patch.object(client, "get_request", side_effect=get_request)
+
+    result = client.upgrades_downgrades_rss_feed_bulk()
+    assert result["symbol"].tolist() == ["NVDA", "AAPL", "MSFT"]
+    assert result["published_date"].dtype == "datetime64[ns]"
+
+    result = client.upgrades_downgrades_rss_feed_bulk(cutoff="2024-07-04")
+    assert result["symbol"].tolist() == ["AAPL", "MSFT"]
+
+    seen = set()
+    client.upgrades_downgrades_rss_feed_bulk(seen=seen, max_pages=1)
+    assert len(seen) == 2
+    assert client.upgrades_downgrades_rss_feed_bulk(seen=seen).empty
+
+    feed[0] = make_grade_page([("TSLA", "2024-07-06T10:00:00.000Z")]) + feed[0]
+    pages = list(client.upgrades_downgrades_rss_feed_pages(seen=seen))
+    assert [page["symbol"].tolist() for page in pages] == [["TSLA"]]